@@ -0,0 +1,31 @@
+"""Index job pipeline checkpoint + throughput metrics.
+
+Revision ID: 20261120_index_job_checkpoint
+Revises: 20261113_standards_w6_edges
+
+Additive nullable JSON columns. Jobs written before this revision keep the
+prefix-based resume (``documents_processed`` as an offset into ``document_ids``).
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261120_index_job_checkpoint"
+down_revision: Union[str, Sequence[str], None] = "20261113_standards_w6_edges"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("index_jobs", sa.Column("processed_document_ids", sa.JSON(), nullable=True))
+    op.add_column("index_jobs", sa.Column("metrics", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("index_jobs", "metrics")
+    op.drop_column("index_jobs", "processed_document_ids")
@@ -0,0 +1,52 @@
+"""Approver inbox projection (pending_decisions).
+
+Revision ID: 20261121_pending_decisions
+Revises: 20261120_index_job_checkpoint
+
+New table only. It starts empty: run
+``python -m scripts.maintenance.rebuild_pending_decisions --apply`` before
+setting ``APPROVALS_INBOX_PROJECTION_ENABLED``.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261121_pending_decisions"
+down_revision: Union[str, Sequence[str], None] = "20261120_index_job_checkpoint"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pending_decisions",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("tenant_id", sa.Integer(), nullable=False),
+        sa.Column("source", sa.String(length=32), nullable=False),
+        sa.Column("source_id", sa.Integer(), nullable=False),
+        sa.Column("approver_user_id", sa.Integer(), nullable=True),
+        sa.Column("approver_email", sa.String(length=255), nullable=True),
+        sa.Column("decision", sa.String(length=20), nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column("reference", sa.String(length=100), nullable=True),
+        sa.Column("requested_at", sa.DateTime(), nullable=True),
+        sa.Column("requested_at_basis", sa.String(length=20), nullable=True),
+        sa.Column("due_at", sa.DateTime(), nullable=True),
+        sa.Column("deep_link", sa.String(length=255), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_pending_decisions_tenant_user", "pending_decisions", ["tenant_id", "approver_user_id"])
+    op.create_index("ix_pending_decisions_tenant_email", "pending_decisions", ["tenant_id", "approver_email"])
+    op.create_index("ix_pending_decisions_source", "pending_decisions", ["source", "source_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pending_decisions_source", table_name="pending_decisions")
+    op.drop_index("ix_pending_decisions_tenant_email", table_name="pending_decisions")
+    op.drop_index("ix_pending_decisions_tenant_user", table_name="pending_decisions")
+    op.drop_table("pending_decisions")
@@ -0,0 +1,36 @@
+"""Data retention sweep cursors (retention_sweep_cursors).
+
+Revision ID: 20261122_retention_cursors
+Revises: 20261121_pending_decisions
+
+New table only. Rows exist only while a table's retention pass is unfinished.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20261122_retention_cursors"
+down_revision: Union[str, Sequence[str], None] = "20261121_pending_decisions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "retention_sweep_cursors",
+        sa.Column("table_name", sa.String(length=100), nullable=False),
+        sa.Column("cutoff", sa.DateTime(), nullable=False),
+        sa.Column("last_key", sa.BigInteger(), nullable=False),
+        sa.Column("rows_deleted", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("retention_sweep_cursors")
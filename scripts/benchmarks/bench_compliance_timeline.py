@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Benchmark tool and training compliance sparklines: per-week rescans vs. as-of timelines.
+
+Generates deterministic asset rows ``(status, expiry_date, created_at)`` and
+scored training cells ``(passed_on, expires_on)``, then computes a 52-week
+compliance series two ways:
+
+* ``rescan``   — the previous behaviour: per week, rebuild ``AssetHealthRow``
+                 objects and call ``aggregate_asset_health_kpis`` / test every
+                 cell with ``training_cell_is_compliant``;
+* ``timeline`` — ``ToolComplianceTimeline`` / ``TrainingComplianceTimeline``
+                 built once, then one sorted-column search per week.
+
+The two series are checked for equality before timing is reported. Rows are
+in memory: this isolates the Python work, which is what the change removes.
+
+Usage:
+    python scripts/benchmarks/bench_compliance_timeline.py --assets 50000 --cells 200000 --weeks 52
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, cast
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.domain.models.asset import AssetStatus  # noqa: E402
+from src.domain.services.asset_health_analytics_service import AssetHealthRow, aggregate_asset_health_kpis  # noqa: E402
+from src.domain.services.compliance_timeline import ToolComplianceTimeline, TrainingComplianceTimeline  # noqa: E402
+from src.domain.services.executive_dashboard import training_cell_is_compliant  # noqa: E402
+
+STATUSES = [status.value for status in AssetStatus]
+
+
+def _rescan_tools(rows, cutoffs) -> list[float]:
+    series = []
+    for cutoff in cutoffs:
+        rows_as_of = [
+            AssetHealthRow(asset_type=None, status=status, expiry_date=expiry)
+            for status, expiry, created_at in rows
+            if created_at is None or created_at <= cutoff
+        ]
+        summary = cast(Dict[str, Any], aggregate_asset_health_kpis(rows_as_of, as_of=cutoff))
+        bands = summary["expiry_bands"]
+        in_service = summary["total"] - bands["removed"]
+        if in_service <= 0:
+            series.append(100.0)
+            continue
+        quarantined = summary["by_status"].get(AssetStatus.QUARANTINED.value, 0)
+        series.append(round(100.0 * (in_service - bands["overdue"] - quarantined) / in_service, 1))
+    return series
+
+
+def _rescan_training(cells, cutoffs) -> list[float]:
+    return [
+        round(100.0 * sum(1 for p, e in cells if training_cell_is_compliant(p, e, cutoff.date())) / len(cells), 1)
+        for cutoff in cutoffs
+    ]
+
+
+def _timeline_tools(rows, cutoffs) -> list[float]:
+    timeline = ToolComplianceTimeline(rows)
+    return [timeline.compliance_pct_at(cutoff) for cutoff in cutoffs]
+
+
+def _timeline_training(cells, cutoffs) -> list[float]:
+    timeline = TrainingComplianceTimeline(cells)
+    return [round(100.0 * timeline.compliant_at(cutoff.date()) / timeline.measured, 1) for cutoff in cutoffs]
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - started, result
+
+
+def main(assets: int, cells: int, weeks: int, seed: int) -> None:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    today = now.date()
+    asset_rows = [
+        (
+            rng.choice(STATUSES),
+            None if rng.random() < 0.15 else now + timedelta(minutes=rng.randint(-420 * 1440, 120 * 1440)),
+            None if rng.random() < 0.1 else now - timedelta(minutes=rng.randint(0, 500 * 1440)),
+        )
+        for _ in range(assets)
+    ]
+    cell_rows = []
+    while len(cell_rows) < cells:
+        passed = None if rng.random() < 0.3 else today - timedelta(days=rng.randint(0, 900))
+        expires = None if rng.random() < 0.25 else today + timedelta(days=rng.randint(-400, 400))
+        if passed is not None or expires is not None:
+            cell_rows.append((passed, expires))
+    cutoffs = [now - timedelta(days=7 * week) for week in range(weeks - 1, -1, -1)]
+
+    print(f"{assets} assets, {cells} scored training cells, {weeks} weekly cut-offs")
+    print(f"{'series':<10}{'rescan ms':>12}{'timeline ms':>14}{'speed-up':>10}")
+    for label, rescan, timeline, data in (
+        ("tools", _rescan_tools, _timeline_tools, asset_rows),
+        ("training", _rescan_training, _timeline_training, cell_rows),
+    ):
+        old_seconds, old = _timed(rescan, data, cutoffs)
+        new_seconds, new = _timed(timeline, data, cutoffs)
+        assert old == new, f"{label} series differ"
+        print(f"{label:<10}{old_seconds * 1000:>12.1f}{new_seconds * 1000:>14.1f}{old_seconds / new_seconds:>9.0f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets", type=int, default=50000)
+    parser.add_argument("--cells", type=int, default=200000)
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--seed", type=int, default=32)
+    args = parser.parse_args()
+    main(args.assets, args.cells, args.weeks, args.seed)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark native extraction of a large PDF: wall time and event-loop stall.
+
+Compares three ways of extracting a synthetic N-page PDF from async code:
+
+* ``inline``   — ``extract_document_content`` called directly in the coroutine
+                 (the pre-executor behaviour);
+* ``thread``   — ``DocumentExtractionExecutor(workers=0)``;
+* ``process``  — ``DocumentExtractionExecutor(workers=N)`` with page fan-out.
+
+Event-loop stall is the worst gap observed by a 5 ms heartbeat coroutine that
+runs alongside the extraction — what every other request on the worker feels.
+
+Usage:
+    python scripts/benchmarks/bench_document_extraction.py --pages 300 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.domain.models.document import FileType  # noqa: E402
+from src.domain.services.document_extraction_executor import DocumentExtractionExecutor  # noqa: E402
+from src.domain.services.document_extraction_service import extract_document_content  # noqa: E402
+from src.infrastructure.cache.redis_cache import InMemoryCache  # noqa: E402
+
+HEARTBEAT_SECONDS = 0.005
+
+
+def build_pdf(pages: int) -> bytes:
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=10)
+    paragraph = (
+        "The contractor shall maintain a documented fire risk assessment, review it annually "
+        "and after any significant change, and retain evidence of the review. "
+    ) * 6
+    for page in range(1, pages + 1):
+        pdf.add_page()
+        pdf.multi_cell(0, 5, f"Section {page}. {paragraph}")
+        pdf.cell(60, 6, f"Control {page}", border=1)
+        pdf.cell(60, 6, "Compliant", border=1, new_x="LMARGIN", new_y="NEXT")
+    return bytes(pdf.output())
+
+
+async def _measure(label: str, run, content: bytes) -> dict[str, object]:
+    worst_gap = 0.0
+    stop = asyncio.Event()
+
+    async def heartbeat() -> None:
+        nonlocal worst_gap
+        last = time.perf_counter()
+        while not stop.is_set():
+            await asyncio.sleep(HEARTBEAT_SECONDS)
+            now = time.perf_counter()
+            worst_gap = max(worst_gap, now - last - HEARTBEAT_SECONDS)
+            last = now
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(HEARTBEAT_SECONDS * 2)
+    started = time.perf_counter()
+    result = await run(content)
+    wall = time.perf_counter() - started
+    stop.set()
+    await beat
+    return {
+        "mode": label,
+        "wall_seconds": round(wall, 3),
+        "max_loop_stall_ms": round(worst_gap * 1000, 1),
+        "pages": result.page_count,
+        "chars": len(result.text),
+    }
+
+
+async def main(pages: int, workers: int) -> list[dict[str, object]]:
+    content = build_pdf(pages)
+    print(f"Synthetic PDF: {pages} pages, {len(content) / 1024:.0f} KiB")
+
+    async def inline(raw: bytes):
+        return extract_document_content(FileType.PDF, "bench.pdf", raw)
+
+    thread_executor = DocumentExtractionExecutor(workers=0, cache_ttl_seconds=0)
+    process_executor = DocumentExtractionExecutor(
+        workers=workers,
+        cache_ttl_seconds=0,
+        timeout_seconds=600,
+    )
+    cached_executor = DocumentExtractionExecutor(workers=workers, cache=InMemoryCache(), timeout_seconds=600)
+
+    async def threaded(raw: bytes):
+        return await thread_executor.extract(FileType.PDF, "bench.pdf", raw)
+
+    async def pooled(raw: bytes):
+        return await process_executor.extract(FileType.PDF, "bench.pdf", raw)
+
+    async def cached(raw: bytes):
+        return await cached_executor.extract(FileType.PDF, "bench.pdf", raw)
+
+    # Warm the pool so the first measurement does not include worker start-up.
+    await process_executor.extract(FileType.TXT, "warm.txt", b"warm")
+
+    rows = [
+        await _measure("inline", inline, content),
+        await _measure("thread", threaded, content),
+        await _measure(f"process x{workers}", pooled, content),
+    ]
+    await cached(content)
+    rows.append(await _measure("process (cache hit)", cached, content))
+    process_executor.shutdown()
+    cached_executor.shutdown()
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args.pages, args.workers))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'mode':<22}{'wall s':>10}{'max stall ms':>15}{'pages':>8}{'chars':>10}")
+        for row in results:
+            print(
+                f"{row['mode']:<22}{row['wall_seconds']:>10}{row['max_loop_stall_ms']:>15}"
+                f"{row['pages']:>8}{row['chars']:>10}"
+            )
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark Doc Graph implements-index reads against the per-call queries.
+
+Seeds an on-disk SQLite database with one tenant's ``--nodes`` documents linked
+by confirmed primary ``implements`` edges into a tree (``--branching`` children
+per node), plus a pending cross-link per ten documents, then times:
+
+* ``cycle``   — ``would_create_implements_cycle`` for ``--checks`` random
+                (src, dst) pairs, walking one query per ancestor as before
+                against the cached ``ImplementsIndex``;
+* ``cascade`` — ``get_cascade_aggregate`` with the confirmed-edge query against
+                the index.
+
+Answers and payloads are checked for equality before timings are printed.
+Indexed timings are warm (fingerprint statement only); the first read after a
+change pays one extra edge load.
+
+Usage:
+    python scripts/benchmarks/bench_document_graph_index.py --nodes 3000 --checks 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import event, insert  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from src.api.schemas.document_graph import CascadeAggregateResponse  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.domain.models.document import Document  # noqa: E402
+from src.domain.models.document_graph import DocumentEdge, DocumentEdgeStatus, DocumentEdgeType  # noqa: E402
+from src.domain.services.document_graph_service import DocumentGraphService  # noqa: E402
+
+TENANT_ID = 1
+
+
+async def _seed(conn, nodes: int, branching: int, rng: random.Random) -> None:
+    await conn.run_sync(Document.__table__.create)
+    await conn.run_sync(DocumentEdge.__table__.create)
+    await conn.execute(
+        insert(Document),
+        [
+            {
+                "id": n,
+                "tenant_id": TENANT_ID,
+                "title": f"Document {n}",
+                "reference_number": f"DOC-{n:05d}",
+                "file_name": "x.pdf",
+                "file_type": "pdf",
+                "file_size": 1,
+                "file_path": "x",
+                "cascade_level": min(5, 1 + (n - 1).bit_length() // 3),
+            }
+            for n in range(1, nodes + 1)
+        ],
+    )
+    edges = [
+        {
+            "tenant_id": TENANT_ID,
+            "src_document_id": n,
+            "dst_document_id": (n - 2) // branching + 1,
+            "edge_type": DocumentEdgeType.IMPLEMENTS,
+            "status": DocumentEdgeStatus.CONFIRMED,
+            "is_primary_parent": True,
+        }
+        for n in range(2, nodes + 1)
+    ]
+    # Pending cross-links to an earlier document count for the cycle guard only.
+    for n in range(20, nodes + 1, 10):
+        target = rng.randrange(2, n // branching + 2)
+        if target == (n - 2) // branching + 1:
+            continue
+        edges.append(
+            {
+                "tenant_id": TENANT_ID,
+                "src_document_id": n,
+                "dst_document_id": target,
+                "edge_type": DocumentEdgeType.IMPLEMENTS,
+                "status": DocumentEdgeStatus.PROPOSED,
+                "is_primary_parent": False,
+            }
+        )
+    await conn.execute(insert(DocumentEdge), edges)
+
+
+async def _timed(fn, repeat: int, statements: list[str]):
+    best, result, issued = float("inf"), None, 0
+    for _ in range(repeat):
+        statements.clear()
+        started = time.perf_counter()
+        result = await fn()
+        best = min(best, time.perf_counter() - started)
+        issued = sum(1 for sql in statements if sql.lstrip().upper().startswith("SELECT"))
+    return best, result, issued
+
+
+async def main(nodes: int, branching: int, checks: int, repeat: int, seed: int) -> None:
+    rng = random.Random(seed)
+    pairs = [(rng.randint(1, nodes), rng.randint(1, nodes)) for _ in range(checks)]
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/graph.db")
+        async with engine.begin() as conn:
+            await _seed(conn, nodes, branching, rng)
+        statements: list[str] = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+        async with factory() as db:
+            service = DocumentGraphService(db)
+
+            async def cycle_checks():
+                return [
+                    await service.would_create_implements_cycle(
+                        tenant_id=TENANT_ID, src_document_id=src, dst_document_id=dst
+                    )
+                    for src, dst in pairs
+                ]
+
+            async def cascade():
+                payload = await service.get_cascade_aggregate(tenant_id=TENANT_ID, viewer=None)
+                return CascadeAggregateResponse.model_validate(payload).model_dump()
+
+            print(f"{nodes}-node tree, {branching} children per node, {checks} cycle checks; best of {repeat}")
+            print(f"{'read':>20}{'ms':>10}{'stmts':>8}")
+            for label, fn in (("cycle", cycle_checks), ("cascade", cascade)):
+                settings.document_graph_implements_index_enabled = False
+                old_s, old, old_n = await _timed(fn, repeat, statements)
+                settings.document_graph_implements_index_enabled = True
+                await fn()
+                new_s, new, new_n = await _timed(fn, repeat, statements)
+                assert old == new, f"{label} differs"
+                print(f"{label + ' per-call':>20}{old_s * 1000:>10.1f}{old_n:>8}")
+                print(f"{label + ' indexed':>20}{new_s * 1000:>10.1f}{new_n:>8}")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=3000)
+    parser.add_argument("--branching", type=int, default=8)
+    parser.add_argument("--checks", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=39)
+    args = parser.parse_args()
+    asyncio.run(main(args.nodes, args.branching, args.checks, args.repeat, args.seed))
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Benchmark Doc Graph thread walks on a 500-node policy tree.
+
+Seeds an on-disk SQLite database with one tenant's documents linked by
+confirmed primary ``implements`` edges into a tree of ``--nodes`` documents
+(``--branching`` children per node, so four levels below the root by default),
+then times:
+
+* ``per-query`` — the walk ``get_thread`` used to do: one query per ancestor
+                  level and one per descendant node;
+* ``cte``       — ``DocumentGraphService.get_thread`` (one recursive-CTE walk);
+* ``batch``     — ``get_threads`` for every document in the tree at once,
+                  against ``cte`` called once per document.
+
+Hops are checked for equality before timings are printed. Statement counts are
+what matters on PostgreSQL, where each round trip costs far more than it does
+against a local SQLite file.
+
+Usage:
+    python scripts/benchmarks/bench_document_thread.py --nodes 500 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import event, insert, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from src.domain.models.document import Document  # noqa: E402
+from src.domain.models.document_graph import DocumentEdge, DocumentEdgeStatus, DocumentEdgeType  # noqa: E402
+from src.domain.services.document_graph_service import THREAD_MAX_DEPTH, DocumentGraphService  # noqa: E402
+
+TENANT_ID = 1
+
+
+async def _seed(conn, nodes: int, branching: int) -> None:
+    await conn.run_sync(Document.__table__.create)
+    await conn.run_sync(DocumentEdge.__table__.create)
+    await conn.execute(
+        insert(Document),
+        [
+            {
+                "id": n,
+                "tenant_id": TENANT_ID,
+                "title": f"Document {n}",
+                "reference_number": f"DOC-{n:05d}",
+                "file_name": "x.pdf",
+                "file_type": "pdf",
+                "file_size": 1,
+                "file_path": "x",
+            }
+            for n in range(1, nodes + 1)
+        ],
+    )
+    # Breadth-first: node n's parent is (n - 2) // branching + 1.
+    await conn.execute(
+        insert(DocumentEdge),
+        [
+            {
+                "tenant_id": TENANT_ID,
+                "src_document_id": n,
+                "dst_document_id": (n - 2) // branching + 1,
+                "edge_type": DocumentEdgeType.IMPLEMENTS,
+                "status": DocumentEdgeStatus.CONFIRMED,
+                "is_primary_parent": True,
+            }
+            for n in range(2, nodes + 1)
+        ],
+    )
+
+
+async def _per_query_thread(db: AsyncSession, document_id: int) -> dict:
+    """The walk get_thread did before the CTE, statement for statement."""
+
+    def walkable():
+        return (
+            DocumentEdge.tenant_id == TENANT_ID,
+            DocumentEdge.edge_type == DocumentEdgeType.IMPLEMENTS,
+            DocumentEdge.is_primary_parent.is_(True),
+            DocumentEdge.status.in_((DocumentEdgeStatus.CONFIRMED,)),
+            DocumentEdge.deleted_at.is_(None),
+        )
+
+    await db.execute(select(Document).where(Document.id == document_id, Document.tenant_id == TENANT_ID))
+    ancestors, current, seen = [], document_id, {document_id}
+    for depth in range(1, THREAD_MAX_DEPTH + 1):
+        edges = (
+            (
+                await db.execute(
+                    select(DocumentEdge)
+                    .where(DocumentEdge.src_document_id == current, *walkable())
+                    .order_by(DocumentEdge.id.asc())
+                )
+            )
+            .scalars()
+            .all()
+        )
+        if not edges or edges[0].dst_document_id in seen:
+            break
+        seen.add(edges[0].dst_document_id)
+        ancestors.append((edges[0].dst_document_id, edges[0].id, depth))
+        current = edges[0].dst_document_id
+
+    descendants, visited = [], {document_id}
+
+    async def walk(parent_id: int, depth: int) -> None:
+        if depth > THREAD_MAX_DEPTH:
+            return
+        edges = (
+            (
+                await db.execute(
+                    select(DocumentEdge)
+                    .where(DocumentEdge.dst_document_id == parent_id, *walkable())
+                    .order_by(DocumentEdge.id.asc())
+                )
+            )
+            .scalars()
+            .all()
+        )
+        for edge in edges:
+            if edge.src_document_id in visited:
+                continue
+            visited.add(edge.src_document_id)
+            descendants.append((edge.src_document_id, edge.id, depth))
+            await walk(edge.src_document_id, depth + 1)
+
+    await walk(document_id, 1)
+    ids = {hop[0] for hop in ancestors + descendants}
+    await db.execute(select(Document).where(Document.tenant_id == TENANT_ID, Document.id.in_(ids)))
+    return {"ancestors": ancestors, "descendants": descendants}
+
+
+def _hops(payload: dict) -> dict:
+    return {
+        key: [(hop["document_id"], hop["edge_id"], hop["depth"]) for hop in payload[key]]
+        for key in ("ancestors", "descendants")
+    }
+
+
+async def _timed(fn, repeat: int, statements: list[str]):
+    best, result, issued = float("inf"), None, 0
+    for _ in range(repeat):
+        statements.clear()
+        started = time.perf_counter()
+        result = await fn()
+        best = min(best, time.perf_counter() - started)
+        issued = sum(1 for sql in statements if sql.lstrip().upper().startswith(("SELECT", "WITH")))
+    return best, result, issued
+
+
+async def main(nodes: int, branching: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/threads.db")
+        async with engine.begin() as conn:
+            await _seed(conn, nodes, branching)
+        statements: list[str] = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+        async with factory() as db:
+            service = DocumentGraphService(db)
+            root, mid = 1, 2 + branching
+
+            print(f"{nodes}-node tree, {branching} children per node; best of {repeat}")
+            print(f"{'walk':>28}{'ms':>10}{'stmts':>8}")
+            for label, document_id in (("root", root), ("level-2 node", mid)):
+                old_s, old, old_n = await _timed(lambda: _per_query_thread(db, document_id), repeat, statements)
+                new_s, new, new_n = await _timed(
+                    lambda: service.get_thread(tenant_id=TENANT_ID, document_id=document_id), repeat, statements
+                )
+                assert old == _hops(new), f"thread of {document_id} differs"
+                print(f"{label + ' per-query':>28}{old_s * 1000:>10.1f}{old_n:>8}")
+                print(f"{label + ' cte':>28}{new_s * 1000:>10.1f}{new_n:>8}")
+
+            every = list(range(1, nodes + 1))
+
+            async def one_by_one():
+                return {
+                    document_id: await service.get_thread(tenant_id=TENANT_ID, document_id=document_id)
+                    for document_id in every
+                }
+
+            loop_s, looped, loop_n = await _timed(one_by_one, 1, statements)
+            batch_s, batched, batch_n = await _timed(
+                lambda: service.get_threads(tenant_id=TENANT_ID, document_ids=every), repeat, statements
+            )
+            assert looped == batched, "batch threads differ"
+            print(f"{f'all {nodes} cte one by one':>28}{loop_s * 1000:>10.1f}{loop_n:>8}")
+            print(f"{f'all {nodes} batch':>28}{batch_s * 1000:>10.1f}{batch_n:>8}")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=500)
+    parser.add_argument("--branching", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.nodes, args.branching, args.repeat))
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Benchmark dashboard weekly trend series: per-week queries vs. one grouped pass.
+
+Seeds an on-disk SQLite database with N synthetic events (several tenants, some
+soft-deleted, a nullable score) spread over the last year, then builds a count
+series and an average series for 30/90/365-day periods two ways:
+
+* ``per-week`` — the previous behaviour, one COUNT / AVG statement per window;
+* ``grouped``  — ``ExecutiveDashboardService._week_buckets``, one statement per
+                 series grouping by a ``CASE`` over the window ends.
+
+Both results are checked for equality before timing is reported. Statement
+counts are what matters on PostgreSQL, where each round trip costs far more than
+it does against a local SQLite file.
+
+Usage:
+    python scripts/benchmarks/bench_executive_trends.py --rows 200000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import (  # noqa: E402
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    MetaData,
+    Table,
+    and_,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from src.domain.services.executive_dashboard import _TREND_WEEK, ExecutiveDashboardService  # noqa: E402
+
+TENANT_ID = 1
+metadata = MetaData()
+events = Table(
+    "bench_trend_events",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer),
+    Column("deleted_at", DateTime(timezone=True)),
+    Column("occurred_at", DateTime(timezone=True)),
+    Column("score", Float),
+    Index("ix_bench_trend_events_tenant_occurred", "tenant_id", "occurred_at"),
+)
+
+
+def _windows(now: datetime, period_days: int) -> list[tuple[datetime, datetime, str]]:
+    windows = []
+    for i in range(max(period_days // 7, 1), 0, -1):
+        week_end = now - (i - 1) * _TREND_WEEK
+        week_start = week_end - _TREND_WEEK
+        windows.append((week_start, week_end, week_start.strftime("%Y-%m-%d")))
+    return windows
+
+
+async def _per_week(db: AsyncSession, windows, criteria) -> dict[int, tuple[int, float | None]]:
+    buckets: dict[int, tuple[int, float | None]] = {}
+    for index, (start, end, _label) in enumerate(windows):
+        in_window = and_(criteria, events.c.occurred_at >= start, events.c.occurred_at < end)
+        count = (await db.execute(select(func.count()).where(in_window))).scalar() or 0
+        average = (await db.execute(select(func.avg(events.c.score)).where(in_window))).scalar()
+        if count:
+            buckets[index] = (int(count), float(average) if average is not None else None)
+    return buckets
+
+
+async def _timed(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = await fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+async def main(rows: int, repeat: int, seed: int) -> None:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/trends.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+            batch = []
+            for _ in range(rows):
+                batch.append(
+                    {
+                        "tenant_id": rng.randint(1, 4),
+                        "deleted_at": now if rng.random() < 0.05 else None,
+                        "occurred_at": now - timedelta(seconds=rng.randint(0, 400 * 86400)),
+                        "score": None if rng.random() < 0.1 else rng.uniform(20, 100),
+                    }
+                )
+                if len(batch) == 20000:
+                    await conn.execute(insert(events), batch)
+                    batch = []
+            if batch:
+                await conn.execute(insert(events), batch)
+
+        factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+        print(f"{rows} events over ~400 days, 4 tenants; best of {repeat}")
+        print(f"{'period':>8}{'weeks':>7}{'per-week ms':>14}{'stmts':>7}{'grouped ms':>13}{'stmts':>7}{'speed-up':>10}")
+        async with factory() as db:
+            service = ExecutiveDashboardService(db, tenant_id=TENANT_ID)
+            criteria = service._tenant_filter(events.c)
+            for period in (30, 90, 365):
+                windows = _windows(now, period)
+                old_seconds, old = await _timed(lambda: _per_week(db, windows, criteria), repeat)
+                new_seconds, new = await _timed(
+                    lambda: service._week_buckets(windows, events.c.occurred_at, criteria, value_col=events.c.score),
+                    repeat,
+                )
+                assert old.keys() == new.keys(), "bucket sets differ"
+                for index, (count, average) in old.items():
+                    assert new[index][0] == count, (index, count, new[index])
+                    assert average is None or abs(new[index][1] - average) < 1e-6, (index, average, new[index])
+                print(
+                    f"{period:>7}d{len(windows):>7}{old_seconds * 1000:>14.1f}{2 * len(windows):>7}"
+                    f"{new_seconds * 1000:>13.1f}{1:>7}{old_seconds / new_seconds:>9.1f}x"
+                )
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=31)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat, args.seed))
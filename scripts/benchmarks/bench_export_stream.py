@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Benchmark peak memory and time of streamed exports against load-everything.
+
+Seeds ``--rows`` incidents (default 1M) for one tenant into a SQLite file
+(reused across runs when the count matches) and exports them all. Each mode
+runs in a fresh process so its peak RSS (``ru_maxrss``) is its own:
+
+* ``legacy``      — the previous sync shape without its row cap: every row
+                    loaded as an ORM entity, then written to an in-memory CSV;
+* ``stream-csv``  — ``ExportCenterService.write_export``: column-only select
+                    on a server-side cursor, rows written straight to a file;
+* ``stream-xlsx`` — the same into a write-only openpyxl workbook.
+
+Each child's row count must equal ``--rows`` before timings are printed.
+``baseline`` is the child's RSS after imports, before any query.
+
+Usage:
+    python scripts/benchmarks/bench_export_stream.py --rows 1000000
+    python scripts/benchmarks/bench_export_stream.py --rows 200000 --modes legacy stream-csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import resource
+import subprocess  # nosec B404 - re-runs this script per mode
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import cast
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import sqlalchemy as sa  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+import src.domain.models  # noqa: E402,F401
+from src.domain.models.incident import Incident  # noqa: E402
+from src.domain.services.export_center_service import _MODULE_SPECS, ExportCenterService  # noqa: E402
+
+MODES = ("legacy", "stream-csv", "stream-xlsx")
+TENANT_ID = 1
+INCIDENTS = cast(sa.Table, Incident.__table__)
+
+
+def _seed(db_path: Path, rows: int) -> None:
+    engine = sa.create_engine(f"sqlite+pysqlite:///{db_path}")
+    if db_path.exists():
+        with engine.connect() as conn:
+            if conn.execute(sa.select(sa.func.count()).select_from(INCIDENTS)).scalar_one() == rows:
+                return
+        db_path.unlink()
+        engine = sa.create_engine(f"sqlite+pysqlite:///{db_path}")
+    INCIDENTS.create(engine)
+    insert = sa.insert(INCIDENTS)
+    for start in range(0, rows, 50_000):
+        with engine.begin() as conn:
+            conn.execute(
+                insert,
+                [
+                    {
+                        "tenant_id": TENANT_ID,
+                        "reference_number": f"INC-2026-{n:07d}",
+                        "title": f"Slip on wet floor near bay {n % 40}",
+                        "incident_type": "injury",
+                        "severity": "low",
+                        "status": "reported",
+                        "incident_date": datetime(2026, 1, 1),
+                        "reported_date": datetime(2026, 1, 2),
+                        "description": "Operative slipped on standing water; no lost time." * 4,
+                    }
+                    for n in range(start, min(start + 50_000, rows))
+                ],
+            )
+    engine.dispose()
+
+
+def _rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _legacy(db, scratch: Path) -> int:
+    spec = _MODULE_SPECS["incidents"]
+    result = await db.execute(sa.select(Incident).where(Incident.tenant_id == TENANT_ID).order_by(spec.order_by))
+    rows = list(result.scalars().all())
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(list(spec.columns))
+    for row in rows:
+        writer.writerow(spec.row_mapper(row))
+    (scratch / "legacy.csv").write_bytes(buffer.getvalue().encode("utf-8"))
+    return len(rows)
+
+
+async def _child(mode: str, db_path: Path) -> dict:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    baseline = _rss_mb()
+    with tempfile.TemporaryDirectory() as scratch:
+        async with async_sessionmaker(engine)() as db:
+            started = time.perf_counter()
+            if mode == "legacy":
+                count = await _legacy(db, Path(scratch))
+            else:
+                fmt = mode.split("-", 1)[1]
+                count = (
+                    await ExportCenterService(db).write_export(TENANT_ID, "incidents", fmt, Path(scratch))
+                ).row_count
+            elapsed = time.perf_counter() - started
+    await engine.dispose()
+    return {"mode": mode, "rows": count, "seconds": elapsed, "baseline_mb": baseline, "peak_mb": _rss_mb()}
+
+
+def main(rows: int, modes: list[str], db_path: Path) -> None:
+    _seed(db_path, rows)
+    results = []
+    for mode in modes:
+        out = subprocess.run(  # nosec B603 - fixed argv
+            [sys.executable, __file__, "--child", mode, "--db", str(db_path)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results.append(json.loads(out.strip().splitlines()[-1]))
+
+    for result in results:
+        assert result["rows"] == rows, f"{result['mode']} exported {result['rows']} of {rows} rows"
+
+    print(f"{rows} incident rows, SQLite ({db_path})")
+    print(f"{'mode':>12}{'seconds':>10}{'rows/s':>10}{'baseline MB':>13}{'peak MB':>10}{'growth MB':>11}")
+    for r in results:
+        print(
+            f"{r['mode']:>12}{r['seconds']:>10.1f}{rows / r['seconds']:>10.0f}"
+            f"{r['baseline_mb']:>13.0f}{r['peak_mb']:>10.0f}{r['peak_mb'] - r['baseline_mb']:>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--db", type=Path, default=Path(tempfile.gettempdir()) / "bench_export_stream.db")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(asyncio.run(_child(args.child, args.db))))
+    else:
+        main(args.rows, args.modes, args.db)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Benchmark KRI recalculation: per-KRI loop vs. one shared metric plan.
+
+Seeds an on-disk SQLite database with synthetic incidents and near misses and N
+auto-calculated KRIs spread over the incident/near-miss data sources (each with
+some measurement history), then times two ways of recalculating all of them:
+
+* ``per-kri`` — the previous ``calculate_all_kris`` shape: ``calculate_kri`` for
+                each KRI, which re-reads the KRI, computes its sources, reads its
+                history and commits, one KRI at a time;
+* ``planned`` — ``calculate_all_kris``: distinct source metrics computed once
+                (one aggregate per source table), history in one statement, a
+                single bulk insert and commit.
+
+Statement counts are reported alongside wall time; against PostgreSQL every
+statement is a network round trip, so they are the number that scales.
+
+Usage:
+    python scripts/benchmarks/bench_kri_calculation.py --kris 100 --incidents 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import event, insert, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from src.domain.models.incident import Incident, IncidentSeverity, IncidentStatus  # noqa: E402
+from src.domain.models.kri import KeyRiskIndicator, KRIAlert, KRICategory, KRIMeasurement, ThresholdStatus  # noqa: E402
+from src.domain.models.near_miss import NearMiss  # noqa: E402
+from src.domain.models.tenant import Tenant  # noqa: E402
+from src.domain.services.risk_scoring import KRIService  # noqa: E402
+
+DATA_SOURCES = [
+    "incident_count",
+    "incident_rate_per_1000",
+    "critical_incident_count",
+    "open_incident_count",
+    "incident_closure_rate",
+    "near_miss_count",
+    "near_miss_reporting_ratio",
+]
+
+
+async def _seed(engine, kris: int, incidents: int, seed: int) -> None:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    async with engine.begin() as conn:
+        for table in (Tenant, Incident, NearMiss, KeyRiskIndicator, KRIMeasurement, KRIAlert):
+            await conn.run_sync(table.__table__.create)
+        incident_rows = []
+        for n in range(incidents):
+            when = now - timedelta(minutes=rng.randint(0, 365 * 1440))
+            incident_rows.append(
+                {
+                    "tenant_id": 1,
+                    "reference_number": f"INC-{n:06d}",
+                    "title": "t",
+                    "description": "d",
+                    "incident_date": when,
+                    "reported_date": when,
+                    "created_at": when,
+                    "updated_at": when,
+                    "severity": rng.choice(list(IncidentSeverity)),
+                    "status": rng.choice(list(IncidentStatus)),
+                }
+            )
+        await conn.execute(insert(Incident), incident_rows)
+        near_miss_rows = []
+        for n in range(incidents // 2):
+            when = now - timedelta(minutes=rng.randint(0, 365 * 1440))
+            near_miss_rows.append(
+                {
+                    "tenant_id": 1,
+                    "reference_number": f"NM-{n:06d}",
+                    "reporter_name": "r",
+                    "contract": "c",
+                    "location": "l",
+                    "event_date": when,
+                    "description": "d",
+                    "created_at": when,
+                    "updated_at": when,
+                }
+            )
+        await conn.execute(insert(NearMiss), near_miss_rows)
+        kri_rows = [
+            {
+                "code": f"KRI-{n:03d}",
+                "name": f"KRI {n}",
+                "category": KRICategory.SAFETY,
+                "unit": "count",
+                "data_source": DATA_SOURCES[n % len(DATA_SOURCES)],
+                "lower_is_better": n % 2 == 0,
+                "green_threshold": 10,
+                "amber_threshold": 50,
+                "red_threshold": 100,
+                "is_active": True,
+                "auto_calculate": True,
+            }
+            for n in range(kris)
+        ]
+        await conn.execute(insert(KeyRiskIndicator), kri_rows)
+        history = [
+            {
+                "kri_id": kri_id,
+                "measurement_date": now - timedelta(days=30 * k),
+                "value": rng.uniform(0, 120),
+                "status": ThresholdStatus.AMBER,
+            }
+            for kri_id in range(1, kris + 1)
+            for k in range(1, 13)
+        ]
+        await conn.execute(insert(KRIMeasurement), history)
+
+
+async def _run(factory, engine, label: str, planned: bool) -> tuple[float, int, int]:
+    statements = 0
+
+    def _count(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _count)
+    started = time.perf_counter()
+    async with factory() as db:
+        service = KRIService(db)
+        if planned:
+            results = await service.calculate_all_kris()
+        else:
+            ids = (
+                (await db.execute(select(KeyRiskIndicator.id).where(KeyRiskIndicator.auto_calculate.is_(True))))
+                .scalars()
+                .all()
+            )
+            results = [result for kri_id in ids if (result := await service.calculate_kri(kri_id))]
+    elapsed = time.perf_counter() - started
+    event.remove(engine.sync_engine, "before_cursor_execute", _count)
+    return elapsed, statements, len(results)
+
+
+async def main(kris: int, incidents: int, seed: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/kri.db")
+        await _seed(engine, kris, incidents, seed)
+        factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+        print(f"{kris} KRIs over {len(DATA_SOURCES)} data sources; {incidents} incidents, {incidents // 2} near misses")
+        print(f"{'mode':<10}{'wall ms':>10}{'statements':>12}{'KRIs':>7}")
+        for label, planned in (("per-kri", False), ("planned", True)):
+            elapsed, statements, calculated = await _run(factory, engine, label, planned)
+            print(f"{label:<10}{elapsed * 1000:>10.1f}{statements:>12}{calculated:>7}")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--kris", type=int, default=100)
+    parser.add_argument("--incidents", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=33)
+    args = parser.parse_args()
+    asyncio.run(main(args.kris, args.incidents, args.seed))
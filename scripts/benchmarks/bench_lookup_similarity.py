@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark lookup-name classification: full scan vs. the trigram index.
+
+Generates a deterministic catalogue of candidate lookup names (asset types,
+locations, engineers with realistic typos) and a batch of import rows, then
+classifies every row:
+
+* ``scan``  — the previous behaviour, ``SequenceMatcher`` against every
+              candidate (timed on a sample and extrapolated; it is slow);
+* ``index`` — ``LookupMatchIndex`` built once plus ``classify_many``.
+
+The sampled rows are checked for identical results before timing is reported.
+
+Usage:
+    python scripts/benchmarks/bench_lookup_similarity.py --rows 5000 --candidates 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.domain.services.lookup_similarity import (  # noqa: E402
+    SIMILAR_THRESHOLD,
+    LookupMatchIndex,
+    SimilarMatch,
+    normalise_lookup_key,
+    similarity_score,
+)
+
+PREFIXES = ["", "site", "depot", "van", "unit", "plant", "store", "yard", "workshop", "bay"]
+NOUNS = [
+    "d shackle",
+    "torque wrench",
+    "gas detector",
+    "rcd tester",
+    "bottle jack",
+    "axle stand",
+    "pipe bender",
+    "cable locator",
+    "harness",
+    "step ladder",
+    "generator",
+    "pressure washer",
+]
+PLACES = ["north", "south", "east", "west", "central", "bristol", "leeds", "cardiff", "derby", "hull"]
+
+
+def _name(rng: random.Random, serial: int) -> str:
+    parts = [rng.choice(PREFIXES), rng.choice(NOUNS), rng.choice(PLACES), str(serial % 997)]
+    return " ".join(part for part in parts if part).title()
+
+
+def _typo(rng: random.Random, name: str) -> str:
+    chars = list(name)
+    for _ in range(rng.randint(0, 2)):
+        position = rng.randrange(len(chars))
+        roll = rng.random()
+        if roll < 0.4:
+            chars[position] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+        elif roll < 0.7:
+            del chars[position]
+        else:
+            chars.insert(position, rng.choice(" -"))
+    return "".join(chars)
+
+
+def _scan_classify(name: str, candidates: list[tuple[int, str]]):
+    key = normalise_lookup_key(name)
+    for candidate_id, candidate_name in candidates:
+        if normalise_lookup_key(candidate_name) == key:
+            return "reuse", (candidate_id, candidate_name), []
+    scored = []
+    for candidate_id, candidate_name in candidates:
+        score = similarity_score(name, candidate_name)
+        if score >= SIMILAR_THRESHOLD and normalise_lookup_key(candidate_name) != key:
+            scored.append(SimilarMatch(id=candidate_id, name=candidate_name, score=round(score, 4)))
+    scored.sort(key=lambda item: (-item.score, item.name.lower(), item.id))
+    return ("similar", None, scored[:5]) if scored else ("new", None, [])
+
+
+def main(rows: int, candidate_count: int, sample: int, seed: int) -> None:
+    rng = random.Random(seed)
+    candidates = [(index, _name(rng, index)) for index in range(candidate_count)]
+    names = [
+        _typo(rng, rng.choice(candidates)[1]) if rng.random() < 0.7 else _name(rng, rng.randint(0, 10**6))
+        for _ in range(rows)
+    ]
+
+    started = time.perf_counter()
+    index = LookupMatchIndex(candidates)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    results = index.classify_many(names)
+    classify_seconds = time.perf_counter() - started
+
+    sampled = names[:sample]
+    started = time.perf_counter()
+    scanned = [_scan_classify(name, candidates) for name in sampled]
+    scan_seconds = time.perf_counter() - started
+    assert scanned == results[:sample], "index results differ from full scan"
+
+    intents = {intent: sum(1 for result in results if result[0] == intent) for intent in ("reuse", "similar", "new")}
+    scan_estimate = scan_seconds / len(sampled) * rows
+    index_total = build_seconds + classify_seconds
+    print(f"{rows} rows x {candidate_count} candidates; intents {intents}")
+    print(f"index build:        {build_seconds * 1000:10.1f} ms")
+    print(f"classify_many:      {classify_seconds * 1000:10.1f} ms  ({classify_seconds / rows * 1e6:.0f} us/row)")
+    print(f"full scan ({len(sampled)} rows): {scan_seconds:8.2f} s   ({scan_seconds / len(sampled) * 1000:.0f} ms/row)")
+    print(f"full scan estimate: {scan_estimate:10.1f} s   (index {scan_estimate / index_total:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--candidates", type=int, default=20000)
+    parser.add_argument("--sample", type=int, default=25, help="rows timed with the full scan")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    main(args.rows, args.candidates, args.sample, args.seed)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Benchmark PAMS defect detection: set-based batch against the per-failure loop.
+
+Generates ``--rows`` synthetic daily checklist rows (default 100k), each with
+the real skip columns plus 36 check columns in the PAMS answer vocabulary,
+about 1 in 50 answers a fail. A tenth of the failing (record, check) pairs
+already have an open defect. Each path runs on its own SQLite file with the
+same seed:
+
+* ``legacy`` — the previous ``_auto_detect_defects``: per row, per failing
+               column, one open-defect query, then add + flush per new defect;
+* ``batch``  — ``_auto_detect_defects`` over the whole sync: one open-defect
+               query, bulk insert.
+
+The defects both paths create must match before timings are printed.
+
+Usage:
+    python scripts/benchmarks/bench_pams_defect_detection.py --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, cast
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import sqlalchemy as sa  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+import src.domain.models  # noqa: E402,F401
+from src.domain.models.vehicle_defect import VehicleDefect  # noqa: E402
+from src.infrastructure.tasks.pams_sync_tasks import FAIL_VALUES, _auto_detect_defects  # noqa: E402
+
+DEFECTS = cast(sa.Table, VehicleDefect.__table__)
+CHECKS = [f"check{n:02d}" for n in range(36)]
+PASSES = ["pass", "Pass", "yes", "Yes", "1", "ok", "N/A", 1, True]
+FAILS = ["fail", "Fail", "no", "No", "0", "n", 0, False]
+_LEGACY_SKIP = (
+    "id ID inc_id created_at updated_at date driver vehicle registration reg VehicleReg DriverName DateSubmitted "
+    "userName vanID vanReg startTimeDate endTimeDate technician comments notes mileage Mileage bodyWorkDamage "
+    "defects uploaded roadTaxExpiryDate toolingCalibrationExpiryDate fireExtinguisherExpiryDate"
+).split()
+
+
+def _rows(count: int) -> list[tuple[int, dict[str, Any]]]:
+    rng = random.Random(47)
+    rows = []
+    for pams_id in range(1, count + 1):
+        row: dict[str, Any] = {
+            "id": pams_id,
+            "vanID": f"VAN{pams_id % 400:03d}",
+            "vanReg": f"AB{pams_id % 400:02d} CDE",
+            "startTimeDate": "2026-10-01T07:30:00",
+            "userName": f"tech{pams_id % 90}",
+            "mileage": 40_000 + pams_id,
+            "comments": "" if pams_id % 7 else "Nearside wiper smearing",
+        }
+        for check in CHECKS:
+            row[check] = rng.choice(FAILS) if rng.random() < 0.02 else rng.choice(PASSES)
+        rows.append((pams_id, row))
+    return rows
+
+
+def _legacy_detect(row_dict: dict[str, Any], pams_id: int, db: Session) -> int:
+    """The per-failure loop this replaced (CAPA creation omitted: auto-detected defects are P3)."""
+    detected = 0
+    skip_keys = set(_LEGACY_SKIP)
+    for col_name, col_value in row_dict.items():
+        if col_name in skip_keys:
+            continue
+        str_val = str(col_value).strip().lower() if col_value is not None else ""
+        if str_val not in FAIL_VALUES:
+            continue
+        existing_defect = (
+            db.query(VehicleDefect)
+            .filter(
+                VehicleDefect.pams_table == "daily",
+                VehicleDefect.pams_record_id == pams_id,
+                VehicleDefect.check_field == col_name,
+                VehicleDefect.status.in_(["open", "auto_detected", "acknowledged", "action_assigned"]),
+            )
+            .first()
+        )
+        if existing_defect:
+            continue
+        vehicle_reg = str(row_dict.get("vanID") or row_dict.get("vanReg") or "").strip()
+        db.add(
+            VehicleDefect(
+                pams_table="daily",
+                pams_record_id=pams_id,
+                check_field=col_name,
+                check_value=str(col_value),
+                priority="P3",
+                status="auto_detected",
+                notes="Auto-detected during PAMS sync",
+                vehicle_reg=vehicle_reg,
+            )
+        )
+        db.flush()
+        detected += 1
+    return detected
+
+
+def _engine(directory: Path, name: str, rows: list[tuple[int, dict[str, Any]]]) -> sa.Engine:
+    engine = sa.create_engine(f"sqlite+pysqlite:///{directory / name}.db")
+    DEFECTS.create(engine)
+    rng = random.Random(48)
+    open_defects = [
+        {
+            "pams_table": "daily",
+            "pams_record_id": pams_id,
+            "check_field": check,
+            "check_value": "fail",
+            "priority": "P3",
+            "status": "acknowledged",
+        }
+        for pams_id, row in rows
+        for check in CHECKS
+        if str(row[check]).strip().lower() in FAIL_VALUES and rng.random() < 0.1
+    ]
+    with engine.begin() as conn:
+        conn.execute(sa.insert(DEFECTS), open_defects)
+    return engine
+
+
+def _created(engine: sa.Engine) -> set[tuple[int, str, str]]:
+    with engine.connect() as conn:
+        return {
+            (row.pams_record_id, row.check_field, row.check_value)
+            for row in conn.execute(
+                sa.select(DEFECTS.c.pams_record_id, DEFECTS.c.check_field, DEFECTS.c.check_value).where(
+                    DEFECTS.c.status == "auto_detected"
+                )
+            )
+        }
+
+
+def _run(engine: sa.Engine, rows: list[tuple[int, dict[str, Any]]], legacy: bool) -> tuple[float, int]:
+    with Session(engine) as db:
+        started = time.perf_counter()
+        if legacy:
+            detected = sum(_legacy_detect(row, pams_id, db) for pams_id, row in rows)
+        else:
+            detected = _auto_detect_defects(rows, "vanchecklist", VehicleDefect, db)
+        db.commit()
+        return time.perf_counter() - started, detected
+
+
+def main(count: int) -> None:
+    rows = _rows(count)
+    results = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        for label in ("legacy", "batch"):
+            engine = _engine(Path(scratch), label, rows)
+            seconds, detected = _run(engine, rows, legacy=label == "legacy")
+            results[label] = (seconds, detected, _created(engine))
+            engine.dispose()
+    assert results["legacy"][2] == results["batch"][2], "batch and legacy created different defects"
+
+    print(f"{count} daily checklist rows x {len(CHECKS)} checks (SQLite)")
+    print(f"{'path':>8}{'defects':>9}{'seconds':>9}{'rows/s':>10}{'speedup':>9}")
+    base = results["legacy"][0]
+    for label, (seconds, detected, _) in results.items():
+        print(f"{label:>8}{detected:>9}{seconds:>9.2f}{count / seconds:>10.0f}{base / seconds:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.rows)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Benchmark rate-limit decisions across many distinct client keys.
+
+Replays ``--requests`` decisions over ``--keys`` distinct keys (1% of the keys
+take half the traffic, so those run past their limit) from ``--concurrency``
+tasks, and reports decisions/second for:
+
+* ``memory`` — the previous sliding-window limiter (timestamp list per key,
+               one global lock) against the GCRA ``InMemoryRateLimiter``;
+* ``redis``  — with ``--redis-url``: the previous four-command sorted-set
+               pipeline against the GCRA script, without and with local
+               leases (``--lease``), counting Redis round trips.
+
+The limit is ``--limit`` per hour, so no key refills during a run and every
+implementation must admit exactly ``min(requests, limit)`` per key; admissions
+are checked per key before timings are printed. Redis keys are written under a
+``bench:`` prefix and deleted afterwards.
+
+Usage:
+    python scripts/benchmarks/bench_rate_limiter.py --keys 10000 --requests 200000
+    python scripts/benchmarks/bench_rate_limiter.py --redis-url redis://localhost:6379/15 --lease 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.infrastructure.middleware.rate_limiter import InMemoryRateLimiter, RedisRateLimiter  # noqa: E402
+
+WINDOW = 3600
+
+
+class _SlidingWindowLimiter:
+    """The limiter this change replaced, kept here as the baseline."""
+
+    def __init__(self):
+        self._requests: dict[str, list[float]] = defaultdict(list)
+        self._lock = asyncio.Lock()
+
+    async def is_allowed(self, key: str, limit: int, window_seconds: int) -> tuple[bool, int, int]:
+        async with self._lock:
+            now = time.time()
+            window_start = now - window_seconds
+            self._requests[key] = [ts for ts in self._requests[key] if ts > window_start]
+            current_count = len(self._requests[key])
+            if current_count >= limit:
+                return False, 0, int(now)
+            self._requests[key].append(now)
+            return True, limit - current_count - 1, int(now)
+
+
+class _SortedSetLimiter:
+    """The previous Redis path: ZREMRANGEBYSCORE, ZCARD, ZADD, EXPIRE per call."""
+
+    def __init__(self, redis):
+        self._redis = redis
+
+    async def is_allowed(self, key: str, limit: int, window_seconds: int) -> tuple[bool, int, int]:
+        now = time.time()
+        redis_key = f"ratelimit:{key}"
+        pipe = self._redis.pipeline()
+        pipe.zremrangebyscore(redis_key, 0, now - window_seconds)
+        pipe.zcard(redis_key)
+        pipe.zadd(redis_key, {str(now): now})
+        pipe.expire(redis_key, window_seconds)
+        current_count = (await pipe.execute())[1]
+        if current_count >= limit:
+            return False, 0, int(now)
+        return True, limit - current_count - 1, int(now)
+
+
+def _workload(keys: int, requests: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    hot = max(1, keys // 100)
+    names = [f"bench:client-{n}" for n in range(keys)]
+    return [names[rng.randrange(hot)] if rng.random() < 0.5 else names[rng.randrange(keys)] for _ in range(requests)]
+
+
+async def _run(limiter, workload: list[str], limit: int, concurrency: int) -> tuple[float, Counter]:
+    admitted: Counter = Counter()
+    queue = iter(workload)
+
+    async def worker() -> None:
+        for key in queue:
+            allowed, _, _ = await limiter.is_allowed(key, limit, WINDOW)
+            if allowed:
+                admitted[key] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, admitted
+
+
+def _check(label: str, admitted: Counter, expected: dict[str, int]) -> None:
+    wrong = {key: (admitted[key], want) for key, want in expected.items() if admitted[key] != want}
+    assert not wrong, f"{label}: admissions differ for {len(wrong)} keys, e.g. {next(iter(wrong.items()))}"
+
+
+async def main(keys: int, requests: int, limit: int, concurrency: int, redis_url: str | None, lease: int) -> None:
+    workload = _workload(keys, requests, seed=42)
+    expected = {key: min(count, limit) for key, count in Counter(workload).items()}
+    print(f"{requests} decisions over {len(expected)} keys, limit {limit}/h, {concurrency} tasks")
+    print(f"{'limiter':>26}{'seconds':>10}{'decisions/s':>14}{'round trips':>14}")
+
+    runs: list[tuple[str, object]] = [("sliding window (memory)", _SlidingWindowLimiter())]
+    runs.append(("GCRA (memory)", InMemoryRateLimiter()))
+    client = None
+    if redis_url:
+        import redis.asyncio as redis
+
+        client = redis.from_url(redis_url)
+        runs.append(("sorted set (redis)", _SortedSetLimiter(client)))
+        for label, local_lease in (("GCRA (redis)", 0), (f"GCRA lease {lease} (redis)", lease)):
+            redis_limiter = RedisRateLimiter(redis_url, local_lease=local_lease)
+            await redis_limiter._get_redis()
+            runs.append((label, redis_limiter))
+
+    try:
+        for label, limiter in runs:
+            if client is not None:
+                await _clear(client)
+            calls = _count_round_trips(limiter, requests)
+            elapsed, admitted = await _run(limiter, workload, limit, concurrency)
+            _check(label, admitted, expected)
+            trips = str(calls[0]) if calls else "-"
+            print(f"{label:>26}{elapsed:>10.2f}{requests / elapsed:>14.0f}{trips:>14}")
+    finally:
+        if client is not None:
+            await _clear(client)
+            await client.aclose()
+
+
+def _count_round_trips(limiter, requests: int) -> list[int] | None:
+    """Count the limiter's Redis calls (one pipeline per decision for the sorted set)."""
+    if isinstance(limiter, _SortedSetLimiter):
+        return [requests]
+    if not isinstance(limiter, RedisRateLimiter):
+        return None
+    calls = [0]
+    script = limiter._script
+
+    async def counted_script(**kwargs):
+        calls[0] += 1
+        return await script(**kwargs)
+
+    limiter._script = counted_script
+    return calls
+
+
+async def _clear(client) -> None:
+    async for key in client.scan_iter(match="ratelimit:bench:*", count=1000):
+        await client.delete(key)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keys", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=100, help="requests per key per hour")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--redis-url", help="also benchmark the Redis limiters against this database")
+    parser.add_argument("--lease", type=int, default=8, help="local lease size for the leased Redis run")
+    args = parser.parse_args()
+    asyncio.run(main(args.keys, args.requests, args.limit, args.concurrency, args.redis_url, args.lease))
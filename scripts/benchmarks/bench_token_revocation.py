@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Benchmark per-request auth overhead of the token revocation check.
+
+Seeds ``--table-rows`` unexpired revocations (default 50k) into a SQLite
+``token_blacklist`` and issues ``--requests`` live access tokens plus
+``--revoked-requests`` revoked ones. Each request decodes its JWT and runs
+``ensure_access_token_not_revoked`` on one open session, as
+``get_current_user`` does:
+
+* ``decode`` — JWT decode only, the floor every mode pays;
+* ``table``  — no Redis configured: one ``token_blacklist`` lookup per request;
+* ``filter`` — the Redis store with its Bloom filter built from the table.
+               Live tokens are answered by the filter. Revoked tokens are
+               confirmed in Redis with ``--redis-url``; without it Redis is
+               unreachable and they fall back to the table.
+
+Every mode must reject exactly the revoked tokens before timings are printed.
+SQLite is in-process, so ``table`` here is a lower bound; against PostgreSQL
+each lookup also pays a network round trip.
+
+Usage:
+    python scripts/benchmarks/bench_token_revocation.py --requests 20000
+    python scripts/benchmarks/bench_token_revocation.py --redis-url redis://localhost:6379/15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional, cast
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import sqlalchemy as sa  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from src.core.security import create_access_token, decode_token, ensure_access_token_not_revoked  # noqa: E402
+from src.domain.exceptions import TokenRevokedError  # noqa: E402
+from src.domain.models.token_blacklist import TokenBlacklist  # noqa: E402
+from src.infrastructure.security import token_revocation  # noqa: E402
+from src.infrastructure.security.token_revocation import RedisTokenRevocationStore  # noqa: E402
+
+BLACKLIST = cast(sa.Table, TokenBlacklist.__table__)
+MODES = ("decode", "table", "filter")
+
+
+async def _seed(session_maker: async_sessionmaker, table_rows: int, revoked_jtis: list[str]) -> None:
+    expires_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(minutes=30)
+    jtis = [str(uuid.uuid4()) for _ in range(table_rows - len(revoked_jtis))] + revoked_jtis
+    async with session_maker() as db:
+        for start in range(0, len(jtis), 10_000):
+            await db.execute(
+                sa.insert(BLACKLIST),
+                [
+                    {"jti": jti, "user_id": 1, "expires_at": expires_at, "reason": "logout"}
+                    for jti in jtis[start : start + 10_000]
+                ],
+            )
+        await db.commit()
+
+
+async def _authenticate(token: str, db: AsyncSession, decode_only: bool) -> bool:
+    payload = decode_token(token)
+    assert payload is not None
+    if decode_only:
+        return False
+    try:
+        await ensure_access_token_not_revoked(payload, db)
+    except TokenRevokedError:
+        return True
+    return False
+
+
+async def _time(tokens: list[str], db: AsyncSession, decode_only: bool) -> tuple[float, int]:
+    started = time.perf_counter()
+    rejected = 0
+    for token in tokens:
+        rejected += await _authenticate(token, db, decode_only)
+    return (time.perf_counter() - started) / len(tokens) * 1e6, rejected
+
+
+async def _filter_store(
+    session_maker: async_sessionmaker, redis_url: Optional[str], revoked_jtis: list[str]
+) -> RedisTokenRevocationStore:
+    async def loader() -> list[str]:
+        async with session_maker() as db:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            return list(await db.scalars(sa.select(TokenBlacklist.jti).where(TokenBlacklist.expires_at > now)))
+
+    store = RedisTokenRevocationStore(redis_url or "redis://127.0.0.1:1/0", loader, refresh_seconds=3600)
+    await store.check("warm-up")  # binds the store to this loop and starts its listener
+    if redis_url:
+        deadline = time.monotonic() + 30
+        while not store.ready:
+            assert time.monotonic() < deadline, "filter was not built from the table within 30s"
+            await asyncio.sleep(0.05)
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+        for jti in revoked_jtis:
+            await store.revoke(jti, expires_at)
+    else:
+        logging.getLogger(token_revocation.__name__).setLevel(logging.ERROR)
+        await store.rebuild()
+    return store
+
+
+async def main(requests: int, revoked_requests: int, table_rows: int, redis_url: Optional[str]) -> None:
+    live = [create_access_token(subject=n) for n in range(requests)]
+    revoked = [create_access_token(subject=n) for n in range(revoked_requests)]
+    revoked_jtis = [str(cast(dict, decode_token(token))["jti"]) for token in revoked]
+
+    results: dict[str, tuple[float, float]] = {}
+    false_positives = 0
+    with tempfile.TemporaryDirectory() as scratch:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(scratch) / 'revocation.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(BLACKLIST.create)
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        await _seed(session_maker, table_rows, revoked_jtis)
+
+        for mode in MODES:
+            store = await _filter_store(session_maker, redis_url, revoked_jtis) if mode == "filter" else None
+            token_revocation._token_revocation_store = store
+            async with session_maker() as db:
+                await _authenticate(live[0], db, decode_only=False)  # warm the connection
+                live_us, live_rejected = await _time(live, db, decode_only=mode == "decode")
+                revoked_us, revoked_rejected = await _time(revoked, db, decode_only=mode == "decode")
+            if mode != "decode":
+                assert live_rejected == 0, f"{mode} rejected {live_rejected} live tokens"
+                assert revoked_rejected == len(revoked), f"{mode} let {len(revoked) - revoked_rejected} revoked through"
+            if store is not None:
+                filter_ = store._filter
+                assert filter_ is not None, "filter was dropped during the run"
+                false_positives = sum(str(cast(dict, decode_token(token))["jti"]) in filter_ for token in live)
+                await store.close()
+            token_revocation._token_revocation_store = None
+            results[mode] = (live_us, revoked_us)
+        await engine.dispose()
+
+    backend = "Redis" if redis_url else "no Redis (revoked tokens fall back to the table)"
+    print(f"{table_rows} revocations in SQLite; {requests} live + {revoked_requests} revoked requests; {backend}")
+    print(f"{'mode':>8}{'live us/req':>13}{'revoked us/req':>16}{'live overhead us':>18}")
+    floor = results["decode"][0]
+    for mode, (live_us, revoked_us) in results.items():
+        print(f"{mode:>8}{live_us:>13.1f}{revoked_us:>16.1f}{live_us - floor:>18.1f}")
+    print(f"filter false positives: {false_positives}/{requests} ({false_positives / requests:.3%})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--revoked-requests", type=int, default=1_000)
+    parser.add_argument("--table-rows", type=int, default=50_000)
+    parser.add_argument("--redis-url", help="measure revoked-token confirmation against a real Redis")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.revoked_requests, args.table_rows, args.redis_url))
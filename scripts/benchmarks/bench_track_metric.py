@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Benchmark ``track_metric`` against the per-call instrument lookup it replaced.
+
+Makes ``--calls`` metric calls (default 1M) in the mix global search produces:
+per request a ``search.query`` with a module tag, a bare ``search.executed``,
+one ``search.module_latency_ms`` sample per module, plus a mapped business
+counter. Each implementation reports into its own OpenTelemetry meter
+provider with an in-memory reader, and times:
+
+* ``legacy``   — the previous function: the name -> instrument dict rebuilt on
+                 every call and ``create_counter`` for every unmapped name;
+* ``registry`` — ``track_metric`` on the instrument registry;
+* ``bound``    — the same series through ``metric_registry.bind`` handles.
+
+Collected totals must match across the three before timings are printed
+(latencies are whole milliseconds so the legacy counter and the histogram
+sum agree).
+
+Usage:
+    python scripts/benchmarks/bench_track_metric.py --calls 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from opentelemetry.sdk.metrics import MeterProvider  # noqa: E402
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader  # noqa: E402
+
+from src.infrastructure.monitoring.azure_monitor import METRIC_SPECS  # noqa: E402
+from src.infrastructure.monitoring.metric_registry import BoundMetric, MetricRegistry  # noqa: E402
+
+MODULES = ("incidents", "audits", "risks", "documents")
+# Names the previous track_metric mapped to instruments created at startup.
+_LEGACY_MAPPED = (
+    "incidents.created incidents.resolved audits.completed audits.findings capa.created capa.closed "
+    "complaints.created risks.created auth.login auth.logout documents.uploaded workflows.completed "
+    "api.error_rate_5xx cache.miss_rate db.pool_usage_percent celery.task_failures celery.queue_depth auth.failures"
+).split()
+
+
+def _workload(calls: int) -> list[tuple[str, float, dict[str, str] | None]]:
+    per_request = [("search.query", 1.0, {"module": "all"}), ("search.executed", 1.0, None)]
+    per_request += [
+        ("search.module_latency_ms", float(3 + n), {"module": module, "outcome": "ok"})
+        for n, module in enumerate(MODULES)
+    ]
+    per_request.append(("incidents.created", 1.0, None))
+    return [per_request[n % len(per_request)] for n in range(calls)]
+
+
+def _legacy_track_metric(meter, mapped: dict):
+    def track_metric(name: str, value: float = 1.0, tags: dict[str, str] | None = None) -> None:
+        metric_map = {key: mapped.get(key) for key in _LEGACY_MAPPED}
+        counter = metric_map.get(name)
+        if counter:
+            counter.add(int(value), attributes=tags or {})
+        else:
+            dynamic = meter.create_counter(name, description=f"Dynamic metric: {name}")
+            dynamic.add(int(value), attributes=tags or {})
+
+    return track_metric
+
+
+def _collect(reader: InMemoryMetricReader) -> dict[tuple[str, frozenset], float]:
+    totals: dict[tuple[str, frozenset], float] = {}
+    data = reader.get_metrics_data()
+    assert data is not None
+    for resource_metrics in data.resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                for point in metric.data.data_points:
+                    value: float = getattr(point, "sum" if hasattr(point, "bucket_counts") else "value")
+                    totals[(metric.name, frozenset((point.attributes or {}).items()))] = value
+    return totals
+
+
+def main(calls: int) -> None:
+    # The SDK warns on every duplicate create_counter the legacy path makes.
+    logging.disable(logging.WARNING)
+    workload = _workload(calls)
+    results = {}
+
+    reader = InMemoryMetricReader()
+    meter = MeterProvider(metric_readers=[reader]).get_meter("bench")
+    legacy = _legacy_track_metric(meter, {name: meter.create_counter(name) for name in _LEGACY_MAPPED})
+    started = time.perf_counter()
+    for name, value, tags in workload:
+        legacy(name, value, tags)
+    results["legacy"] = (time.perf_counter() - started, _collect(reader))
+
+    reader = InMemoryMetricReader()
+    registry = MetricRegistry(METRIC_SPECS)
+    registry.bind_meter(MeterProvider(metric_readers=[reader]).get_meter("bench"))
+    started = time.perf_counter()
+    for name, value, tags in workload:
+        registry.add(name, value, tags)
+    results["registry"] = (time.perf_counter() - started, _collect(reader))
+
+    reader = InMemoryMetricReader()
+    registry = MetricRegistry(METRIC_SPECS)
+    registry.bind_meter(MeterProvider(metric_readers=[reader]).get_meter("bench"))
+    handles: dict[tuple[str, tuple], BoundMetric] = {}
+    bound = []
+    for name, value, tags in workload:
+        key = (name, tuple(sorted((tags or {}).items())))
+        if key not in handles:
+            handles[key] = registry.bind(name, **(tags or {}))
+        bound.append((handles[key], value))
+    started = time.perf_counter()
+    for handle, value in bound:
+        handle.add(value)
+    results["bound"] = (time.perf_counter() - started, _collect(reader))
+
+    expected = results["legacy"][1]
+    for label, (_, totals) in results.items():
+        assert totals == expected, f"{label} totals differ from legacy"
+
+    print(f"{calls} track_metric calls, {len(expected)} series")
+    print(f"{'path':>10}{'seconds':>10}{'ns/call':>10}{'speedup':>10}")
+    base = results["legacy"][0]
+    for label, (elapsed, _) in results.items():
+        print(f"{label:>10}{elapsed:>10.2f}{elapsed / calls * 1e9:>10.0f}{base / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    args = parser.parse_args()
+    main(args.calls)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Benchmark the Training Matrix board summary on a full-size workforce.
+
+Generates ``--people`` x ``--courses`` compliance rows the way
+``_build_compliance_rows`` does (``evaluate_compliance`` per cell, then
+``TrainingMatrixComplianceRow.model_dump``) and times:
+
+* ``rows``        — building those rows, which the per-import snapshot cache
+                    skips on every view after the first;
+* ``multi-pass``  — the board payload composed from ``compute_module_role_stats``,
+                    ``compute_people_fully_ok_stats``, ``compute_horizon_counts``
+                    and ``top_overdue_courses``, as the summary route used to;
+* ``single-pass`` — ``build_board_summary`` (one ``BoardSnapshot`` pass);
+* ``snapshot``    — ``BoardSnapshot.summary`` for a later day from a snapshot
+                    built once with ``redate=True``, i.e. a cache hit.
+
+The three payloads are checked for equality (the snapshot against rows
+re-evaluated on the later day) before timings are printed.
+
+Usage:
+    python scripts/benchmarks/bench_training_matrix_board.py --people 2000 --courses 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.api.schemas.training_matrix import TrainingMatrixComplianceRow  # noqa: E402
+from src.domain.services.training_matrix_board import (  # noqa: E402
+    BoardSnapshot,
+    build_board_summary,
+    compute_horizon_counts,
+    compute_module_role_stats,
+    compute_people_fully_ok_stats,
+    top_overdue_courses,
+)
+from src.domain.services.training_matrix_compliance import (  # noqa: E402
+    ATLAS_HUB_URL,
+    ComplianceInput,
+    evaluate_compliance,
+)
+
+DEPARTMENTS = ["Mobile Engineers", "Workshop", "Head Office", "Senior Management", "Sales"]
+ATLAS = ["Passed", "Passed", "Passed", "Pending", "Failed", None]
+
+
+def _cells(people: int, courses: int, today: date, rng: random.Random) -> list[tuple]:
+    cells = []
+    for p in range(people):
+        department = rng.choice(DEPARTMENTS)
+        for c in range(courses):
+            atlas = rng.choice(ATLAS)
+            passed = today - timedelta(days=rng.randint(0, 4 * 365)) if atlas == "Passed" else None
+            cells.append((p, department, c, rng.choice((1, 2, 3)), atlas, passed))
+    return cells
+
+
+def _rows(cells: list[tuple], today: date) -> list[dict]:
+    rows = []
+    for p, department, c, frequency, atlas, passed in cells:
+        result = evaluate_compliance(
+            ComplianceInput(
+                course_key=f"course-{c}",
+                course_display_name=f"Course {c}",
+                frequency_years=frequency,
+                atlas_status=atlas,
+                passed_on=passed,
+                expires_on=None,
+            ),
+            today=today,
+        )
+        rows.append(
+            TrainingMatrixComplianceRow(
+                person_id=p,
+                atlas_name=f"Person {p:05d}",
+                department=department,
+                course_key=result.course_key,
+                course_display_name=result.course_display_name,
+                frequency_years=result.frequency_years,
+                status=result.status,
+                atlas_status=result.atlas_status,
+                passed_on=result.passed_on,
+                expires_on=result.expires_on,
+                qgp_due_on=result.qgp_due_on,
+                expiry_without_passed=result.expiry_without_passed,
+                atlas_hub_url=ATLAS_HUB_URL,
+            ).model_dump()
+        )
+    return rows
+
+
+def _multi_pass(rows: list[dict], today: date) -> dict:
+    return {
+        "module_ok": compute_module_role_stats(rows),
+        "people_fully_ok": compute_people_fully_ok_stats(rows),
+        "horizons": compute_horizon_counts(rows, today=today),
+        "top_overdue_courses": top_overdue_courses(rows, today=today),
+        "required_row_count": len(rows),
+        "person_count": len({str(r["atlas_name"]) for r in rows if r.get("atlas_name")}),
+    }
+
+
+def _best(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main(people: int, courses: int, repeat: int, seed: int) -> None:
+    today = date.today()
+    later = today + timedelta(days=3)
+    cells = _cells(people, courses, today, random.Random(seed))
+
+    row_seconds, rows = _best(lambda: _rows(cells, today), 1)
+    later_rows = _rows(cells, later)
+    snapshot = BoardSnapshot.from_rows(rows, redate=True)
+
+    old_seconds, old = _best(lambda: _multi_pass(rows, today), repeat)
+    new_seconds, new = _best(lambda: build_board_summary(rows, today=today), repeat)
+    hot_seconds, hot = _best(lambda: snapshot.summary(later), repeat)
+    assert old == new, "single-pass payload differs from the per-metric functions"
+    assert hot == build_board_summary(later_rows, today=later), "re-dated snapshot differs from a rebuild"
+
+    print(f"{people} people x {courses} courses = {len(rows)} rows; best of {repeat}")
+    print(f"{'rows':>12}: {row_seconds * 1000:10.1f} ms  (skipped on a snapshot hit)")
+    print(f"{'multi-pass':>12}: {old_seconds * 1000:10.1f} ms")
+    print(f"{'single-pass':>12}: {new_seconds * 1000:10.1f} ms")
+    print(f"{'snapshot':>12}: {hot_seconds * 1000:10.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--people", type=int, default=2000)
+    parser.add_argument("--courses", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=37)
+    args = parser.parse_args()
+    main(args.people, args.courses, args.repeat, args.seed)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Benchmark a 12-widget analytics dashboard through the widget query engine.
+
+Seeds an on-disk SQLite database with synthetic incidents, audit runs and
+register risks for several tenants over ~2 years, then evaluates a 12-widget
+dashboard (counts, rates, averages, group-bys and a filtered percentage across
+30/90/365-day periods) three ways:
+
+* ``per-widget`` — one statement per widget, as a dashboard that fetched each
+                   tile from ``/widgets/{id}/data`` with a cold cache would;
+* ``batched``    — ``WidgetQueryEngine.evaluate_many`` with a cold cache: one
+                   ``UNION ALL`` statement for the whole dashboard;
+* ``cached``     — the same call again with the cache warm.
+
+Per-widget and batched payloads are checked for equality before timing is
+reported. Statement counts are what matters on PostgreSQL, where each round
+trip costs far more than it does against a local SQLite file.
+
+Usage:
+    python scripts/benchmarks/bench_widget_dashboard.py --rows 200000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import event, insert  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from src.domain.models.audit import AuditRun  # noqa: E402
+from src.domain.models.incident import Incident  # noqa: E402
+from src.domain.models.risk_register import EnterpriseRisk  # noqa: E402
+from src.domain.services.widget_query_engine import WidgetQueryEngine  # noqa: E402
+from src.infrastructure.cache.redis_cache import InMemoryCache  # noqa: E402
+
+TENANT_ID = 1
+SEVERITIES = ["critical", "high", "medium", "low", "negligible"]
+STATUSES = ["reported", "under_investigation", "actions_in_progress", "closed"]
+CATEGORIES = ["operational", "strategic", "financial", "compliance", "safety"]
+
+
+def _w(data_source: str, aggregation: str = "count", metric: str = "count", group_by=None, filters=None):
+    return SimpleNamespace(
+        data_source=data_source, aggregation=aggregation, metric=metric, group_by=group_by, filters=filters
+    )
+
+
+DASHBOARD = [
+    _w("incidents"),
+    _w("incidents", "rate"),
+    _w("incidents", group_by="severity"),
+    _w("incidents", group_by="status"),
+    _w("incidents", "percentage", filters={"severity": ["critical", "high"]}),
+    _w("incidents", filters={"status": "closed"}),
+    _w("audits"),
+    _w("audits", "average", "score_percentage"),
+    _w("audits", "min", "score_percentage", group_by="location"),
+    _w("risks", group_by="category"),
+    _w("risks", "average", "residual_score"),
+    _w("risks", "max", "inherent_score", group_by="department"),
+]
+
+
+async def _seed(conn, rows: int, rng: random.Random, now: datetime) -> None:
+    def when() -> datetime:
+        return now - timedelta(seconds=rng.randint(0, 730 * 86400))
+
+    for model in (Incident, AuditRun, EnterpriseRisk):
+        await conn.run_sync(model.__table__.create)
+    incidents, audits, risks = [], [], []
+    for n in range(rows):
+        occurred = when()
+        incidents.append(
+            {
+                "tenant_id": rng.randint(1, 4),
+                "reference_number": f"INC-{n:07d}",
+                "title": "-",
+                "description": "-",
+                "incident_type": "other",
+                "severity": rng.choice(SEVERITIES),
+                "status": rng.choice(STATUSES),
+                "department": f"Dept {rng.randint(1, 12)}",
+                "incident_date": occurred,
+                "reported_date": occurred,
+                "created_at": occurred,
+                "updated_at": occurred,
+                "deleted_at": now if rng.random() < 0.03 else None,
+            }
+        )
+        if n % 4 == 0:
+            audits.append(
+                {
+                    "tenant_id": rng.randint(1, 4),
+                    "template_id": 1,
+                    "reference_number": f"AUD-{n:07d}",
+                    "status": "completed",
+                    "location": f"Site {rng.randint(1, 20)}",
+                    "completed_at": when(),
+                    "score_percentage": None if rng.random() < 0.1 else rng.uniform(40, 100),
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+        if n % 8 == 0:
+            likelihood, impact = rng.randint(1, 5), rng.randint(1, 5)
+            risks.append(
+                {
+                    "tenant_id": rng.randint(1, 4),
+                    "reference": f"RSK-{n:07d}",
+                    "title": "-",
+                    "description": "-",
+                    "category": rng.choice(CATEGORIES),
+                    "department": f"Dept {rng.randint(1, 12)}",
+                    "inherent_likelihood": likelihood,
+                    "inherent_impact": impact,
+                    "inherent_score": likelihood * impact,
+                    "residual_likelihood": max(1, likelihood - 1),
+                    "residual_impact": impact,
+                    "residual_score": max(1, likelihood - 1) * impact,
+                    "status": "identified",
+                    "identified_date": when().replace(tzinfo=None),
+                    "created_at": now.replace(tzinfo=None),
+                }
+            )
+        for model, batch in ((Incident, incidents), (AuditRun, audits), (EnterpriseRisk, risks)):
+            if len(batch) >= 20000:
+                await conn.execute(insert(model), batch)
+                batch.clear()
+    for model, batch in ((Incident, incidents), (AuditRun, audits), (EnterpriseRisk, risks)):
+        if batch:
+            await conn.execute(insert(model), batch)
+
+
+async def _timed(fn, repeat: int, statements: list[str]):
+    best, result, issued = float("inf"), None, 0
+    for _ in range(repeat):
+        statements.clear()
+        started = time.perf_counter()
+        result = await fn()
+        best = min(best, time.perf_counter() - started)
+        issued = sum(1 for sql in statements if sql.lstrip().upper().startswith("SELECT"))
+    return best, result, issued
+
+
+async def main(rows: int, repeat: int, seed: int) -> None:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/widgets.db")
+        async with engine.begin() as conn:
+            await _seed(conn, rows, rng, now)
+        statements: list[str] = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+        print(f"{rows} incidents, {rows // 4} audits, {rows // 8} risks over ~2 years, 4 tenants")
+        print(f"{len(DASHBOARD)}-widget dashboard; best of {repeat}")
+        print(
+            f"{'period':>8}{'per-widget ms':>15}{'stmts':>7}{'batched ms':>12}{'stmts':>7}{'cached ms':>11}{'stmts':>7}"
+        )
+        async with factory() as db:
+            for period in (30, 90, 365):
+
+                async def per_widget():
+                    out = []
+                    for widget in DASHBOARD:
+                        cold = WidgetQueryEngine(db, TENANT_ID, cache=InMemoryCache(), now=now)
+                        out.append(await cold.evaluate(widget, period))
+                    return out
+
+                async def batched():
+                    cold = WidgetQueryEngine(db, TENANT_ID, cache=InMemoryCache(), now=now)
+                    return await cold.evaluate_many(DASHBOARD, period)
+
+                warm_cache = InMemoryCache()
+                await WidgetQueryEngine(db, TENANT_ID, cache=warm_cache, now=now).evaluate_many(DASHBOARD, period)
+
+                async def cached():
+                    return await WidgetQueryEngine(db, TENANT_ID, cache=warm_cache, now=now).evaluate_many(
+                        DASHBOARD, period
+                    )
+
+                old_seconds, old, old_stmts = await _timed(per_widget, repeat, statements)
+                new_seconds, new, new_stmts = await _timed(batched, repeat, statements)
+                hot_seconds, hot, hot_stmts = await _timed(cached, repeat, statements)
+                assert old == new == hot, "widget payloads differ"
+                assert all(payload["status"] == "measured" for payload in new), new
+                print(
+                    f"{period:>7}d{old_seconds * 1000:>15.1f}{old_stmts:>7}{new_seconds * 1000:>12.1f}{new_stmts:>7}"
+                    f"{hot_seconds * 1000:>11.2f}{hot_stmts:>7}"
+                )
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=36)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat, args.seed))
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Rebuild or check the ``pending_decisions`` approver-inbox projection.
+
+The projection is maintained on every ORM flush that touches an investigation
+review, a document approval or a signature request. Writes that bypass the
+session — raw SQL, a bulk import, a restore — are invisible to that listener, and
+so is everything written before the table existed. This puts it right.
+
+  --check   compare each tenant's projection with the domains (rows and the
+            per-user inbox the live readers build) and report drift; writes
+            nothing. Exit status 1 when any tenant has drifted.
+  --apply   drop and re-project, one transaction per tenant.
+
+With neither flag the script only reports what a rebuild would write.
+
+Usage:
+    python -m scripts.maintenance.rebuild_pending_decisions                 # report only
+    python -m scripts.maintenance.rebuild_pending_decisions --check         # drift report
+    python -m scripts.maintenance.rebuild_pending_decisions --apply         # rebuild every tenant
+    python -m scripts.maintenance.rebuild_pending_decisions --apply --tenant 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import select
+
+from src.domain.models.tenant import Tenant
+from src.domain.services.approvals_inbox_projection import (
+    DEFAULT_CHECK_USERS,
+    check_pending_decisions,
+    rebuild_pending_decisions,
+)
+from src.infrastructure.database import async_session_maker
+
+
+async def _tenant_ids(requested: int | None) -> list[int]:
+    if requested is not None:
+        return [requested]
+    async with async_session_maker() as db:
+        return list((await db.execute(select(Tenant.id).order_by(Tenant.id))).scalars().all())
+
+
+async def _check(tenant_ids: list[int], max_users: int) -> int:
+    drifted = 0
+    for tenant_id in tenant_ids:
+        async with async_session_maker() as db:
+            drift = await check_pending_decisions(db, tenant_id=tenant_id, max_users=max_users)
+        if drift.is_consistent:
+            print(f"  tenant {tenant_id}: consistent ({drift.users_checked} inbox(es) compared)")
+            continue
+        drifted += 1
+        print(
+            f"  tenant {tenant_id}: DRIFT — {len(drift.missing)} missing row(s), "
+            f"{len(drift.unexpected)} unexpected row(s), "
+            f"{len(drift.reader_mismatches)} of {drift.users_checked} inbox(es) differ"
+        )
+        if drift.reader_mismatches:
+            print(f"    users: {list(drift.reader_mismatches[:20])}")
+    if drifted:
+        print(f"  {drifted} tenant(s) drifted — run with --apply to rebuild")
+    return 1 if drifted else 0
+
+
+async def _rebuild(tenant_ids: list[int], *, apply: bool) -> int:
+    for tenant_id in tenant_ids:
+        async with async_session_maker() as db:
+            written = await rebuild_pending_decisions(db, tenant_id=tenant_id)
+            if apply:
+                await db.commit()
+            else:
+                await db.rollback()
+        print(f"  tenant {tenant_id}: {written} row(s){'' if apply else ' (not written)'}")
+    if not apply:
+        print("  DRY RUN — pass --apply to write the projection")
+    return 0
+
+
+async def _run(args: argparse.Namespace) -> int:
+    tenant_ids = await _tenant_ids(args.tenant)
+    if args.check:
+        return await _check(tenant_ids, args.max_users)
+    return await _rebuild(tenant_ids, apply=args.apply)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--apply", action="store_true", help="rebuild and commit the projection")
+    mode.add_argument("--check", action="store_true", help="report drift between projection and domains")
+    parser.add_argument("--tenant", type=int, default=None, help="limit to one tenant id")
+    parser.add_argument(
+        "--max-users",
+        type=int,
+        default=DEFAULT_CHECK_USERS,
+        help="approvers per tenant whose inbox --check reads both ways",
+    )
+    args = parser.parse_args()
+    try:
+        return asyncio.run(_run(args))
+    except Exception as exc:  # noqa: BLE001 — script entrypoint
+        print(f"[rebuild_pending_decisions] failed: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
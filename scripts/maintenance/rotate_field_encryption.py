@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Re-encrypt every ``EncryptedString`` column under the newest field key.
+
+Put the new key first in ``FIELD_ENCRYPTION_KEY`` (``new,old``) and deploy, so
+the application writes under it and still reads the old values; then run this
+to rewrite the old values. The old key may be dropped from the list once a
+fresh run (no ``--state``) finds nothing to rotate and nothing unreadable.
+
+Tables are walked in primary-key batches while the application is live. Progress
+is written to ``--state`` after every committed batch; running again with the
+same file resumes after the last one, and a finished run is a no-op. Starting
+over without the file is also safe, just slower: values already under the new
+key are recognised and left alone.
+
+Usage:
+    python -m scripts.maintenance.rotate_field_encryption --state rotation.json
+    python -m scripts.maintenance.rotate_field_encryption --state rotation.json --workers 8 --batch-size 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import sys
+from pathlib import Path
+
+from src.infrastructure.encryption.key_rotation import (
+    RotationProgress,
+    discover_encrypted_columns,
+    rotate_encrypted_columns,
+)
+
+
+def _load_models():
+    import src.domain.models as models_pkg
+
+    for _, name, _ in pkgutil.iter_modules(models_pkg.__path__):
+        importlib.import_module(f"src.domain.models.{name}")
+    from src.domain.models.base import Base
+
+    return Base.metadata
+
+
+def _load_state(path: Path | None) -> dict[str, RotationProgress]:
+    if path is None or not path.exists():
+        return {}
+    return {name: RotationProgress.from_dict(data) for name, data in json.loads(path.read_text()).items()}
+
+
+def _saver(path: Path | None, progress: dict[str, RotationProgress]):
+    def save(table: RotationProgress) -> None:
+        print(
+            f"  {table.table}: {table.rows_scanned} rows, {table.rows_per_second} rows/s, "
+            f"{table.counts}{' (done)' if table.done else ''}",
+            flush=True,
+        )
+        if path is None:
+            return
+        scratch = path.with_suffix(path.suffix + ".tmp")
+        scratch.write_text(json.dumps({name: state.to_dict() for name, state in progress.items()}, indent=2))
+        os.replace(scratch, path)
+
+    return save
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--state", type=Path, help="progress file to resume from and write to")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Fernet processes (0 = in process)")
+    args = parser.parse_args()
+
+    from src.infrastructure.database import sync_engine
+
+    metadata = _load_models()
+    columns = discover_encrypted_columns(metadata)
+    if not columns:
+        print("No EncryptedString columns are declared; nothing to rotate.")
+        return 0
+    for table, table_columns in columns.items():
+        print(f"{table.name}: {', '.join(column.name for column in table_columns)}")
+
+    progress = _load_state(args.state)
+    rotate_encrypted_columns(
+        sync_engine,
+        metadata,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        progress=progress,
+        on_batch=_saver(args.state, progress),
+    )
+    unreadable = sum(state.counts.get("unreadable", 0) for state in progress.values())
+    if unreadable:
+        print(f"{unreadable} value(s) open under no configured key; keep the old keys until they are resolved.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
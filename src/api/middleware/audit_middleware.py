@@ -2,15 +2,17 @@
 Audit Logging Middleware for FastAPI.
 
 Automatically logs all mutating requests (POST, PUT, PATCH, DELETE) to the audit log
-with PII masking, hash chain integrity, and asynchronous background processing.
+with PII masking and hash chain integrity, written after the response is sent.
 """
 
 import json
 import logging
 from typing import Any, Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.middleware import buffered_receive
 
 logger = logging.getLogger(__name__)
 
@@ -81,19 +83,18 @@ def _mask_pii(data: Any) -> Any:
         return data
 
 
-async def _get_request_body(request: Request) -> Optional[dict]:
+def _parse_request_body(body: bytes) -> Optional[dict]:
     """
-    Safely read and parse request body as JSON.
+    Safely parse a request body as JSON.
 
-    Returns None if body cannot be read or parsed.
+    Returns None if the body is empty or cannot be parsed.
     """
+    if not body:
+        return None
     try:
-        body = await request.body()
-        if not body:
-            return None
         return json.loads(body)
-    except (json.JSONDecodeError, ValueError, RuntimeError):
-        # Body might not be JSON or might have been consumed
+    except (json.JSONDecodeError, ValueError):
+        # Body might not be JSON
         return None
 
 
@@ -145,7 +146,7 @@ def _get_user_info(request: Request) -> tuple[Optional[int], Optional[int]]:
 
 async def _log_audit_entry(
     request: Request,
-    response: Response,
+    status_code: int,
     user_id: Optional[int],
     tenant_id: Optional[int],
     request_body: Optional[dict],
@@ -153,7 +154,7 @@ async def _log_audit_entry(
     """
     Log an audit entry asynchronously using the audit log service.
 
-    This function runs in a background task and should not block the request.
+    Runs once the response has been sent, so it never delays the client.
     """
     try:
         # Conditional import to avoid circular dependencies
@@ -164,7 +165,7 @@ async def _log_audit_entry(
         from src.infrastructure.database import async_session_maker
 
         # If we have user_id but no tenant_id, try to get it from database
-        # This is OK in background task since it doesn't block the response
+        # This is OK here since the response has already been sent
         if user_id and not tenant_id:
             try:
                 async with async_session_maker() as session:
@@ -254,7 +255,7 @@ async def _log_audit_entry(
                     metadata={
                         "endpoint": request.url.path,
                         "method": method,
-                        "status_code": response.status_code,
+                        "status_code": status_code,
                         "query_params": (dict(request.query_params) if request.query_params else None),
                     },
                     action_category="api_request",
@@ -278,7 +279,7 @@ async def _log_audit_entry(
                     metadata={
                         "endpoint": request.url.path,
                         "method": method,
-                        "status_code": response.status_code,
+                        "status_code": status_code,
                         "query_params": (dict(request.query_params) if request.query_params else None),
                     },
                     action_category="api_request",
@@ -301,7 +302,7 @@ async def _log_audit_entry(
                     metadata={
                         "endpoint": request.url.path,
                         "method": method,
-                        "status_code": response.status_code,
+                        "status_code": status_code,
                         "query_params": (dict(request.query_params) if request.query_params else None),
                     },
                     action_category="api_request",
@@ -322,7 +323,7 @@ async def _log_audit_entry(
         )
 
 
-class AuditLoggingMiddleware(BaseHTTPMiddleware):
+class AuditLoggingMiddleware:
     """
     Middleware to automatically log all mutating requests to the audit log.
 
@@ -330,52 +331,52 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
     - Only logs POST/PUT/PATCH/DELETE requests
     - Skips health check and auth paths
     - Masks PII fields in request bodies
-    - Logs asynchronously using background tasks
+    - Logs after the response has been sent
     - Uses hash chain for tamper-proofing
     - Never fails the request if logging fails
     """
 
-    async def dispatch(self, request: Request, call_next):
-        # Only process mutating methods
-        if request.method not in MUTATING_METHODS:
-            return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Only process mutating methods; skip health check and auth paths
+        if scope["type"] != "http" or scope["method"] not in MUTATING_METHODS or _should_skip_path(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        # Read request body before it's consumed; the handler gets a replay
+        body, receive = await buffered_receive(receive)
+        request_body = _parse_request_body(body)
 
-        # Skip health check and auth paths
-        if _should_skip_path(request.url.path):
-            return await call_next(request)
+        status_code = 500
 
-        # Read request body before it's consumed
-        request_body = await _get_request_body(request)
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         # Process the request
-        response = await call_next(request)
+        await self.app(scope, receive, send_with_status)
 
         # Only log successful requests (2xx, 3xx) or client errors (4xx)
         # Skip server errors (5xx) as they might indicate system issues
-        if response.status_code >= 500:
-            return response
+        if status_code >= 500:
+            return
 
         # Get user info from request state or JWT
+        request = Request(scope)
         user_id, tenant_id = _get_user_info(request)
 
         # Skip if no tenant_id (unauthenticated requests)
         if not tenant_id:
-            return response
-
-        # Log audit entry in background task
-        # Use background task to avoid blocking the response
-        from starlette.background import BackgroundTask
+            return
 
-        background_task = BackgroundTask(
-            _log_audit_entry,
-            request=request,
-            response=response,
+        await _log_audit_entry(
+            request,
+            status_code=status_code,
             user_id=user_id,
             tenant_id=tenant_id,
             request_body=request_body,
         )
-
-        # Attach background task to response
-        response.background = background_task
-
-        return response
@@ -18,9 +18,11 @@ from typing import Optional
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.core.config import settings
+from src.core.middleware import buffered_receive
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +108,16 @@ def _make_key(idempotency_key: str, tenant_fingerprint: str, method: str, path:
 
 _IDEMPOTENT_METHODS = {"POST", "PUT", "PATCH"}
 _IDEMPOTENCY_TTL_S = 86400  # 24 hours
+_HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+}
 _IN_FLIGHT_POLL_ATTEMPTS = 25
 _IN_FLIGHT_POLL_INTERVAL_S = 0.2
 
@@ -177,7 +189,108 @@ async def _wait_for_cached_response(
     return None
 
 
-class IdempotencyMiddleware(BaseHTTPMiddleware):
+async def _claim_or_replay(
+    redis_client,
+    redis_key: str,
+    payload_hash: str,
+    idempotency_key: str,
+) -> tuple[Optional[Response], bool]:
+    """Check the cache and claim the key.
+
+    Returns ``(replay, claimed)``: ``replay`` is a response to send instead of
+    running the handler; ``claimed`` says whether this request holds the claim.
+    """
+    claimed = False
+    try:
+        cached_response = await _parse_cached(redis_client, redis_key)
+        if cached_response:
+            if cached_response.get("payload_hash") != payload_hash:
+                logger.warning(
+                    f"Idempotency key conflict: {idempotency_key}",
+                    extra={"idempotency_key": idempotency_key},
+                )
+                return _conflict_response(idempotency_key), False
+
+            if cached_response.get("status") == "processing":
+                waited = await _wait_for_cached_response(redis_client, redis_key, payload_hash, idempotency_key)
+                if waited is not None:
+                    return waited, False
+                # Timed out waiting — fall through without a second create if claim fails
+            elif "body" in cached_response and "status_code" in cached_response:
+                logger.debug(f"Idempotency cache hit: {idempotency_key}")
+                return _response_from_cache(cached_response), False
+
+        # Claim the key before executing so concurrent retries cannot double-create
+        placeholder = json.dumps({"status": "processing", "payload_hash": payload_hash}).encode("utf-8")
+        claimed = await redis_client.set(redis_key, placeholder, nx=True, ex=_IDEMPOTENCY_TTL_S)
+        if not claimed:
+            cached_response = await _parse_cached(redis_client, redis_key)
+            if cached_response:
+                if cached_response.get("payload_hash") != payload_hash:
+                    return _conflict_response(idempotency_key), False
+                if "body" in cached_response and "status_code" in cached_response:
+                    return _response_from_cache(cached_response), False
+                if cached_response.get("status") == "processing":
+                    waited = await _wait_for_cached_response(redis_client, redis_key, payload_hash, idempotency_key)
+                    if waited is not None:
+                        return waited, False
+
+    except Exception as e:
+        logger.warning(f"Idempotency middleware: Error reading from Redis: {e}")
+        # Fall through to process request normally
+    return None, bool(claimed)
+
+
+async def _store_response(
+    redis_client,
+    redis_key: str,
+    start: Message,
+    response_body: bytes,
+    payload_hash: str,
+    idempotency_key: str,
+    claimed: bool,
+) -> None:
+    """Cache a completed response for 24h; on failure release our claim so retries can proceed."""
+    try:
+        # Collect response headers (excluding hop-by-hop headers)
+        response_headers = {
+            k: v for k, v in Headers(raw=start.get("headers", [])).items() if k.lower() not in _HOP_BY_HOP_HEADERS
+        }
+
+        # Decode body to string for storage (handle both text and binary)
+        try:
+            body_str = response_body.decode("utf-8")
+        except UnicodeDecodeError:
+            body_str = _base64.b64encode(response_body).decode("utf-8")
+            response_headers["X-Idempotency-Body-Encoding"] = "base64"
+
+        # Store in Redis with 24h TTL (86400 seconds)
+        cache_data = {
+            "body": body_str,
+            "status_code": start["status"],
+            "headers": response_headers,
+            "payload_hash": payload_hash,
+        }
+
+        await redis_client.setex(
+            redis_key,
+            _IDEMPOTENCY_TTL_S,
+            json.dumps(cache_data).encode("utf-8"),
+        )
+
+        logger.debug(f"Idempotency response cached: {idempotency_key}")
+
+    except Exception as e:
+        logger.warning(f"Idempotency middleware: Error caching response: {e}")
+        # If we held the in-flight claim but failed to cache, release it so retries can proceed
+        if claimed:
+            try:
+                await redis_client.delete(redis_key)
+            except Exception:
+                pass
+
+
+class IdempotencyMiddleware:
     """
     Middleware to handle idempotency keys for mutating requests.
 
@@ -189,146 +302,65 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
     - If not found, executes request and caches response with 24h TTL
     - Skips GET/DELETE/OPTIONS/HEAD requests
     - Falls back gracefully if Redis is unavailable
+
+    Only keyed requests are buffered: their response is held until the body is
+    complete, cached, and then sent whole, as a replay would be.
     """
 
-    async def dispatch(self, request: Request, call_next):  # noqa: C901
-        if request.method not in _IDEMPOTENT_METHODS:
-            return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in _IDEMPOTENT_METHODS:
+            await self.app(scope, receive, send)
+            return
 
         # Check for Idempotency-Key header
+        request = Request(scope)
         idempotency_key = request.headers.get("Idempotency-Key")
         if not idempotency_key:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Get Redis connection (may be None if unavailable)
         redis_client = await _get_redis()
         if redis_client is None:
             # Redis unavailable - process request normally
             logger.debug("Idempotency middleware: Redis unavailable, processing request normally")
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
-        # Read request body to compute hash
-        # Note: We need to read the body, but FastAPI/Starlette only allows reading once
-        # So we'll read it, store it, and create a new request with the body
-        body_bytes = await request.body()
-
-        # Compute payload hash
+        # Read the request body to compute its hash; the handler gets a replay
+        body_bytes, receive = await buffered_receive(receive)
         payload_hash = _compute_payload_hash(body_bytes)
 
         # Build tenant + endpoint scoped Redis key (prevents cross-tenant collisions)
         tenant_fingerprint = _extract_tenant_fingerprint(request)
-        redis_key = _make_key(idempotency_key, tenant_fingerprint, request.method, request.url.path)
-        claimed = False
-        try:
-            cached_response = await _parse_cached(redis_client, redis_key)
-            if cached_response:
-                if cached_response.get("payload_hash") != payload_hash:
-                    logger.warning(
-                        f"Idempotency key conflict: {idempotency_key}",
-                        extra={"idempotency_key": idempotency_key},
-                    )
-                    return _conflict_response(idempotency_key)
-
-                if cached_response.get("status") == "processing":
-                    waited = await _wait_for_cached_response(redis_client, redis_key, payload_hash, idempotency_key)
-                    if waited is not None:
-                        return waited
-                    # Timed out waiting — fall through without a second create if claim fails
-                elif "body" in cached_response and "status_code" in cached_response:
-                    logger.debug(f"Idempotency cache hit: {idempotency_key}")
-                    return _response_from_cache(cached_response)
-
-            # Claim the key before executing so concurrent retries cannot double-create
-            placeholder = json.dumps({"status": "processing", "payload_hash": payload_hash}).encode("utf-8")
-            claimed = await redis_client.set(redis_key, placeholder, nx=True, ex=_IDEMPOTENCY_TTL_S)
-            if not claimed:
-                cached_response = await _parse_cached(redis_client, redis_key)
-                if cached_response:
-                    if cached_response.get("payload_hash") != payload_hash:
-                        return _conflict_response(idempotency_key)
-                    if "body" in cached_response and "status_code" in cached_response:
-                        return _response_from_cache(cached_response)
-                    if cached_response.get("status") == "processing":
-                        waited = await _wait_for_cached_response(redis_client, redis_key, payload_hash, idempotency_key)
-                        if waited is not None:
-                            return waited
-
-        except Exception as e:
-            logger.warning(f"Idempotency middleware: Error reading from Redis: {e}")
-            # Fall through to process request normally
-
-        # Key doesn't exist or error occurred - process request
-        # Recreate request with body since we already read it
-        async def receive():
-            return {"type": "http.request", "body": body_bytes}
-
-        request._receive = receive  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
-
-        # Execute the request
-        response = await call_next(request)
-
-        # Cache the response
-        try:
-            # Read response body
-            response_body = b""
-            async for chunk in response.body_iterator:
-                response_body += chunk
-
-            # Collect response headers (excluding hop-by-hop headers)
-            hop_by_hop_headers = {
-                "connection",
-                "keep-alive",
-                "proxy-authenticate",
-                "proxy-authorization",
-                "te",
-                "trailers",
-                "transfer-encoding",
-                "upgrade",
-            }
-            response_headers = {k: v for k, v in response.headers.items() if k.lower() not in hop_by_hop_headers}
-
-            # Decode body to string for storage (handle both text and binary)
-            try:
-                body_str = response_body.decode("utf-8")
-            except UnicodeDecodeError:
-                body_str = _base64.b64encode(response_body).decode("utf-8")
-                response_headers["X-Idempotency-Body-Encoding"] = "base64"
-
-            # Store in Redis with 24h TTL (86400 seconds)
-            cache_data = {
-                "body": body_str,
-                "status_code": response.status_code,
-                "headers": response_headers,
-                "payload_hash": payload_hash,
-            }
-
-            await redis_client.setex(
-                redis_key,
-                _IDEMPOTENCY_TTL_S,
-                json.dumps(cache_data).encode("utf-8"),
-            )
-
-            logger.debug(f"Idempotency response cached: {idempotency_key}")
-
-            # Return response with body
-            return Response(
-                content=response_body,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-            )
-
-        except Exception as e:
-            logger.warning(f"Idempotency middleware: Error caching response: {e}")
-            # If we held the in-flight claim but failed to cache, release it so retries can proceed
-            if claimed:
-                try:
-                    await redis_client.delete(redis_key)
-                except Exception:
-                    pass
-            # Return response with body even if caching failed
-            # Note: response_body_iterator was consumed above, so we return the body we read
-            return Response(
-                content=response_body if "response_body" in locals() else b"",
-                status_code=response.status_code,
-                headers=dict(response.headers),
-            )
+        redis_key = _make_key(idempotency_key, tenant_fingerprint, scope["method"], scope["path"])
+        replay, claimed = await _claim_or_replay(redis_client, redis_key, payload_hash, idempotency_key)
+        if replay is not None:
+            await replay(scope, receive, send)
+            return
+
+        # Key doesn't exist or error occurred - process request, holding the
+        # response until its body is complete so it can be cached
+        start: Optional[Message] = None
+        chunks: list[bytes] = []
+
+        async def send_cached(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            response_body = b"".join(chunks)
+            await _store_response(redis_client, redis_key, start, response_body, payload_hash, idempotency_key, claimed)
+            await send(start)
+            await send({"type": "http.response.body", "body": response_body, "more_body": False})
+
+        await self.app(scope, receive, send_cached)
@@ -16,12 +16,16 @@ from typing import Annotated, Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
+from sqlalchemy import and_, or_, select
 
 from src.api.dependencies import CurrentUser, DbSession, require_permission
 from src.api.routes.actions import _compute_actions_summary
+from src.domain.exceptions import NotFoundError
+from src.domain.models.analytics import Dashboard, DashboardWidget
 from src.domain.models.user import User
 from src.domain.services.analytics_service import analytics_service
 from src.domain.services.executive_dashboard import ExecutiveDashboardService
+from src.domain.services.widget_query_engine import WidgetQueryEngine
 
 router = APIRouter()
 
@@ -187,25 +191,73 @@ async def delete_dashboard(
 # ============================================================================
 
 
+def _visible_dashboards(current_user: User) -> Any:
+    """Dashboards in the caller's tenant that they own or that are shared."""
+    return and_(
+        Dashboard.tenant_id == current_user.tenant_id,
+        or_(Dashboard.owner_id == current_user.id, Dashboard.is_shared.is_(True)),
+    )
+
+
+@router.get("/dashboards/{dashboard_id}/data")
+async def get_dashboard_data(
+    dashboard_id: int,
+    db: DbSession,
+    current_user: CurrentUser,
+    time_range: Optional[str] = Query(None),
+):
+    """Evaluate every widget on a dashboard in one batched round."""
+    dashboard = (
+        await db.execute(select(Dashboard).where(Dashboard.id == dashboard_id, _visible_dashboards(current_user)))
+    ).scalar_one_or_none()
+    if dashboard is None:
+        raise NotFoundError("Dashboard not found")
+    widgets = (
+        (
+            await db.execute(
+                select(DashboardWidget)
+                .where(DashboardWidget.dashboard_id == dashboard.id)
+                .order_by(DashboardWidget.grid_y, DashboardWidget.grid_x, DashboardWidget.id)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    days = _period_days_from_time_range(time_range or dashboard.default_time_range)
+    engine = WidgetQueryEngine(db, current_user.tenant_id)
+    payloads = await engine.evaluate_many(widgets, days)
+    return {
+        "dashboard_id": dashboard.id,
+        "period_days": days,
+        "widgets": [
+            {"widget_id": widget.id, "widget_type": widget.widget_type, "title": widget.title, "data": payload}
+            for widget, payload in zip(widgets, payloads)
+        ],
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
 @router.get("/widgets/{widget_id}/data")
 async def get_widget_data(
     widget_id: int,
+    db: DbSession,
     current_user: CurrentUser,
     time_range: str = Query("last_30_days"),
 ):
     """Get data for a specific widget."""
+    widget = (
+        await db.execute(
+            select(DashboardWidget)
+            .join(Dashboard, Dashboard.id == DashboardWidget.dashboard_id)
+            .where(DashboardWidget.id == widget_id, _visible_dashboards(current_user))
+        )
+    ).scalar_one_or_none()
+    if widget is None:
+        raise NotFoundError("Widget not found")
+    engine = WidgetQueryEngine(db, current_user.tenant_id)
     return {
-        "widget_id": widget_id,
-        "data": {
-            "value": 0,
-            "previous_value": 0,
-            "change": 0.0,
-            "trend": "stable",
-            "chart_data": {
-                "labels": [],
-                "values": [],
-            },
-        },
+        "widget_id": widget.id,
+        "data": await engine.evaluate(widget, _period_days_from_time_range(time_range)),
         "updated_at": datetime.now(timezone.utc).isoformat(),
     }
 
@@ -213,19 +265,21 @@ async def get_widget_data(
 @router.post("/widgets/preview")
 async def preview_widget(
     widget: WidgetConfig,
+    db: DbSession,
     current_user: Annotated[User, Depends(require_permission("analytics:create"))],
+    time_range: str = Query("last_30_days"),
 ):
-    """Preview widget data without saving."""
-    trend_data = analytics_service.get_trend_data(
-        data_source=widget.data_source,
-        metric=widget.metric,
-        time_range="last_30_days",
-        group_by=widget.group_by,
-    )
+    """Preview widget data without saving.
+
+    An invalid configuration is a 422 here, where the author can fix it; on a
+    saved dashboard the same widget reports ``unavailable`` in its own tile.
+    """
+    engine = WidgetQueryEngine(db, current_user.tenant_id)
+    data = await engine.evaluate(widget, _period_days_from_time_range(time_range), strict=True)
     return {
         "widget_type": widget.widget_type,
         "title": widget.title,
-        "data": trend_data,
+        "data": data,
     }
 
 
@@ -575,7 +575,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: int):
         if jti:
             from src.domain.services.token_service import TokenService
 
-            if await TokenService.is_revoked(db, jti):
+            if await TokenService.is_revoked(db, jti, prefilter=True):
                 await websocket.close(code=4001, reason="Token revoked")
                 return
 
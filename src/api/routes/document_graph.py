@@ -19,6 +19,7 @@ from src.api.schemas.document_graph import (
     DocumentEdgeListResponse,
     DocumentEdgeRejectRequest,
     DocumentEdgeResponse,
+    DocumentThreadBatchResponse,
     DocumentThreadResponse,
     HeuristicProposeResponse,
     ImSeedDocumentItem,
@@ -33,7 +34,7 @@ from src.domain.models.user import User
 from src.domain.services.document_graph_heuristic_propose import DocumentGraphHeuristicProposeService
 from src.domain.services.document_graph_im_seed import DocumentGraphImSeedService
 from src.domain.services.document_graph_iso_reverse import DocumentGraphIsoReverseService
-from src.domain.services.document_graph_service import PENDING_QUEUE_LIMIT, DocumentGraphService
+from src.domain.services.document_graph_service import PENDING_QUEUE_LIMIT, THREAD_BATCH_LIMIT, DocumentGraphService
 
 DISABLED_DETAIL = "Doc Graph is not enabled in this environment."
 HEURISTIC_DISABLED_DETAIL = "Doc Graph heuristic propose is not enabled in this environment."
@@ -162,6 +163,36 @@ async def get_document_thread(
     return DocumentThreadResponse.model_validate(payload)
 
 
+@_enabled_router.get(
+    "/documents/threads",
+    response_model=DocumentThreadBatchResponse,
+)
+async def get_document_threads(
+    db: DbSession,
+    current_user: Annotated[User, Depends(require_permission("document:read"))],
+    document_ids: list[int] = Query(
+        ...,
+        alias="document_id",
+        min_length=1,
+        max_length=THREAD_BATCH_LIMIT,
+        description="Repeat for each document. Ids that are not documents of this tenant are left out.",
+    ),
+    include_proposed: bool = Query(
+        False,
+        description="When true, include PROPOSED/NEEDS_REVIEW primary edges. Default ambient thread is confirmed-only.",
+    ),
+):
+    """Threads for many documents in one walk (library tree view)."""
+    tenant_id = require_tenant_id(getattr(current_user, "tenant_id", None))
+    service = DocumentGraphService(db)
+    threads = await service.get_threads(
+        tenant_id=tenant_id,
+        document_ids=document_ids,
+        include_proposed=include_proposed,
+    )
+    return DocumentThreadBatchResponse.model_validate({"threads": list(threads.values())})
+
+
 @_enabled_router.post(
     "/edges",
     response_model=DocumentEdgeResponse,
@@ -2159,13 +2159,11 @@ async def search_document_content(
     """Full-text search over document chunk body text (RBAC-scoped)."""
     import time
 
-    from src.domain.services.search_service import SearchService
+    from src.domain.services.search_service import SearchFilters, SearchService
 
     start_time = time.time()
     service = SearchService(db)
-    hits = await service._search_document_content(q, current_user, request_id=None)
-    if top_k < len(hits):
-        hits = hits[:top_k]
+    hits = await service._search_document_content(q, current_user, request_id=None, filters=SearchFilters(limit=top_k))
 
     results = [
         SearchResult(
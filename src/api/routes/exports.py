@@ -1,11 +1,14 @@
 """Export Center API — sync catalog + download (PX-160 + WA-3 IMS052).
 
-No async export_jobs table this wave (Lane S owns alembic). Job history and
-scheduled templates remain honestly unavailable.
+Sync downloads are capped at ``SYNC_ROW_LIMIT``. Uncapped exports run as Celery
+jobs (``POST /exports/jobs``) that write the file to blob storage; job state is
+the Celery result, so there is no export_jobs table this wave (Lane S owns
+alembic). Job history and scheduled templates remain honestly unavailable.
 """
 
 from __future__ import annotations
 
+import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
@@ -16,14 +19,20 @@ from src.api.schemas.exports import (
     CreateExportRequest,
     ExportCapabilities,
     ExportCatalogResponse,
+    ExportJobResponse,
     ExportModuleCatalogItem,
 )
 from src.api.utils.tenant import require_tenant_id
+from src.domain.exceptions import ExternalServiceError, NotFoundError
 from src.domain.models.user import User
 from src.domain.services.export_center_service import ExportCenterService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+_EXPORT_JOB_NOT_FOUND = "Export job not found"
+
 
 def _export_response(result) -> StreamingResponse:
     headers = {
@@ -74,6 +83,60 @@ async def create_sync_export(
     return _export_response(result)
 
 
+@router.post("/jobs", response_model=ExportJobResponse, status_code=202)
+async def create_export_job(
+    body: CreateExportRequest,
+    db: DbSession,
+    current_user: Annotated[User, Depends(require_permission("incident:read"))],
+) -> ExportJobResponse:
+    """Queue an uncapped export; poll ``GET /exports/jobs/{job_id}`` for the download URL."""
+    from src.infrastructure.tasks.export_tasks import run_export_job
+
+    tenant_id = require_tenant_id(getattr(current_user, "tenant_id", None))
+    ExportCenterService(db).validate_job_request(body.module, body.format, user=current_user)
+    try:
+        task = run_export_job.delay(tenant_id, body.module, body.format, current_user.id)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Export job enqueue failed (%s)", type(exc).__name__)
+        raise ExternalServiceError("Export jobs are unavailable: the task queue could not be reached.") from exc
+    return ExportJobResponse(job_id=task.id, status="queued", module=body.module, format=body.format)
+
+
+@router.get("/jobs/{job_id}", response_model=ExportJobResponse)
+async def get_export_job(
+    job_id: str,
+    current_user: Annotated[User, Depends(require_permission("incident:read"))],
+) -> ExportJobResponse:
+    """Job state; a completed job carries a freshly signed download URL."""
+    from src.infrastructure.tasks.export_tasks import EXPORT_URL_TTL_SECONDS, export_download_url, run_export_job
+
+    tenant_id = require_tenant_id(getattr(current_user, "tenant_id", None))
+    task = run_export_job.AsyncResult(job_id)
+    state = task.state
+    if state == "SUCCESS":
+        payload = task.result if isinstance(task.result, dict) else {}
+        # Only the requester may fetch it: exports such as the documents register
+        # are filtered by the requesting user's ACL, not just by tenant.
+        if payload.get("tenant_id") != tenant_id or payload.get("user_id") != current_user.id:
+            raise NotFoundError(_EXPORT_JOB_NOT_FOUND)
+        return ExportJobResponse(
+            job_id=job_id,
+            status="completed",
+            module=payload["module"],
+            format=payload["format"],
+            filename=payload["filename"],
+            row_count=payload["row_count"],
+            download_url=export_download_url(payload["storage_key"], payload["filename"]),
+            expires_in_seconds=EXPORT_URL_TTL_SECONDS,
+        )
+    if state == "FAILURE":
+        # The result carries no tenant, so only the exception type is disclosed.
+        return ExportJobResponse(job_id=job_id, status="failed", error=type(task.result).__name__)
+    if state in ("STARTED", "RETRY"):
+        return ExportJobResponse(job_id=job_id, status="running")
+    return ExportJobResponse(job_id=job_id, status="queued")
+
+
 @router.get("/{module}/csv")
 async def download_module_csv(
     module: str,
@@ -14,6 +14,7 @@ from src.api.dependencies.partner import is_partner_caller, partner_readable
 from src.api.dependencies.request_context import get_request_id
 from src.domain.services.search_interpret_service import interpret_search_query
 from src.domain.services.search_service import PARTNER_VISIBLE_MODULES, SearchService
+from src.infrastructure.database import tenant_read_session
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +102,7 @@ async def global_search(
         page_size=page_size,
         request_id=request_id,
         allowed_modules=PARTNER_VISIBLE_MODULES if is_partner_caller(current_user) else None,
+        session_factory=tenant_read_session,
     )
     return SearchResponse(**result)
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import APIRouter, File, Query, UploadFile, status
 from sqlalchemy import func, select
@@ -61,6 +61,7 @@ from src.domain.services.training_matrix_board import (
     person_rollup,
     resolve_board_role,
 )
+from src.domain.services.training_matrix_board_cache import cached_board_summary
 from src.domain.services.training_matrix_compliance import (
     ATLAS_HUB_URL,
     ComplianceInput,
@@ -990,8 +991,19 @@ async def training_matrix_summary(db: DbSession, user: CurrentUser):
     """Board SSOT: module OK% (hero), people fully OK (caption), horizons, top overdue courses."""
     _require_manager(user)
     tenant_id = _tenant(user)
-    rows, import_id = await _build_compliance_rows(db, tenant_id=tenant_id)
-    payload = build_board_summary([r.model_dump() for r in rows])
+    imp = await _latest_import(db, tenant_id)
+    if imp is None:
+        import_id = None
+        payload = build_board_summary([])
+    else:
+        import_id = imp.id
+
+        async def _load_rows() -> list[dict[str, Any]]:
+            rows, _ = await _build_compliance_rows(db, tenant_id=tenant_id)
+            return [r.model_dump() for r in rows]
+
+        # Rebuilt only when the import or anything its rows come from changes.
+        payload = await cached_board_summary(db, tenant_id=tenant_id, import_id=imp.id, load_rows=_load_rows)
     return TrainingMatrixSummaryResponse(
         module_ok=payload["module_ok"],
         people_fully_ok=payload["people_fully_ok"],
@@ -1040,8 +1052,9 @@ async def person_compliance(person_id: int, db: DbSession, user: CurrentUser):
     if not person:
         raise NotFoundError("Atlas person not found")
 
-    rows, import_id = await _build_compliance_rows(db, tenant_id=tenant_id)
-    person_rows = [r for r in rows if r.person_id == person.id]
+    rows, import_id = await _build_compliance_rows(db, tenant_id=tenant_id, people_override=[person])
+    # Only people seen in the latest import are on the board.
+    person_rows = rows if import_id is not None and person.last_seen_import_id == import_id else []
     rollup = person_rollup([r.model_dump() for r in person_rows])
 
     can_email = False
@@ -7,8 +7,7 @@ for the Van Checklists governance module.
 import logging
 import math
 from datetime import datetime, timedelta, timezone
-from io import StringIO
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 from fastapi import APIRouter, Depends, Query, Response
 from fastapi.responses import StreamingResponse
@@ -20,6 +19,7 @@ from src.api.schemas.vehicle_checklist import AnalyticsSummary, HeatmapEntry, Tr
 from src.domain.models.capa import CAPAAction, CAPAStatus
 from src.domain.models.pams_cache import PAMSSyncLog, PAMSVanChecklistCache, PAMSVanChecklistMonthlyCache
 from src.domain.models.vehicle_defect import VehicleDefect
+from src.domain.services.export_stream import csv_chunks, stream_rows
 
 logger = logging.getLogger(__name__)
 
@@ -202,11 +202,7 @@ async def export_daily_csv(
     db: DbSession,
 ) -> StreamingResponse:
     """Export all cached daily checklists as CSV."""
-    rows = (
-        (await db.execute(select(PAMSVanChecklistCache).order_by(PAMSVanChecklistCache.pams_id.desc()))).scalars().all()
-    )
-
-    return _build_csv_response(list(rows), "daily_checklists.csv")
+    return _cache_csv_response(db, PAMSVanChecklistCache, "daily_checklists.csv")
 
 
 @router.get("/export/monthly")
@@ -215,13 +211,22 @@ async def export_monthly_csv(
     db: DbSession,
 ) -> StreamingResponse:
     """Export all cached monthly checklists as CSV."""
-    rows = (
-        (await db.execute(select(PAMSVanChecklistMonthlyCache).order_by(PAMSVanChecklistMonthlyCache.pams_id.desc())))
-        .scalars()
-        .all()
-    )
+    return _cache_csv_response(db, PAMSVanChecklistMonthlyCache, "monthly_checklists.csv")
+
 
-    return _build_csv_response(list(rows), "monthly_checklists.csv")
+_DEFECT_CSV_HEADER = [
+    "ID",
+    "PAMS Table",
+    "Record ID",
+    "Check Field",
+    "Check Value",
+    "Priority",
+    "Status",
+    "Vehicle Reg",
+    "Notes",
+    "Assigned To",
+    "Created At",
+]
 
 
 @router.get("/export/defects")
@@ -230,40 +235,28 @@ async def export_defects_csv(
     db: DbSession,
 ) -> StreamingResponse:
     """Export defect register as CSV."""
-    rows = (
-        (
-            await db.execute(
-                select(VehicleDefect)
-                .where(VehicleDefect.tenant_id == current_user.tenant_id)
-                .order_by(VehicleDefect.created_at.desc())
-            )
+    stmt = (
+        select(
+            VehicleDefect.id,
+            VehicleDefect.pams_table,
+            VehicleDefect.pams_record_id,
+            VehicleDefect.check_field,
+            VehicleDefect.check_value,
+            VehicleDefect.priority,
+            VehicleDefect.status,
+            VehicleDefect.vehicle_reg,
+            VehicleDefect.notes,
+            VehicleDefect.assigned_to_email,
+            VehicleDefect.created_at,
         )
-        .scalars()
-        .all()
+        .where(VehicleDefect.tenant_id == current_user.tenant_id)
+        .order_by(VehicleDefect.created_at.desc())
     )
 
-    import csv
-
-    output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow(
-        [
-            "ID",
-            "PAMS Table",
-            "Record ID",
-            "Check Field",
-            "Check Value",
-            "Priority",
-            "Status",
-            "Vehicle Reg",
-            "Notes",
-            "Assigned To",
-            "Created At",
-        ]
-    )
-    for d in rows:
-        writer.writerow(
-            [
+    async def rows() -> AsyncIterator[list[Any]]:
+        yield _DEFECT_CSV_HEADER
+        async for d in stream_rows(db, stmt):
+            yield [
                 d.id,
                 d.pams_table,
                 d.pams_record_id,
@@ -276,49 +269,42 @@ async def export_defects_csv(
                 d.assigned_to_email,
                 d.created_at.isoformat() if d.created_at else "",
             ]
-        )
 
-    output.seek(0)
     return StreamingResponse(
-        output,
+        csv_chunks(rows()),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=defects_register.csv"},
     )
 
 
-def _build_csv_response(cache_rows: list, filename: str) -> StreamingResponse:
-    """Build a CSV StreamingResponse from cache rows with JSON raw_data."""
-    import csv
-
-    output = StringIO()
-    writer = csv.writer(output)
-
-    if not cache_rows:
-        writer.writerow(["No data"])
-        output.seek(0)
-        return StreamingResponse(
-            output,
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
-        )
+def _cache_csv_response(db: AsyncSession, model: Any, filename: str) -> StreamingResponse:
+    """Stream cache rows as CSV; columns are pams_id, synced_at and the first row's raw_data keys.
+
+    Rows come off a server-side cursor and are encoded in chunks, so the
+    response never holds the table. The request session stays open until the
+    body has been sent.
+    """
+    stmt = select(model.pams_id, model.synced_at, model.raw_data).order_by(model.pams_id.desc())
+
+    async def rows() -> AsyncIterator[list[Any]]:
+        keys: Optional[list[str]] = None
+        async for row in stream_rows(db, stmt):
+            data = row.raw_data or {}
+            if keys is None:
+                keys = list(data.keys())
+                yield ["pams_id", "synced_at"] + keys
+            csv_row = [row.pams_id, row.synced_at.isoformat() if row.synced_at else ""]
+            for h in keys:
+                val = data.get(h, "")
+                if isinstance(val, datetime):
+                    val = val.isoformat()
+                csv_row.append(val)
+            yield csv_row
+        if keys is None:
+            yield ["No data"]
 
-    first_data = cache_rows[0].raw_data or {}
-    headers = ["pams_id", "synced_at"] + list(first_data.keys())
-    writer.writerow(headers)
-
-    for row in cache_rows:
-        data = row.raw_data or {}
-        csv_row = [row.pams_id, row.synced_at.isoformat() if row.synced_at else ""]
-        for h in list(first_data.keys()):
-            val = data.get(h, "")
-            if isinstance(val, datetime):
-                val = val.isoformat()
-            csv_row.append(val)
-        writer.writerow(csv_row)
-
-    output.seek(0)
     return StreamingResponse(
-        output,
+        csv_chunks(rows()),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
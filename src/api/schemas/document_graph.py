@@ -169,6 +169,12 @@ class DocumentThreadResponse(BaseModel):
     max_depth: int
 
 
+class DocumentThreadBatchResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    threads: List[DocumentThreadResponse]
+
+
 class HeuristicProposeResponse(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -1,8 +1,8 @@
-"""Pydantic schemas for Export Center sync APIs (PX-160 + WA-3 IMS052)."""
+"""Pydantic schemas for Export Center sync + job APIs (PX-160 + WA-3 IMS052)."""
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -21,9 +21,10 @@ ExportFormat = Literal["csv", "xlsx", "pdf"]
 
 
 class ExportCapabilities(BaseModel):
-    """Honest capability disclosure — sync formats now; job store deferred to Lane S."""
+    """Honest capability disclosure — sync + uncapped jobs; job history deferred to Lane S."""
 
     sync_csv: bool = True
+    async_jobs: bool = False
     job_history: bool = False
     scheduled_templates: bool = False
     max_sync_rows: int
@@ -41,6 +42,7 @@ class ExportModuleCatalogItem(BaseModel):
     description: str
     record_count: int = Field(ge=0)
     formats: list[ExportFormat] = Field(default_factory=_default_csv_formats)
+    job_formats: list[ExportFormat] = Field(default_factory=_default_csv_formats)
     sync_available: bool = True
 
 
@@ -52,7 +54,7 @@ class ExportCatalogResponse(BaseModel):
 
 
 class CreateExportRequest(BaseModel):
-    """POST /exports body — sync stream only this wave (no async job create).
+    """POST /exports and POST /exports/jobs body.
 
     ``extra="forbid"`` so a misspelled or unsupported field fails loudly instead
     of the export proceeding while the unknown key is silently dropped (B-10).
@@ -65,3 +67,23 @@ class CreateExportRequest(BaseModel):
 
     module: ExportModuleId
     format: ExportFormat = "csv"
+
+
+ExportJobStatus = Literal["queued", "running", "completed", "failed"]
+
+
+class ExportJobResponse(BaseModel):
+    """An export job: queued by POST /exports/jobs, polled by GET /exports/jobs/{job_id}.
+
+    ``download_url`` is a fresh signed URL on every read of a completed job.
+    """
+
+    job_id: str
+    status: ExportJobStatus
+    module: Optional[ExportModuleId] = None
+    format: Optional[ExportFormat] = None
+    filename: Optional[str] = None
+    row_count: Optional[int] = Field(default=None, ge=0)
+    download_url: Optional[str] = None
+    expires_in_seconds: Optional[int] = None
+    error: Optional[str] = None
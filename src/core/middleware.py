@@ -1,11 +1,21 @@
-"""Core middleware components for request processing."""
+"""Core middleware components for request processing.
+
+Every middleware the application registers is a pure ASGI class: it wraps the
+next app and, where it touches the response, the ``send`` callable. None of them
+subclass ``BaseHTTPMiddleware``, which runs the downstream app in a separate task
+and pipes the response through a memory stream per layer — a measurable cost on
+every request when stacked nine deep, and one that broke true streaming of large
+exports. ``RequestPipeline`` composes the stages once, outermost first, so
+``create_application`` registers a single middleware.
+"""
 
 import uuid
-from typing import Callable, Optional
+from typing import Optional, Sequence
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.middleware import Middleware
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.core.security import decode_token
 from src.domain.context.audit_request_context import (
@@ -36,7 +46,7 @@ def client_ip_of(request: Request) -> Optional[str]:
     return request.client.host if request.client else None
 
 
-class RequestStateMiddleware(BaseHTTPMiddleware):
+class RequestStateMiddleware:
     """
     Middleware to propagate request_id via request.state for reliable access.
 
@@ -57,8 +67,15 @@ class RequestStateMiddleware(BaseHTTPMiddleware):
     authorization decisions without relying on client-supplied identity headers.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and set request_id in request.state."""
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         # Get or generate request_id BEFORE processing request
         request_id = request.headers.get("X-Request-ID")
         if not request_id:
@@ -76,6 +93,15 @@ class RequestStateMiddleware(BaseHTTPMiddleware):
             if user_id is not None:
                 request.state.user_id = str(user_id)
 
+        async def send_with_request_id(message: Message) -> None:
+            # Ensure response has X-Request-ID header
+            # (ContextMiddleware also sets this, but we ensure it's consistent)
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if "X-Request-ID" not in headers:
+                    headers["X-Request-ID"] = request_id
+            await send(message)
+
         # Carry the client address and user agent to record_audit_event, which is
         # a domain function and cannot be handed a Request. Reset by token in
         # `finally` so a worker that serves the next request after this one does
@@ -87,14 +113,59 @@ class RequestStateMiddleware(BaseHTTPMiddleware):
             )
         )
         try:
-            # Process request (handlers can now access request.state.request_id)
-            response = await call_next(request)
-
-            # Ensure response has X-Request-ID header
-            # (ContextMiddleware also sets this, but we ensure it's consistent)
-            if "X-Request-ID" not in response.headers:
-                response.headers["X-Request-ID"] = request_id
-
-            return response  # type: ignore[no-any-return]  # TYPE-IGNORE: MYPY-003 Starlette middleware call_next returns Any
+            await self.app(scope, receive, send_with_request_id)
         finally:
             reset_audit_request_context(audit_token)
+
+
+async def buffered_receive(receive: Receive) -> tuple[bytes, Receive]:
+    """Read the whole request body; return it with a ``receive`` that replays it.
+
+    The replacement hands the body over as a single message on its first call and
+    then defers to the original ``receive``, so the app downstream can still read
+    the body and still sees ``http.disconnect``.
+    """
+    chunks: list[bytes] = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            # The client went away mid-body; downstream sees the disconnect too.
+            first = message
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            first = {"type": "http.request", "body": b"".join(chunks), "more_body": False}
+            break
+    pending = [first]
+
+    async def replay() -> Message:
+        if pending:
+            return pending.pop()
+        return await receive()
+
+    return b"".join(chunks), replay
+
+
+class RequestPipeline:
+    """The application's HTTP middleware, composed once into a single layer.
+
+    ``stages`` are listed outermost first: the first sees the request first and
+    the response last. Each is a pure ASGI middleware (``Middleware(cls, ...)``)
+    built around the next when the pipeline is constructed, so a request costs
+    one coroutine frame per stage and no tasks or streams. Non-HTTP scopes
+    (lifespan, websockets) skip the stages entirely.
+    """
+
+    def __init__(self, app: ASGIApp, stages: Sequence[Middleware]) -> None:
+        self.stages = tuple(stages)
+        self.inner = app
+        composed = app
+        for cls, args, kwargs in reversed(self.stages):
+            composed = cls(composed, *args, **kwargs)
+        self.app = composed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.inner(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -181,11 +181,15 @@ def verify_password_reset_token(token: str) -> Optional[int]:
         return None
 
 
-async def is_token_revoked(jti: str, db: AsyncSession) -> bool:
-    """Check whether a token identifier has been revoked."""
+async def is_token_revoked(jti: str, db: AsyncSession, *, prefilter: bool = False) -> bool:
+    """Check whether a token identifier has been revoked.
+
+    ``prefilter=True`` lets the Redis revocation store answer instead of
+    ``token_blacklist``; only per-request access-token checks should use it.
+    """
     from src.domain.services.token_service import TokenService
 
-    return await TokenService.is_revoked(db, jti)
+    return await TokenService.is_revoked(db, jti, prefilter=prefilter)
 
 
 async def ensure_access_token_not_revoked(payload: dict[str, Any], db: AsyncSession) -> None:
@@ -203,5 +207,5 @@ async def ensure_access_token_not_revoked(payload: dict[str, Any], db: AsyncSess
     if not jti:
         raise ValueError("Access token missing jti claim")
 
-    if await is_token_revoked(str(jti), db):
+    if await is_token_revoked(str(jti), db, prefilter=True):
         raise TokenRevokedError("Access token has been revoked")
@@ -20,9 +20,9 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from fastapi import Request
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.core.config import settings
 
@@ -158,7 +158,7 @@ def _log_uat_write_attempt(
         logger.warning("UAT write blocked", extra=log_data)
 
 
-class UATSafetyMiddleware(BaseHTTPMiddleware):
+class UATSafetyMiddleware:
     """
     Middleware to enforce UAT read-only mode in production.
 
@@ -168,18 +168,29 @@ class UATSafetyMiddleware(BaseHTTPMiddleware):
     - Allows writes only with valid override headers from admin users
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        blocked = self._check(Request(scope)) if scope["type"] == "http" else None
+        if blocked is not None:
+            await blocked(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    def _check(self, request: Request) -> Optional[Response]:
+        """Return the 409 to send instead of the handler, or None to let the request through."""
         # Skip if not in read-only mode
         if not settings.is_uat_read_only:
-            return await call_next(request)
+            return None
 
         # Always allow non-write methods
         if request.method not in WRITE_METHODS:
-            return await call_next(request)
+            return None
 
         # Always allow certain paths
         if _is_path_always_allowed(request.url.path):
-            return await call_next(request)
+            return None
 
         # Check for override headers
         user_id = _get_user_id_from_request(request)
@@ -232,4 +243,4 @@ class UATSafetyMiddleware(BaseHTTPMiddleware):
             issue_id=issue_id,
             owner=owner,
         )
-        return await call_next(request)
+        return None
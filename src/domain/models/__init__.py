@@ -239,6 +239,7 @@ from src.domain.models.partner_webhook import (
     WebhookDeliveryStatus,
     WebhookSubscription,
 )
+from src.domain.models.pending_decision import PendingDecisionProjection
 
 # Planet Mark Carbon Management
 from src.domain.models.planet_mark import (
@@ -254,6 +255,7 @@ from src.domain.models.planet_mark import (
     UtilityMeterReading,
 )
 from src.domain.models.policy import Policy, PolicyVersion
+from src.domain.models.retention_sweep_cursor import RetentionSweepCursor
 from src.domain.models.risk import OperationalRiskControl, Risk, RiskAssessment
 
 # Enterprise Risk Register (Tier 1)
@@ -403,6 +405,10 @@ __all__ = [
     # Policy models
     "Policy",
     "PolicyVersion",
+    # Approver inbox projection
+    "PendingDecisionProjection",
+    # Data retention sweep cursors
+    "RetentionSweepCursor",
     # Partner webhook models (Wave5)
     "PARTNER_WEBHOOK_EVENTS",
     "WebhookDeliveryLog",
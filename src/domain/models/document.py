@@ -545,6 +545,12 @@ class IndexJob(Base, TimestampMixin):
     chunks_processed: Mapped[int] = mapped_column(Integer, default=0)
     chunks_succeeded: Mapped[int] = mapped_column(Integer, default=0)
     chunks_failed: Mapped[int] = mapped_column(Integer, default=0)
+    # Checkpoint — documents that reached a terminal outcome, in completion order.
+    # The pipeline finishes documents out of order, so resume reads this rather
+    # than treating documents_processed as a prefix of document_ids.
+    processed_document_ids: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    # Throughput: documents_per_minute, elapsed_seconds and per-stage latency.
+    metrics: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
     # Error tracking
     error_log: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
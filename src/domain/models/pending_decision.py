@@ -0,0 +1,72 @@
+"""Materialised approver inbox: one row per (decision, person it names).
+
+A projection of the three domains ``approvals_read_model`` reads, maintained by
+``src.domain.services.approvals_inbox_projection`` as those records change. The
+domains stay the source of truth; this table only exists so "what is waiting on
+me" is an index lookup rather than three scans and a walk over workflow JSON.
+
+Attribution is copied, not invented: an approval step naming two users is two
+rows, a signer invited by address is a row carrying that address, and a record
+that names nobody is one row with both approver columns NULL so it can still be
+counted as unattributed.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, event
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from src.domain.models.base import Base
+
+
+class PendingDecisionProjection(Base):
+    """One outstanding decision as seen by one approver."""
+
+    __tablename__ = "pending_decisions"
+    __table_args__ = (
+        Index("ix_pending_decisions_tenant_user", "tenant_id", "approver_user_id"),
+        Index("ix_pending_decisions_tenant_email", "tenant_id", "approver_email"),
+        Index("ix_pending_decisions_source", "source", "source_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    tenant_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # approvals_read_model.SOURCE_* key, and the id of the record in that domain.
+    source: Mapped[str] = mapped_column(String(32), nullable=False)
+    source_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Both NULL: the record names nobody (unattributed). Email is stored lowercased.
+    approver_user_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    approver_email: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    decision: Mapped[str] = mapped_column(String(20), nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    reference: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    # Naive UTC, like the document and signature columns they are copied from.
+    requested_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    requested_at_basis: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    due_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    deep_link: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+
+
+def _maintain_after_flush(session: Session, flush_context: object) -> None:
+    """Refresh the projection rows of every approval record this flush touched.
+
+    Registered here, beside the table, because every writer of the three domains
+    imports the models package and not every writer imports the read model — a
+    Celery task expiring signature requests would otherwise leave stale rows.
+    The work runs on the flush's own connection, so a rollback discards it with
+    the change that caused it. Inert until the projection is switched on.
+    """
+    from src.core.config import settings
+
+    if not settings.approvals_inbox_projection_enabled:
+        return
+
+    from src.domain.services.approvals_inbox_projection import refresh_after_flush
+
+    refresh_after_flush(session)
+
+
+event.listen(Session, "after_flush", _maintain_after_flush)
@@ -0,0 +1,31 @@
+"""Resume point of an interrupted data-retention purge, one row per table.
+
+``run_data_retention`` deletes in keyset batches and commits each one together
+with this row, so a sweep that dies part-way (worker restart, statement timeout)
+picks up after the last committed key with the cutoff it started with. The row
+is removed once the table's pass completes; a table with no row starts a fresh
+pass at the next sweep.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.domain.models.base import Base
+
+
+class RetentionSweepCursor(Base):
+    """Progress of one table's unfinished retention pass."""
+
+    __tablename__ = "retention_sweep_cursors"
+
+    table_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    # The pass's horizon, fixed when it started so a resumed pass purges the same rows.
+    cutoff: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # Highest key already purged; the next batch starts strictly above it.
+    last_key: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    rows_deleted: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
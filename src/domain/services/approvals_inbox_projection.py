@@ -0,0 +1,421 @@
+"""Keep ``pending_decisions`` in step with the domains the approvals read model asks.
+
+``collect_my_decisions`` answers "what is waiting on me" by reading three domains:
+investigations under review, controlled-document approvals and signature
+requests. The document source cannot filter in SQL — attribution lives in
+workflow JSON — so every call scanned the tenant's pending approvals. The
+projection materialises the answer per (tenant, approver): one row per decision
+and person it names, indexed on both, so the inbox is an index lookup.
+
+Three entry points, one definition
+----------------------------------
+Every row is produced by the same per-source projector, so the three ways rows
+are written cannot disagree about what a row is:
+
+* :func:`refresh_after_flush` — called from the ``after_flush`` listener in
+  ``src.domain.models.pending_decision``. It collects the approval records a flush
+  touched, drops their rows and projects them again on the flush's connection.
+  Edits to a controlled document or an approval workflow re-project the pending
+  instances that show them.
+* :func:`rebuild_pending_decisions` — drops and re-projects a tenant, or every
+  tenant. Needed once after the migration, and whenever something wrote to these
+  tables without going through the ORM session.
+* :func:`check_pending_decisions` — compares the stored rows with a fresh
+  projection, and each approver's projected inbox with the live readers. It
+  writes nothing; ``scripts/maintenance/rebuild_pending_decisions.py --check``
+  is its command-line form.
+
+Attribution is delegated, not re-implemented: document approvals go through
+:func:`~src.domain.services.approvals_read_model.approvers_for_step`, and the
+status filters are the read model's own constants.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Any, Callable, Iterable, Optional, cast
+
+from sqlalchemy import ColumnElement, Table, delete, insert
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.domain.models.digital_signature import SignatureRequest, SignatureRequestSigner
+from src.domain.models.document_control import ControlledDocument, DocumentApprovalInstance, DocumentApprovalWorkflow
+from src.domain.models.investigation import InvestigationRun, InvestigationStatus
+from src.domain.models.pending_decision import PendingDecisionProjection
+from src.domain.models.user import User
+from src.domain.services.approvals_read_model import (
+    BASIS_LAST_UPDATED,
+    BASIS_RAISED,
+    BASIS_SUBMITTED,
+    SIGNATURE_REQUEST_OPEN_STATUSES,
+    SIGNATURE_SIGNER_OPEN_STATUSES,
+    SOURCE_DOCUMENT_APPROVAL,
+    SOURCE_INVESTIGATION_REVIEW,
+    SOURCE_SIGNATURE_REQUEST,
+    MyDecisions,
+    approvers_for_step,
+    collect_my_decisions,
+)
+
+logger = logging.getLogger(__name__)
+
+_TABLE = cast(Table, PendingDecisionProjection.__table__)
+
+#: Approvers whose inbox :func:`check_pending_decisions` reads both ways by default.
+#: Every row is compared regardless; this bounds only the per-user reader pass.
+DEFAULT_CHECK_USERS = 200
+
+#: Columns that identify a projected row; ``id`` is excluded because a rebuild
+#: renumbers it.
+_ROW_COLUMNS = tuple(column.name for column in _TABLE.columns if column.name != "id")
+
+Row = dict[str, Any]
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """The projection stores naive UTC; investigation timestamps arrive aware."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _investigation_rows(conn: Connection, where: Iterable[ColumnElement[bool]]) -> list[Row]:
+    stmt = select(
+        InvestigationRun.id,
+        InvestigationRun.tenant_id,
+        InvestigationRun.reference_number,
+        InvestigationRun.title,
+        InvestigationRun.updated_at,
+        InvestigationRun.reviewer_user_id,
+    ).where(InvestigationRun.status == InvestigationStatus.UNDER_REVIEW, *where)
+    return [
+        {
+            "tenant_id": row.tenant_id,
+            "source": SOURCE_INVESTIGATION_REVIEW,
+            "source_id": row.id,
+            "approver_user_id": row.reviewer_user_id,
+            "approver_email": None,
+            "decision": "review",
+            "title": row.title,
+            "reference": row.reference_number,
+            "requested_at": _naive_utc(row.updated_at),
+            "requested_at_basis": BASIS_LAST_UPDATED,
+            "due_at": None,
+            "deep_link": f"/investigations/{row.id}",
+        }
+        for row in conn.execute(stmt)
+    ]
+
+
+def _document_rows(conn: Connection, where: Iterable[ColumnElement[bool]]) -> list[Row]:
+    # The live reader requires workflow and document to sit in the caller's
+    # tenant as well as the instance; requiring them to match the instance's
+    # tenant is the same rule stated without a caller.
+    stmt = (
+        select(
+            DocumentApprovalInstance.id,
+            DocumentApprovalInstance.tenant_id,
+            DocumentApprovalInstance.document_id,
+            DocumentApprovalInstance.current_step,
+            DocumentApprovalInstance.initiated_date,
+            DocumentApprovalInstance.due_date,
+            DocumentApprovalWorkflow.workflow_steps,
+            ControlledDocument.document_number,
+            ControlledDocument.title,
+        )
+        .join(DocumentApprovalWorkflow, DocumentApprovalWorkflow.id == DocumentApprovalInstance.workflow_id)
+        .join(ControlledDocument, ControlledDocument.id == DocumentApprovalInstance.document_id)
+        .where(
+            DocumentApprovalInstance.status == "pending",
+            DocumentApprovalInstance.tenant_id.is_not(None),
+            DocumentApprovalWorkflow.tenant_id == DocumentApprovalInstance.tenant_id,
+            ControlledDocument.tenant_id == DocumentApprovalInstance.tenant_id,
+            *where,
+        )
+    )
+    rows: list[Row] = []
+    for row in conn.execute(stmt):
+        approvers, attributable = approvers_for_step(row.workflow_steps, row.current_step)
+        shared = {
+            "tenant_id": row.tenant_id,
+            "source": SOURCE_DOCUMENT_APPROVAL,
+            "source_id": row.id,
+            "approver_email": None,
+            "decision": "approve",
+            "title": row.title,
+            "reference": row.document_number,
+            "requested_at": _naive_utc(row.initiated_date),
+            "requested_at_basis": BASIS_SUBMITTED,
+            "due_at": _naive_utc(row.due_date),
+            "deep_link": f"/document-control?document={row.document_id}",
+        }
+        if not attributable:
+            rows.append({**shared, "approver_user_id": None})
+            continue
+        rows.extend({**shared, "approver_user_id": user_id} for user_id in sorted(approvers))
+    return rows
+
+
+def _signature_rows(conn: Connection, where: Iterable[ColumnElement[bool]]) -> list[Row]:
+    stmt = (
+        select(
+            SignatureRequest.id,
+            SignatureRequest.tenant_id,
+            SignatureRequest.reference_number,
+            SignatureRequest.title,
+            SignatureRequest.created_at,
+            SignatureRequest.expires_at,
+            SignatureRequestSigner.user_id,
+            SignatureRequestSigner.email,
+        )
+        .join(SignatureRequestSigner, SignatureRequestSigner.request_id == SignatureRequest.id)
+        .where(
+            SignatureRequest.status.in_(SIGNATURE_REQUEST_OPEN_STATUSES),
+            SignatureRequestSigner.status.in_(SIGNATURE_SIGNER_OPEN_STATUSES),
+            *where,
+        )
+    )
+    return [
+        {
+            "tenant_id": row.tenant_id,
+            "source": SOURCE_SIGNATURE_REQUEST,
+            "source_id": row.id,
+            "approver_user_id": row.user_id,
+            # Lowercased as stored; the live reader compares lower(email).
+            "approver_email": row.email.lower() if row.email else None,
+            "decision": "sign",
+            "title": row.title,
+            "reference": row.reference_number,
+            "requested_at": _naive_utc(row.created_at),
+            "requested_at_basis": BASIS_RAISED,
+            "due_at": _naive_utc(row.expires_at),
+            "deep_link": None,
+        }
+        for row in conn.execute(stmt)
+    ]
+
+
+#: Per source: the projector, the record id column, and the tenant column.
+_PROJECTORS: dict[str, tuple[Callable[[Connection, Iterable[ColumnElement[bool]]], list[Row]], Any, Any]] = {
+    SOURCE_INVESTIGATION_REVIEW: (_investigation_rows, InvestigationRun.id, InvestigationRun.tenant_id),
+    SOURCE_DOCUMENT_APPROVAL: (_document_rows, DocumentApprovalInstance.id, DocumentApprovalInstance.tenant_id),
+    SOURCE_SIGNATURE_REQUEST: (_signature_rows, SignatureRequest.id, SignatureRequest.tenant_id),
+}
+
+
+def _project(conn: Connection, tenant_id: Optional[int]) -> list[Row]:
+    rows: list[Row] = []
+    for projector, _id_column, tenant_column in _PROJECTORS.values():
+        rows.extend(projector(conn, [] if tenant_id is None else [tenant_column == tenant_id]))
+    return rows
+
+
+def _insert(conn: Connection, rows: list[Row]) -> None:
+    if rows:
+        conn.execute(insert(_TABLE), rows)
+
+
+def refresh_records(conn: Connection, source: str, ids: Iterable[int]) -> int:
+    """Replace the projected rows of these records of ``source``; returns rows written."""
+    wanted = sorted(set(ids))
+    if not wanted:
+        return 0
+    projector, id_column, _tenant_column = _PROJECTORS[source]
+    conn.execute(delete(_TABLE).where(_TABLE.c.source == source, _TABLE.c.source_id.in_(wanted)))
+    rows = projector(conn, [id_column.in_(wanted)])
+    _insert(conn, rows)
+    return len(rows)
+
+
+def _state_value(obj: Any, attribute: str) -> Any:
+    # Read from the instance dict: after a flush an attribute may be expired, and
+    # loading it here would emit lazy IO from inside the flush.
+    return sa_inspect(obj).dict.get(attribute)
+
+
+def refresh_after_flush(session: Session) -> None:
+    """Re-project every approval record the flush that just ran inserted, changed or deleted."""
+    touched: dict[str, set[int]] = {source: set() for source in _PROJECTORS}
+    documents: set[int] = set()
+    workflows: set[int] = set()
+    parent_deleted = False
+
+    changed = [obj for obj in session.dirty if session.is_modified(obj, include_collections=False)]
+    for obj in chain(session.new, changed, session.deleted):
+        record_id = _state_value(obj, "id")
+        if isinstance(obj, InvestigationRun):
+            touched[SOURCE_INVESTIGATION_REVIEW].add(record_id)
+        elif isinstance(obj, DocumentApprovalInstance):
+            touched[SOURCE_DOCUMENT_APPROVAL].add(record_id)
+        elif isinstance(obj, SignatureRequest):
+            touched[SOURCE_SIGNATURE_REQUEST].add(record_id)
+        elif isinstance(obj, SignatureRequestSigner):
+            touched[SOURCE_SIGNATURE_REQUEST].add(_state_value(obj, "request_id"))
+        elif isinstance(obj, ControlledDocument):
+            documents.add(record_id)
+            parent_deleted = parent_deleted or obj in session.deleted
+        elif isinstance(obj, DocumentApprovalWorkflow):
+            workflows.add(record_id)
+            parent_deleted = parent_deleted or obj in session.deleted
+
+    if not any(touched.values()) and not documents and not workflows:
+        return
+
+    conn = session.connection()
+    # A document title or a workflow's approver list shows on every pending
+    # instance that uses it.
+    parents = [
+        column.in_(ids)
+        for column, ids in (
+            (DocumentApprovalInstance.document_id, documents - {None}),
+            (DocumentApprovalInstance.workflow_id, workflows - {None}),
+        )
+        if ids
+    ]
+    for clause in parents:
+        touched[SOURCE_DOCUMENT_APPROVAL].update(
+            conn.execute(
+                select(DocumentApprovalInstance.id).where(DocumentApprovalInstance.status == "pending", clause)
+            ).scalars()
+        )
+
+    for source, ids in touched.items():
+        refresh_records(conn, source, ids - {None})
+
+    if parent_deleted:
+        # Instances go with their document or workflow by ON DELETE CASCADE, which
+        # the session never sees; drop whatever rows they leave behind.
+        conn.execute(
+            delete(_TABLE).where(
+                _TABLE.c.source == SOURCE_DOCUMENT_APPROVAL,
+                _TABLE.c.source_id.not_in(select(DocumentApprovalInstance.id)),
+            )
+        )
+
+
+def _rebuild(conn: Connection, tenant_id: Optional[int]) -> int:
+    if tenant_id is None:
+        conn.execute(delete(_TABLE))
+    else:
+        conn.execute(delete(_TABLE).where(_TABLE.c.tenant_id == tenant_id))
+    rows = _project(conn, tenant_id)
+    _insert(conn, rows)
+    return len(rows)
+
+
+async def rebuild_pending_decisions(db: AsyncSession, *, tenant_id: Optional[int] = None) -> int:
+    """Drop and re-project the inbox of one tenant, or of every tenant when ``None``.
+
+    Runs in the caller's transaction and does not commit, so a failed rebuild
+    leaves the previous projection in place. Returns the rows written.
+    """
+    connection = await db.connection()
+    written = await connection.run_sync(_rebuild, tenant_id)
+    logger.info("pending_decisions rebuilt: tenant=%s rows=%d", tenant_id or "all", written)
+    return written
+
+
+def _row_key(row: Any) -> tuple[Any, ...]:
+    return tuple(row[name] for name in _ROW_COLUMNS)
+
+
+@dataclass(frozen=True)
+class ProjectionDrift:
+    """How a tenant's stored projection differs from the domains it mirrors."""
+
+    tenant_id: int
+    #: Rows a fresh projection produces that the table does not hold.
+    missing: tuple[tuple[Any, ...], ...]
+    #: Rows the table holds that a fresh projection does not produce.
+    unexpected: tuple[tuple[Any, ...], ...]
+    #: Approver user ids whose projected inbox differs from the live readers'.
+    reader_mismatches: tuple[int, ...]
+    users_checked: int
+
+    @property
+    def is_consistent(self) -> bool:
+        return not (self.missing or self.unexpected or self.reader_mismatches)
+
+
+def _comparable(decisions: MyDecisions) -> MyDecisions:
+    """Decisions with every timestamp as naive UTC.
+
+    Aware columns round-trip naive on SQLite, so the two readers may disagree on
+    representation while agreeing on the instant; only the instant is compared.
+    """
+    return MyDecisions(
+        items=tuple(
+            replace(item, requested_at=_naive_utc(item.requested_at), due_at=_naive_utc(item.due_at))
+            for item in decisions.items
+        ),
+        sources=decisions.sources,
+    )
+
+
+async def check_pending_decisions(
+    db: AsyncSession,
+    *,
+    tenant_id: int,
+    max_users: int = DEFAULT_CHECK_USERS,
+) -> ProjectionDrift:
+    """Compare a tenant's projection with the domains, without writing.
+
+    Two passes. Row level: the stored rows against a fresh projection, as
+    multisets, which covers every approver including signers with no account.
+    Reader level: for up to ``max_users`` approvers named on either side, the
+    inbox ``collect_my_decisions`` builds from the projection against the one its
+    live readers build — the answer a user actually sees.
+    """
+    connection = await db.connection()
+    expected = Counter(_row_key(row) for row in await connection.run_sync(_project, tenant_id))
+    stored = Counter(
+        _row_key(row._mapping)
+        for row in (
+            await db.execute(select(*[_TABLE.c[name] for name in _ROW_COLUMNS]).where(_TABLE.c.tenant_id == tenant_id))
+        )
+    )
+    user_index = _ROW_COLUMNS.index("approver_user_id")
+    user_ids = sorted({key[user_index] for key in chain(expected, stored) if key[user_index] is not None})[:max_users]
+
+    emails: dict[int, Optional[str]] = {}
+    if user_ids:
+        emails = {
+            row.id: row.email for row in await db.execute(select(User.id, User.email).where(User.id.in_(user_ids)))
+        }
+    mismatches = []
+    for user_id in user_ids:
+        email = emails.get(user_id)
+        projected = await collect_my_decisions(
+            db, tenant_id=tenant_id, user_id=user_id, user_email=email, use_projection=True
+        )
+        live = await collect_my_decisions(
+            db, tenant_id=tenant_id, user_id=user_id, user_email=email, use_projection=False
+        )
+        if _comparable(projected) != _comparable(live):
+            mismatches.append(user_id)
+
+    return ProjectionDrift(
+        tenant_id=tenant_id,
+        missing=tuple(sorted((expected - stored).elements(), key=repr)),
+        unexpected=tuple(sorted((stored - expected).elements(), key=repr)),
+        reader_mismatches=tuple(mismatches),
+        users_checked=len(user_ids),
+    )
+
+
+__all__ = [
+    "DEFAULT_CHECK_USERS",
+    "ProjectionDrift",
+    "check_pending_decisions",
+    "rebuild_pending_decisions",
+    "refresh_after_flush",
+    "refresh_records",
+]
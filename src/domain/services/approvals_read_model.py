@@ -67,21 +67,32 @@ would put another person's work in your queue. A pending approval whose current
 step names nobody is therefore not silently dropped — it cannot be attributed to
 *anyone*, which is a defect in the workflow configuration, so it is counted and
 reported on the source (:attr:`SourceReading.unattributed`) instead of vanishing.
+
+The projection is a cache of these readers, not a replacement
+-------------------------------------------------------------
+With ``approvals_inbox_projection_enabled`` the inbox is read from
+``pending_decisions``, which ``approvals_inbox_projection`` keeps in step with
+the domains on every flush. The domains remain the source of truth: the readers
+below are what the projection is rebuilt from and checked against, and the
+attribution rules above apply unchanged because the projection copies them
+rather than restating them.
 """
 
 from __future__ import annotations
 
 from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Optional
 
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
 from src.domain.models.digital_signature import SignatureRequest, SignatureRequestSigner
 from src.domain.models.document_control import ControlledDocument, DocumentApprovalInstance, DocumentApprovalWorkflow
 from src.domain.models.investigation import InvestigationRun, InvestigationStatus
+from src.domain.models.pending_decision import PendingDecisionProjection
 from src.domain.services.schema_presence import absent_tables
 
 #: Source keys. Stable strings: the frontend keys its per-source copy off these,
@@ -104,12 +115,36 @@ BASIS_LAST_UPDATED = "last_updated"
 #: quietly wrong.
 MAX_ITEMS_PER_SOURCE = 50
 
+#: Panel heading per source, and the tables each source is read from.
+SOURCE_LABELS = {
+    SOURCE_INVESTIGATION_REVIEW: "Investigations awaiting my review",
+    SOURCE_DOCUMENT_APPROVAL: "Controlled documents naming me as approver",
+    SOURCE_SIGNATURE_REQUEST: "Signature requests awaiting my signature",
+}
+SOURCE_TABLES: dict[str, tuple[str, ...]] = {
+    SOURCE_INVESTIGATION_REVIEW: (InvestigationRun.__tablename__,),
+    SOURCE_DOCUMENT_APPROVAL: (
+        DocumentApprovalInstance.__tablename__,
+        DocumentApprovalWorkflow.__tablename__,
+    ),
+    SOURCE_SIGNATURE_REQUEST: (
+        SignatureRequest.__tablename__,
+        SignatureRequestSigner.__tablename__,
+    ),
+}
+#: What an unreadable source could not tell the caller about.
+_SOURCE_SUBJECTS = {
+    SOURCE_INVESTIGATION_REVIEW: "investigations under review",
+    SOURCE_DOCUMENT_APPROVAL: "document approvals",
+    SOURCE_SIGNATURE_REQUEST: "outstanding signatures",
+}
+
 #: Statuses a signature request must hold for a signature on it to be outstanding.
-_SIGNATURE_REQUEST_OPEN_STATUSES = ("pending", "in_progress")
+SIGNATURE_REQUEST_OPEN_STATUSES = ("pending", "in_progress")
 #: Statuses *this signer's* row must hold. ``viewed`` is still outstanding — the
 #: user opened the request and did not sign it, which is exactly the case this
 #: surface exists to keep visible.
-_SIGNATURE_SIGNER_OPEN_STATUSES = ("pending", "viewed")
+SIGNATURE_SIGNER_OPEN_STATUSES = ("pending", "viewed")
 
 
 @dataclass(frozen=True)
@@ -227,11 +262,12 @@ def approvers_for_step(workflow_steps: Any, step_number: int) -> tuple[frozenset
     return frozenset(ids), bool(ids)
 
 
-def _unavailable(key: str, label: str, absent: tuple[str, ...], what: str) -> SourceReading:
+def _unavailable(key: str, absent: tuple[str, ...]) -> SourceReading:
     """The reading for a source whose tables this database does not carry."""
+    what = _SOURCE_SUBJECTS[key]
     return SourceReading(
         key=key,
-        label=label,
+        label=SOURCE_LABELS[key],
         status="unavailable",
         count=None,
         reason=(
@@ -248,11 +284,10 @@ async def _read_investigation_reviews(
     user_id: int,
 ) -> tuple[list[PendingDecision], SourceReading]:
     """Investigations under review that name this user as the reviewer."""
-    label = "Investigations awaiting my review"
-    tables = (InvestigationRun.__tablename__,)
-    absent = await absent_tables(db, tables)
+    label = SOURCE_LABELS[SOURCE_INVESTIGATION_REVIEW]
+    absent = await absent_tables(db, SOURCE_TABLES[SOURCE_INVESTIGATION_REVIEW])
     if absent:
-        return [], _unavailable(SOURCE_INVESTIGATION_REVIEW, label, absent, "investigations under review")
+        return [], _unavailable(SOURCE_INVESTIGATION_REVIEW, absent)
 
     # Under review with no reviewer named. Counted for the same reason a document
     # approval step naming nobody is counted: it is waiting on a person this row
@@ -330,14 +365,10 @@ async def _read_document_approvals(
     SELECT against a missing relation aborts the transaction, which would take the
     other sources in this request down with it.
     """
-    label = "Controlled documents naming me as approver"
-    tables = (
-        DocumentApprovalInstance.__tablename__,
-        DocumentApprovalWorkflow.__tablename__,
-    )
-    absent = await absent_tables(db, tables)
+    label = SOURCE_LABELS[SOURCE_DOCUMENT_APPROVAL]
+    absent = await absent_tables(db, SOURCE_TABLES[SOURCE_DOCUMENT_APPROVAL])
     if absent:
-        return [], _unavailable(SOURCE_DOCUMENT_APPROVAL, label, absent, "document approvals")
+        return [], _unavailable(SOURCE_DOCUMENT_APPROVAL, absent)
 
     # Explicit columns: selecting whole entities here would load every document
     # column for a list that shows four fields.
@@ -428,14 +459,10 @@ async def _read_signature_requests(
     signers who hold no account, and a user invited by address before their
     account existed still owes the signature.
     """
-    label = "Signature requests awaiting my signature"
-    tables = (
-        SignatureRequest.__tablename__,
-        SignatureRequestSigner.__tablename__,
-    )
-    absent = await absent_tables(db, tables)
+    label = SOURCE_LABELS[SOURCE_SIGNATURE_REQUEST]
+    absent = await absent_tables(db, SOURCE_TABLES[SOURCE_SIGNATURE_REQUEST])
     if absent:
-        return [], _unavailable(SOURCE_SIGNATURE_REQUEST, label, absent, "outstanding signatures")
+        return [], _unavailable(SOURCE_SIGNATURE_REQUEST, absent)
 
     me = [SignatureRequestSigner.user_id == user_id]
     if user_email:
@@ -457,8 +484,8 @@ async def _read_signature_requests(
         .join(SignatureRequestSigner, SignatureRequestSigner.request_id == SignatureRequest.id)
         .where(
             SignatureRequest.tenant_id == tenant_id,
-            SignatureRequest.status.in_(_SIGNATURE_REQUEST_OPEN_STATUSES),
-            SignatureRequestSigner.status.in_(_SIGNATURE_SIGNER_OPEN_STATUSES),
+            SignatureRequest.status.in_(SIGNATURE_REQUEST_OPEN_STATUSES),
+            SignatureRequestSigner.status.in_(SIGNATURE_SIGNER_OPEN_STATUSES),
             or_(*me),
         )
         .distinct()
@@ -511,12 +538,139 @@ def _sort_key(item: PendingDecision) -> tuple[int, float, str]:
     return (1, -requested, item.key)
 
 
+#: Sources whose ``requested_at`` column is timezone-aware. The projection stores
+#: naive UTC for every source, so these get their zone back on the way out.
+_AWARE_REQUESTED_AT = frozenset({SOURCE_INVESTIGATION_REVIEW})
+
+
+async def _read_projection(
+    db: AsyncSession,
+    *,
+    tenant_id: int,
+    user_id: int,
+    user_email: Optional[str],
+) -> Optional[tuple[list[PendingDecision], list[SourceReading]]]:
+    """The same answer as the three domain readers, from ``pending_decisions``.
+
+    Two statements whatever the number of sources: the caller's rows, capped per
+    source by a window rather than one query each, and the unattributed counts.
+    ``None`` when the projection table itself is absent, so the caller falls back
+    to the live readers instead of reporting an empty inbox. A source whose own
+    tables are absent is still reported unavailable: an empty projection for it
+    would be exactly the confident empty list this module exists to avoid.
+    """
+    projection = PendingDecisionProjection
+    absent = await absent_tables(
+        db, (projection.__tablename__, *[table for tables in SOURCE_TABLES.values() for table in tables])
+    )
+    if projection.__tablename__ in absent:
+        return None
+
+    unreadable = {
+        key: tuple(table for table in tables if table in absent)
+        for key, tables in SOURCE_TABLES.items()
+        if any(table in absent for table in tables)
+    }
+    readable = [key for key in SOURCE_TABLES if key not in unreadable]
+
+    me = [projection.approver_user_id == user_id]
+    if user_email:
+        me.append(projection.approver_email == user_email.strip().lower())
+
+    # distinct(): one row per decision, however many ways the caller is named on it.
+    mine = (
+        select(
+            projection.source,
+            projection.source_id,
+            projection.decision,
+            projection.title,
+            projection.reference,
+            projection.requested_at,
+            projection.requested_at_basis,
+            projection.due_at,
+            projection.deep_link,
+        )
+        .where(projection.tenant_id == tenant_id, projection.source.in_(readable), or_(*me))
+        .distinct()
+        .subquery()
+    )
+    rank = (
+        func.row_number()
+        .over(partition_by=mine.c.source, order_by=(mine.c.requested_at.desc(), mine.c.source_id.desc()))
+        .label("rank")
+    )
+    ranked = select(mine, rank).subquery()
+    rows = (
+        await db.execute(
+            select(ranked).where(ranked.c.rank <= MAX_ITEMS_PER_SOURCE + 1).order_by(ranked.c.source, ranked.c.rank)
+        )
+    ).all()
+
+    unattributed = {
+        source: int(count)
+        for source, count in (
+            await db.execute(
+                select(projection.source, func.count(func.distinct(projection.source_id)))
+                .where(
+                    projection.tenant_id == tenant_id,
+                    projection.source.in_(readable),
+                    projection.approver_user_id.is_(None),
+                    projection.approver_email.is_(None),
+                )
+                .group_by(projection.source)
+            )
+        ).all()
+    }
+
+    by_source: dict[str, list[Any]] = {key: [] for key in readable}
+    for row in rows:
+        by_source[row.source].append(row)
+
+    items: list[PendingDecision] = []
+    sources: list[SourceReading] = []
+    for key in SOURCE_TABLES:
+        if key in unreadable:
+            sources.append(_unavailable(key, unreadable[key]))
+            continue
+        kept = by_source[key][:MAX_ITEMS_PER_SOURCE]
+        for row in kept:
+            requested_at = row.requested_at
+            if requested_at is not None and key in _AWARE_REQUESTED_AT:
+                requested_at = requested_at.replace(tzinfo=timezone.utc)
+            items.append(
+                PendingDecision(
+                    key=f"{key}:{row.source_id}",
+                    source=key,
+                    source_label=SOURCE_LABELS[key],
+                    decision=row.decision,
+                    title=row.title,
+                    reference=row.reference,
+                    requested_at=requested_at,
+                    requested_at_basis=row.requested_at_basis,
+                    due_at=row.due_at,
+                    deep_link=row.deep_link,
+                )
+            )
+        sources.append(
+            SourceReading(
+                key=key,
+                label=SOURCE_LABELS[key],
+                status="live",
+                count=len(kept),
+                unattributed=unattributed.get(key, 0),
+                truncated=len(by_source[key]) > MAX_ITEMS_PER_SOURCE,
+            )
+        )
+    return items, sources
+
+
 async def collect_my_decisions(
     db: AsyncSession,
     *,
     tenant_id: int,
     user_id: int,
     user_email: Optional[str] = None,
+    use_projection: Optional[bool] = None,
 ) -> MyDecisions:
     """Ask every wired domain what this user owes, and account for the ones that could not answer.
 
@@ -524,7 +678,20 @@ async def collect_my_decisions(
     ``AsyncSession``, which is not safe for concurrent use, and a session per
     source would buy latency at the cost of reading the request in several
     transactions.
+
+    With the inbox projection enabled (``use_projection``, defaulting to
+    ``settings.approvals_inbox_projection_enabled``) the answer is read from
+    ``pending_decisions`` instead — see ``approvals_inbox_projection`` for how it
+    is kept current and checked against the readers below.
     """
+    if use_projection is None:
+        use_projection = settings.approvals_inbox_projection_enabled
+    if use_projection:
+        projected = await _read_projection(db, tenant_id=tenant_id, user_id=user_id, user_email=user_email)
+        if projected is not None:
+            projected_items, projected_sources = projected
+            return MyDecisions(items=tuple(sorted(projected_items, key=_sort_key)), sources=tuple(projected_sources))
+
     items: list[PendingDecision] = []
     sources: list[SourceReading] = []
 
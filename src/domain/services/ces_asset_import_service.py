@@ -21,7 +21,7 @@ from src.domain.models.training_matrix import TrainingMatrixNameMap
 from src.domain.models.user import User
 from src.domain.services.asset_service import AssetService
 from src.domain.services.ces_asset_import_parser import cell_text, normalise_ces_row
-from src.domain.services.lookup_similarity import classify_lookup_name, normalise_lookup_key
+from src.domain.services.lookup_similarity import LookupMatchIndex, normalise_lookup_key
 from src.domain.services.notification_service import NotificationService
 from src.domain.services.training_matrix_parser import normalize_person_name
 
@@ -442,8 +442,8 @@ class CesAssetImportService:
         types: list[AssetType],
         locations: list[Location],
     ) -> list[LookupProposal]:
-        type_candidates = [(item.id, item.name) for item in types]
-        location_candidates = [(item.id, item.name) for item in locations]
+        type_index = LookupMatchIndex((item.id, item.name) for item in types)
+        location_index = LookupMatchIndex((item.id, item.name) for item in locations)
         type_counts: dict[str, tuple[str, int]] = {}
         location_counts: dict[str, tuple[str, int]] = {}
         for row in rows:
@@ -463,8 +463,9 @@ class CesAssetImportService:
                 location_counts[key] = (display, count + 1)
 
         proposals: list[LookupProposal] = []
-        for _key, (name, count) in sorted(type_counts.items(), key=lambda item: item[1][0].lower()):
-            intent, exact, similar = classify_lookup_name(name, type_candidates)
+        type_entries = sorted(type_counts.values(), key=lambda item: item[0].lower())
+        type_results = type_index.classify_many(name for name, _count in type_entries)
+        for (name, count), (intent, exact, similar) in zip(type_entries, type_results):
             proposals.append(
                 LookupProposal(
                     kind="asset_type",
@@ -477,8 +478,9 @@ class CesAssetImportService:
                     needs_confirmation=intent == "similar",
                 )
             )
-        for _key, (name, count) in sorted(location_counts.items(), key=lambda item: item[1][0].lower()):
-            intent, exact, similar = classify_lookup_name(name, location_candidates)
+        location_entries = sorted(location_counts.values(), key=lambda item: item[0].lower())
+        location_results = location_index.classify_many(name for name, _count in location_entries)
+        for (name, count), (intent, exact, similar) in zip(location_entries, location_results):
             proposals.append(
                 LookupProposal(
                     kind="location",
@@ -0,0 +1,135 @@
+"""As-of compliance counts for many cut-offs from one pass over the data.
+
+The dashboard asks the same question at up to 52 weekly cut-offs: "how many
+assets / training cells were compliant at time *t*?". Answering it by rescanning
+every row per cut-off is O(weeks × rows) in Python. Every condition involved is
+monotone in *t*, though: an asset joins the population once it is created and
+becomes overdue once its expiry day has passed, and a certificate stays
+compliant until its expiry day ends. So each count is a prefix of a sorted
+column, and :mod:`bisect` answers it in O(log rows):
+
+* build once, O(rows log rows): keep only the date columns and sort them;
+* query per cut-off, O(log rows), with no per-row Python work.
+
+The row-at-a-time definitions stay authoritative —
+:func:`~src.domain.services.asset_health_analytics_service.aggregate_asset_health_kpis`
+for tools and :func:`~src.domain.services.executive_dashboard.training_cell_is_compliant`
+for training — and the unit tests compare both timelines against them.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, Optional
+
+from src.domain.models.asset import AssetStatus
+from src.domain.services.asset_health_analytics_service import is_removed_asset_status
+
+
+def _aware(moment: datetime) -> datetime:
+    """Naive timestamps are stored UTC; make them comparable with aware cut-offs."""
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=timezone.utc)
+
+
+class ToolComplianceTimeline:
+    """Tool (safety asset) compliance at any cut-off, from one sorted build.
+
+    At cut-off ``t`` the population is the assets created at or before ``t``.
+    Removed assets are out of service; of the rest, an asset is non-compliant if
+    it is overdue (its expiry *day* is before ``t``'s day, the banding rule of
+    ``aggregate_asset_health_kpis``) or quarantined. An asset that is both is
+    subtracted twice, as the dashboard always has.
+    """
+
+    def __init__(self, rows: Iterable[tuple[str, Optional[datetime], Optional[datetime]]]) -> None:
+        """``rows`` are ``(status value, expiry_date, created_at)`` per asset."""
+        in_service: list[datetime] = []
+        quarantined: list[datetime] = []
+        overdue_from: list[datetime] = []
+        undated = {"in_service": 0, "quarantined": 0}
+        for status, expiry_date, created_at in rows:
+            if is_removed_asset_status(status):
+                continue
+            created = _aware(created_at) if created_at is not None else None
+            if created is None:
+                undated["in_service"] += 1
+            else:
+                in_service.append(created)
+            if status == AssetStatus.QUARANTINED.value:
+                if created is None:
+                    undated["quarantined"] += 1
+                else:
+                    quarantined.append(created)
+            if expiry_date is not None and expiry_date.date() < date.max:
+                # Overdue from the first instant of the day after the expiry day
+                # (in UTC, the zone of the cut-offs), and never before creation.
+                lapses = datetime.combine(expiry_date.date() + timedelta(days=1), time.min, tzinfo=timezone.utc)
+                overdue_from.append(lapses if created is None else max(lapses, created))
+        self._in_service = sorted(in_service)
+        self._quarantined = sorted(quarantined)
+        self._overdue_from = sorted(overdue_from)
+        self._undated_in_service = undated["in_service"]
+        self._undated_quarantined = undated["quarantined"]
+
+    def in_service_at(self, cutoff: datetime) -> int:
+        return self._undated_in_service + bisect_right(self._in_service, cutoff)
+
+    def quarantined_at(self, cutoff: datetime) -> int:
+        return self._undated_quarantined + bisect_right(self._quarantined, cutoff)
+
+    def overdue_at(self, cutoff: datetime) -> int:
+        """Non-removed assets whose expiry day is before ``cutoff``'s UTC day."""
+        # ``cutoff.date() > expiry day`` is ``cutoff >= midnight after expiry``.
+        return bisect_right(self._overdue_from, cutoff)
+
+    def compliance_pct_at(self, cutoff: datetime) -> float:
+        """Percent of in-service assets neither overdue nor quarantined; 100 when none."""
+        in_service = self.in_service_at(cutoff)
+        if in_service <= 0:
+            return 100.0
+        compliant = in_service - self.overdue_at(cutoff) - self.quarantined_at(cutoff)
+        return round(100.0 * compliant / in_service, 1)
+
+
+class TrainingComplianceTimeline:
+    """Training matrix compliance at any date, from one sorted build.
+
+    Built from the *scored* cells' ``(passed_on, expires_on)`` pairs, so
+    :attr:`measured` is the shared denominator of the headline summary and the
+    weekly sparkline.
+    """
+
+    def __init__(self, cells: Iterable[tuple[Optional[date], Optional[date]]]) -> None:
+        passed_expiries: list[date] = []
+        expiries: list[date] = []
+        measured = 0
+        passed_never_expire = 0
+        for passed_on, expires_on in cells:
+            measured += 1
+            if expires_on is not None:
+                expiries.append(expires_on)
+                if passed_on is not None:
+                    passed_expiries.append(expires_on)
+            elif passed_on is not None:
+                passed_never_expire += 1
+        self.measured = measured
+        self._passed_never_expire = passed_never_expire
+        self._passed_expiries = sorted(passed_expiries)
+        self._expiries = sorted(expiries)
+
+    def compliant_at(self, as_of: date) -> int:
+        """Passed cells that never expire or expire on or after ``as_of``."""
+        still_valid = len(self._passed_expiries) - bisect_left(self._passed_expiries, as_of)
+        return self._passed_never_expire + still_valid
+
+    def overdue_at(self, as_of: date) -> int:
+        """Cells whose expiry is before ``as_of``, passed or not."""
+        return bisect_left(self._expiries, as_of)
+
+    def expiring_between(self, start: date, end: date) -> int:
+        """Cells with ``start <= expires_on < end``."""
+        return max(bisect_left(self._expiries, end) - bisect_left(self._expiries, start), 0)
+
+
+__all__ = ["ToolComplianceTimeline", "TrainingComplianceTimeline"]
@@ -8,6 +8,8 @@ Enterprise-grade document analysis using Claude AI for:
 - Quality and compliance checking
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
@@ -18,6 +20,7 @@ import httpx
 
 from src.core.config import settings
 from src.domain.services.upstream_circuit_breaker import call_via_upstream_breaker
+from src.infrastructure.cache.redis_cache import get_cache
 
 logger = logging.getLogger(__name__)
 
@@ -383,7 +386,14 @@ Return ONLY the JSON array, no markdown fences, no preamble."""
     async def generate_chunks(
         self, content: str, max_chunk_size: int = 1000, overlap: int = 100
     ) -> list[DocumentChunk]:
-        """Split document into semantic chunks for vector embedding."""
+        """Split document into semantic chunks for vector embedding.
+
+        The splitter is pure-Python regex work, so it runs in a worker thread to
+        keep large documents from stalling the event loop.
+        """
+        return await asyncio.to_thread(self._split_chunks, content, max_chunk_size, overlap)
+
+    def _split_chunks(self, content: str, max_chunk_size: int, overlap: int) -> list[DocumentChunk]:
 
         chunks: list[DocumentChunk] = []
 
@@ -536,12 +546,41 @@ class EmbeddingService:
             logger.error(f"Embedding generation failed: {e}")
             return []
 
+    def _query_embedding_cache_key(self, query: str) -> str:
+        digest = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        return f"query_embedding:v1:{self.model}:{digest}"
+
     async def generate_query_embedding(self, query: str) -> Optional[list[float]]:
-        """Generate embedding for a search query."""
+        """Generate embedding for a search query.
+
+        Embeddings are cached by model and whitespace-normalised query text, so a
+        paginated or repeated search embeds its query once.
+        """
 
         if not self.voyage_api_key:
             return None
 
+        query = " ".join(query.split())
+        ttl = settings.query_embedding_cache_ttl_seconds
+        cache_key = self._query_embedding_cache_key(query)
+        if ttl > 0:
+            try:
+                cached = await get_cache().get(cache_key)
+            except Exception:
+                logger.debug("Query embedding cache read failed", exc_info=True)
+                cached = None
+            if isinstance(cached, list) and cached:
+                return cached
+
+        embedding = await self._request_query_embedding(query)
+        if embedding and ttl > 0:
+            try:
+                await get_cache().set(cache_key, embedding, ttl)
+            except Exception:
+                logger.debug("Query embedding cache write failed", exc_info=True)
+        return embedding
+
+    async def _request_query_embedding(self, query: str) -> Optional[list[float]]:
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
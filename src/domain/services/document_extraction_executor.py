@@ -0,0 +1,320 @@
+"""Off-loop native document extraction: process pool, per-job limits, result cache.
+
+``extract_document_content`` is CPU-bound (pdfplumber walks every glyph of every
+page), so calling it from a coroutine stalls the event loop for the whole parse.
+This executor runs it in a process pool with a per-job timeout and a per-worker
+address-space cap, fans large PDFs out across workers page range by page range,
+and caches successful results by content hash so re-uploads and re-indexes of the
+same bytes skip extraction entirely.
+
+Every failure mode returns an ``ExtractedDocumentContent`` with an empty text and
+a note, exactly like the synchronous extractor does for unreadable files, so the
+OCR fallbacks in the callers keep working unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict
+from typing import Any, Callable, TypeVar
+
+from src.core.config import settings
+from src.domain.models.document import FileType
+from src.domain.services.document_extraction_service import (
+    ExtractedDocumentContent,
+    count_pdf_pages,
+    extract_document_content,
+    extract_pdf_page_range,
+)
+from src.infrastructure.cache.redis_cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_CACHE_PREFIX = "doc_extraction:v1"
+# Keep multi-megabyte corpora out of the shared cache; they are rare and the
+# in-memory fallback holds values by reference.
+_MAX_CACHED_CHARS = 2_000_000
+
+
+def _limit_worker_memory(limit_mb: int) -> None:
+    """Pool initializer: cap the worker's address space.
+
+    A decompression-bomb PDF then fails with MemoryError inside the worker (or the
+    worker dies and the pool is recycled) instead of taking the host down.
+    """
+    if limit_mb <= 0:
+        return
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - non-POSIX hosts
+        return
+    limit = limit_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):  # pragma: no cover - hard limit below the request
+        logger.warning("Could not cap extraction worker memory at %s MB", limit_mb)
+
+
+def extraction_cache_key(file_type: FileType, digest: str) -> str:
+    """Cache key for one file's native extraction — the bytes, not the name, decide."""
+    return f"{_CACHE_PREFIX}:{file_type.value}:{digest}"
+
+
+def _content_digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _failure(file_name: str, reason: str) -> ExtractedDocumentContent:
+    return ExtractedDocumentContent(text="", note=f"Stored successfully but extraction {reason} for {file_name}.")
+
+
+class DocumentExtractionExecutor:
+    """Async facade over a process pool running the native extractors.
+
+    ``workers=0`` (or a host where child processes cannot be started, such as a
+    daemonic Celery prefork child) runs extraction in a worker thread instead:
+    still off the event loop, without the memory cap or page fan-out.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int | None = None,
+        timeout_seconds: float | None = None,
+        memory_limit_mb: int | None = None,
+        split_pages: int | None = None,
+        pages_per_task: int | None = None,
+        cache_ttl_seconds: int | None = None,
+        cache: Any | None = None,
+    ) -> None:
+        self.workers = settings.document_extraction_workers if workers is None else workers
+        self.timeout_seconds = (
+            settings.document_extraction_timeout_seconds if timeout_seconds is None else timeout_seconds
+        )
+        self.memory_limit_mb = (
+            settings.document_extraction_memory_limit_mb if memory_limit_mb is None else memory_limit_mb
+        )
+        self.split_pages = settings.document_extraction_split_pages if split_pages is None else split_pages
+        self.pages_per_task = max(
+            1, settings.document_extraction_pages_per_task if pages_per_task is None else pages_per_task
+        )
+        self.cache_ttl_seconds = (
+            settings.document_extraction_cache_ttl_seconds if cache_ttl_seconds is None else cache_ttl_seconds
+        )
+        self._cache = cache
+        self._pool: ProcessPoolExecutor | None = None
+        if self.workers > 0 and multiprocessing.current_process().daemon:
+            logger.info("Extraction executor running in a daemonic process; using threads")
+            self.workers = 0
+
+    @property
+    def uses_processes(self) -> bool:
+        return self.workers > 0
+
+    def _executor(self) -> ProcessPoolExecutor | None:
+        if not self.uses_processes:
+            return None
+        if self._pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            # forkserver: workers fork from a clean single-threaded server rather
+            # than from this process and its event loop / exporter threads.
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            if context.get_start_method() == "forkserver":
+                context.set_forkserver_preload(["src.domain.services.document_extraction_service"])
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_limit_worker_memory,
+                initargs=(self.memory_limit_mb,),
+            )
+        return self._pool
+
+    def _recycle(self, pool: ProcessPoolExecutor | None) -> None:
+        """Drop ``pool``, killing workers that are still grinding a timed-out job.
+
+        ProcessPoolExecutor has no public way to stop a running task, and a hung
+        worker would otherwise hold its slot forever. Only the caller that
+        submitted to ``pool`` recycles it, and a pool that has already been
+        replaced is left alone, so a second failure cannot kill its successor.
+        Jobs sharing the pool at that moment see BrokenProcessPool and retry.
+        """
+        if pool is None or self._pool is not pool:
+            return
+        self._pool = None
+        processes = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            try:
+                process.terminate()
+            except Exception:  # pragma: no cover - already gone
+                pass
+
+    def shutdown(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, pool: ProcessPoolExecutor | None, fn: Callable[..., T], *args: Any) -> T:
+        if pool is None:
+            return await asyncio.to_thread(fn, *args)
+        return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+
+    def _cache_backend(self) -> Any:
+        if self._cache is None:
+            self._cache = get_cache()
+        return self._cache
+
+    async def _cache_get(self, key: str) -> ExtractedDocumentContent | None:
+        if self.cache_ttl_seconds <= 0:
+            return None
+        try:
+            payload = await self._cache_backend().get(key)
+        except Exception:
+            logger.debug("Extraction cache read failed for %s", key, exc_info=True)
+            return None
+        if not isinstance(payload, dict):
+            return None
+        try:
+            return ExtractedDocumentContent(**copy.deepcopy(payload))
+        except TypeError:
+            return None
+
+    async def _cache_set(self, key: str, result: ExtractedDocumentContent) -> None:
+        if self.cache_ttl_seconds <= 0 or not result.text.strip() or len(result.text) > _MAX_CACHED_CHARS:
+            return
+        try:
+            await self._cache_backend().set(key, asdict(result), self.cache_ttl_seconds)
+        except Exception:
+            logger.debug("Extraction cache write failed for %s", key, exc_info=True)
+
+    async def extract(self, file_type: FileType, file_name: str, content: bytes) -> ExtractedDocumentContent:
+        """Extract searchable text without blocking the event loop."""
+        key = extraction_cache_key(file_type, await asyncio.to_thread(_content_digest, content))
+        cached = await self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        retried = False
+        while True:
+            pool = self._executor()
+            try:
+                result = await asyncio.wait_for(
+                    self._extract_uncached(pool, file_type, file_name, content),
+                    timeout=self.timeout_seconds,
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Native extraction timed out after %ss for %s", self.timeout_seconds, file_name)
+                self._recycle(pool)
+                return _failure(file_name, "timed out")
+            except BrokenProcessPool:
+                # Either this job's worker died or another job recycled the pool
+                # under it; one retry on a fresh pool tells the two apart.
+                self._recycle(pool)
+                if not retried:
+                    logger.info("Extraction pool broke under %s; retrying on a fresh pool", file_name)
+                    retried = True
+                    continue
+                logger.warning("Native extraction exhausted worker memory for %s", file_name)
+                return _failure(file_name, "exceeded the memory limit")
+            except MemoryError:
+                logger.warning("Native extraction exhausted worker memory for %s", file_name)
+                return _failure(file_name, "exceeded the memory limit")
+
+            await self._cache_set(key, result)
+            return result
+
+    async def _extract_uncached(
+        self,
+        pool: ProcessPoolExecutor | None,
+        file_type: FileType,
+        file_name: str,
+        content: bytes,
+    ) -> ExtractedDocumentContent:
+        if file_type == FileType.PDF and self.workers > 1 and self.split_pages > 0:
+            page_count = await asyncio.to_thread(count_pdf_pages, content)
+            if page_count and page_count > self.split_pages:
+                split = await self._extract_pdf_ranges(pool, file_name, content, page_count)
+                if split is not None:
+                    return split
+        return await self._run(pool, extract_document_content, file_type, file_name, content)
+
+    async def _extract_pdf_ranges(
+        self,
+        pool: ProcessPoolExecutor | None,
+        file_name: str,
+        content: bytes,
+        page_count: int,
+    ) -> ExtractedDocumentContent | None:
+        """Extract page ranges in parallel and stitch them in page order.
+
+        Returns None when any range fails or the PDF has no text layer, so the
+        whole-document path (which owns the pypdf fallback) decides the result.
+        """
+        ranges = [
+            (first, min(first + self.pages_per_task - 1, page_count))
+            for first in range(1, page_count + 1, self.pages_per_task)
+        ]
+        parts = await asyncio.gather(
+            *(self._run(pool, extract_pdf_page_range, content, file_name, first, last) for first, last in ranges)
+        )
+        if any(part is None for part in parts):
+            return None
+        page_texts = [page_text for part in parts if part is not None for page_text in part.page_texts]
+        text = "\n\n".join(page_text for page_text in page_texts if page_text.strip())
+        if not text.strip():
+            return None
+        return ExtractedDocumentContent(
+            text=text,
+            page_count=page_count,
+            page_texts=page_texts,
+            has_tables=any(part.has_tables for part in parts if part is not None),
+            extraction_method="pdfplumber",
+            color_annotations=[
+                annotation for part in parts if part is not None for annotation in part.color_annotations
+            ],
+        )
+
+
+_executor: DocumentExtractionExecutor | None = None
+
+
+def document_extraction_executor() -> DocumentExtractionExecutor:
+    """Get the process-wide extraction executor."""
+    global _executor
+    if _executor is None:
+        _executor = DocumentExtractionExecutor()
+    return _executor
+
+
+def shutdown_document_extraction_executor() -> None:
+    """Release the worker pool (application shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+
+
+async def extract_document_content_async(
+    file_type: FileType,
+    file_name: str,
+    content: bytes,
+) -> ExtractedDocumentContent:
+    """Async drop-in for ``extract_document_content``."""
+    return await document_extraction_executor().extract(file_type, file_name, content)
+
+
+__all__ = [
+    "DocumentExtractionExecutor",
+    "document_extraction_executor",
+    "extract_document_content_async",
+    "extraction_cache_key",
+    "shutdown_document_extraction_executor",
+]
@@ -163,6 +163,52 @@ def _classify_color(color) -> str | None:
     return None
 
 
+def _pdfplumber_page(page) -> tuple[str, bool, list[dict[str, object]]]:
+    """Extract one pdfplumber page: (normalized text, has_tables, color annotations)."""
+    parts: list[str] = []
+    has_tables = False
+    color_annotations: list[dict[str, object]] = []
+
+    table_objects = page.find_tables()
+    if table_objects:
+        has_tables = True
+        for tbl in table_objects:
+            for row in tbl.extract():
+                cells = [str(c).strip() for c in row if c]
+                if cells:
+                    parts.append(" | ".join(cells))
+
+    try:
+        for rect in page.rects or []:
+            fill = rect.get("non_stroking_color")
+            label = _classify_color(fill)
+            if label:
+                color_annotations.append(
+                    {
+                        "page": page.page_number,
+                        "type": "cell_fill",
+                        "color_label": label,
+                        "x0": rect.get("x0"),
+                        "y0": rect.get("y0"),
+                    }
+                )
+    except Exception:
+        pass
+
+    # Extract text outside table bounding boxes to avoid duplication
+    text_page = page
+    if table_objects:
+        for tbl in table_objects:
+            try:
+                text_page = text_page.outside_bbox(tbl.bbox)
+            except Exception:
+                pass
+    plain = text_page.extract_text(x_tolerance=5, y_tolerance=3)
+    if plain:
+        parts.append(plain.strip())
+    return _fix_concatenated_words(_normalize_symbols("\n".join(parts))), has_tables, color_annotations
+
+
 def _extract_pdf_via_pdfplumber(content: bytes, file_name: str) -> ExtractedDocumentContent | None:
     """Use pdfplumber for table-aware PDF extraction with color detection."""
     try:
@@ -177,48 +223,11 @@ def _extract_pdf_via_pdfplumber(content: bytes, file_name: str) -> ExtractedDocu
 
         with pdfplumber.open(io.BytesIO(content)) as pdf:
             page_count = len(pdf.pages)
-            for page_num, page in enumerate(pdf.pages, start=1):
-                parts: list[str] = []
-
-                table_objects = page.find_tables()
-                if table_objects:
-                    has_tables = True
-                    for tbl in table_objects:
-                        for row in tbl.extract():
-                            cells = [str(c).strip() for c in row if c]
-                            if cells:
-                                parts.append(" | ".join(cells))
-
-                try:
-                    for rect in page.rects or []:
-                        fill = rect.get("non_stroking_color")
-                        label = _classify_color(fill)
-                        if label:
-                            color_annotations.append(
-                                {
-                                    "page": page_num,
-                                    "type": "cell_fill",
-                                    "color_label": label,
-                                    "x0": rect.get("x0"),
-                                    "y0": rect.get("y0"),
-                                }
-                            )
-                except Exception:
-                    pass
-
-                # Extract text outside table bounding boxes to avoid duplication
-                text_page = page
-                if table_objects:
-                    for tbl in table_objects:
-                        try:
-                            text_page = text_page.outside_bbox(tbl.bbox)
-                        except Exception:
-                            pass
-                plain = text_page.extract_text(x_tolerance=5, y_tolerance=3)
-                if plain:
-                    parts.append(plain.strip())
-                page_text = _fix_concatenated_words(_normalize_symbols("\n".join(parts)))
+            for page in pdf.pages:
+                page_text, page_has_tables, page_colors = _pdfplumber_page(page)
                 page_texts.append(page_text)
+                has_tables = has_tables or page_has_tables
+                color_annotations.extend(page_colors)
 
         filtered = [p for p in page_texts if p.strip()]
         text = "\n\n".join(filtered)
@@ -238,6 +247,56 @@ def _extract_pdf_via_pdfplumber(content: bytes, file_name: str) -> ExtractedDocu
         return None
 
 
+def count_pdf_pages(content: bytes) -> int | None:
+    """Return the PDF page count, or None when the file cannot be read cheaply."""
+    try:
+        from pypdf import PdfReader
+
+        reader = PdfReader(io.BytesIO(content))
+        if getattr(reader, "is_encrypted", False):
+            return None
+        return len(reader.pages)
+    except Exception:
+        return None
+
+
+def extract_pdf_page_range(
+    content: bytes, file_name: str, first_page: int, last_page: int
+) -> ExtractedDocumentContent | None:
+    """pdfplumber extraction of pages ``first_page..last_page`` (1-based, inclusive).
+
+    Produces exactly the per-page output of ``_extract_pdf_via_pdfplumber`` so the
+    extraction executor can fan a large PDF out across workers and stitch the
+    ranges back together. Returns None on any failure so the caller can fall back
+    to whole-document extraction, which owns the pypdf path.
+    """
+    try:
+        import pdfplumber  # noqa: F811
+    except ImportError:
+        return None
+
+    try:
+        page_texts: list[str] = []
+        has_tables = False
+        color_annotations: list[dict[str, object]] = []
+        with pdfplumber.open(io.BytesIO(content), pages=list(range(first_page, last_page + 1))) as pdf:
+            for page in pdf.pages:
+                page_text, page_has_tables, page_colors = _pdfplumber_page(page)
+                page_texts.append(page_text)
+                has_tables = has_tables or page_has_tables
+                color_annotations.extend(page_colors)
+        return ExtractedDocumentContent(
+            text="",
+            page_texts=page_texts,
+            has_tables=has_tables,
+            extraction_method="pdfplumber",
+            color_annotations=color_annotations,
+        )
+    except Exception as exc:
+        logger.warning("pdfplumber range %s-%s failed for %s: %s", first_page, last_page, file_name, type(exc).__name__)
+        return None
+
+
 def _extract_docx_via_python_docx(content: bytes, file_name: str) -> ExtractedDocumentContent | None:
     """Extract text and tables from DOCX using python-docx. Returns None if unavailable."""
     try:
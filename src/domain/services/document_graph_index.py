@@ -0,0 +1,309 @@
+"""Per-tenant in-memory index of live Doc Graph ``implements`` edges.
+
+Two hot paths walk the ``implements`` layer. ``would_create_implements_cycle``
+used to issue one query per ancestor while guarding every new edge, and
+``get_cascade_aggregate`` re-read every confirmed edge on each Structure map
+view. Both now read an ``ImplementsIndex``: the tenant's live ``implements``
+edges in the statuses cycle detection counts (proposed, confirmed,
+needs_review), held as adjacency maps with a memo of each document's ancestor
+set, so a cycle check is a set lookup once the memo is warm.
+
+``implements_fingerprint`` reads the row count, max id and latest
+``updated_at`` of the tenant's ``implements`` edges (every status, deleted rows
+included) in one statement; the index is rebuilt when that changes or when it
+is older than ``document_graph_index_max_age_seconds``. The service's own
+writes apply their delta in place through ``record_implements_write`` instead
+of forcing a rebuild, and ``verify_implements_index`` compares a cached index
+with the database for operators chasing drift.
+
+The index is per process and bounded. A write that bypasses the ORM and leaves
+``updated_at`` alone (and does not change a row count) is only seen once the
+index ages out; call ``invalidate_implements_index`` after one.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.domain.models.document_graph import DocumentEdge, DocumentEdgeStatus, DocumentEdgeType
+from src.infrastructure.monitoring.azure_monitor import track_metric
+
+MAX_INDEXED_TENANTS = 64
+
+# Same statuses as the service's cycle guard: rejected edges are inert.
+INDEXED_STATUSES = frozenset(
+    {
+        DocumentEdgeStatus.PROPOSED,
+        DocumentEdgeStatus.CONFIRMED,
+        DocumentEdgeStatus.NEEDS_REVIEW,
+    }
+)
+
+_EDGE_COLUMNS = tuple(DocumentEdge.__table__.columns)
+
+_indexes: "OrderedDict[int, ImplementsIndex]" = OrderedDict()
+
+
+@dataclass(frozen=True)
+class IndexedEdge:
+    """One live ``implements`` edge; ``row`` carries every column for API payloads."""
+
+    id: int
+    src_document_id: int
+    dst_document_id: int
+    status: DocumentEdgeStatus
+    is_primary_parent: bool
+    dst_pel_doc_ref: Optional[str]
+    row: Mapping[str, Any]
+
+    @classmethod
+    def from_row(cls, row: Mapping[Any, Any]) -> "IndexedEdge":
+        return cls(
+            id=row["id"],
+            src_document_id=row["src_document_id"],
+            dst_document_id=row["dst_document_id"],
+            status=DocumentEdgeStatus(row["status"]),
+            is_primary_parent=bool(row["is_primary_parent"]),
+            dst_pel_doc_ref=row["dst_pel_doc_ref"],
+            row=dict(row),
+        )
+
+    @classmethod
+    def from_model(cls, edge: DocumentEdge) -> "IndexedEdge":
+        return cls.from_row({column.key: getattr(edge, column.key) for column in _EDGE_COLUMNS})
+
+
+def _is_indexed(row: Mapping[Any, Any]) -> bool:
+    return (
+        row["deleted_at"] is None
+        and DocumentEdgeType(row["edge_type"]) == DocumentEdgeType.IMPLEMENTS
+        and DocumentEdgeStatus(row["status"]) in INDEXED_STATUSES
+    )
+
+
+@dataclass(eq=False)
+class ImplementsIndex:
+    """Adjacency of one tenant's live ``implements`` edges (child ``src`` → parent ``dst``)."""
+
+    tenant_id: int
+    fingerprint: tuple[Any, ...]
+    built_at: float = field(default_factory=time.monotonic)
+    edges: dict[int, IndexedEdge] = field(default_factory=dict)
+    by_src: dict[int, set[int]] = field(default_factory=dict)
+    by_dst: dict[int, set[int]] = field(default_factory=dict)
+    _ancestors: dict[int, frozenset[int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls, tenant_id: int, fingerprint: tuple[Any, ...], rows: Iterable[Mapping[Any, Any]]
+    ) -> "ImplementsIndex":
+        index = cls(tenant_id=tenant_id, fingerprint=fingerprint)
+        for row in rows:
+            if _is_indexed(row):
+                index._link(IndexedEdge.from_row(row))
+        return index
+
+    def _link(self, edge: IndexedEdge) -> None:
+        self.edges[edge.id] = edge
+        self.by_src.setdefault(edge.src_document_id, set()).add(edge.id)
+        self.by_dst.setdefault(edge.dst_document_id, set()).add(edge.id)
+
+    def _unlink(self, edge_id: int) -> Optional[IndexedEdge]:
+        edge = self.edges.pop(edge_id, None)
+        if edge is not None:
+            self.by_src[edge.src_document_id].discard(edge_id)
+            self.by_dst[edge.dst_document_id].discard(edge_id)
+        return edge
+
+    def apply(self, row: Mapping[str, Any]) -> None:
+        """Bring one edge up to date from its current column values."""
+        previous = self._unlink(row["id"])
+        if not _is_indexed(row):
+            if previous is not None:
+                # Losing an edge can shrink any ancestor set; recompute lazily.
+                self._ancestors.clear()
+            return
+        edge = IndexedEdge.from_row(row)
+        if previous is not None and (previous.src_document_id, previous.dst_document_id) == (
+            edge.src_document_id,
+            edge.dst_document_id,
+        ):
+            self._link(edge)
+            return
+        if previous is not None:
+            self._ancestors.clear()
+        src, dst = edge.src_document_id, edge.dst_document_id
+        # Reach of dst is unchanged by src→dst unless the edge closes a cycle.
+        closes_cycle = self.would_create_cycle(src, dst)
+        gained = None if closes_cycle else self.ancestors(dst) | {dst}
+        self._link(edge)
+        if gained is None:
+            self._ancestors.clear()
+            return
+        for node, reach in list(self._ancestors.items()):
+            if node == src or src in reach:
+                self._ancestors[node] = reach | gained
+
+    def ancestors(self, document_id: int) -> frozenset[int]:
+        """Every document reachable from ``document_id`` by walking child → parent."""
+        cached = self._ancestors.get(document_id)
+        if cached is not None:
+            return cached
+        reach: set[int] = set()
+        stack = [document_id]
+        while stack:
+            current = stack.pop()
+            for edge_id in self.by_src.get(current, ()):
+                parent = self.edges[edge_id].dst_document_id
+                if parent in reach:
+                    continue
+                reach.add(parent)
+                memo = self._ancestors.get(parent)
+                if memo is not None:
+                    reach |= memo
+                else:
+                    stack.append(parent)
+        result = frozenset(reach)
+        self._ancestors[document_id] = result
+        return result
+
+    def would_create_cycle(self, src_document_id: int, dst_document_id: int) -> bool:
+        """Same answer as the per-hop walk: ``src`` is ``dst`` or already one of its ancestors."""
+        return src_document_id == dst_document_id or src_document_id in self.ancestors(dst_document_id)
+
+    def confirmed_edges_touching(self, document_ids: Iterable[int]) -> list[IndexedEdge]:
+        """Confirmed edges with either end in ``document_ids``, in id order."""
+        edge_ids: set[int] = set()
+        for document_id in document_ids:
+            edge_ids |= self.by_src.get(document_id, set())
+            edge_ids |= self.by_dst.get(document_id, set())
+        return sorted(
+            (self.edges[i] for i in edge_ids if self.edges[i].status == DocumentEdgeStatus.CONFIRMED),
+            key=lambda edge: edge.id,
+        )
+
+
+def invalidate_implements_index(tenant_id: Optional[int] = None) -> None:
+    """Forget the cached index for one tenant, or for every tenant."""
+    if tenant_id is None:
+        _indexes.clear()
+    else:
+        _indexes.pop(tenant_id, None)
+
+
+async def implements_fingerprint(db: AsyncSession, tenant_id: int) -> tuple[Any, ...]:
+    """Row count, max id and latest ``updated_at`` of the tenant's ``implements`` edges."""
+    row = (
+        await db.execute(
+            select(func.count(), func.max(DocumentEdge.id), func.max(DocumentEdge.updated_at)).where(
+                DocumentEdge.tenant_id == tenant_id,
+                DocumentEdge.edge_type == DocumentEdgeType.IMPLEMENTS,
+            )
+        )
+    ).one()
+    return tuple(row)
+
+
+async def _load(db: AsyncSession, tenant_id: int, fingerprint: tuple[Any, ...]) -> ImplementsIndex:
+    result = await db.execute(
+        select(*_EDGE_COLUMNS).where(
+            DocumentEdge.tenant_id == tenant_id,
+            DocumentEdge.edge_type == DocumentEdgeType.IMPLEMENTS,
+            DocumentEdge.status.in_(INDEXED_STATUSES),
+            DocumentEdge.deleted_at.is_(None),
+        )
+    )
+    return ImplementsIndex.build(tenant_id, fingerprint, result.mappings().all())
+
+
+async def implements_index(db: AsyncSession, tenant_id: int) -> ImplementsIndex:
+    """The tenant's index, rebuilt only when its edges changed or it aged out."""
+    fingerprint = await implements_fingerprint(db, tenant_id)
+    cached = _indexes.get(tenant_id)
+    if (
+        cached is not None
+        and cached.fingerprint == fingerprint
+        and time.monotonic() - cached.built_at < settings.document_graph_index_max_age_seconds
+    ):
+        _indexes.move_to_end(tenant_id)
+        track_metric("document_graph.implements_index", 1, {"result": "hit"})
+        return cached
+
+    index = await _load(db, tenant_id, fingerprint)
+    _indexes[tenant_id] = index
+    _indexes.move_to_end(tenant_id)
+    while len(_indexes) > MAX_INDEXED_TENANTS:
+        _indexes.popitem(last=False)
+    track_metric("document_graph.implements_index", 1, {"result": "miss" if cached is None else "rebuild"})
+    return index
+
+
+async def record_implements_write(db: AsyncSession, tenant_id: int, edge: DocumentEdge, *, created: bool) -> None:
+    """Apply one of the service's own edge writes to the cached index, if there is one.
+
+    Called after the write is flushed or committed. The fingerprint is re-read in
+    the same session: when it moved by exactly this write (one more row for a
+    create, same count and max id otherwise) the edge is patched in place;
+    anything else means another writer got in between, so the index is dropped
+    and the next read rebuilds it. A write later rolled back leaves a fingerprint
+    the index no longer matches, which also forces a rebuild.
+    """
+    index = _indexes.get(tenant_id)
+    if index is None or DocumentEdgeType(edge.edge_type) != DocumentEdgeType.IMPLEMENTS:
+        return
+    count, max_id, _ = index.fingerprint
+    fingerprint = await implements_fingerprint(db, tenant_id)
+    if created:
+        expected = (count + 1, max(max_id or 0, edge.id))
+    else:
+        expected = (count, max_id)
+    if fingerprint[:2] != expected:
+        invalidate_implements_index(tenant_id)
+        track_metric("document_graph.implements_index", 1, {"result": "dropped"})
+        return
+    index.apply(IndexedEdge.from_model(edge).row)
+    index.fingerprint = fingerprint
+    track_metric("document_graph.implements_index", 1, {"result": "applied"})
+
+
+def _edge_state(edge: IndexedEdge) -> tuple[Any, ...]:
+    return (edge.src_document_id, edge.dst_document_id, edge.status, edge.is_primary_parent, edge.dst_pel_doc_ref)
+
+
+async def verify_implements_index(db: AsyncSession, tenant_id: int) -> dict[str, Any]:
+    """Compare the cached index with the database; a drifted index is dropped.
+
+    ``status`` is ``not_cached`` when there is nothing to check, otherwise
+    ``verified`` or ``drift`` with the edge ids that are missing from the index,
+    held by it but no longer live, or held with stale values.
+    """
+    cached = _indexes.get(tenant_id)
+    if cached is None:
+        return {"status": "not_cached", "tenant_id": tenant_id}
+    fresh = await _load(db, tenant_id, await implements_fingerprint(db, tenant_id))
+    missing = sorted(set(fresh.edges) - set(cached.edges))
+    unexpected = sorted(set(cached.edges) - set(fresh.edges))
+    changed = sorted(
+        edge_id
+        for edge_id in set(fresh.edges) & set(cached.edges)
+        if _edge_state(fresh.edges[edge_id]) != _edge_state(cached.edges[edge_id])
+    )
+    drift = bool(missing or unexpected or changed)
+    if drift:
+        invalidate_implements_index(tenant_id)
+    track_metric("document_graph.implements_index", 1, {"result": "drift" if drift else "verified"})
+    return {
+        "status": "drift" if drift else "verified",
+        "tenant_id": tenant_id,
+        "edges": len(fresh.edges),
+        "missing_edge_ids": missing,
+        "unexpected_edge_ids": unexpected,
+        "changed_edge_ids": changed,
+    }
@@ -11,10 +11,12 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Optional, Sequence
 
-from sqlalchemy import or_, select
+from sqlalchemy import Integer, Select, cast, func, literal_column, null, or_, select, union_all
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
+from src.core.config import settings
 from src.domain.exceptions import ConflictError, NotFoundError, ValidationError
 from src.domain.models.document import Document
 from src.domain.models.document_graph import (
@@ -25,9 +27,12 @@ from src.domain.models.document_graph import (
     DocumentEdgeType,
 )
 from src.domain.services.audit_service import record_audit_event
+from src.domain.services.document_graph_index import implements_index, record_implements_write
 
 THREAD_MAX_DEPTH = 4
 THREAD_HOP_ORIGIN = "graph"
+# One library tree page of documents per batch thread walk.
+THREAD_BATCH_LIMIT = 200
 
 # WE-1: statuses that belong in the operator confirm queue (Knowledge Exceptions).
 PENDING_EDGE_STATUSES = (
@@ -372,9 +377,15 @@ class DocumentGraphService:
         exists if ``dst`` can already reach ``src`` by walking child→parent
         edges (or equivalently if ``src`` is already an ancestor of ``dst``
         via reverse: walking parent→children from ``dst`` eventually hits ``src``).
+
+        Answered from the tenant's cached ``ImplementsIndex`` (one fingerprint
+        statement) unless ``document_graph_implements_index_enabled`` is off.
         """
         if src_document_id == dst_document_id:
             return True
+        if settings.document_graph_implements_index_enabled:
+            index = await implements_index(self.db, tenant_id)
+            return index.would_create_cycle(src_document_id, dst_document_id)
 
         # Walk from dst toward ancestors (follow implements where src=current → dst=parent).
         # If we reach src, adding src→dst would cycle.
@@ -569,6 +580,7 @@ class DocumentGraphService:
                         },
                     ) from exc
             raise
+        await record_implements_write(self.db, tenant_id, edge, created=True)
         return edge
 
     async def list_edges(
@@ -810,6 +822,7 @@ class DocumentGraphService:
             await self.db.refresh(edge)
         else:
             await self.db.flush()
+        await record_implements_write(self.db, tenant_id, edge, created=False)
         return edge
 
     async def reject(
@@ -856,6 +869,7 @@ class DocumentGraphService:
             await self.db.refresh(edge)
         else:
             await self.db.flush()
+        await record_implements_write(self.db, tenant_id, edge, created=False)
         return edge
 
     async def soft_delete(
@@ -889,51 +903,92 @@ class DocumentGraphService:
             await self.db.refresh(edge)
         else:
             await self.db.flush()
+        await record_implements_write(self.db, tenant_id, edge, created=False)
         return edge
 
-    async def get_thread(
+    def _thread_walk_statement(
         self,
         *,
         tenant_id: int,
-        document_id: int,
-        max_depth: int = THREAD_MAX_DEPTH,
-        include_proposed: bool = False,
-    ) -> dict:
-        """Walk primary ``implements`` edges up (parents) and down (children).
+        document_ids: Sequence[int],
+        depth_cap: int,
+        walk_statuses: Sequence[DocumentEdgeStatus],
+    ) -> Select:
+        """Every edge the thread walks of ``document_ids`` can touch, in one statement.
+
+        Two recursive CTEs seeded with the tenant's documents: ``thread_up``
+        follows each node's primary parent (lowest live edge id, the same pick
+        the walk makes) and ``thread_down`` collects the nodes within
+        ``depth_cap - 1`` hops below. The statement returns the ``thread_up``
+        edges tagged ``parent`` and every walkable edge into a ``thread_down``
+        node tagged ``child``. Both CTEs stop at the depth cap, so a cycle in
+        legacy data ends there; the walks in ``_thread_payload`` dedupe. Plain
+        ``WITH RECURSIVE`` with integer depths runs unchanged on SQLite.
+        """
 
-        ``implements`` direction: src implements dst (child → parent). Primary
-        parent links use ``is_primary_parent=True``. Depth is capped at
-        ``THREAD_MAX_DEPTH`` (default 4).
+        def walkable(edge: Any) -> list[Any]:
+            return [
+                edge.tenant_id == tenant_id,
+                edge.edge_type == DocumentEdgeType.IMPLEMENTS,
+                edge.is_primary_parent.is_(True),
+                edge.status.in_(walk_statuses),
+                edge.deleted_at.is_(None),
+            ]
+
+        seeds = (
+            select(Document.id.label("node"), literal_column("0", Integer).label("depth"))
+            .where(Document.tenant_id == tenant_id, Document.id.in_(document_ids))
+            .subquery("thread_seeds")
+        )
+        edge = aliased(DocumentEdge)
+        rival = aliased(DocumentEdge)
 
-        Ambient thread is confirmed-only unless ``include_proposed`` is true.
-        Ancestor selection is deterministic (``order_by`` edge id ascending —
-        never nondeterministic ``.first()``). Descendant walk is visited-set /
-        cycle-safe so each node appears at most once.
-        """
-        await self._get_document_or_404(tenant_id=tenant_id, document_id=document_id)
-        depth_cap = max(0, min(max_depth, THREAD_MAX_DEPTH))
-        walk_statuses = thread_walk_statuses(include_proposed=include_proposed)
+        up = select(seeds.c.node, seeds.c.depth, cast(null(), Integer).label("edge_id")).cte(
+            "thread_up", recursive=True
+        )
+        primary_parent_id = select(func.min(rival.id)).where(
+            rival.src_document_id == edge.src_document_id, *walkable(rival)
+        )
+        up = up.union_all(
+            select(edge.dst_document_id, up.c.depth + 1, edge.id)
+            .select_from(up)
+            .join(edge, edge.src_document_id == up.c.node)
+            .where(up.c.depth < depth_cap, *walkable(edge), edge.id == primary_parent_id.scalar_subquery())
+        )
+
+        down = select(seeds.c.node, seeds.c.depth).cte("thread_down", recursive=True)
+        down = down.union(
+            select(edge.src_document_id, down.c.depth + 1)
+            .select_from(down)
+            .join(edge, edge.dst_document_id == down.c.node)
+            .where(down.c.depth < depth_cap - 1, *walkable(edge))
+        )
+
+        hops = union_all(
+            select(literal_column("'parent'").label("thread_hop"), DocumentEdge)
+            .select_from(up)
+            .join(DocumentEdge, DocumentEdge.id == up.c.edge_id),
+            select(literal_column("'child'").label("thread_hop"), DocumentEdge).where(
+                *walkable(DocumentEdge),
+                DocumentEdge.dst_document_id.in_(select(down.c.node).where(down.c.depth < depth_cap)),
+            ),
+        ).subquery("thread_hops")
+        return select(hops.c.thread_hop, aliased(DocumentEdge, hops))
 
+    def _thread_payload(
+        self,
+        *,
+        document_id: int,
+        depth_cap: int,
+        parent_edge_by_src: dict[int, DocumentEdge],
+        child_edges_by_dst: dict[int, list[DocumentEdge]],
+        docs: dict[int, Document],
+    ) -> dict:
         raw_ancestors: list[tuple[DocumentEdge, int]] = []
         current = document_id
         seen_ancestors: set[int] = {document_id}
         for depth in range(1, depth_cap + 1):
-            result = await self.db.execute(
-                select(DocumentEdge)
-                .where(
-                    DocumentEdge.tenant_id == tenant_id,
-                    DocumentEdge.src_document_id == current,
-                    DocumentEdge.edge_type == DocumentEdgeType.IMPLEMENTS,
-                    DocumentEdge.is_primary_parent.is_(True),
-                    DocumentEdge.status.in_(walk_statuses),
-                    DocumentEdge.deleted_at.is_(None),
-                )
-                .order_by(DocumentEdge.id.asc())
-            )
-            # Deterministic pick among legacy duplicate primaries.
-            parent_edges = list(result.scalars().all())
-            parent_edges.sort(key=lambda e: e.id)
-            parent_edge = parent_edges[0] if parent_edges else None
+            parent_edge = parent_edge_by_src.get(current)
             if parent_edge is None:
                 break
             parent_id = parent_edge.dst_document_id
@@ -946,37 +1001,18 @@ class DocumentGraphService:
         raw_descendants: list[tuple[DocumentEdge, int, int]] = []
         visited_descendants: set[int] = {document_id}
 
-        async def _walk_children(parent_id: int, depth: int) -> None:
+        def _walk_children(parent_id: int, depth: int) -> None:
             if depth > depth_cap:
                 return
-            result = await self.db.execute(
-                select(DocumentEdge)
-                .where(
-                    DocumentEdge.tenant_id == tenant_id,
-                    DocumentEdge.dst_document_id == parent_id,
-                    DocumentEdge.edge_type == DocumentEdgeType.IMPLEMENTS,
-                    DocumentEdge.is_primary_parent.is_(True),
-                    DocumentEdge.status.in_(walk_statuses),
-                    DocumentEdge.deleted_at.is_(None),
-                )
-                .order_by(DocumentEdge.id.asc())
-            )
-            child_edges = list(result.scalars().all())
-            child_edges.sort(key=lambda e: e.id)
-            for child_edge in child_edges:
+            for child_edge in child_edges_by_dst.get(parent_id, ()):
                 child_id = child_edge.src_document_id
                 if child_id in visited_descendants:
                     continue
                 visited_descendants.add(child_id)
                 raw_descendants.append((child_edge, child_id, depth))
-                await _walk_children(child_id, depth + 1)
+                _walk_children(child_id, depth + 1)
 
-        await _walk_children(document_id, 1)
-
-        needed_ids = {edge.dst_document_id for edge, _ in raw_ancestors} | {
-            child_id for _, child_id, _ in raw_descendants
-        }
-        docs = await self._documents_by_ids(tenant_id=tenant_id, document_ids=needed_ids)
+        _walk_children(document_id, 1)
 
         ancestors = [
             self._hop_payload(
@@ -998,7 +1034,6 @@ class DocumentGraphService:
             )
             for edge, child_id, depth in raw_descendants
         ]
-
         return {
             "document_id": document_id,
             "ancestors": ancestors,
@@ -1006,6 +1041,93 @@ class DocumentGraphService:
             "max_depth": depth_cap,
         }
 
+    async def get_threads(
+        self,
+        *,
+        tenant_id: int,
+        document_ids: Sequence[int],
+        max_depth: int = THREAD_MAX_DEPTH,
+        include_proposed: bool = False,
+    ) -> dict[int, dict]:
+        """``get_thread`` for many documents at once (library tree view).
+
+        Keyed by document id in request order; ids that are not documents of
+        this tenant are left out rather than failing the batch. Costs two
+        statements however many documents or hops: the walk
+        (``_thread_walk_statement``) and one document fetch for the hop titles.
+        """
+        requested = list(dict.fromkeys(document_ids))
+        if not requested:
+            return {}
+        depth_cap = max(0, min(max_depth, THREAD_MAX_DEPTH))
+        walk_statuses = thread_walk_statuses(include_proposed=include_proposed)
+
+        result = await self.db.execute(
+            self._thread_walk_statement(
+                tenant_id=tenant_id,
+                document_ids=requested,
+                depth_cap=depth_cap,
+                walk_statuses=walk_statuses,
+            )
+        )
+        parent_edge_by_src: dict[int, DocumentEdge] = {}
+        child_edges: dict[int, DocumentEdge] = {}
+        for hop, edge in result.all():
+            if hop == "parent":
+                parent_edge_by_src[edge.src_document_id] = edge
+            else:
+                child_edges[edge.id] = edge
+        # Children in edge id order, as the walk visits them.
+        child_edges_by_dst: dict[int, list[DocumentEdge]] = {}
+        for edge_id in sorted(child_edges):
+            edge = child_edges[edge_id]
+            child_edges_by_dst.setdefault(edge.dst_document_id, []).append(edge)
+
+        needed_ids = set(requested) | {edge.dst_document_id for edge in parent_edge_by_src.values()}
+        needed_ids |= {edge.src_document_id for edge in child_edges.values()}
+        docs = await self._documents_by_ids(tenant_id=tenant_id, document_ids=needed_ids)
+
+        return {
+            document_id: self._thread_payload(
+                document_id=document_id,
+                depth_cap=depth_cap,
+                parent_edge_by_src=parent_edge_by_src,
+                child_edges_by_dst=child_edges_by_dst,
+                docs=docs,
+            )
+            for document_id in requested
+            if document_id in docs
+        }
+
+    async def get_thread(
+        self,
+        *,
+        tenant_id: int,
+        document_id: int,
+        max_depth: int = THREAD_MAX_DEPTH,
+        include_proposed: bool = False,
+    ) -> dict:
+        """Walk primary ``implements`` edges up (parents) and down (children).
+
+        ``implements`` direction: src implements dst (child → parent). Primary
+        parent links use ``is_primary_parent=True``. Depth is capped at
+        ``THREAD_MAX_DEPTH`` (default 4).
+
+        Ambient thread is confirmed-only unless ``include_proposed`` is true.
+        Ancestor selection is deterministic (lowest edge id among legacy
+        duplicate primaries — never nondeterministic ``.first()``). Descendant
+        walk is visited-set / cycle-safe so each node appears at most once.
+        Both walks come from one recursive-CTE statement (see ``get_threads``).
+        """
+        await self._get_document_or_404(tenant_id=tenant_id, document_id=document_id)
+        threads = await self.get_threads(
+            tenant_id=tenant_id,
+            document_ids=[document_id],
+            max_depth=max_depth,
+            include_proposed=include_proposed,
+        )
+        return threads[document_id]
+
     async def get_cascade_aggregate(
         self,
         *,
@@ -1023,6 +1145,10 @@ class DocumentGraphService:
         Parent PEL comes only from a live confirmed primary-parent
         ``implements`` edge (``document_edges`` SoT). Orphan ids match the
         workbook definitions among readable rows only.
+
+        Edges come from the tenant's cached ``ImplementsIndex`` when
+        ``document_graph_implements_index_enabled`` is on, so a warm view reads
+        documents and parent documents only.
         """
         from src.domain.models.document_library import CASCADE_LEVELS
 
@@ -1037,8 +1163,13 @@ class DocumentGraphService:
         visible_docs = [doc for doc in all_docs if doc.id in readable_ids]
         visible_id_set = {doc.id for doc in visible_docs}
 
-        edges: list[DocumentEdge] = []
-        if visible_id_set:
+        edges: Sequence[Any] = []
+        edge_payloads: Sequence[Any] = []
+        if visible_id_set and settings.document_graph_implements_index_enabled:
+            index = await implements_index(self.db, tenant_id)
+            edges = index.confirmed_edges_touching(visible_id_set)
+            edge_payloads = [edge.row for edge in edges]
+        elif visible_id_set:
             edges_result = await self.db.execute(
                 select(DocumentEdge)
                 .where(
@@ -1053,7 +1184,7 @@ class DocumentGraphService:
                 )
                 .order_by(DocumentEdge.id.asc())
             )
-            edges = list(edges_result.scalars().all())
+            edges = edge_payloads = list(edges_result.scalars().all())
 
         # Primary parent: child (src) → parent (dst) on a confirmed primary edge.
         parent_by_child: dict[int, tuple[int, Optional[str]]] = {}
@@ -1125,7 +1256,7 @@ class DocumentGraphService:
 
         return {
             "documents": documents_payload,
-            "edges": edges,
+            "edges": edge_payloads,
             "bands": bands,
             "orphans": {
                 "unimplemented_policy_ids": unimplemented,
@@ -9,7 +9,7 @@ from typing import Literal, Protocol
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.models.document import Document, FileType
-from src.domain.services.document_extraction_service import extract_document_content
+from src.domain.services.document_extraction_executor import extract_document_content_async
 from src.domain.services.external_audit_ocr_service import ExternalAuditExtractionResult, ExternalAuditOcrService
 from src.domain.services.scheme_profiles import canonical_scheme_id
 from src.infrastructure.storage import storage_service
@@ -225,7 +225,7 @@ class DocumentIntelligenceService:
             return result
 
         resolved_file_type = file_type or self.ocr_service._infer_file_type(filename, content_type)
-        native = extract_document_content(resolved_file_type, filename, raw)
+        native = await extract_document_content_async(resolved_file_type, filename, raw)
         native_text = native.text.strip()
 
         if native_text and not _is_thin_native_text(native_text):
@@ -281,7 +281,12 @@ class DocumentIntelligenceService:
             file_type=document.file_type if purpose == "library" else None,
             purpose=purpose,
         )
+        self.apply_result(document, result)
+        return result
 
+    @staticmethod
+    def apply_result(document: Document, result: DocumentIntelligenceResult) -> None:
+        """Copy extraction facts onto the document row (no I/O)."""
         document.page_count = result.page_count
         document.sheet_count = result.sheet_count
         document.has_tables = result.has_tables
@@ -289,8 +294,6 @@ class DocumentIntelligenceService:
         if result.hard_ocr_failure:
             document.indexing_error = result.note or "OCR extraction failed with no native fallback text"
 
-        return result
-
 
 __all__ = [
     "DocumentIntelligenceResult",
@@ -11,11 +11,11 @@ import logging
 from datetime import date, datetime, timedelta, timezone
 from typing import Any, Awaitable, Callable, Dict, List, Optional, cast
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, case, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.metrics import percentage_or_none
-from src.domain.models.asset import Asset, AssetStatus, AssetType
+from src.domain.models.asset import Asset
 from src.domain.models.audit import AuditRun, AuditStatus
 from src.domain.models.complaint import Complaint, ComplaintStatus
 from src.domain.models.incident import Incident, IncidentSeverity, IncidentStatus
@@ -26,12 +26,14 @@ from src.domain.models.risk_register import EnterpriseRisk
 from src.domain.models.rta import RTA, RTAStatus
 from src.domain.models.training_matrix import TrainingMatrixCell, TrainingMatrixImport
 from src.domain.models.workflow_rules import SLATracking
-from src.domain.services.asset_health_analytics_service import AssetHealthRow, aggregate_asset_health_kpis
+from src.domain.services.compliance_timeline import ToolComplianceTimeline, TrainingComplianceTimeline
 from src.domain.services.risk_service import register_active_clause, register_visibility_clause
 from src.domain.services.session_savepoint import SavepointScope, read_savepoint
 
 logger = logging.getLogger(__name__)
 
+_TREND_WEEK = timedelta(days=7)
+
 _EMPTY_INCIDENT_SUMMARY: Dict[str, Any] = {
     "total_in_period": 0,
     "open": 0,
@@ -890,37 +892,63 @@ class ExecutiveDashboardService:
             await self._recover_session(scope)
             return []
 
+    async def _week_buckets(
+        self,
+        week_windows: List[tuple[datetime, datetime, str]],
+        date_col: Any,
+        criteria: Any,
+        value_col: Any = None,
+    ) -> Dict[int, tuple[int, Optional[float]]]:
+        """One grouped statement for a whole weekly series: ``{week index: (count, avg)}``.
+
+        The windows are contiguous and ascending, so a row's week is the first
+        window end it falls before; that is a ``CASE`` over the window ends, which
+        uses exactly the comparisons the per-week filters used and runs unchanged on
+        PostgreSQL and SQLite. Index 0 is the oldest week and empty weeks are absent.
+        ``avg`` is the mean of ``value_col`` (None without one, or when every value
+        in the week is NULL).
+        """
+        bucket = case(
+            *[(date_col < week_end, index) for index, (_start, week_end, _label) in enumerate(week_windows)],
+        )
+        columns = [bucket.label("bucket")]
+        if value_col is not None:
+            columns.append(value_col.label("value"))
+        in_range = and_(criteria, date_col >= week_windows[0][0], date_col < week_windows[-1][1])
+        # Grouped through a subquery: PostgreSQL will not match a GROUP BY
+        # expression against a select-list copy that binds its own parameters.
+        inner = select(*columns).where(in_range).subquery()
+        measures = [func.count()] if value_col is None else [func.count(), func.avg(inner.c.value)]
+        result = await self.db.execute(select(inner.c.bucket, *measures).group_by(inner.c.bucket))
+        return {
+            int(row[0]): (int(row[1]), float(row[2]) if len(row) > 2 and row[2] is not None else None)
+            for row in result.all()
+        }
+
     async def _trend_count_in_window(
         self,
         week_windows: List[tuple[datetime, datetime, str]],
         model: Any,
         date_col: Any,
     ) -> List[Dict[str, Any]]:
-        tf = self._tenant_filter(model)
-        out: List[Dict[str, Any]] = []
-        for week_start, week_end, label in week_windows:
-            result = await self.db.execute(
-                select(func.count(model.id)).where(and_(tf, date_col >= week_start, date_col < week_end))
-            )
-            out.append({"week_start": label, "count": result.scalar() or 0})
-        return out
+        buckets = await self._week_buckets(week_windows, date_col, self._tenant_filter(model))
+        return [
+            {"week_start": label, "count": buckets.get(index, (0, None))[0]}
+            for index, (_week_start, _week_end, label) in enumerate(week_windows)
+        ]
 
     async def _trend_audits_weekly(self, week_windows: List[tuple[datetime, datetime, str]]) -> List[Dict[str, Any]]:
+        criteria = and_(
+            self._tenant_filter(AuditRun),
+            AuditRun.status == AuditStatus.COMPLETED,
+            AuditRun.score_percentage.is_not(None),
+        )
+        buckets = await self._week_buckets(
+            week_windows, AuditRun.completed_at, criteria, value_col=AuditRun.score_percentage
+        )
         audits_weekly: List[Dict[str, Any]] = []
-        tf_audit = self._tenant_filter(AuditRun)
-        for week_start, week_end, label in week_windows:
-            result = await self.db.execute(
-                select(func.avg(AuditRun.score_percentage)).where(
-                    and_(
-                        tf_audit,
-                        AuditRun.status == AuditStatus.COMPLETED,
-                        AuditRun.score_percentage.is_not(None),
-                        AuditRun.completed_at >= week_start,
-                        AuditRun.completed_at < week_end,
-                    )
-                )
-            )
-            avg = result.scalar()
+        for index, (_week_start, _week_end, label) in enumerate(week_windows):
+            avg = buckets.get(index, (0, None))[1]
             if avg is None:
                 audits_weekly.append({"week_start": label, "count": 0, "value": None})
             else:
@@ -931,48 +959,30 @@ class ExecutiveDashboardService:
     async def _trend_tool_compliance_weekly(
         self, week_windows: List[tuple[datetime, datetime, str]]
     ) -> List[Dict[str, Any]]:
-        tool_compliance_weekly: List[Dict[str, Any]] = []
-        asset_q = select(AssetType.name, Asset.status, Asset.expiry_date, Asset.created_at)
-        asset_q = asset_q.outerjoin(AssetType, Asset.asset_type_id == AssetType.id)
+        asset_q = select(Asset.status, Asset.expiry_date, Asset.created_at)
         if self.tenant_id is not None:
             asset_q = asset_q.where(or_(Asset.tenant_id == self.tenant_id, Asset.tenant_id.is_(None)))
         asset_result = await self.db.execute(asset_q)
-        asset_rows_raw = [
-            (
-                asset_type,
-                status.value if hasattr(status, "value") else str(status),
-                expiry_date,
-                created_at,
-            )
-            for asset_type, status, expiry_date, created_at in asset_result.all()
-        ]
+        timeline = ToolComplianceTimeline(
+            (status.value if hasattr(status, "value") else str(status), expiry_date, created_at)
+            for status, expiry_date, created_at in asset_result.all()
+        )
+        tool_compliance_weekly: List[Dict[str, Any]] = []
         for _ws, week_end, label in week_windows:
-            rows_as_of = [
-                AssetHealthRow(asset_type=at, status=st, expiry_date=exp)
-                for at, st, exp, created_at in asset_rows_raw
-                if created_at is None or created_at <= week_end
-            ]
-            summary_map = cast(Dict[str, Any], aggregate_asset_health_kpis(rows_as_of, as_of=week_end))
-            bands = cast(Dict[str, Any], summary_map.get("expiry_bands") or {})
-            by_status = cast(Dict[str, Any], summary_map.get("by_status") or {})
-            in_service = int(summary_map.get("total") or 0) - int(bands.get("removed", 0) or 0)
-            if in_service <= 0:
-                pct = 100.0
-            else:
-                overdue = int(bands.get("overdue", 0) or 0)
-                quarantined = int(by_status.get(AssetStatus.QUARANTINED.value, 0) or 0)
-                pct = round(100.0 * (in_service - overdue - quarantined) / in_service, 1)
+            pct = timeline.compliance_pct_at(week_end)
             tool_compliance_weekly.append({"week_start": label, "count": int(pct), "value": pct})
         return tool_compliance_weekly
 
-    async def _load_scored_training_cells(self) -> List[TrainingMatrixCell]:
+    async def _load_training_timeline(self) -> TrainingComplianceTimeline:
         """Scored cells of the tenant's most recent training matrix import.
 
         Shared by the headline summary and the weekly sparkline so the two cannot
-        drift onto different denominators and contradict each other (C-7).
+        drift onto different denominators and contradict each other (C-7). Only
+        the two date columns are read; the timeline answers every as-of date from
+        one sorted build.
         """
         if self.tenant_id is None:
-            return []
+            return TrainingComplianceTimeline(())
         latest_imp = await self.db.execute(
             select(TrainingMatrixImport.id)
             .where(TrainingMatrixImport.tenant_id == self.tenant_id)
@@ -981,16 +991,20 @@ class ExecutiveDashboardService:
         )
         import_id = latest_imp.scalar_one_or_none()
         if import_id is None:
-            return []
+            return TrainingComplianceTimeline(())
         cell_result = await self.db.execute(
-            select(TrainingMatrixCell).where(
+            select(TrainingMatrixCell.passed_on, TrainingMatrixCell.expires_on).where(
                 and_(
                     TrainingMatrixCell.tenant_id == self.tenant_id,
                     TrainingMatrixCell.import_id == import_id,
                 )
             )
         )
-        return [c for c in cell_result.scalars().all() if training_cell_is_scored(c.passed_on, c.expires_on)]
+        return TrainingComplianceTimeline(
+            (passed_on, expires_on)
+            for passed_on, expires_on in cell_result.all()
+            if training_cell_is_scored(passed_on, expires_on)
+        )
 
     async def _get_training_summary(self) -> Dict[str, Any]:
         """Point-in-time training compliance for the tenant's latest matrix import.
@@ -1001,23 +1015,21 @@ class ExecutiveDashboardService:
         training compliance is. Before this existed, ``/analytics/kpis`` served a
         hardcoded ``completion_rate`` of 0.0 whatever the matrix held (C-7).
         """
-        scored = await self._load_scored_training_cells()
-        if not scored:
+        timeline = await self._load_training_timeline()
+        if not timeline.measured:
             return dict(_EMPTY_TRAINING_SUMMARY)
 
         as_of = datetime.now(timezone.utc).date()
         horizon = as_of + timedelta(days=TRAINING_EXPIRY_HORIZON_DAYS)
-        compliant = sum(1 for c in scored if training_cell_is_compliant(c.passed_on, c.expires_on, as_of))
-        # Expired, not merely un-passed: an expiry in the past is a lapsed
-        # certificate, which is a different piece of work from one never taken.
-        overdue = sum(1 for c in scored if c.expires_on is not None and c.expires_on < as_of)
-        expiring_soon = sum(1 for c in scored if c.expires_on is not None and as_of <= c.expires_on < horizon)
+        compliant = timeline.compliant_at(as_of)
         return {
-            "measured_cells": len(scored),
+            "measured_cells": timeline.measured,
             "compliant_cells": compliant,
-            "completion_rate": percentage_or_none(compliant, len(scored), digits=1),
-            "expiring_soon": expiring_soon,
-            "overdue": overdue,
+            "completion_rate": percentage_or_none(compliant, timeline.measured, digits=1),
+            "expiring_soon": timeline.expiring_between(as_of, horizon),
+            # Expired, not merely un-passed: an expiry in the past is a lapsed
+            # certificate, which is a different piece of work from one never taken.
+            "overdue": timeline.overdue_at(as_of),
         }
 
     async def _trend_training_compliance_weekly(
@@ -1026,14 +1038,12 @@ class ExecutiveDashboardService:
         training_compliance_weekly: List[Dict[str, Any]] = []
         if self.tenant_id is None:
             return training_compliance_weekly
-        scored = await self._load_scored_training_cells()
+        timeline = await self._load_training_timeline()
         for _ws, week_end, label in week_windows:
-            as_of = week_end.date()
-            if not scored:
+            if not timeline.measured:
                 training_compliance_weekly.append({"week_start": label, "count": 0, "value": None})
                 continue
-            ok = sum(1 for cell in scored if training_cell_is_compliant(cell.passed_on, cell.expires_on, as_of))
-            pct = round(100.0 * ok / len(scored), 1)
+            pct = round(100.0 * timeline.compliant_at(week_end.date()) / timeline.measured, 1)
             training_compliance_weekly.append({"week_start": label, "count": int(pct), "value": pct})
         return training_compliance_weekly
 
@@ -1046,8 +1056,8 @@ class ExecutiveDashboardService:
         now = datetime.now(timezone.utc)
         week_windows: List[tuple[datetime, datetime, str]] = []
         for i in range(weeks, 0, -1):
-            week_end = now - timedelta(days=(i - 1) * 7)
-            week_start = week_end - timedelta(days=7)
+            week_end = now - (i - 1) * _TREND_WEEK
+            week_start = week_end - _TREND_WEEK
             week_windows.append((week_start, week_end, week_start.strftime("%Y-%m-%d")))
 
         unavailable: List[str] = []
@@ -1,7 +1,13 @@
 """Export Center sync builders (PX-160) + IMS052 document register (WA-3 / L-07).
 
-Prefer synchronous streaming exports. Async ``export_jobs`` persistence is
-owned by Lane S (alembic) and is intentionally not claimed here.
+Sync exports stay capped at ``SYNC_ROW_LIMIT`` and are built in the request.
+Anything larger goes through ``write_export``: the export Celery job streams
+every row from a server-side cursor into a CSV / XLSX file and uploads it to
+blob storage. Job state lives in the Celery result backend; a persisted
+``export_jobs`` history is owned by Lane S (alembic) and is not claimed here.
+
+Generic modules select only the columns their row mapper reads, never whole
+entities, so neither path pays for ORM identity-map bookkeeping per row.
 
 The ``documents`` module is the Master Document Register evidence pack —
 fixed IMS052 columns, never driven by a UI column picker. Other modules keep
@@ -12,8 +18,10 @@ from __future__ import annotations
 
 import csv
 import io
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Awaitable, Callable, Optional, Sequence
 
 from sqlalchemy import Select, func, select
@@ -29,10 +37,13 @@ from src.domain.models.incident import Incident
 from src.domain.models.risk import Risk
 from src.domain.models.rta import RoadTrafficCollision
 from src.domain.services.document_register_export import (
+    IMS052_COLUMNS,
     IMS052_FILENAME_STEM,
+    IMS052_SHEET_TITLE,
     build_document_register_rows,
     serialize_register,
 )
+from src.domain.services.export_stream import MEDIA_TYPES, TabularFileWriter, stream_rows
 
 # Hard cap for sync responses — keep request-scoped memory bounded.
 SYNC_ROW_LIMIT = 10_000
@@ -60,7 +71,10 @@ class _ModuleSpec:
     columns: Sequence[str]
     row_mapper: Callable[[Any], list[str]]
     order_by: Any
+    # Model attributes the row mapper reads; selected as columns of the same name.
+    fields: Sequence[str] = ()
     formats: tuple[str, ...] = ("csv",)
+    job_formats: tuple[str, ...] = ("csv", "xlsx")
     filename_stem: Optional[str] = None
     # When set, replaces the generic select+row_mapper path (documents / IMS052).
     rows_builder: Optional[Callable[..., Awaitable[tuple[list[list[str]], int, bool]]]] = None
@@ -211,6 +225,16 @@ _MODULE_SPECS: dict[str, _ModuleSpec] = {
             "created_at",
         ],
         row_mapper=_incident_row,
+        fields=(
+            "id",
+            "reference_number",
+            "title",
+            "incident_type",
+            "severity",
+            "status",
+            "incident_date",
+            "created_at",
+        ),
         order_by=Incident.id.desc(),
     ),
     "rtas": _ModuleSpec(
@@ -229,6 +253,7 @@ _MODULE_SPECS: dict[str, _ModuleSpec] = {
             "created_at",
         ],
         row_mapper=_rta_row,
+        fields=("id", "reference_number", "title", "severity", "status", "collision_date", "location", "created_at"),
         order_by=RoadTrafficCollision.id.desc(),
     ),
     "complaints": _ModuleSpec(
@@ -246,6 +271,7 @@ _MODULE_SPECS: dict[str, _ModuleSpec] = {
             "created_at",
         ],
         row_mapper=_complaint_row,
+        fields=("id", "reference_number", "title", "complaint_type", "priority", "status", "created_at"),
         order_by=Complaint.id.desc(),
     ),
     "risks": _ModuleSpec(
@@ -262,6 +288,7 @@ _MODULE_SPECS: dict[str, _ModuleSpec] = {
             "created_at",
         ],
         row_mapper=_risk_row,
+        fields=("id", "reference_number", "title", "risk_level", "status", "created_at"),
         order_by=Risk.id.desc(),
     ),
     "audits": _ModuleSpec(
@@ -278,6 +305,7 @@ _MODULE_SPECS: dict[str, _ModuleSpec] = {
             "created_at",
         ],
         row_mapper=_audit_row,
+        fields=("id", "reference_number", "title", "status", "template_id", "created_at"),
         order_by=AuditRun.id.desc(),
     ),
     "actions": _ModuleSpec(
@@ -296,6 +324,7 @@ _MODULE_SPECS: dict[str, _ModuleSpec] = {
             "created_at",
         ],
         row_mapper=_action_row,
+        fields=("id", "reference_number", "title", "status", "priority", "capa_type", "due_date", "created_at"),
         order_by=CAPAAction.id.desc(),
     ),
     "documents": _ModuleSpec(
@@ -310,6 +339,7 @@ _MODULE_SPECS: dict[str, _ModuleSpec] = {
         row_mapper=_document_row,
         order_by=Document.id.desc(),
         formats=("csv", "xlsx", "pdf"),
+        job_formats=("csv", "xlsx", "pdf"),
         filename_stem=IMS052_FILENAME_STEM,
         rows_builder=_build_document_register,
         active_only=True,
@@ -329,6 +359,7 @@ _MODULE_SPECS: dict[str, _ModuleSpec] = {
             "statutory",
         ],
         row_mapper=_compliance_schedule_row,
+        fields=("id", "reference_number", "title", "next_due_date", "owner_id", "is_active", "statutory"),
         order_by=ComplianceRequirement.id.desc(),
     ),
 }
@@ -354,6 +385,17 @@ class SyncExportResult:
         return self.content.decode("utf-8")
 
 
+@dataclass(frozen=True)
+class ExportFileResult:
+    """A complete (uncapped) export written to disk by ``write_export``."""
+
+    module: str
+    filename: str
+    path: Path
+    media_type: str
+    row_count: int
+
+
 class ExportCenterService:
     """Tenant-scoped catalog + sync export generation for Export Center."""
 
@@ -372,6 +414,7 @@ class ExportCenterService:
                     "description": spec.description,
                     "record_count": count,
                     "formats": list(spec.formats),
+                    "job_formats": list(spec.job_formats),
                     "sync_available": True,
                 }
             )
@@ -379,6 +422,7 @@ class ExportCenterService:
             "modules": modules,
             "capabilities": {
                 "sync_csv": True,
+                "async_jobs": True,
                 "job_history": False,
                 "scheduled_templates": False,
                 "max_sync_rows": SYNC_ROW_LIMIT,
@@ -394,18 +438,7 @@ class ExportCenterService:
         user: Any = None,
     ) -> SyncExportResult:
         """Build a sync export. Name retained for route compatibility; formats vary."""
-        module_key = (module or "").strip().lower()
-        fmt = (export_format or "").strip().lower()
-        if module_key not in _MODULE_SPECS:
-            raise BadRequestError(
-                f"Unsupported export module '{module}'. " f"Supported: {', '.join(SUPPORTED_MODULES)}."
-            )
-        spec = _MODULE_SPECS[module_key]
-        if fmt not in spec.formats:
-            raise BadRequestError(
-                f"Unsupported export format '{export_format}' for module '{module_key}'. "
-                f"Supported: {', '.join(spec.formats)}."
-            )
+        module_key, fmt, spec = self._resolve(module, export_format, job=False)
 
         stamp = datetime.now(timezone.utc).strftime("%Y%m%d")
         stem = spec.filename_stem or f"{module_key}_export"
@@ -435,13 +468,8 @@ class ExportCenterService:
             )
 
         total = await self._count(spec, tenant_id)
-        stmt: Select[Any] = (
-            select(spec.model).where(spec.model.tenant_id == tenant_id).order_by(spec.order_by).limit(SYNC_ROW_LIMIT)
-        )
-        if spec.active_only and hasattr(spec.model, "is_active"):
-            stmt = stmt.where(spec.model.is_active.is_(True))
-        result = await self._db.execute(stmt)
-        rows = list(result.scalars().all())
+        result = await self._db.execute(self._rows_statement(spec, tenant_id).limit(SYNC_ROW_LIMIT))
+        rows = result.all()
 
         buffer = io.StringIO()
         writer = csv.writer(buffer)
@@ -460,6 +488,76 @@ class ExportCenterService:
             total_available=total,
         )
 
+    async def write_export(
+        self,
+        tenant_id: int,
+        module: str,
+        export_format: str,
+        directory: Path,
+        *,
+        user: Any = None,
+    ) -> ExportFileResult:
+        """Write the whole module (no row cap) to a file in ``directory``.
+
+        Generic modules stream from a server-side cursor straight into the
+        file writer. The IMS052 register is ACL-filtered across the active
+        estate in Python, so it is built in memory as for sync (uncapped).
+        """
+        module_key, fmt, spec = self._resolve(module, export_format, job=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%d")
+        filename = f"{spec.filename_stem or f'{module_key}_export'}_{stamp}.{fmt}"
+        path = Path(directory) / filename
+
+        if spec.rows_builder is not None:
+            if user is None:
+                raise BadRequestError("Document register export requires an authenticated user for ACL narrowing.")
+            data_rows, _, _ = await build_document_register_rows(self._db, tenant_id, user=user, row_limit=sys.maxsize)
+            if fmt == "pdf":
+                path.write_bytes(serialize_register(data_rows, fmt)[0])
+            else:
+                with TabularFileWriter(path, fmt, IMS052_COLUMNS, sheet_title=IMS052_SHEET_TITLE) as writer:
+                    for data_row in data_rows:
+                        writer.writerow(data_row)
+            return ExportFileResult(module_key, filename, path, MEDIA_TYPES[fmt], len(data_rows))
+
+        with TabularFileWriter(path, fmt, spec.columns, sheet_title=spec.name) as writer:
+            async for row in stream_rows(self._db, self._rows_statement(spec, tenant_id)):
+                writer.writerow(spec.row_mapper(row))
+        return ExportFileResult(module_key, filename, path, MEDIA_TYPES[fmt], writer.row_count)
+
+    def validate_job_request(self, module: str, export_format: str, *, user: Any = None) -> None:
+        """Reject a job the worker would refuse, before it is queued."""
+        _, _, spec = self._resolve(module, export_format, job=True)
+        if spec.rows_builder is not None and user is None:
+            raise BadRequestError("Document register export requires an authenticated user for ACL narrowing.")
+
+    def _resolve(self, module: str, export_format: str, *, job: bool) -> tuple[str, str, _ModuleSpec]:
+        module_key = (module or "").strip().lower()
+        fmt = (export_format or "").strip().lower()
+        if module_key not in _MODULE_SPECS:
+            raise BadRequestError(
+                f"Unsupported export module '{module}'. " f"Supported: {', '.join(SUPPORTED_MODULES)}."
+            )
+        spec = _MODULE_SPECS[module_key]
+        formats = spec.job_formats if job else spec.formats
+        if fmt not in formats:
+            raise BadRequestError(
+                f"Unsupported export format '{export_format}' for module '{module_key}'. "
+                f"Supported: {', '.join(formats)}."
+            )
+        return module_key, fmt, spec
+
+    def _rows_statement(self, spec: _ModuleSpec, tenant_id: int) -> Select[Any]:
+        model = spec.model
+        stmt: Select[Any] = (
+            select(*(getattr(model, name).label(name) for name in spec.fields))
+            .where(model.tenant_id == tenant_id)
+            .order_by(spec.order_by)
+        )
+        if spec.active_only and hasattr(model, "is_active"):
+            stmt = stmt.where(model.is_active.is_(True))
+        return stmt
+
     async def _count(self, spec: _ModuleSpec, tenant_id: int) -> int:
         model = spec.model
         stmt = select(func.count()).select_from(model).where(model.tenant_id == tenant_id)
@@ -8,7 +8,7 @@ from pathlib import Path
 
 from src.domain.exceptions import ValidationError
 from src.domain.models.document import FileType
-from src.domain.services.document_extraction_service import extract_document_content
+from src.domain.services.document_extraction_executor import extract_document_content_async
 from src.domain.services.mistral_ocr_service import MistralOCRService
 
 logger = logging.getLogger(__name__)
@@ -120,7 +120,7 @@ class ExternalAuditOcrService:
     ) -> ExternalAuditExtractionResult:
         """Run native extraction, optional OCR, and merge into a single text corpus."""
         file_type = self._infer_file_type(filename, content_type)
-        extraction = extract_document_content(file_type, filename or "source", raw)
+        extraction = await extract_document_content_async(file_type, filename or "source", raw)
         native_text = extraction.text.strip()
         extraction_method = extraction.extraction_method
         page_texts = extraction.page_texts or []
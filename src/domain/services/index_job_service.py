@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import re
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -21,6 +25,7 @@ from src.domain.services.document_ai_service import (
     document_chunk_vector_id,
 )
 from src.domain.services.document_intelligence_service import DocumentIntelligenceService
+from src.domain.services.session_savepoint import read_savepoint
 from src.infrastructure.storage import storage_service
 
 logger = logging.getLogger(__name__)
@@ -52,6 +57,22 @@ def _apply_post_index_status(document: Document, target_status: DocumentStatus)
     document.status = target_status
 
 
+def _mark_index_failure(document: Document, note: str) -> None:
+    """Record an indexing failure without erasing a filed document's lifecycle.
+
+    Filed / taxonomy documents must not flip to FAILED — that would erase the
+    governance lifecycle (DRAFT → review → approve) because a scan was unreadable.
+    Record indexing_error only and restore DRAFT when the row was moved to
+    PROCESSING for this job.
+    """
+    document.indexing_error = note
+    if getattr(document, "category_id", None) is not None:
+        if document.status == DocumentStatus.PROCESSING:
+            document.status = DocumentStatus.DRAFT
+    else:
+        document.status = DocumentStatus.FAILED
+
+
 DEFAULT_BULK_REPROCESS_STATUSES = (
     DocumentStatus.INDEXED,
     DocumentStatus.APPROVED,
@@ -80,6 +101,119 @@ def vector_index_configured() -> tuple[bool, str | None]:
     return True, None
 
 
+# Stages that touch the AsyncSession; they take the pipeline's session lock because
+# one session cannot run two statements at once. Every other stage is I/O or CPU
+# work on plain values and runs with bounded concurrency.
+_SESSION_STAGES = frozenset({"load", "persist"})
+_IO_STAGES = ("download", "extract", "analyze", "embed", "upsert")
+
+
+@dataclass
+class _StageTiming:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def as_dict(self) -> dict[str, float | int]:
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total_seconds, 3),
+            "avg_seconds": round(self.total_seconds / self.count, 3) if self.count else 0.0,
+            "max_seconds": round(self.max_seconds, 3),
+        }
+
+
+@dataclass
+class _JobProgress:
+    documents_processed: int = 0
+    documents_succeeded: int = 0
+    documents_failed: int = 0
+    chunks_total: int = 0
+    chunks_succeeded: int = 0
+    chunks_failed: int = 0
+
+
+@dataclass
+class _IndexPipeline:
+    """Per-job stage limits, session serialisation and latency accounting.
+
+    ``concurrency`` bounds each I/O stage; chunking runs in worker threads capped
+    at the CPU count. Session stages share one lock, and latency is measured from
+    the moment a stage is admitted, so queueing time is not counted as work.
+    """
+
+    concurrency: int
+    started: float = field(default_factory=time.perf_counter)
+    session_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    timings: dict[str, _StageTiming] = field(default_factory=dict)
+    _limits: dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.concurrency = max(1, self.concurrency)
+        self._limits = {stage: asyncio.Semaphore(self.concurrency) for stage in _IO_STAGES}
+        self._limits["chunk"] = asyncio.Semaphore(max(1, min(self.concurrency, os.cpu_count() or 1)))
+
+    @property
+    def depth(self) -> int:
+        """Documents in flight: twice the stage width so adjacent stages overlap."""
+        return self.concurrency * 2
+
+    @asynccontextmanager
+    async def stage(self, name: str) -> AsyncIterator[None]:
+        gate: asyncio.Lock | asyncio.Semaphore = self.session_lock if name in _SESSION_STAGES else self._limits[name]
+        async with gate:
+            admitted = time.perf_counter()
+            try:
+                yield
+            finally:
+                elapsed = time.perf_counter() - admitted
+                timing = self.timings.setdefault(name, _StageTiming())
+                timing.count += 1
+                timing.total_seconds += elapsed
+                timing.max_seconds = max(timing.max_seconds, elapsed)
+
+    def snapshot(self, documents_processed: int) -> dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "concurrency": self.concurrency,
+            "elapsed_seconds": round(elapsed, 3),
+            "documents_per_minute": round(documents_processed * 60 / elapsed, 2) if elapsed > 0 else 0.0,
+            "stages": {name: timing.as_dict() for name, timing in sorted(self.timings.items())},
+        }
+
+
+@dataclass(frozen=True)
+class _DocumentSource:
+    """Plain-value view of a document so non-session stages never touch the ORM row."""
+
+    id: int
+    tenant_id: int | None
+    file_path: str
+    file_name: str
+    file_type: Any
+    content_type: str
+    document_type: str
+
+    @classmethod
+    def from_document(cls, document: Document) -> "_DocumentSource":
+        return cls(
+            id=document.id,
+            tenant_id=document.tenant_id,
+            file_path=document.file_path,
+            file_name=document.file_name or "",
+            file_type=document.file_type,
+            content_type=DocumentIntelligenceService._mime_for_document(document),
+            document_type=(
+                document.document_type.value
+                if hasattr(document.document_type, "value")
+                else str(document.document_type)
+            ),
+        )
+
+
+IndexCheckpoint = Callable[[IndexJob], Awaitable[None]]
+
+
 class IndexJobService:
     """Create and process background document indexing jobs."""
 
@@ -178,8 +312,14 @@ class IndexJobService:
             if match:
                 failed_ids.add(int(match.group(1)))
 
-        processed_count = int(getattr(job, "documents_processed", 0) or 0)
-        remaining_ids = list(job.document_ids[processed_count:])
+        processed_ids = getattr(job, "processed_document_ids", None)
+        if processed_ids is not None:
+            done = {int(document_id) for document_id in processed_ids}
+            remaining_ids = [document_id for document_id in job.document_ids if document_id not in done]
+        else:
+            # Jobs written before the pipeline checkpoint processed strictly in order.
+            processed_count = int(getattr(job, "documents_processed", 0) or 0)
+            remaining_ids = list(job.document_ids[processed_count:])
         resume_ids = sorted(set(remaining_ids) | failed_ids)
         if not resume_ids:
             raise ValueError(f"Index job {job_id} has no remaining documents to resume")
@@ -282,189 +422,314 @@ class IndexJobService:
         tenant_id: int | None = None,
         content_cache: dict[int, bytes] | None = None,
         current_user: User | None = None,
+        concurrency: int | None = None,
+        checkpoint: IndexCheckpoint | None = None,
     ) -> IndexJob:
-        """Run OCR → chunk → embed → Pinecone for each document in the job."""
+        """Run OCR → chunk → embed → Pinecone for every document in the job.
+
+        Documents flow through a staged pipeline: download, extraction, AI
+        analysis, embedding and upsert overlap across documents with bounded
+        concurrency per stage, chunking runs off the event loop, and every
+        session write is serialised. A failure in one document is recorded as
+        ``Document <id>: ...`` and the job moves on; only a failure that leaves
+        the transaction unusable aborts the job.
+
+        ``checkpoint`` is awaited every ``index_job_checkpoint_every`` finished
+        documents, after the progress has been flushed — the Celery task commits
+        there so ``resolve_resume_document_ids`` can resume mid-job.
+        """
         job = await self.get_job(job_id, tenant_id=tenant_id)
         if job is None:
             raise ValueError(f"Index job {job_id} not found")
 
         job.status = IndexJobStatus.PROCESSING
         job.started_at = datetime.now(timezone.utc)
+        job.processed_document_ids = []
         await self.db.flush()
 
+        pipeline = _IndexPipeline(concurrency or settings.index_job_pipeline_concurrency)
+        progress = _JobProgress()
         ai_service = DocumentAIService()
         embedding_service = EmbeddingService()
         vector_service = VectorSearchService()
-        chunks_total = 0
-        chunks_succeeded = 0
-        chunks_failed = 0
-        documents_processed = 0
-        documents_succeeded = 0
-        documents_failed = 0
         # One TrapGuard + cover-block index per tenant for the whole job.
         gate_contexts: dict[int, Any] = {}
 
-        try:
-            for document_id in job.document_ids:
-                document = await self.db.get(Document, document_id)
-                if document is None:
-                    await self._append_error(job, f"Document {document_id} not found")
-                    documents_failed += 1
-                    chunks_failed += 1
-                    documents_processed += 1
-                    job.documents_processed = documents_processed
-                    job.documents_failed = documents_failed
-                    continue
-
-                document.status = DocumentStatus.PROCESSING
-                content = (content_cache or {}).get(document_id)
-                if content is None:
-                    content = await storage_service().download(document.file_path)
-
-                extraction = await self.intelligence_service.process(
-                    self.db,
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for document_id in job.document_ids:
+            queue.put_nowait(document_id)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    document_id = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await self._index_document(
+                    job,
                     document_id,
+                    pipeline,
+                    progress,
+                    ai_service=ai_service,
+                    embedding_service=embedding_service,
+                    vector_service=vector_service,
+                    content_cache=content_cache or {},
+                    current_user=current_user,
+                    gate_contexts=gate_contexts,
+                    checkpoint=checkpoint,
+                )
+
+        try:
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for _ in range(min(pipeline.depth, len(job.document_ids))):
+                        group.create_task(worker())
+            except BaseExceptionGroup as grouped:
+                raise grouped.exceptions[0] from None
+
+            job.status = IndexJobStatus.COMPLETED if progress.documents_failed == 0 else IndexJobStatus.FAILED
+            if progress.documents_failed and progress.documents_succeeded:
+                job.status = IndexJobStatus.COMPLETED
+        except Exception as exc:
+            logger.exception("Index job %s failed", job_id)
+            job.status = IndexJobStatus.FAILED
+            await self._append_error(job, str(exc))
+            raise
+        finally:
+            job.metrics = pipeline.snapshot(progress.documents_processed)
+            job.completed_at = datetime.now(timezone.utc)
+            await self.db.flush()
+
+        return job
+
+    async def _index_document(
+        self,
+        job: IndexJob,
+        document_id: int,
+        pipeline: _IndexPipeline,
+        progress: _JobProgress,
+        *,
+        ai_service: DocumentAIService,
+        embedding_service: EmbeddingService,
+        vector_service: VectorSearchService,
+        content_cache: dict[int, bytes],
+        current_user: User | None,
+        gate_contexts: dict[int, Any],
+        checkpoint: IndexCheckpoint | None,
+    ) -> None:
+        """Carry one document through every stage; failures stay with this document."""
+        async with pipeline.stage("load"):
+            document = await self.db.get(Document, document_id)
+            if document is None:
+                await self._append_error(job, f"Document {document_id} not found")
+                progress.documents_failed += 1
+                progress.chunks_failed += 1
+                await self._finish_document(job, document_id, pipeline, progress, checkpoint)
+                return
+            document.status = DocumentStatus.PROCESSING
+            source = _DocumentSource.from_document(document)
+
+        try:
+            content = content_cache.get(document_id)
+            if content is None:
+                async with pipeline.stage("download"):
+                    content = await storage_service().download(source.file_path)
+
+            async with pipeline.stage("extract"):
+                extraction = await self.intelligence_service.extract_bytes(
+                    raw=content,
+                    filename=source.file_name,
+                    content_type=source.content_type,
+                    file_type=source.file_type,
                     purpose="library",
-                    content=content,
                 )
 
-                text_content = extraction.text.strip()
-                if extraction.hard_ocr_failure or not text_content:
+            text_content = extraction.text.strip()
+            if extraction.hard_ocr_failure or not text_content:
+                async with pipeline.stage("persist"):
+                    DocumentIntelligenceService.apply_result(document, extraction)
                     if extraction.hard_ocr_failure:
-                        document.indexing_error = extraction.note or "OCR extraction failed"
-                        # Filed / taxonomy documents must not flip to FAILED — that would
-                        # erase the governance lifecycle (DRAFT → review → approve) because
-                        # a scan was unreadable. Record indexing_error only and restore DRAFT
-                        # when we had moved the row to PROCESSING for this job.
-                        if getattr(document, "category_id", None) is not None:
-                            if document.status == DocumentStatus.PROCESSING:
-                                document.status = DocumentStatus.DRAFT
-                        else:
-                            document.status = DocumentStatus.FAILED
+                        _mark_index_failure(document, extraction.note or "OCR extraction failed")
                     else:
                         _apply_post_index_status(document, DocumentStatus.APPROVED)
-                    await self._append_error(
-                        job,
-                        f"Document {document_id}: no searchable text extracted",
-                    )
-                    documents_failed += 1
-                    documents_processed += 1
-                    job.documents_processed = documents_processed
-                    job.documents_failed = documents_failed
-                    continue
-
-                file_ext = document.file_name.rsplit(".", 1)[-1].lower() if document.file_name else ""
-                analysis = await ai_service.analyze_document(text_content, document.file_name, file_ext)
-                document.ai_summary = analysis.summary
-                document.ai_tags = analysis.tags
-                document.ai_keywords = analysis.keywords
-                document.ai_topics = analysis.topics
-                document.ai_entities = analysis.entities
-                document.ai_confidence = analysis.confidence
-                document.ai_processed_at = datetime.now(timezone.utc)
-                document.has_tables = document.has_tables or analysis.has_tables
-                document.has_images = analysis.has_images
-                document.word_count = len(text_content.split())
-
-                previous_vector_ids = await self._previous_vector_ids(document.id)
-                if previous_vector_ids and not job.previous_vector_ids:
-                    job.previous_vector_ids = previous_vector_ids
-
-                await self.db.execute(delete(DocumentChunk).where(DocumentChunk.document_id == document.id))
+                    await self._append_error(job, f"Document {document_id}: no searchable text extracted")
+                    progress.documents_failed += 1
+                    await self._finish_document(job, document_id, pipeline, progress, checkpoint)
+                return
 
+            file_ext = source.file_name.rsplit(".", 1)[-1].lower() if source.file_name else ""
+            async with pipeline.stage("analyze"):
+                analysis = await ai_service.analyze_document(text_content, source.file_name, file_ext)
+
+            async with pipeline.stage("chunk"):
                 chunks = await ai_service.generate_chunks(text_content)
-                document.chunk_count = len(chunks)
-                chunks_total += len(chunks)
-
-                chunk_rows = [
-                    DocumentChunk(
-                        document_id=document.id,
-                        tenant_id=document.tenant_id,
-                        content=chunk.content,
-                        chunk_index=chunk.index,
-                        token_count=chunk.token_count,
-                        heading=chunk.heading,
-                        char_start=chunk.char_start,
-                        char_end=chunk.char_end,
-                    )
-                    for chunk in chunks
-                ]
-                for chunk_row in chunk_rows:
-                    self.db.add(chunk_row)
 
-                stale_vector_ids: list[str] = []
+            async with pipeline.stage("embed"):
                 embeddings = await embedding_service.generate_embeddings([chunk.content for chunk in chunks])
-                if embeddings and await vector_service.upsert_chunks(
-                    document.id,
-                    chunks,
-                    embeddings,
-                    extra_metadata={
-                        "tenant_id": document.tenant_id or 0,
-                        "document_type": (
-                            document.document_type.value
-                            if hasattr(document.document_type, "value")
-                            else str(document.document_type)
-                        ),
-                    },
-                ):
-                    # Only chunks with an embedding reached Pinecone: upsert_chunks
-                    # zips chunks against embeddings and Voyage may return fewer.
-                    for chunk_row, _embedding in zip(chunk_rows, embeddings):
-                        chunk_row.vector_id = document_chunk_vector_id(document.id, chunk_row.chunk_index)
-                    upserted_vector_ids = {row.vector_id for row in chunk_rows if row.vector_id}
-                    stale_vector_ids = sorted(set(previous_vector_ids) - upserted_vector_ids)
-                    document.indexed_at = datetime.now(timezone.utc)
-                    _apply_post_index_status(document, DocumentStatus.INDEXED)
-                    document.indexing_error = None
-                    chunks_succeeded += len(chunks)
-                else:
-                    # P0 fix: indexed_at must stay honest. Chunks + AI metadata are still
-                    # usable for quiz/map/Q&A even when Voyage/Pinecone are unavailable or
-                    # the upsert failed, but the document is NOT semantically searchable —
-                    # do not set indexed_at or pretend otherwise. Keep APPROVED so publish
-                    # can still proceed without losing readiness signals.
-                    document.indexed_at = None
-                    _apply_post_index_status(document, DocumentStatus.APPROVED)
-                    document.indexing_error = (
-                        document.indexing_error
-                        or "Vector indexing unavailable — searchable chunks stored; "
-                        "semantic search requires VOYAGE_API_KEY + PINECONE_API_KEY"
+
+            upserted = False
+            if embeddings:
+                async with pipeline.stage("upsert"):
+                    upserted = await vector_service.upsert_chunks(
+                        source.id,
+                        chunks,
+                        embeddings,
+                        extra_metadata={
+                            "tenant_id": source.tenant_id or 0,
+                            "document_type": source.document_type,
+                        },
                     )
-                    chunks_succeeded += len(chunks)
-
-                documents_succeeded += 1
-                documents_processed += 1
-                job.documents_processed = documents_processed
-                job.documents_succeeded = documents_succeeded
-                job.documents_failed = documents_failed
-                job.chunks_processed = chunks_total
-                job.chunks_succeeded = chunks_succeeded
-                job.chunks_failed = chunks_failed
-                job.chunk_count = chunks_total
-                await self.db.flush()
-
-                if stale_vector_ids:
-                    self.pending_stale_vector_ids.extend(stale_vector_ids)
-                    self._pending_stale_document_ids.append(document.id)
-
-                if current_user is not None:
-                    await self._trigger_governed_kb_mapping(
-                        document, text_content, current_user, gate_contexts=gate_contexts
+        except Exception as exc:
+            logger.warning("Index job %s: document %s failed; continuing", job.id, document_id, exc_info=True)
+            async with pipeline.stage("persist"):
+                _mark_index_failure(document, f"Indexing failed: {exc}")
+                await self._append_error(job, f"Document {document_id}: {exc}")
+                progress.documents_failed += 1
+                await self._finish_document(job, document_id, pipeline, progress, checkpoint)
+            return
+
+        async with pipeline.stage("persist"):
+            scope = None
+            try:
+                async with read_savepoint(self.db) as scope:
+                    stale_vector_ids = await self._persist_document(
+                        job,
+                        document,
+                        extraction=extraction,
+                        analysis=analysis,
+                        text_content=text_content,
+                        chunks=chunks,
+                        embeddings=embeddings,
+                        upserted=upserted,
                     )
+            except Exception as exc:
+                # A flush failure inside the savepoint has been unwound; anything
+                # else leaves the transaction unusable, so the job must stop.
+                if scope is None or not scope.recovered:
+                    raise
+                logger.warning("Index job %s: persisting document %s failed", job.id, document_id, exc_info=True)
+                # Unwinding the savepoint expired what it had changed; reload both
+                # before reading them, since a lazy load here raises MissingGreenlet.
+                await self.db.refresh(document)
+                await self.db.refresh(job)
+                _mark_index_failure(document, f"Indexing failed: {exc}")
+                await self._append_error(job, f"Document {document_id}: {exc}")
+                progress.documents_failed += 1
+                await self._finish_document(job, document_id, pipeline, progress, checkpoint)
+                return
+
+            progress.chunks_total += len(chunks)
+            progress.chunks_succeeded += len(chunks)
+            progress.documents_succeeded += 1
+            if stale_vector_ids:
+                self.pending_stale_vector_ids.extend(stale_vector_ids)
+                self._pending_stale_document_ids.append(document.id)
+
+            if current_user is not None:
+                await self._trigger_governed_kb_mapping(
+                    document, text_content, current_user, gate_contexts=gate_contexts
+                )
+            await self._finish_document(job, document_id, pipeline, progress, checkpoint)
 
-            job.status = IndexJobStatus.COMPLETED if documents_failed == 0 else IndexJobStatus.FAILED
-            if documents_failed and documents_succeeded:
-                job.status = IndexJobStatus.COMPLETED
-        except Exception as exc:
-            logger.exception("Index job %s failed", job_id)
-            job.status = IndexJobStatus.FAILED
-            await self._append_error(job, str(exc))
-            raise
-        finally:
-            job.completed_at = datetime.now(timezone.utc)
-            await self.db.flush()
+    async def _persist_document(
+        self,
+        job: IndexJob,
+        document: Document,
+        *,
+        extraction: Any,
+        analysis: Any,
+        text_content: str,
+        chunks: list[Any],
+        embeddings: list[list[float]],
+        upserted: bool,
+    ) -> list[str]:
+        """Write extraction, AI metadata and chunk rows; return superseded vector IDs."""
+        DocumentIntelligenceService.apply_result(document, extraction)
+        document.ai_summary = analysis.summary
+        document.ai_tags = analysis.tags
+        document.ai_keywords = analysis.keywords
+        document.ai_topics = analysis.topics
+        document.ai_entities = analysis.entities
+        document.ai_confidence = analysis.confidence
+        document.ai_processed_at = datetime.now(timezone.utc)
+        document.has_tables = document.has_tables or analysis.has_tables
+        document.has_images = analysis.has_images
+        document.word_count = len(text_content.split())
+
+        previous_vector_ids = await self._previous_vector_ids(document.id)
+        if previous_vector_ids and not job.previous_vector_ids:
+            job.previous_vector_ids = previous_vector_ids
+
+        await self.db.execute(delete(DocumentChunk).where(DocumentChunk.document_id == document.id))
+
+        document.chunk_count = len(chunks)
+        chunk_rows = [
+            DocumentChunk(
+                document_id=document.id,
+                tenant_id=document.tenant_id,
+                content=chunk.content,
+                chunk_index=chunk.index,
+                token_count=chunk.token_count,
+                heading=chunk.heading,
+                char_start=chunk.char_start,
+                char_end=chunk.char_end,
+            )
+            for chunk in chunks
+        ]
+        for chunk_row in chunk_rows:
+            self.db.add(chunk_row)
+
+        stale_vector_ids: list[str] = []
+        if upserted:
+            # Only chunks with an embedding reached Pinecone: upsert_chunks
+            # zips chunks against embeddings and Voyage may return fewer.
+            for chunk_row, _embedding in zip(chunk_rows, embeddings):
+                chunk_row.vector_id = document_chunk_vector_id(document.id, chunk_row.chunk_index)
+            upserted_vector_ids = {row.vector_id for row in chunk_rows if row.vector_id}
+            stale_vector_ids = sorted(set(previous_vector_ids) - upserted_vector_ids)
+            document.indexed_at = datetime.now(timezone.utc)
+            _apply_post_index_status(document, DocumentStatus.INDEXED)
+            document.indexing_error = None
+        else:
+            # P0 fix: indexed_at must stay honest. Chunks + AI metadata are still
+            # usable for quiz/map/Q&A even when Voyage/Pinecone are unavailable or
+            # the upsert failed, but the document is NOT semantically searchable —
+            # do not set indexed_at or pretend otherwise. Keep APPROVED so publish
+            # can still proceed without losing readiness signals.
+            document.indexed_at = None
+            _apply_post_index_status(document, DocumentStatus.APPROVED)
+            document.indexing_error = (
+                document.indexing_error
+                or "Vector indexing unavailable — searchable chunks stored; "
+                "semantic search requires VOYAGE_API_KEY + PINECONE_API_KEY"
+            )
+        await self.db.flush()
+        return stale_vector_ids
 
-        return job
+    async def _finish_document(
+        self,
+        job: IndexJob,
+        document_id: int,
+        pipeline: _IndexPipeline,
+        progress: _JobProgress,
+        checkpoint: IndexCheckpoint | None,
+    ) -> None:
+        """Record a terminal outcome for one document; caller holds the session lock."""
+        progress.documents_processed += 1
+        job.processed_document_ids = [*(job.processed_document_ids or []), document_id]
+        job.documents_processed = progress.documents_processed
+        job.documents_succeeded = progress.documents_succeeded
+        job.documents_failed = progress.documents_failed
+        job.chunks_processed = progress.chunks_total
+        job.chunks_succeeded = progress.chunks_succeeded
+        job.chunks_failed = progress.chunks_failed
+        job.chunk_count = progress.chunks_total
+        job.metrics = pipeline.snapshot(progress.documents_processed)
+        await self.db.flush()
+
+        every = max(1, settings.index_job_checkpoint_every)
+        if checkpoint is not None and progress.documents_processed % every == 0:
+            await checkpoint(job)
 
     async def _trigger_governed_kb_mapping(
         self,
@@ -0,0 +1,234 @@
+"""Shared source metrics for KRI calculation.
+
+Every KRI ``data_source`` is a small formula over a handful of primitive source
+metrics — "incidents in the last 30 days", "workforce size", "incidents closed
+of those created in the last 90 days". Many KRIs share them: the incident count,
+the incident rate and the near-miss ratio all read the incident table.
+``KRIService`` used to compute each KRI on its own, so a run over N KRIs issued
+the same counts again and again.
+
+:class:`KRIMetricPlan` collects the distinct primitive metrics the KRIs in a run
+need and computes each exactly once. Count metrics that read the same table are
+folded into one aggregate statement of conditional counts,
+``COUNT(CASE WHEN <condition> THEN 1 END)``, so a run issues at most one
+statement per source table whatever the number of KRIs.
+:func:`evaluate_data_source` then turns the metrics into KRI values in memory.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping, Optional
+
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models.audit import AuditFinding, FindingStatus
+from src.domain.models.complaint import Complaint, ComplaintStatus
+from src.domain.models.incident import ActionStatus, Incident, IncidentAction, IncidentSeverity, IncidentStatus
+from src.domain.models.near_miss import NearMiss
+from src.domain.models.risk import Risk
+
+logger = logging.getLogger(__name__)
+
+#: Headcount used for per-1000 rates when the tenant does not record one.
+DEFAULT_WORKFORCE_SIZE = 250
+
+_OPEN_INCIDENT_STATUSES = [
+    IncidentStatus.REPORTED,
+    IncidentStatus.UNDER_INVESTIGATION,
+    IncidentStatus.PENDING_ACTIONS,
+    IncidentStatus.ACTIONS_IN_PROGRESS,
+]
+
+#: Primitive metrics each KRI data source is computed from.
+KRI_SOURCE_METRICS: Dict[str, tuple[str, ...]] = {
+    "incident_count": ("incidents_30d",),
+    "incident_rate_per_1000": ("incidents_30d", "workforce_size"),
+    "critical_incident_count": ("critical_incidents_30d",),
+    "open_incident_count": ("open_incidents",),
+    "incident_closure_rate": ("incidents_created_90d", "incidents_closed_created_90d"),
+    "near_miss_count": ("near_misses_30d",),
+    "near_miss_reporting_ratio": ("near_misses_90d", "incidents_90d"),
+    "complaint_count": ("complaints_30d",),
+    "complaint_resolution_days": ("complaint_resolution_days",),
+    "audit_finding_count": ("audit_findings_30d",),
+    "high_risk_finding_count": ("open_high_risk_findings",),
+    "high_risk_count": ("high_risks",),
+    "overdue_action_count": ("overdue_actions",),
+}
+
+
+@dataclass(frozen=True)
+class _CountTable:
+    """Count metrics over one table, each a condition evaluated at ``now``."""
+
+    model: Any
+    conditions: Callable[[datetime], Dict[str, Any]]
+
+
+def _incident_conditions(now: datetime) -> Dict[str, Any]:
+    last_30, last_90 = now - timedelta(days=30), now - timedelta(days=90)
+    return {
+        "incidents_30d": Incident.incident_date >= last_30,
+        "incidents_90d": Incident.incident_date >= last_90,
+        "critical_incidents_30d": and_(
+            Incident.incident_date >= last_30, Incident.severity == IncidentSeverity.CRITICAL
+        ),
+        "open_incidents": Incident.status.in_(_OPEN_INCIDENT_STATUSES),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
+        "incidents_created_90d": Incident.created_at >= last_90,
+        "incidents_closed_created_90d": and_(Incident.created_at >= last_90, Incident.status == IncidentStatus.CLOSED),
+    }
+
+
+def _near_miss_conditions(now: datetime) -> Dict[str, Any]:
+    return {
+        "near_misses_30d": NearMiss.created_at >= now - timedelta(days=30),
+        "near_misses_90d": NearMiss.created_at >= now - timedelta(days=90),
+    }
+
+
+def _complaint_conditions(now: datetime) -> Dict[str, Any]:
+    return {"complaints_30d": Complaint.created_at >= now - timedelta(days=30)}
+
+
+def _audit_finding_conditions(now: datetime) -> Dict[str, Any]:
+    return {
+        "audit_findings_30d": AuditFinding.created_at >= now - timedelta(days=30),
+        "open_high_risk_findings": and_(
+            AuditFinding.severity.in_(["critical", "high"]),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
+            AuditFinding.status.in_([FindingStatus.OPEN, FindingStatus.IN_PROGRESS]),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
+        ),
+    }
+
+
+def _risk_conditions(now: datetime) -> Dict[str, Any]:
+    return {
+        "high_risks": and_(
+            Risk.risk_level.in_(["high", "critical"]),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
+            Risk.is_active == True,  # noqa: E712
+        )
+    }
+
+
+def _incident_action_conditions(now: datetime) -> Dict[str, Any]:
+    return {
+        "overdue_actions": and_(
+            IncidentAction.due_date < now,
+            IncidentAction.status.in_([ActionStatus.OPEN, ActionStatus.IN_PROGRESS]),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
+        )
+    }
+
+
+_COUNT_TABLES: tuple[_CountTable, ...] = (
+    _CountTable(Incident, _incident_conditions),
+    _CountTable(NearMiss, _near_miss_conditions),
+    _CountTable(Complaint, _complaint_conditions),
+    _CountTable(AuditFinding, _audit_finding_conditions),
+    _CountTable(Risk, _risk_conditions),
+    _CountTable(IncidentAction, _incident_action_conditions),
+)
+
+
+async def _workforce_size(db: AsyncSession, now: datetime) -> float:
+    """Headcount from tenant settings, or :data:`DEFAULT_WORKFORCE_SIZE`."""
+    try:
+        from src.domain.models.tenant import Tenant
+
+        result = await db.execute(select(Tenant).limit(1))
+        employee_count = getattr(result.scalar_one_or_none(), "employee_count", None)
+        if employee_count:
+            return float(employee_count)
+    except Exception:
+        logger.debug("Could not retrieve workforce size from tenant settings")
+    return float(DEFAULT_WORKFORCE_SIZE)
+
+
+async def _complaint_resolution_days(db: AsyncSession, now: datetime) -> float:
+    """Mean days from receipt to resolution for complaints closed in the last 90 days."""
+    result = await db.execute(
+        select(Complaint.received_date, Complaint.resolved_date).where(
+            and_(
+                Complaint.status.in_([ComplaintStatus.RESOLVED, ComplaintStatus.CLOSED]),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
+                Complaint.resolved_date.isnot(None),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
+                Complaint.created_at >= now - timedelta(days=90),
+            )
+        )
+    )
+    rows = result.all()
+    if not rows:
+        return 0.0
+    total_days = sum(
+        (row.resolved_date - row.received_date).total_seconds() / 86400
+        for row in rows
+        if row.resolved_date and row.received_date
+    )
+    return round(total_days / len(rows), 1)
+
+
+#: Metrics that are not a conditional count, each with its own reader.
+_SCALAR_METRICS: Dict[str, Callable[[AsyncSession, datetime], Awaitable[float]]] = {
+    "workforce_size": _workforce_size,
+    "complaint_resolution_days": _complaint_resolution_days,
+}
+
+
+class KRIMetricPlan:
+    """The distinct source metrics needed by a set of KRI data sources."""
+
+    def __init__(self, data_sources: Iterable[Optional[str]]):
+        self.metrics = frozenset(
+            metric for source in data_sources for metric in KRI_SOURCE_METRICS.get(source or "", ())
+        )
+
+    async def compute(self, db: AsyncSession, now: datetime) -> Dict[str, float]:
+        """Compute every planned metric once: one statement per source table.
+
+        Statements run one after another, as an ``AsyncSession`` requires.
+        """
+        values: Dict[str, float] = {}
+        for table in _COUNT_TABLES:
+            conditions = {name: cond for name, cond in table.conditions(now).items() if name in self.metrics}
+            if not conditions:
+                continue
+            statement = (
+                select(*[func.count(case((cond, 1))).label(name) for name, cond in conditions.items()])
+                .select_from(table.model)
+                .where(or_(*conditions.values()))
+            )
+            row = (await db.execute(statement)).one()
+            values.update({name: float(row._mapping[name] or 0) for name in conditions})
+        for name, reader in _SCALAR_METRICS.items():
+            if name in self.metrics:
+                values[name] = await reader(db, now)
+        return values
+
+
+def evaluate_data_source(data_source: Optional[str], metrics: Mapping[str, float]) -> Optional[float]:
+    """A KRI's value from precomputed metrics; None for an unknown data source."""
+    if data_source == "incident_rate_per_1000":
+        workforce = metrics["workforce_size"]
+        if workforce <= 0:
+            logger.warning("Workforce size unavailable, defaulting to %s", DEFAULT_WORKFORCE_SIZE)
+            workforce = DEFAULT_WORKFORCE_SIZE
+        return (metrics["incidents_30d"] / workforce) * 1000
+    if data_source == "incident_closure_rate":
+        total = metrics["incidents_created_90d"]
+        if total == 0:
+            return 100.0
+        return (metrics["incidents_closed_created_90d"] / total) * 100
+    if data_source == "near_miss_reporting_ratio":
+        near_misses, incidents = metrics["near_misses_90d"], metrics["incidents_90d"]
+        if incidents == 0:
+            return near_misses * 10 if near_misses > 0 else 0
+        return near_misses / incidents
+    needed = KRI_SOURCE_METRICS.get(data_source or "")
+    if not needed:
+        return None
+    # Every remaining data source is a single metric reported as-is.
+    return metrics[needed[0]]
+
+
+__all__ = ["DEFAULT_WORKFORCE_SIZE", "KRI_SOURCE_METRICS", "KRIMetricPlan", "evaluate_data_source"]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import math
 import re
+from collections import Counter
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from typing import Iterable, Sequence
@@ -14,6 +16,12 @@ SIMILAR_THRESHOLD = 0.86
 _PUNCT_RE = re.compile(r"[^a-z0-9]+")
 _SPACE_RE = re.compile(r"\s+")
 
+# Bigrams: the q-gram lemma loses q grams per edit, and at the 0.86 threshold
+# trigrams leave a floor too low to prune typical 10–30 character names.
+_GRAM = 2
+# Guards the float comparisons in the prefilters; they may only ever admit more.
+_EPSILON = 1e-9
+
 
 def normalise_lookup_key(value: str) -> str:
     """Lowercase, strip punctuation, collapse whitespace for equality checks."""
@@ -39,6 +47,166 @@ class SimilarMatch:
     score: float
 
 
+def _qgrams(key: str) -> Counter[str]:
+    return Counter(key[index : index + _GRAM] for index in range(len(key) - _GRAM + 1))
+
+
+def _min_shared_qgrams(left_length: int, right_length: int, threshold: float) -> int:
+    """Fewest q-gram occurrences two keys must share to reach ``threshold``.
+
+    ``ratio = 2·M / (|a| + |b|)`` and the matched characters ``M`` never exceed
+    the longest common subsequence, so a ratio at or above the threshold caps the
+    insert/delete distance at ``(1 - t)·(|a| + |b|)``. Each edit destroys at most
+    ``q`` q-grams (the q-gram lemma), which leaves a floor on shared grams. A floor
+    of zero or less means the q-gram filter cannot prune this pair.
+    """
+    max_edits = math.floor((1 - threshold) * (left_length + right_length) + _EPSILON)
+    return max(left_length, right_length) - _GRAM + 1 - max_edits * _GRAM
+
+
+class LookupMatchIndex:
+    """Reusable fuzzy-match index over ``(id, name)`` lookup candidates.
+
+    Build it once per import or listing and classify every proposed name against
+    it. Keys are normalised once; a query only runs ``SequenceMatcher`` on
+    candidates that survive three cheap upper bounds on its ratio (length window,
+    shared q-grams, shared characters). Results, thresholds and ordering are
+    identical to scoring every candidate.
+    """
+
+    def __init__(self, candidates: Iterable[tuple[int, str]]) -> None:
+        self._candidates = list(candidates)
+        self._keys = [normalise_lookup_key(name) for _id, name in self._candidates]
+        self._exact: dict[str, tuple[int, str]] = {}
+        self._by_length: dict[int, list[int]] = {}
+        self._blank: list[int] = []
+        self._characters: list[Counter[str]] = []
+        # gram -> [positions holding it at least once, at least twice, ...] so the
+        # shared count for a query is a handful of C-level ``Counter.update`` calls.
+        self._postings: dict[str, list[list[int]]] = {}
+        for position, (candidate, key) in enumerate(zip(self._candidates, self._keys)):
+            self._exact.setdefault(key, candidate)
+            self._characters.append(Counter(key))
+            if not key:
+                self._blank.append(position)
+                continue
+            self._by_length.setdefault(len(key), []).append(position)
+            for gram, count in _qgrams(key).items():
+                levels = self._postings.setdefault(gram, [])
+                while len(levels) < count:
+                    levels.append([])
+                for level in levels[:count]:
+                    level.append(position)
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def exact(self, name: str) -> tuple[int, str] | None:
+        """First candidate whose normalised name equals ``name``'s."""
+        key = normalise_lookup_key(name)
+        if not key:
+            return None
+        return self._exact.get(key)
+
+    def _plausible(self, key: str, threshold: float) -> set[int]:
+        """Positions whose length and shared q-grams allow the threshold."""
+        length = len(key)
+        required: dict[int, int] = {
+            other: _min_shared_qgrams(length, other, threshold)
+            for other in self._by_length
+            if 2 * min(length, other) / (length + other) >= threshold - _EPSILON
+        }
+        plausible: set[int] = set()
+        for other, floor in required.items():
+            if floor <= 0:
+                plausible.update(self._by_length[other])
+        floors = [floor for floor in required.values() if floor > 0]
+        if not floors:
+            return plausible
+
+        shared: Counter[int] = Counter()
+        for gram, query_count in _qgrams(key).items():
+            for level in self._postings.get(gram, [])[:query_count]:
+                shared.update(level)
+        lowest = min(floors)
+        keys = self._keys
+        for position in [position for position, count in shared.items() if count >= lowest]:
+            needed = required.get(len(keys[position]))
+            if needed is not None and shared[position] >= needed:
+                plausible.add(position)
+        return plausible
+
+    def similar(
+        self,
+        name: str,
+        *,
+        threshold: float = SIMILAR_THRESHOLD,
+        limit: int = 5,
+    ) -> list[SimilarMatch]:
+        """Same contract as ``find_similar_matches``."""
+        key = normalise_lookup_key(name)
+        if not key:
+            return []
+        query_characters = Counter(key).items()
+        matcher = SequenceMatcher(None)
+        scored: list[SimilarMatch] = []
+        for position in self._plausible(key, threshold):
+            candidate_key = self._keys[position]
+            if candidate_key == key:
+                continue
+            characters = self._characters[position]
+            common = sum(min(count, characters[char]) for char, count in query_characters)
+            if 2 * common / (len(key) + len(candidate_key)) < threshold - _EPSILON:
+                continue
+            # Same argument order as ``similarity_score``: SequenceMatcher is not
+            # symmetric under ties.
+            matcher.set_seqs(key, candidate_key)
+            score = matcher.ratio()
+            if score >= threshold:
+                candidate_id, candidate_name = self._candidates[position]
+                scored.append(SimilarMatch(id=candidate_id, name=candidate_name, score=round(score, 4)))
+        if threshold <= 0:
+            # ``similarity_score`` gives blank names 0.0, which a non-positive
+            # threshold still admits.
+            for position in self._blank:
+                candidate_id, candidate_name = self._candidates[position]
+                scored.append(SimilarMatch(id=candidate_id, name=candidate_name, score=0.0))
+        scored.sort(key=lambda item: (-item.score, item.name.lower(), item.id))
+        return scored[:limit]
+
+    def classify(
+        self,
+        name: str,
+        *,
+        threshold: float = SIMILAR_THRESHOLD,
+    ) -> tuple[str, tuple[int, str] | None, list[SimilarMatch]]:
+        """Same contract as ``classify_lookup_name``."""
+        exact = self.exact(name)
+        if exact is not None:
+            return "reuse", exact, []
+        similar = self.similar(name, threshold=threshold)
+        if similar:
+            return "similar", None, similar
+        return "new", None, []
+
+    def classify_many(
+        self,
+        names: Iterable[str],
+        *,
+        threshold: float = SIMILAR_THRESHOLD,
+    ) -> list[tuple[str, tuple[int, str] | None, list[SimilarMatch]]]:
+        """Classify each name, in order; repeated normalised names are scored once."""
+        results: dict[str, tuple[str, tuple[int, str] | None, list[SimilarMatch]]] = {}
+        classified = []
+        for name in names:
+            key = normalise_lookup_key(name)
+            if key not in results:
+                results[key] = self.classify(name, threshold=threshold)
+            intent, exact, similar = results[key]
+            classified.append((intent, exact, list(similar)))
+        return classified
+
+
 def find_similar_matches(
     name: str,
     candidates: Sequence[tuple[int, str]],
@@ -47,16 +215,9 @@ def find_similar_matches(
     limit: int = 5,
 ) -> list[SimilarMatch]:
     """Return candidates at/above threshold, highest score first (excluding exact)."""
-    key = normalise_lookup_key(name)
-    if not key:
+    if not normalise_lookup_key(name):
         return []
-    scored: list[SimilarMatch] = []
-    for candidate_id, candidate_name in candidates:
-        score = similarity_score(name, candidate_name)
-        if score >= threshold and normalise_lookup_key(candidate_name) != key:
-            scored.append(SimilarMatch(id=candidate_id, name=candidate_name, score=round(score, 4)))
-    scored.sort(key=lambda item: (-item.score, item.name.lower(), item.id))
-    return scored[:limit]
+    return LookupMatchIndex(candidates).similar(name, threshold=threshold, limit=limit)
 
 
 def find_exact_match(name: str, candidates: Iterable[tuple[int, str]]) -> tuple[int, str] | None:
@@ -83,10 +244,14 @@ def classify_lookup_name(
     - similar: near-duplicate requires confirmation
     - new: no close match
     """
-    exact = find_exact_match(name, candidates)
-    if exact is not None:
-        return "reuse", exact, []
-    similar = find_similar_matches(name, candidates, threshold=threshold)
-    if similar:
-        return "similar", None, similar
-    return "new", None, []
+    return LookupMatchIndex(candidates).classify(name, threshold=threshold)
+
+
+def classify_many(
+    names: Iterable[str],
+    candidates: Sequence[tuple[int, str]],
+    *,
+    threshold: float = SIMILAR_THRESHOLD,
+) -> list[tuple[str, tuple[int, str] | None, list[SimilarMatch]]]:
+    """``classify_lookup_name`` for a batch of names against one candidate index."""
+    return LookupMatchIndex(candidates).classify_many(names, threshold=threshold)
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import hashlib
+from collections import Counter
 from dataclasses import dataclass
-from typing import Callable, Protocol, Sequence
+from itertools import combinations
+from typing import Callable, Iterable, Protocol, Sequence
 
 PAGE_CONSENSUS_PIPELINE_VERSION = "2026.07.r5"
 
@@ -52,27 +54,163 @@ def hash_ocr_text(text: str) -> str:
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
 
-def character_error_rate(reference: str, observed: str) -> float | None:
-    """Return Levenshtein character error rate, or ``None`` without a reference."""
+def _common_affix_trim(first: str, second: str) -> tuple[str, str]:
+    """Drop the shared prefix and suffix; they never contribute to the distance."""
+    limit = min(len(first), len(second))
+    start = 0
+    while start < limit and first[start] == second[start]:
+        start += 1
+    end = 0
+    while end < limit - start and first[-1 - end] == second[-1 - end]:
+        end += 1
+    return first[start : len(first) - end], second[start : len(second) - end]
+
+
+def _myers_distance(pattern: str, text: str, max_distance: int | None) -> int | None:
+    """Bit-parallel Levenshtein distance (Myers 1999, Hyyrö's global variant).
+
+    One Python int holds a whole column of the DP matrix, so each character of
+    ``text`` costs a handful of big-int operations instead of ``len(pattern)``
+    cell updates. With ``max_distance`` the scan stops as soon as the distance
+    can no longer come back under the bound: the final score differs from the
+    running one by at most the number of unread characters.
+    """
+    length = len(pattern)
+    mask = (1 << length) - 1
+    last = 1 << (length - 1)
+    peq: dict[str, int] = {}
+    for index, character in enumerate(pattern):
+        peq[character] = peq.get(character, 0) | (1 << index)
+
+    positive, negative, score = mask, 0, length
+    remaining = len(text)
+    for character in text:
+        remaining -= 1
+        match = peq.get(character, 0)
+        vertical = match | negative
+        horizontal = ((((match & positive) + positive) & mask) ^ positive) | match
+        horizontal_positive = negative | (~(horizontal | positive) & mask)
+        horizontal_negative = positive & horizontal
+        if horizontal_positive & last:
+            score += 1
+        elif horizontal_negative & last:
+            score -= 1
+        if max_distance is not None and score - remaining > max_distance:
+            return None
+        horizontal_positive = ((horizontal_positive << 1) | 1) & mask
+        horizontal_negative = (horizontal_negative << 1) & mask
+        positive = horizontal_negative | (~(vertical | horizontal_positive) & mask)
+        negative = horizontal_positive & vertical
+    return score if max_distance is None or score <= max_distance else None
+
+
+def levenshtein_distance(first: str, second: str, *, max_distance: int | None = None) -> int | None:
+    """Return the Levenshtein distance between two strings.
+
+    ``max_distance`` bounds the work: the result is ``None`` once the distance is
+    known to exceed it, which for unrelated pages is usually decided by the length
+    difference alone. Inputs are compared as given; normalize them first.
+    """
+    if max_distance is not None and max_distance < 0:
+        return None
+    if max_distance is not None and abs(len(first) - len(second)) > max_distance:
+        return None
+    first, second = _common_affix_trim(first, second)
+    if not first or not second:
+        distance = len(first) + len(second)
+        return distance if max_distance is None or distance <= max_distance else None
+    # The longer string becomes the bit vector: Python pays per loop iteration,
+    # far more than per machine word of a big int.
+    pattern, text = (first, second) if len(first) >= len(second) else (second, first)
+    return _myers_distance(pattern, text, max_distance)
+
+
+def _bounded_error_rate(reference: str, observed: str, max_rate: float | None) -> tuple[int | None, float | None]:
+    """Distance and rate of two normalized texts, ``(None, None)`` above ``max_rate``."""
+    if max_rate is None:
+        distance = levenshtein_distance(reference, observed)
+    else:
+        # One character of slack absorbs float rounding in ``max_rate * len``;
+        # the rate check below is the authoritative comparison.
+        distance = levenshtein_distance(reference, observed, max_distance=int(max_rate * len(reference)) + 1)
+    if distance is None:
+        return None, None
+    rate = distance / len(reference)
+    if max_rate is not None and rate > max_rate:
+        return None, None
+    return distance, rate
+
+
+def character_error_rate(
+    reference: str,
+    observed: str,
+    *,
+    max_rate: float | None = None,
+) -> float | None:
+    """Return Levenshtein character error rate, or ``None`` without a reference.
+
+    With ``max_rate`` the comparison gives up early and returns ``None`` when the
+    rate is known to be above it.
+    """
     normalized_reference = normalize_ocr_text(reference)
     normalized_observed = normalize_ocr_text(observed)
     if not normalized_reference:
         return None
 
-    previous = list(range(len(normalized_observed) + 1))
-    for reference_index, reference_character in enumerate(normalized_reference, start=1):
-        current = [reference_index]
-        for observed_index, observed_character in enumerate(normalized_observed, start=1):
-            substitution_cost = int(reference_character != observed_character)
-            current.append(
-                min(
-                    current[-1] + 1,
-                    previous[observed_index] + 1,
-                    previous[observed_index - 1] + substitution_cost,
+    return _bounded_error_rate(normalized_reference, normalized_observed, max_rate)[1]
+
+
+@dataclass(frozen=True)
+class OCRProviderPairScore:
+    """Edit distance between two providers' text for one page.
+
+    ``character_error_rate`` uses ``reference_provider`` (the earlier supplied
+    candidate) as the reference. Both fields are ``None`` when a threshold was
+    given and the pair exceeded it, or when the reference page is blank.
+    """
+
+    page_number: int
+    reference_provider: str
+    observed_provider: str
+    distance: int | None
+    character_error_rate: float | None
+
+
+def score_provider_pairs(
+    candidates: Iterable[OCRPageSource],
+    *,
+    max_character_error_rate: float | None = None,
+) -> list[OCRProviderPairScore]:
+    """Score every provider pair on every page of a document in one pass.
+
+    Candidates may arrive in any page order; pairs keep the supplied provider
+    order within a page. Each text is normalized once, and identical normalized
+    texts (the common case for agreeing providers) are scored without a distance
+    computation. Results are ordered by page number, then pair order.
+    """
+    pages: dict[int, list[tuple[str, str]]] = {}
+    for candidate in candidates:
+        pages.setdefault(candidate.page_number, []).append((candidate.provider, normalize_ocr_text(candidate.text)))
+
+    scores: list[OCRProviderPairScore] = []
+    for page_number in sorted(pages):
+        for (reference_provider, reference), (observed_provider, observed) in combinations(pages[page_number], 2):
+            if not reference:
+                distance, rate = None, None
+            elif reference == observed:
+                distance, rate = 0, 0.0
+            else:
+                distance, rate = _bounded_error_rate(reference, observed, max_character_error_rate)
+            scores.append(
+                OCRProviderPairScore(
+                    page_number=page_number,
+                    reference_provider=reference_provider,
+                    observed_provider=observed_provider,
+                    distance=distance,
+                    character_error_rate=rate,
                 )
             )
-        previous = current
-    return previous[-1] / len(normalized_reference)
+    return scores
 
 
 def build_page_consensus(
@@ -97,12 +235,13 @@ def build_page_consensus(
         raise ValueError("OCR page candidates must refer to the same page.")
 
     normalized_texts = [normalize_ocr_text(candidate.text) for candidate in candidates]
+    frequencies = Counter(normalized_texts)
     winner_index = max(
         range(len(candidates)),
-        key=lambda index: (normalized_texts.count(normalized_texts[index]), -index),
+        key=lambda index: (frequencies[normalized_texts[index]], -index),
     )
     winner = candidates[winner_index]
-    agreement = normalized_texts.count(normalized_texts[winner_index]) / len(candidates)
+    agreement = frequencies[normalized_texts[winner_index]] / len(candidates)
 
     consensus = OCRPageConsensus(
         page_number=winner.page_number,
@@ -123,10 +262,13 @@ __all__ = [
     "OCRPageCandidate",
     "OCRPageConsensus",
     "OCRPageSource",
+    "OCRProviderPairScore",
     "PAGE_CONSENSUS_PIPELINE_VERSION",
     "PageConsensusPersistHook",
     "build_page_consensus",
     "character_error_rate",
     "hash_ocr_text",
+    "levenshtein_distance",
     "normalize_ocr_text",
+    "score_provider_pairs",
 ]
@@ -6,9 +6,9 @@ and automated alerts when thresholds are breached.
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.models.incident import Incident, IncidentSeverity, IncidentStatus
@@ -25,6 +25,7 @@ from src.domain.models.near_miss import NearMiss
 from src.domain.models.risk import Risk, RiskAssessment, RiskStatus
 from src.domain.models.risk_register import EnterpriseRisk
 from src.domain.services.case_risk_links import get_case_linked_risk_ids
+from src.domain.services.kri_metric_plan import KRIMetricPlan, evaluate_data_source
 
 logger = logging.getLogger(__name__)
 
@@ -364,301 +365,97 @@ class KRIService:
         if not kri or not kri.auto_calculate:
             return None
 
-        # Calculate based on data source
-        value = await self._calculate_from_source(kri)
+        results = await self._calculate_many([kri])
+        return results[0] if results else None
 
-        if value is None:
-            return None
-
-        # Determine status
-        new_status = kri.calculate_status(value)
-
-        # Determine trend
-        trend = await self._calculate_trend(kri, value)
-
-        # Store measurement
-        measurement = KRIMeasurement(
-            kri_id=kri_id,
-            measurement_date=datetime.now(timezone.utc),
-            value=value,
-            status=new_status,
-            period_start=datetime.now(timezone.utc) - timedelta(days=30),
-            period_end=datetime.now(timezone.utc),
-        )
-        self.db.add(measurement)
-
-        # Check for alerts
-        await self._check_thresholds(kri, value, new_status)
-
-        # Update KRI current values
-        old_status = kri.current_status
-        kri.current_value = value
-        kri.current_status = new_status
-        kri.last_updated = datetime.now(timezone.utc)
-        kri.trend_direction = trend
-
-        await self.db.commit()
-
-        return {
-            "kri_id": kri_id,
-            "kri_code": kri.code,
-            "value": value,
-            "status": new_status.value,
-            "previous_status": old_status.value if old_status else None,
-            "trend": trend.value if trend else None,
-        }
+    async def _calculate_many(self, kris: Sequence[KeyRiskIndicator]) -> List[Dict[str, Any]]:
+        """Calculate, record and alert for a batch of KRIs, sharing every source query.
 
-    async def _calculate_from_source(self, kri: KeyRiskIndicator) -> Optional[float]:
-        """Calculate KRI value from its data source."""
-        data_source = kri.data_source
-
-        # Incident-based KRIs
-        if data_source == "incident_count":
-            return await self._count_incidents(days=30)
-        elif data_source == "incident_rate_per_1000":
-            return await self._calculate_incident_rate()
-        elif data_source == "critical_incident_count":
-            return await self._count_incidents(days=30, severity=IncidentSeverity.CRITICAL)
-        elif data_source == "open_incident_count":
-            return await self._count_open_incidents()
-        elif data_source == "incident_closure_rate":
-            return await self._calculate_closure_rate("incident")
-
-        # Near-miss KRIs
-        elif data_source == "near_miss_count":
-            return await self._count_near_misses(days=30)
-        elif data_source == "near_miss_reporting_ratio":
-            return await self._calculate_near_miss_ratio()
-
-        # Complaint KRIs
-        elif data_source == "complaint_count":
-            return await self._count_complaints(days=30)
-        elif data_source == "complaint_resolution_days":
-            return await self._calculate_avg_resolution_days("complaint")
-
-        # Audit KRIs
-        elif data_source == "audit_finding_count":
-            return await self._count_audit_findings(days=30)
-        elif data_source == "high_risk_finding_count":
-            return await self._count_high_risk_findings()
-
-        # Risk KRIs
-        elif data_source == "high_risk_count":
-            return await self._count_high_risks()
-        elif data_source == "overdue_action_count":
-            return await self._count_overdue_actions()
-
-        # Default
-        logger.warning(f"Unknown data source: {data_source}")
-        return None
-
-    async def _count_incidents(
-        self,
-        days: int,
-        severity: Optional[IncidentSeverity] = None,
-    ) -> float:
-        """Count incidents in the specified period."""
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-
-        query = select(func.count(Incident.id)).where(Incident.incident_date >= cutoff)
-
-        if severity:
-            query = query.where(Incident.severity == severity)
-
-        result = await self.db.execute(query)
-        return float(result.scalar() or 0)
-
-    async def _count_open_incidents(self) -> float:
-        """Count currently open incidents."""
-        result = await self.db.execute(
-            select(func.count(Incident.id)).where(
-                Incident.status.in_(  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
-                    [
-                        IncidentStatus.REPORTED,
-                        IncidentStatus.UNDER_INVESTIGATION,
-                        IncidentStatus.PENDING_ACTIONS,
-                        IncidentStatus.ACTIONS_IN_PROGRESS,
-                    ]
-                )
-            )
-        )
-        return float(result.scalar() or 0)
-
-    async def _calculate_incident_rate(self) -> float:
-        """Calculate incident rate per 1000 employees.
-
-        Uses a configurable workforce size; defaults to 250 if not
-        available from tenant settings.
+        The KRIs' source metrics are planned and computed once (one aggregate per
+        source table), their recent history is read in one statement, and
+        thresholds and trends are evaluated in memory. Measurements and alerts
+        are written together in a single commit.
         """
-        incident_count = await self._count_incidents(days=30)
-        workforce_size = await self._get_workforce_size()
-        if workforce_size <= 0:
-            logger.warning("Workforce size unavailable, defaulting to 250")
-            workforce_size = 250
-        return (incident_count / workforce_size) * 1000
-
-    async def _get_workforce_size(self) -> int:
-        """Retrieve the workforce headcount from tenant settings or default."""
-        try:
-            from src.domain.models.tenant import Tenant
-
-            result = await self.db.execute(select(Tenant).limit(1))
-            tenant = result.scalar_one_or_none()
-            if tenant and hasattr(tenant, "employee_count") and tenant.employee_count:
-                return int(tenant.employee_count)
-        except Exception:
-            logger.debug("Could not retrieve workforce size from tenant settings")
-        return 250
-
-    async def _calculate_closure_rate(self, entity_type: str) -> float:
-        """Calculate percentage of cases closed within target."""
-        # Simplified: count closed vs total in last 90 days
-        cutoff = datetime.now(timezone.utc) - timedelta(days=90)
-
-        if entity_type == "incident":
-            total_result = await self.db.execute(select(func.count(Incident.id)).where(Incident.created_at >= cutoff))
-            total = total_result.scalar() or 0
-
-            closed_result = await self.db.execute(
-                select(func.count(Incident.id)).where(
-                    and_(
-                        Incident.created_at >= cutoff,
-                        Incident.status == IncidentStatus.CLOSED,
-                    )
-                )
-            )
-            closed = closed_result.scalar() or 0
-
-            if total == 0:
-                return 100.0
-            return (closed / total) * 100
-
-        return 0.0
-
-    async def _count_near_misses(self, days: int) -> float:
-        """Count near misses in period."""
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-
-        result = await self.db.execute(select(func.count(NearMiss.id)).where(NearMiss.created_at >= cutoff))
-        return float(result.scalar() or 0)
-
-    async def _calculate_near_miss_ratio(self) -> float:
-        """Calculate near-miss to incident ratio (higher is better)."""
-        days = 90
-        near_misses = await self._count_near_misses(days)
-        incidents = await self._count_incidents(days)
-
-        if incidents == 0:
-            return near_misses * 10 if near_misses > 0 else 0
-
-        return near_misses / incidents
-
-    async def _count_complaints(self, days: int) -> float:
-        """Count complaints in period."""
-        from src.domain.models.complaint import Complaint
-
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-
-        result = await self.db.execute(select(func.count(Complaint.id)).where(Complaint.created_at >= cutoff))
-        return float(result.scalar() or 0)
-
-    async def _calculate_avg_resolution_days(self, entity_type: str) -> float:
-        """Calculate average resolution time in days from closed records."""
-        if entity_type == "complaint":
-            from src.domain.models.complaint import Complaint, ComplaintStatus
-
-            cutoff = datetime.now(timezone.utc) - timedelta(days=90)
-            result = await self.db.execute(
-                select(Complaint.received_date, Complaint.resolved_date).where(
-                    and_(
-                        Complaint.status.in_([ComplaintStatus.RESOLVED, ComplaintStatus.CLOSED]),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
-                        Complaint.resolved_date.isnot(None),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
-                        Complaint.created_at >= cutoff,
-                    )
-                )
-            )
-            rows = result.all()
-            if not rows:
-                return 0.0
-            total_days = sum(
-                (row.resolved_date - row.received_date).total_seconds() / 86400
-                for row in rows
-                if row.resolved_date and row.received_date
-            )
-            return round(total_days / len(rows), 1) if rows else 0.0
+        now = datetime.now(timezone.utc)
+        metrics = await KRIMetricPlan(kri.data_source for kri in kris).compute(self.db, now)
 
-        if entity_type == "incident":
-            cutoff = datetime.now(timezone.utc) - timedelta(days=90)
-            result = await self.db.execute(
-                select(Incident.created_at, Incident.closed_at).where(
-                    and_(
-                        Incident.status == IncidentStatus.CLOSED,
-                        Incident.closed_at.isnot(None),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
-                        Incident.created_at >= cutoff,
-                    )
-                )
-            )
-            rows = result.all()
-            if not rows:
-                return 0.0
-            total_days = sum(
-                (row.closed_at - row.created_at).total_seconds() / 86400
-                for row in rows
-                if row.closed_at and row.created_at
+        values: Dict[int, float] = {}
+        for kri in kris:
+            value = evaluate_data_source(kri.data_source, metrics)
+            if value is None:
+                logger.warning(f"Unknown data source: {kri.data_source}")
+                continue
+            values[kri.id] = value
+        if not values:
+            return []
+
+        history = await self._recent_measurement_values(list(values))
+        measurements: List[Dict[str, Any]] = []
+        results: List[Dict[str, Any]] = []
+        for kri in kris:
+            if kri.id not in values:
+                continue
+            value = values[kri.id]
+            new_status = kri.calculate_status(value)
+            trend = self._trend_from_history(kri, value, history.get(kri.id, []))
+            measurements.append(
+                {
+                    "kri_id": kri.id,
+                    "measurement_date": now,
+                    "value": value,
+                    "status": new_status,
+                    "period_start": now - timedelta(days=30),
+                    "period_end": now,
+                }
             )
-            return round(total_days / len(rows), 1) if rows else 0.0
 
-        return 0.0
+            # Check for alerts
+            await self._check_thresholds(kri, value, new_status)
 
-    async def _count_audit_findings(self, days: int) -> float:
-        """Count audit findings in period."""
-        from src.domain.models.audit import AuditFinding
+            # Update KRI current values
+            old_status = kri.current_status
+            kri.current_value = value
+            kri.current_status = new_status
+            kri.last_updated = now
+            kri.trend_direction = trend
 
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        result = await self.db.execute(select(func.count(AuditFinding.id)).where(AuditFinding.created_at >= cutoff))
-        return float(result.scalar() or 0)
-
-    async def _count_high_risk_findings(self) -> float:
-        """Count high-risk audit findings that are still open."""
-        from src.domain.models.audit import AuditFinding, FindingStatus
-
-        result = await self.db.execute(
-            select(func.count(AuditFinding.id)).where(
-                and_(
-                    AuditFinding.severity.in_(["critical", "high"]),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
-                    AuditFinding.status.in_([FindingStatus.OPEN, FindingStatus.IN_PROGRESS]),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
-                )
-            )
-        )
-        return float(result.scalar() or 0)
-
-    async def _count_high_risks(self) -> float:
-        """Count risks rated high or critical."""
-        result = await self.db.execute(
-            select(func.count(Risk.id)).where(
-                and_(
-                    Risk.risk_level.in_(["high", "critical"]),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
-                    Risk.is_active == True,  # noqa: E712  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
-                )
+            results.append(
+                {
+                    "kri_id": kri.id,
+                    "kri_code": kri.code,
+                    "value": value,
+                    "status": new_status.value,
+                    "previous_status": old_status.value if old_status else None,
+                    "trend": trend.value if trend else None,
+                }
             )
-        )
-        return float(result.scalar() or 0)
 
-    async def _count_overdue_actions(self) -> float:
-        """Count overdue corrective actions."""
-        from src.domain.models.incident import ActionStatus, IncidentAction
-
-        now = datetime.now(timezone.utc)
+        # One executemany without RETURNING: nothing reads the new rows back.
+        await self.db.execute(insert(KRIMeasurement), measurements)
+        await self.db.commit()
+        return results
 
-        result = await self.db.execute(
-            select(func.count(IncidentAction.id)).where(
-                and_(
-                    IncidentAction.due_date < now,
-                    IncidentAction.status.in_([ActionStatus.OPEN, ActionStatus.IN_PROGRESS]),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
+    async def _recent_measurement_values(self, kri_ids: List[int], limit: int = 3) -> Dict[int, List[float]]:
+        """The ``limit`` most recent measurement values per KRI, in one statement."""
+        ranked = (
+            select(
+                KRIMeasurement.kri_id,
+                KRIMeasurement.value,
+                func.row_number()
+                .over(
+                    partition_by=KRIMeasurement.kri_id,
+                    order_by=KRIMeasurement.measurement_date.desc(),  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
                 )
+                .label("recency"),
             )
+            .where(KRIMeasurement.kri_id.in_(kri_ids))  # type: ignore[attr-defined]  # TYPE-IGNORE: MYPY-OVERRIDE
+            .subquery()
         )
-        return float(result.scalar() or 0)
+        result = await self.db.execute(select(ranked.c.kri_id, ranked.c.value).where(ranked.c.recency <= limit))
+        history: Dict[int, List[float]] = {}
+        for kri_id, value in result.all():
+            history.setdefault(kri_id, []).append(value)
+        return history
 
     async def _calculate_trend(
         self,
@@ -674,12 +471,20 @@ class KRIService:
             .limit(3)
         )
         measurements = result.scalars().all()
+        return self._trend_from_history(kri, current_value, [m.value for m in measurements])
 
-        if len(measurements) < 2:
+    @staticmethod
+    def _trend_from_history(
+        kri: KeyRiskIndicator,
+        current_value: float,
+        previous_values: Sequence[float],
+    ) -> Optional[KRITrendDirection]:
+        """Trend of ``current_value`` against the mean of recent measurements."""
+        if len(previous_values) < 2:
             return None
 
         # Compare with average of previous measurements
-        previous_avg = sum(m.value for m in measurements) / len(measurements)
+        previous_avg = sum(previous_values) / len(previous_values)
 
         if kri.lower_is_better:
             if current_value < previous_avg * 0.9:
@@ -735,14 +540,9 @@ class KRIService:
             )
         )
         kris = result.scalars().all()
-
-        results = []
-        for kri in kris:
-            calc_result = await self.calculate_kri(kri.id)
-            if calc_result:
-                results.append(calc_result)
-
-        return results
+        if not kris:
+            return []
+        return await self._calculate_many(kris)
 
     async def get_kri_dashboard(self) -> Dict[str, Any]:
         """Get KRI dashboard summary."""
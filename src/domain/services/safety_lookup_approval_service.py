@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.domain.exceptions import NotFoundError, ValidationError
 from src.domain.models.asset import Asset, AssetType
 from src.domain.models.location import Location
-from src.domain.services.lookup_similarity import classify_lookup_name, find_similar_matches
+from src.domain.services.lookup_similarity import LookupMatchIndex, classify_lookup_name
 
 Kind = Literal["asset_type", "location"]
 
@@ -70,11 +70,11 @@ class SafetyLookupApprovalService:
             .scalars()
             .all()
         )
-        type_candidates = [(t.id, t.name) for t in active_types]
-        location_candidates = [(loc.id, loc.name) for loc in active_locations]
+        type_index = LookupMatchIndex((t.id, t.name) for t in active_types)
+        location_index = LookupMatchIndex((loc.id, loc.name) for loc in active_locations)
 
         def serialize_type(item: AssetType) -> dict[str, Any]:
-            similar = find_similar_matches(item.name, type_candidates)
+            similar = type_index.similar(item.name)
             return {
                 "kind": "asset_type",
                 "id": item.id,
@@ -87,7 +87,7 @@ class SafetyLookupApprovalService:
             }
 
         def serialize_location(item: Location) -> dict[str, Any]:
-            similar = find_similar_matches(item.name, location_candidates)
+            similar = location_index.similar(item.name)
             return {
                 "kind": "location",
                 "id": item.id,
@@ -23,30 +23,113 @@ Why the question is asked before the query rather than after it fails
    harnesses build their schema with ``create_all``. A table with no create
    migration therefore exists in every test database and in no deployment, which
    is why this has to be a runtime question and cannot be a test-time one.
+
+Why "present" is cached and "absent" never is
+---------------------------------------------
+This runs once per request on the approvals, document-control and policy
+acknowledgment paths, and building an inspector and asking ``has_table`` per
+name is a catalogue round trip each time. The answer changes only when the
+schema does, so a process-wide :class:`_Catalogue` per engine remembers which
+tables exist, keyed by the ``alembic_version`` revision it was read at. After
+``schema_catalogue_ttl_seconds`` the revision is read again (one row) and the
+catalogue reloaded only if it moved; a database without ``alembic_version``
+(every ``create_all`` harness) reloads on the TTL instead.
+
+A name the catalogue does not list is re-checked against the live catalogue
+before it is reported absent. Absence is the rare answer — a deployment behind a
+migration — and the one that must not outlive the migration that fixes it, so it
+costs what it always did; if the re-check finds the table, the snapshot was stale
+and is reloaded. ``schema_catalogue.refresh`` counts reloads by reason.
 """
 
 from __future__ import annotations
 
-from typing import Any, Iterable, Tuple
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Tuple
 
 from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
+from src.infrastructure.monitoring.azure_monitor import track_metric
+
+_ALEMBIC_VERSION_TABLE = "alembic_version"
+
+
+@dataclass(frozen=True)
+class _Catalogue:
+    """The tables one database had at one Alembic revision."""
+
+    tables: frozenset[str]
+    #: ``alembic_version`` contents, or ``None`` when the table does not exist.
+    revision: Optional[frozenset[str]]
+    checked_at: float
+
+
+_catalogues: "weakref.WeakKeyDictionary[Engine, _Catalogue]" = weakref.WeakKeyDictionary()
+
+
+def invalidate_schema_catalogue() -> None:
+    """Forget every cached catalogue, e.g. after DDL issued outside a migration."""
+    _catalogues.clear()
+
+
+def _read_revision(sync_conn: Connection, tables: frozenset[str]) -> Optional[frozenset[str]]:
+    if _ALEMBIC_VERSION_TABLE not in tables:
+        return None
+    return frozenset(sync_conn.execute(text(f"SELECT version_num FROM {_ALEMBIC_VERSION_TABLE}")).scalars())
+
+
+def _load(sync_conn: Connection, reason: str) -> _Catalogue:
+    inspector = sa_inspect(sync_conn)
+    tables = frozenset(inspector.get_table_names()) | frozenset(inspector.get_view_names())
+    catalogue = _Catalogue(tables=tables, revision=_read_revision(sync_conn, tables), checked_at=time.monotonic())
+    _catalogues[sync_conn.engine] = catalogue
+    track_metric("schema_catalogue.refresh", 1, {"reason": reason})
+    return catalogue
+
+
+def _current_catalogue(sync_conn: Connection) -> _Catalogue:
+    catalogue = _catalogues.get(sync_conn.engine)
+    if catalogue is None:
+        return _load(sync_conn, "cold")
+    if time.monotonic() - catalogue.checked_at < settings.schema_catalogue_ttl_seconds:
+        return catalogue
+    if catalogue.revision is None:
+        return _load(sync_conn, "ttl")
+    if _read_revision(sync_conn, catalogue.tables) != catalogue.revision:
+        return _load(sync_conn, "revision")
+    renewed = _Catalogue(tables=catalogue.tables, revision=catalogue.revision, checked_at=time.monotonic())
+    _catalogues[sync_conn.engine] = renewed
+    return renewed
+
 
 async def absent_tables(db: AsyncSession, names: Iterable[str]) -> Tuple[str, ...]:
     """Which of ``names`` the connected database does not carry.
 
     Order follows ``names`` so a message listing them reads the same way twice.
-    The inspector is built per call rather than cached: a cached "absent" would
-    outlive the migration that fixes it, and this runs once per request.
+    Present tables are answered from the cached catalogue; a name it does not
+    list is confirmed against the live catalogue first, so a cached "absent"
+    never outlives the migration that fixes it.
     """
     wanted = tuple(names)
     if not wanted:
         return ()
 
     def _absent(sync_conn: Any) -> Tuple[str, ...]:
+        catalogue = _current_catalogue(sync_conn)
+        unlisted = [name for name in wanted if name not in catalogue.tables]
+        if not unlisted:
+            return ()
         inspector = sa_inspect(sync_conn)
-        return tuple(name for name in wanted if not inspector.has_table(name))
+        absent = {name for name in unlisted if not inspector.has_table(name)}
+        if len(absent) < len(unlisted):
+            _load(sync_conn, "stale_absent")
+        return tuple(name for name in wanted if name in absent)
 
     connection = await db.connection()
     return await connection.run_sync(_absent)
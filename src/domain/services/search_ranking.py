@@ -0,0 +1,143 @@
+"""Ranking stage for global search: score normalisation, rank fusion, top-k.
+
+Each module helper in :mod:`src.domain.services.search_service` returns its own
+candidates on the shared 0–100 ``relevance`` scale, and the semantic stage
+returns vector hits ordered by similarity. This module turns those candidate
+lists into one ordering:
+
+* :func:`lexical_order` lazily merges the per-module lists (each sorted by its
+  normalised score) into one lexical ranking, without re-sorting everything;
+* :func:`fuse` applies reciprocal-rank fusion (Cormack et al., 2009) across the
+  lexical and semantic rankings, so a hit both retrievers agree on rises and a
+  semantic-only hit can enter the results with no lexical match at all;
+* :func:`top_k` selects the requested page with a bounded heap.
+
+Everything here is pure and synchronous so it can be tested without a session.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Hashable, Iterable, Iterator, Sequence
+
+#: Rank-fusion damping constant. 60 is the value from the original RRF paper and
+#: the default in most engines; larger values flatten the contribution of rank.
+DEFAULT_RRF_K = 60
+
+LEXICAL_RANKING = "lexical"
+SEMANTIC_RANKING = "semantic"
+
+
+def normalized_relevance(relevance: float | int | None) -> float:
+    """Map a module's 0–100 relevance onto 0–1, clamping out-of-range values."""
+    if relevance is None:
+        return 0.0
+    return min(1.0, max(0.0, float(relevance) / 100.0))
+
+
+def fusion_key(item: Any) -> Hashable:
+    """Identity under which lexical and semantic hits for one entity are merged."""
+    entity_id = getattr(item, "entity_id", None)
+    if entity_id is None:
+        return (getattr(item, "type", None), getattr(item, "id", None))
+    return (getattr(item, "type", None), entity_id)
+
+
+def lexical_order(module_results: Iterable[Sequence[Any]]) -> Iterator[Any]:
+    """Yield lexical candidates from every module, best normalised score first.
+
+    Each module list is sorted once (they are short, bounded by the module query
+    limit) and the lists are then k-way merged lazily. Ties keep module order and,
+    within a module, the order the module returned.
+    """
+    ordered = [
+        sorted(results, key=lambda item: normalized_relevance(item.relevance), reverse=True)
+        for results in module_results
+        if results
+    ]
+    return heapq.merge(*ordered, key=lambda item: normalized_relevance(item.relevance), reverse=True)
+
+
+@dataclass
+class FusedCandidate:
+    """One entity's contributions from each ranking it appeared in."""
+
+    item: Any
+    score: float = 0.0
+    ranks: dict[str, int] = field(default_factory=dict)
+    position: int = 0
+
+
+def fuse(
+    rankings: dict[str, Iterable[Any]],
+    *,
+    k: int = DEFAULT_RRF_K,
+    weights: dict[str, float] | None = None,
+) -> list[FusedCandidate]:
+    """Reciprocal-rank fusion: ``score = Σ weight / (k + rank)`` over rankings.
+
+    ``rankings`` maps a ranking name to its candidates, best first. Candidates
+    sharing a :func:`fusion_key` are merged and keep the item from the first
+    ranking that supplied it, so lexical hits (with highlights and a chunk
+    deep-link) win over the semantic copy of the same entity. Only the first
+    occurrence of a key within a ranking counts, which stops a document with many
+    matching chunks from accumulating fusion score chunk by chunk; the later
+    chunks stay in the results at their own rank.
+    """
+    weights = weights or {}
+    by_key: dict[Hashable, FusedCandidate] = {}
+    extras: list[FusedCandidate] = []
+    position = 0
+    for name, candidates in rankings.items():
+        weight = weights.get(name, 1.0)
+        for rank, item in enumerate(candidates, start=1):
+            contribution = weight / (k + rank)
+            key = fusion_key(item)
+            candidate = by_key.get(key)
+            if candidate is None:
+                by_key[key] = FusedCandidate(item=item, score=contribution, ranks={name: rank}, position=position)
+            elif name not in candidate.ranks:
+                candidate.ranks[name] = rank
+                candidate.score += contribution
+                continue
+            elif name == LEXICAL_RANKING:
+                # Another matching chunk of an entity already ranked: a result of
+                # its own, scored at its own lexical rank only.
+                extras.append(FusedCandidate(item=item, score=contribution, ranks={name: rank}, position=position))
+            else:
+                continue
+            position += 1
+    return list(by_key.values()) + extras
+
+
+def top_k(candidates: Iterable[FusedCandidate], count: int) -> list[FusedCandidate]:
+    """The ``count`` best candidates by fused score, then lexical relevance.
+
+    ``heapq.nsmallest`` keeps only ``count`` candidates in memory; a stable
+    position tie-break keeps the result deterministic.
+    """
+    if count <= 0:
+        return []
+    return heapq.nsmallest(
+        count,
+        candidates,
+        key=lambda candidate: (
+            -candidate.score,
+            -normalized_relevance(getattr(candidate.item, "relevance", None)),
+            candidate.position,
+        ),
+    )
+
+
+__all__ = [
+    "DEFAULT_RRF_K",
+    "FusedCandidate",
+    "LEXICAL_RANKING",
+    "SEMANTIC_RANKING",
+    "fuse",
+    "fusion_key",
+    "lexical_order",
+    "normalized_relevance",
+    "top_k",
+]
@@ -3,9 +3,14 @@
 Extracts multi-entity search logic from the global_search route module.
 """
 
+import asyncio
+import copy
 import logging
-from datetime import datetime, timezone
-from typing import Any, Optional
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from enum import Enum
+from typing import Any, AsyncContextManager, Awaitable, Callable, Iterable, Optional
 
 from sqlalchemy import String, and_, cast, func, or_, select
 from sqlalchemy.exc import SQLAlchemyError
@@ -22,6 +27,7 @@ from src.domain.services.document_library_rbac import (
     user_can_read_library_document,
 )
 from src.domain.services.search_paths import build_search_path
+from src.domain.services.search_ranking import LEXICAL_RANKING, SEMANTIC_RANKING, fuse, lexical_order, top_k
 from src.infrastructure.monitoring.azure_monitor import track_metric
 
 logger = logging.getLogger(__name__)
@@ -29,7 +35,12 @@ logger = logging.getLogger(__name__)
 _SHORT_QUERY_THRESHOLD = 3
 _CONTENT_SNIPPET_MAX_CHARS = 280
 _SNIPPET_SUPPRESSED_SENSITIVITY = frozenset({"confidential", "restricted"})
-_CONTENT_SEARCH_LIMIT = 10
+#: Rows each module returns for the first page; deeper pages ask each module for
+#: enough rows to fill them, up to the cap.
+MODULE_RESULT_LIMIT = 10
+MODULE_RESULT_LIMIT_MAX = 100
+
+SessionFactory = Callable[[], AsyncContextManager[AsyncSession]]
 
 #: Spelled here rather than passed to ``has_permission`` as a literal: the permission
 #: scan in ``src.domain.authz.extraction`` refuses any non-literal argument to that
@@ -121,6 +132,95 @@ class SearchResultItem:
         }
 
 
+class SearchHits(list):
+    """One module's results, plus how many rows matched its query in all.
+
+    ``total`` is a ``COUNT`` of the module's matches under the pushed-down
+    filters when its page came back full, so facets and totals are not capped
+    by the page size; ``None`` means the list itself is the whole answer.
+    """
+
+    def __init__(self, module: str, items: Iterable[SearchResultItem] = (), total: Optional[int] = None):
+        super().__init__(items)
+        self.module = module
+        self.total = total
+
+
+@dataclass(frozen=True)
+class SearchFilters:
+    """The caller's status / date facet choices, as SQL predicates for each module."""
+
+    statuses: frozenset[str] = frozenset()
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    limit: int = MODULE_RESULT_LIMIT
+
+    @classmethod
+    def from_request(
+        cls,
+        *,
+        status_filter: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        page: int = 1,
+        page_size: int = 20,
+    ) -> "SearchFilters":
+        """Parse the route's raw query values; an unparseable date is left to the in-memory filter."""
+        statuses: frozenset[str] = frozenset()
+        if status_filter:
+            statuses = frozenset(_normalize_status(s) for s in status_filter.split(",") if s.strip())
+        return cls(
+            statuses=statuses,
+            date_from=_parse_day(date_from),
+            date_to=_parse_day(date_to),
+            limit=min(MODULE_RESULT_LIMIT_MAX, max(MODULE_RESULT_LIMIT, page * page_size)),
+        )
+
+    def predicates(self, status_column: Any, date_column: Any, *, default_status: str) -> list[Any]:
+        """``WHERE`` clauses matching :meth:`SearchService._result_filter` for one module.
+
+        ``default_status`` is what the module shows for a ``NULL`` status, so a
+        filter on it still finds those rows.
+        """
+        clauses: list[Any] = []
+        if self.statuses and status_column is not None:
+            normalized = func.replace(func.lower(cast(status_column, String)), " ", "_")
+            clause = normalized.in_(sorted(self.statuses))
+            if _normalize_status(default_status) in self.statuses:
+                clause = or_(clause, status_column.is_(None))
+            clauses.append(clause)
+        if date_column is not None:
+            clauses.extend(self.date_predicates(date_column))
+        return clauses
+
+    def date_predicates(self, column: Any, *, timestamps: bool = True) -> list[Any]:
+        """Whole-day bounds on ``column``; ``timestamps=False`` for ``DATE`` columns."""
+
+        def bound(day: date) -> Any:
+            return datetime(day.year, day.month, day.day, tzinfo=timezone.utc) if timestamps else day
+
+        clauses: list[Any] = []
+        if self.date_from is not None:
+            clauses.append(column >= bound(self.date_from))
+        if self.date_to is not None:
+            clauses.append(column < bound(self.date_to + timedelta(days=1)))
+        return clauses
+
+
+def _normalize_status(value: Any) -> str:
+    raw = value.value if isinstance(value, Enum) else value
+    return str(raw).strip().lower().replace(" ", "_")
+
+
+def _parse_day(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
 class SearchService:
     """Unified cross-module search across incidents, RTAs, complaints, and risks."""
 
@@ -141,6 +241,7 @@ class SearchService:
         page_size: int = 20,
         request_id: str | None = None,
         allowed_modules: frozenset[str] | None = None,
+        session_factory: SessionFactory | None = None,
     ) -> dict[str, Any]:
         """Execute a cross-module search.
 
@@ -153,54 +254,110 @@ class SearchService:
         not read cannot reach a response through a later mistake, and the
         embedding and FTS work for it is not paid for either. Distinct from
         ``module``, which is the caller's own facet choice within what they may
-        reach.
+        reach. Choosing a ``module`` likewise skips the other modules' queries.
+
+        Status and date filters are pushed into each module's SQL, and facet
+        counts come from a ``COUNT`` of each module's matches, so a filtered
+        search neither loses rows to the page cap nor reports truncated facets.
+        ``total`` counts only the rows that can be paged through: each module
+        contributes at most ``MODULE_RESULT_LIMIT_MAX``.
+        With a ``session_factory`` (the route passes ``tenant_read_session``) the
+        modules run concurrently, each on its own pooled session under
+        ``search_module_timeout_seconds``; without one they run in turn on
+        ``self.db``. Per-module latency goes to ``search.module_latency_ms``.
+
+        Ranking: module results are merged into one lexical ranking by their
+        0–100 relevance, and — when a vector index is configured and the caller
+        may read library content — fused with semantic hits by reciprocal-rank
+        fusion (:mod:`src.domain.services.search_ranking`). Without semantic hits
+        the order is exactly the lexical one. Only the requested page is
+        serialised.
         """
         track_metric("search.query", 1, {"module": module or "all"})
         track_metric("search.executed", 1)
 
+        module_lower = module.lower() if module else None
+
         def _may_search(module_label: str) -> bool:
-            return allowed_modules is None or module_label in allowed_modules
-
-        all_results: list[SearchResultItem] = []
-
-        if _may_search(INCIDENTS_MODULE):
-            all_results.extend(await self._search_incidents(query, tenant_id, request_id))
-        if _may_search(NEAR_MISSES_MODULE):
-            all_results.extend(await self._search_near_misses(query, tenant_id, request_id))
-        if _may_search(RTAS_MODULE):
-            all_results.extend(await self._search_rtas(query, tenant_id, request_id))
-        if _may_search(COMPLAINTS_MODULE):
-            all_results.extend(await self._search_complaints(query, tenant_id, request_id))
-        if _may_search(RISKS_MODULE):
-            all_results.extend(await self._search_risks(query, tenant_id, request_id))
-        if _may_search(AUDITS_MODULE):
-            all_results.extend(await self._search_audits(query, tenant_id, request_id))
-        if _may_search(ACTIONS_MODULE):
-            all_results.extend(await self._search_actions(query, tenant_id, request_id))
-        if _may_search(DOCUMENTS_MODULE):
-            all_results.extend(await self._search_documents(query, tenant_id, request_id, user=user))
+            if allowed_modules is not None and module_label not in allowed_modules:
+                return False
+            return module_lower is None or module_label.lower() == module_lower
+
+        filters = SearchFilters.from_request(
+            status_filter=status_filter, date_from=date_from, date_to=date_to, page=page, page_size=page_size
+        )
+        module_searches: list[tuple[str, Callable[[SearchService], Awaitable[list[SearchResultItem]]]]] = [
+            (INCIDENTS_MODULE, lambda s: s._search_incidents(query, tenant_id, request_id, filters=filters)),
+            (NEAR_MISSES_MODULE, lambda s: s._search_near_misses(query, tenant_id, request_id, filters=filters)),
+            (RTAS_MODULE, lambda s: s._search_rtas(query, tenant_id, request_id, filters=filters)),
+            (COMPLAINTS_MODULE, lambda s: s._search_complaints(query, tenant_id, request_id, filters=filters)),
+            (RISKS_MODULE, lambda s: s._search_risks(query, tenant_id, request_id, filters=filters)),
+            (AUDITS_MODULE, lambda s: s._search_audits(query, tenant_id, request_id, filters=filters)),
+            (ACTIONS_MODULE, lambda s: s._search_actions(query, tenant_id, request_id, filters=filters)),
+            (
+                DOCUMENTS_MODULE,
+                lambda s: s._search_documents(query, tenant_id, request_id, user=user, filters=filters),
+            ),
+            (
+                DOCUMENT_CONTENT_MODULE,
+                lambda s: s._search_document_content(query, user, request_id, filters=filters),
+            ),
+            (
+                COMPLIANCE_SCHEDULE_MODULE,
+                lambda s: s._search_compliance_requirements(query, tenant_id, request_id, user=user, filters=filters),
+            ),
+        ]
+        runs = [(label, search) for label, search in module_searches if _may_search(label)]
         if _may_search(DOCUMENT_CONTENT_MODULE):
-            all_results.extend(await self._search_document_content(query, user, request_id))
-        if _may_search(COMPLIANCE_SCHEDULE_MODULE):
-            all_results.extend(await self._search_compliance_requirements(query, tenant_id, request_id, user=user))
+            runs.append(("Semantic", lambda s: s._search_semantic_documents(query, user, request_id)))
 
-        if module:
-            all_results = [r for r in all_results if r.module.lower() == module.lower()]
-        if status_filter:
-            statuses = {s.strip().lower().replace(" ", "_") for s in status_filter.split(",") if s.strip()}
-            if statuses:
-                all_results = [r for r in all_results if str(r.status).lower().replace(" ", "_") in statuses]
-        if date_from or date_to:
-            all_results = [r for r in all_results if self._within_date_range(r.date, date_from, date_to)]
-
-        all_results.sort(key=lambda r: r.relevance, reverse=True)
-        total = len(all_results)
-        start = (page - 1) * page_size
-        paged = all_results[start : start + page_size]
+        if session_factory is None or settings.search_module_concurrency <= 1:
+            outcomes = [await self._run_module(label, search, request_id=request_id) for label, search in runs]
+        else:
+            gate = asyncio.Semaphore(settings.search_module_concurrency)
+            outcomes = list(
+                await asyncio.gather(
+                    *(
+                        self._run_module(
+                            label, search, request_id=request_id, session_factory=session_factory, gate=gate
+                        )
+                        for label, search in runs
+                    )
+                )
+            )
+        semantic_results = outcomes.pop() if _may_search(DOCUMENT_CONTENT_MODULE) else []
+        module_results = outcomes
+
+        keep = self._result_filter(module, status_filter, date_from, date_to)
+        kept_by_module = [[r for r in results if keep(r)] for results in module_results]
+        rankings: dict[str, Iterable[SearchResultItem]] = {LEXICAL_RANKING: lexical_order(kept_by_module)}
+        if semantic_results:
+            rankings[SEMANTIC_RANKING] = [r for r in semantic_results if keep(r)]
+        candidates = fuse(
+            rankings,
+            k=settings.search_rrf_k,
+            weights={SEMANTIC_RANKING: settings.search_semantic_weight},
+        )
 
+        # Facets count every match a module's COUNT saw, not just the rows fetched;
+        # semantic-only hits can only add to their module's figure. The total only
+        # counts what can be paged through: a module never fetches more than
+        # MODULE_RESULT_LIMIT_MAX rows, so pages past that would come back empty.
         facet_modules: dict[str, int] = {}
-        for r in all_results:
-            facet_modules[r.module] = facet_modules.get(r.module, 0) + 1
+        for results, kept in zip(module_results, kept_by_module):
+            total = getattr(results, "total", None)
+            if total is not None and kept:
+                facet_modules[results.module] = max(facet_modules.get(results.module, 0), total)
+        pageable_modules = {label: min(count, MODULE_RESULT_LIMIT_MAX) for label, count in facet_modules.items()}
+        fused_modules: dict[str, int] = {}
+        for candidate in candidates:
+            fused_modules[candidate.item.module] = fused_modules.get(candidate.item.module, 0) + 1
+        for module_label, count in fused_modules.items():
+            facet_modules[module_label] = max(facet_modules.get(module_label, 0), count)
+            pageable_modules[module_label] = max(pageable_modules.get(module_label, 0), count)
+        total = sum(pageable_modules.values())
+        start = (page - 1) * page_size
+        paged = [candidate.item for candidate in top_k(candidates, start + page_size)[start:]]
 
         return {
             "results": [r.to_dict() for r in paged],
@@ -209,6 +366,85 @@ class SearchService:
             "facets": {"modules": facet_modules},
         }
 
+    async def _run_module(
+        self,
+        label: str,
+        search: Callable[["SearchService"], Awaitable[list[SearchResultItem]]],
+        *,
+        request_id: str | None,
+        session_factory: SessionFactory | None = None,
+        gate: asyncio.Semaphore | None = None,
+    ) -> list[SearchResultItem]:
+        """One module's search, timed; on its own pooled session when given a factory.
+
+        The timeout applies only on a pooled session: cancelling a statement on
+        the shared request session would leave it unusable for the modules after
+        it, whereas a pooled one is simply discarded. It also covers waiting for
+        the session, so a module that cannot get a connection in time (the
+        factory caps fan-out connections across requests) is left out rather
+        than stalling the search.
+        """
+        outcome = "ok"
+        results: list[SearchResultItem] = []
+        if session_factory is None:
+            started = time.perf_counter()
+            results = await search(self)
+        else:
+            async with gate or asyncio.Semaphore(1):
+                started = time.perf_counter()
+                try:
+                    results = await asyncio.wait_for(
+                        self._search_on_own_session(search, session_factory),
+                        settings.search_module_timeout_seconds,
+                    )
+                except asyncio.TimeoutError:
+                    outcome = "timeout"
+                    logger.warning("Search: %s query timed out [request_id=%s]", label, request_id)
+                except SQLAlchemyError as e:
+                    outcome = "error"
+                    logger.warning("Search: %s session failed [request_id=%s]: %s", label, request_id, type(e).__name__)
+        track_metric(
+            "search.module_latency_ms",
+            (time.perf_counter() - started) * 1000,
+            {"module": label, "outcome": outcome},
+        )
+        return results
+
+    async def _search_on_own_session(
+        self,
+        search: Callable[["SearchService"], Awaitable[list[SearchResultItem]]],
+        session_factory: SessionFactory,
+    ) -> list[SearchResultItem]:
+        async with session_factory() as session:
+            worker = copy.copy(self)
+            worker.db = session
+            return await search(worker)
+
+    @classmethod
+    def _result_filter(
+        cls,
+        module: Optional[str],
+        status_filter: Optional[str],
+        date_from: Optional[str],
+        date_to: Optional[str],
+    ) -> Callable[[SearchResultItem], bool]:
+        """The caller's module/status/date facet choices as one predicate."""
+        module_lower = module.lower() if module else None
+        statuses: set[str] = set()
+        if status_filter:
+            statuses = {_normalize_status(s) for s in status_filter.split(",") if s.strip()}
+
+        def keep(result: SearchResultItem) -> bool:
+            if module_lower and result.module.lower() != module_lower:
+                return False
+            if statuses and _normalize_status(result.status) not in statuses:
+                return False
+            if (date_from or date_to) and not cls._within_date_range(result.date, date_from, date_to):
+                return False
+            return True
+
+        return keep
+
     # ------------------------------------------------------------------
     # Full-text search helpers
     # ------------------------------------------------------------------
@@ -344,14 +580,22 @@ class SearchService:
 
         return or_(*clauses)
 
+    async def _matching_total(self, source: Any, conditions: list[Any], *, fetched: int, kept: int, limit: int) -> int:
+        """How many rows match ``conditions``: ``kept`` unless the page came back full, else a ``COUNT``."""
+        if fetched < limit:
+            return kept
+        result = await self.db.execute(select(func.count()).select_from(source).where(*conditions))
+        return int(result.scalar_one())
+
     # ------------------------------------------------------------------
     # Per-entity search helpers
     # ------------------------------------------------------------------
 
     async def _search_incidents(
-        self, query: str, tenant_id: int | None, request_id: str | None
-    ) -> list[SearchResultItem]:
-        results: list[SearchResultItem] = []
+        self, query: str, tenant_id: int | None, request_id: str | None, *, filters: SearchFilters | None = None
+    ) -> SearchHits:
+        filters = filters or SearchFilters()
+        results = SearchHits(INCIDENTS_MODULE)
         try:
             from src.domain.models.incident import Incident
 
@@ -368,16 +612,16 @@ class SearchService:
                 filter_clause = Incident.search_vector.op("@@")(tsquery)
                 score = rank
 
-            stmt = (
-                select(Incident, score.label("score"))
-                .where(Incident.tenant_id == tenant_id)
-                .where(Incident.deleted_at.is_(None))
-                .where(filter_clause)
-                .order_by(score.desc())
-                .limit(10)
-            )
+            conditions = [
+                Incident.tenant_id == tenant_id,
+                Incident.deleted_at.is_(None),
+                filter_clause,
+                *filters.predicates(Incident.status, Incident.incident_date, default_status="Open"),
+            ]
+            stmt = select(Incident, score.label("score")).where(*conditions).order_by(score.desc()).limit(filters.limit)
             db_result = await self.db.execute(stmt)
-            for inc, sc in db_result.all():
+            rows = db_result.all()
+            for inc, sc in rows:
                 relevance = min(100.0, 60 + float(sc) * 40)
                 words = query.lower().split()
                 title_lower = (inc.title or "").lower()
@@ -396,6 +640,9 @@ class SearchService:
                         entity_id=inc.id,
                     )
                 )
+            results.total = await self._matching_total(
+                Incident, conditions, fetched=len(rows), kept=len(results), limit=filters.limit
+            )
         except (AttributeError, SQLAlchemyError, ValueError) as e:
             logger.warning(
                 "Search: incident query failed [request_id=%s]: %s",
@@ -406,9 +653,10 @@ class SearchService:
         return results
 
     async def _search_near_misses(
-        self, query: str, tenant_id: int | None, request_id: str | None
-    ) -> list[SearchResultItem]:
-        results: list[SearchResultItem] = []
+        self, query: str, tenant_id: int | None, request_id: str | None, *, filters: SearchFilters | None = None
+    ) -> SearchHits:
+        filters = filters or SearchFilters()
+        results = SearchHits(NEAR_MISSES_MODULE)
         try:
             from src.domain.models.near_miss import NearMiss
 
@@ -434,15 +682,15 @@ class SearchService:
                 filter_clause = inline_vector.op("@@")(tsquery)
                 score = rank
 
-            stmt = (
-                select(NearMiss, score.label("score"))
-                .where(NearMiss.tenant_id == tenant_id)
-                .where(filter_clause)
-                .order_by(score.desc())
-                .limit(10)
-            )
+            conditions = [
+                NearMiss.tenant_id == tenant_id,
+                filter_clause,
+                *filters.predicates(NearMiss.status, NearMiss.event_date, default_status="Open"),
+            ]
+            stmt = select(NearMiss, score.label("score")).where(*conditions).order_by(score.desc()).limit(filters.limit)
             db_result = await self.db.execute(stmt)
-            for nm, sc in db_result.all():
+            rows = db_result.all()
+            for nm, sc in rows:
                 relevance = min(100.0, 60 + float(sc) * 40)
                 desc = (nm.description or "")[:200]
                 results.append(
@@ -459,6 +707,9 @@ class SearchService:
                         entity_id=nm.id,
                     )
                 )
+            results.total = await self._matching_total(
+                NearMiss, conditions, fetched=len(rows), kept=len(results), limit=filters.limit
+            )
         except (AttributeError, SQLAlchemyError, ValueError) as e:
             logger.warning(
                 "Search: near miss query failed [request_id=%s]: %s",
@@ -468,8 +719,11 @@ class SearchService:
             )
         return results
 
-    async def _search_rtas(self, query: str, tenant_id: int | None, request_id: str | None) -> list[SearchResultItem]:
-        results: list[SearchResultItem] = []
+    async def _search_rtas(
+        self, query: str, tenant_id: int | None, request_id: str | None, *, filters: SearchFilters | None = None
+    ) -> SearchHits:
+        filters = filters or SearchFilters()
+        results = SearchHits(RTAS_MODULE)
         try:
             from src.domain.models.rta import RTA
 
@@ -490,15 +744,15 @@ class SearchService:
                 filter_clause = inline_vector.op("@@")(tsquery)
                 score = rank
 
-            stmt = (
-                select(RTA, score.label("score"))
-                .where(RTA.tenant_id == tenant_id)
-                .where(filter_clause)
-                .order_by(score.desc())
-                .limit(10)
-            )
+            conditions = [
+                RTA.tenant_id == tenant_id,
+                filter_clause,
+                *filters.predicates(RTA.status, RTA.collision_date, default_status="Open"),
+            ]
+            stmt = select(RTA, score.label("score")).where(*conditions).order_by(score.desc()).limit(filters.limit)
             db_result = await self.db.execute(stmt)
-            for rta, sc in db_result.all():
+            rows = db_result.all()
+            for rta, sc in rows:
                 relevance = min(100.0, 60 + float(sc) * 40)
                 results.append(
                     SearchResultItem(
@@ -514,6 +768,9 @@ class SearchService:
                         entity_id=rta.id,
                     )
                 )
+            results.total = await self._matching_total(
+                RTA, conditions, fetched=len(rows), kept=len(results), limit=filters.limit
+            )
         except (AttributeError, SQLAlchemyError, ValueError) as e:
             logger.warning(
                 "Search: RTA query failed [request_id=%s]: %s",
@@ -524,9 +781,10 @@ class SearchService:
         return results
 
     async def _search_complaints(
-        self, query: str, tenant_id: int | None, request_id: str | None
-    ) -> list[SearchResultItem]:
-        results: list[SearchResultItem] = []
+        self, query: str, tenant_id: int | None, request_id: str | None, *, filters: SearchFilters | None = None
+    ) -> SearchHits:
+        filters = filters or SearchFilters()
+        results = SearchHits(COMPLAINTS_MODULE)
         try:
             from src.domain.models.complaint import Complaint
 
@@ -543,16 +801,18 @@ class SearchService:
                 filter_clause = Complaint.search_vector.op("@@")(tsquery)
                 score = rank
 
+            conditions = [
+                Complaint.tenant_id == tenant_id,
+                Complaint.deleted_at.is_(None),
+                filter_clause,
+                *filters.predicates(Complaint.status, Complaint.created_at, default_status="Open"),
+            ]
             stmt = (
-                select(Complaint, score.label("score"))
-                .where(Complaint.tenant_id == tenant_id)
-                .where(Complaint.deleted_at.is_(None))
-                .where(filter_clause)
-                .order_by(score.desc())
-                .limit(10)
+                select(Complaint, score.label("score")).where(*conditions).order_by(score.desc()).limit(filters.limit)
             )
             db_result = await self.db.execute(stmt)
-            for cmp, sc in db_result.all():
+            rows = db_result.all()
+            for cmp, sc in rows:
                 relevance = min(100.0, 60 + float(sc) * 40)
                 words = query.lower().split()
                 title_lower = (cmp.title or "").lower()
@@ -571,6 +831,9 @@ class SearchService:
                         highlights=[w for w in words if w in title_lower or w in desc_lower],
                     )
                 )
+            results.total = await self._matching_total(
+                Complaint, conditions, fetched=len(rows), kept=len(results), limit=filters.limit
+            )
         except (AttributeError, SQLAlchemyError, ValueError) as e:
             logger.warning(
                 "Search: complaint query failed [request_id=%s]: %s",
@@ -580,8 +843,11 @@ class SearchService:
             )
         return results
 
-    async def _search_risks(self, query: str, tenant_id: int | None, request_id: str | None) -> list[SearchResultItem]:
-        results: list[SearchResultItem] = []
+    async def _search_risks(
+        self, query: str, tenant_id: int | None, request_id: str | None, *, filters: SearchFilters | None = None
+    ) -> SearchHits:
+        filters = filters or SearchFilters()
+        results = SearchHits(RISKS_MODULE)
         try:
             from src.domain.models.risk import Risk
 
@@ -598,15 +864,15 @@ class SearchService:
                 filter_clause = Risk.search_vector.op("@@")(tsquery)
                 score = rank
 
-            stmt = (
-                select(Risk, score.label("score"))
-                .where(Risk.tenant_id == tenant_id)
-                .where(filter_clause)
-                .order_by(score.desc())
-                .limit(10)
-            )
+            conditions = [
+                Risk.tenant_id == tenant_id,
+                filter_clause,
+                *filters.predicates(Risk.status, Risk.created_at, default_status="Open"),
+            ]
+            stmt = select(Risk, score.label("score")).where(*conditions).order_by(score.desc()).limit(filters.limit)
             db_result = await self.db.execute(stmt)
-            for risk, sc in db_result.all():
+            rows = db_result.all()
+            for risk, sc in rows:
                 relevance = min(100.0, 60 + float(sc) * 40)
                 words = query.lower().split()
                 title_lower = (risk.title or "").lower()
@@ -625,6 +891,9 @@ class SearchService:
                         entity_id=risk.id,
                     )
                 )
+            results.total = await self._matching_total(
+                Risk, conditions, fetched=len(rows), kept=len(results), limit=filters.limit
+            )
         except (AttributeError, SQLAlchemyError, ValueError) as e:
             logger.warning(
                 "Search: risk query failed [request_id=%s]: %s",
@@ -634,21 +903,24 @@ class SearchService:
             )
         return results
 
-    async def _search_audits(self, query: str, tenant_id: int | None, request_id: str | None) -> list[SearchResultItem]:
-        results: list[SearchResultItem] = []
+    async def _search_audits(
+        self, query: str, tenant_id: int | None, request_id: str | None, *, filters: SearchFilters | None = None
+    ) -> SearchHits:
+        filters = filters or SearchFilters()
+        results = SearchHits(AUDITS_MODULE)
         try:
             from src.domain.models.audit import AuditFinding
 
             search_filter = f"%{query}%"
-            stmt = (
-                select(AuditFinding)
-                .where(AuditFinding.tenant_id == tenant_id)
-                .where(or_(AuditFinding.title.ilike(search_filter), AuditFinding.description.ilike(search_filter)))
-                .order_by(AuditFinding.created_at.desc())
-                .limit(10)
-            )
+            conditions = [
+                AuditFinding.tenant_id == tenant_id,
+                or_(AuditFinding.title.ilike(search_filter), AuditFinding.description.ilike(search_filter)),
+                *filters.predicates(AuditFinding.status, AuditFinding.created_at, default_status="Open"),
+            ]
+            stmt = select(AuditFinding).where(*conditions).order_by(AuditFinding.created_at.desc()).limit(filters.limit)
             db_result = await self.db.execute(stmt)
-            for finding in db_result.scalars().all():
+            findings = db_result.scalars().all()
+            for finding in findings:
                 results.append(
                     SearchResultItem(
                         id=finding.reference_number or f"AUD-{finding.id}",
@@ -666,6 +938,9 @@ class SearchService:
                         path=build_search_path("audit", finding.id, audit_run_id=finding.run_id),
                     )
                 )
+            results.total = await self._matching_total(
+                AuditFinding, conditions, fetched=len(findings), kept=len(results), limit=filters.limit
+            )
         except (AttributeError, SQLAlchemyError, ValueError) as e:
             logger.warning(
                 "Search: audit query failed [request_id=%s]: %s",
@@ -676,10 +951,13 @@ class SearchService:
         return results
 
     async def _search_actions(
-        self, query: str, tenant_id: int | None, request_id: str | None
-    ) -> list[SearchResultItem]:
-        results: list[SearchResultItem] = []
+        self, query: str, tenant_id: int | None, request_id: str | None, *, filters: SearchFilters | None = None
+    ) -> SearchHits:
+        filters = filters or SearchFilters()
+        results = SearchHits(ACTIONS_MODULE, total=0)
         search_filter = f"%{query}%"
+        # Five action registers share the module's page.
+        per_source = max(1, filters.limit // 2)
 
         try:
             from src.domain.models.capa import CAPAAction
@@ -723,15 +1001,15 @@ class SearchService:
             ]
 
             for model, storage_kind, id_builder, date_builder in action_sources:
-                stmt = (
-                    select(model)
-                    .where(model.tenant_id == tenant_id)
-                    .where(or_(model.title.ilike(search_filter), model.description.ilike(search_filter)))
-                    .order_by(model.created_at.desc())
-                    .limit(5)
-                )
+                conditions = [
+                    model.tenant_id == tenant_id,
+                    or_(model.title.ilike(search_filter), model.description.ilike(search_filter)),
+                    *filters.predicates(model.status, model.created_at, default_status="Open"),
+                ]
+                stmt = select(model).where(*conditions).order_by(model.created_at.desc()).limit(per_source)
                 db_result = await self.db.execute(stmt)
-                for action in db_result.scalars().all():
+                actions = db_result.scalars().all()
+                for action in actions:
                     results.append(
                         SearchResultItem(
                             id=id_builder(action),
@@ -753,6 +1031,9 @@ class SearchService:
                             ),
                         )
                     )
+                results.total += await self._matching_total(
+                    model, conditions, fetched=len(actions), kept=len(actions), limit=per_source
+                )
         except (AttributeError, SQLAlchemyError, ValueError) as e:
             logger.warning(
                 "Search: action query failed [request_id=%s]: %s",
@@ -769,8 +1050,10 @@ class SearchService:
         request_id: str | None,
         *,
         user: Any | None = None,
-    ) -> list[SearchResultItem]:
-        results: list[SearchResultItem] = []
+        filters: SearchFilters | None = None,
+    ) -> SearchHits:
+        filters = filters or SearchFilters()
+        results = SearchHits(DOCUMENTS_MODULE)
         if user is None or tenant_id is None:
             return results
         try:
@@ -778,19 +1061,16 @@ class SearchService:
             from src.domain.models.document_library import DocumentCategory
 
             search_filter = f"%{query}%"
-            stmt = (
-                select(Document)
-                .where(Document.tenant_id == tenant_id)
-                .where(
-                    or_(
-                        Document.title.ilike(search_filter),
-                        Document.description.ilike(search_filter),
-                        Document.ai_summary.ilike(search_filter),
-                    )
-                )
-                .order_by(Document.created_at.desc())
-                .limit(10)
-            )
+            conditions = [
+                Document.tenant_id == tenant_id,
+                or_(
+                    Document.title.ilike(search_filter),
+                    Document.description.ilike(search_filter),
+                    Document.ai_summary.ilike(search_filter),
+                ),
+                *filters.predicates(Document.status, Document.created_at, default_status="Available"),
+            ]
+            stmt = select(Document).where(*conditions).order_by(Document.created_at.desc()).limit(filters.limit)
             db_result = await self.db.execute(stmt)
             documents = list(db_result.scalars().all())
 
@@ -840,6 +1120,14 @@ class SearchService:
                         entity_id=document.id,
                     )
                 )
+            # Counted under the SQL mirror of the library ACL the loop above applies per row.
+            results.total = await self._matching_total(
+                Document.__table__.outerjoin(DocumentCategory.__table__, Document.category_id == DocumentCategory.id),
+                [*conditions, self._library_acl_sql_predicate(user, Document, DocumentCategory)],
+                fetched=len(documents),
+                kept=len(results),
+                limit=filters.limit,
+            )
         except (AttributeError, SQLAlchemyError, ValueError) as e:
             logger.warning(
                 "Search: document query failed [request_id=%s]: %s",
@@ -854,9 +1142,12 @@ class SearchService:
         query: str,
         user: Any | None,
         request_id: str | None,
-    ) -> list[SearchResultItem]:
+        *,
+        filters: SearchFilters | None = None,
+    ) -> SearchHits:
         """FTS over document_chunks with fail-closed library RBAC."""
-        results: list[SearchResultItem] = []
+        filters = filters or SearchFilters()
+        results = SearchHits(DOCUMENT_CONTENT_MODULE)
         if user is None:
             return results
         if not self._user_has(user, PERM_DOCUMENT_READ):
@@ -880,6 +1171,17 @@ class SearchService:
                 "MaxWords=35, MinWords=12, MaxFragments=1",
             ).label("snippet")
 
+            conditions = [
+                DocumentChunk.tenant_id == tenant_id,
+                Document.tenant_id == tenant_id,
+                Document.is_active.is_(True),
+                DocumentChunk.search_vector.op("@@")(tsquery),
+                self._library_acl_sql_predicate(user, Document, DocumentCategory),
+                *filters.predicates(Document.status, Document.created_at, default_status="Available"),
+            ]
+            source = DocumentChunk.__table__.join(
+                Document.__table__, DocumentChunk.document_id == Document.id
+            ).outerjoin(DocumentCategory.__table__, Document.category_id == DocumentCategory.id)
             stmt = (
                 select(
                     DocumentChunk,
@@ -888,15 +1190,10 @@ class SearchService:
                     headline,
                     rank.label("score"),
                 )
-                .join(Document, DocumentChunk.document_id == Document.id)
-                .outerjoin(DocumentCategory, Document.category_id == DocumentCategory.id)
-                .where(DocumentChunk.tenant_id == tenant_id)
-                .where(Document.tenant_id == tenant_id)
-                .where(Document.is_active.is_(True))
-                .where(DocumentChunk.search_vector.op("@@")(tsquery))
-                .where(self._library_acl_sql_predicate(user, Document, DocumentCategory))
+                .select_from(source)
+                .where(*conditions)
                 .order_by(rank.desc())
-                .limit(_CONTENT_SEARCH_LIMIT)
+                .limit(filters.limit)
             )
 
             db_result = await self.db.execute(stmt)
@@ -945,6 +1242,9 @@ class SearchService:
                         ),
                     )
                 )
+            results.total = await self._matching_total(
+                source, conditions, fetched=len(rows), kept=len(results), limit=filters.limit
+            )
         except (AttributeError, SQLAlchemyError, ValueError, TypeError) as e:
             logger.warning(
                 "Search: document content query failed [request_id=%s]: %s",
@@ -954,6 +1254,102 @@ class SearchService:
             )
         return results
 
+    async def _search_semantic_documents(
+        self,
+        query: str,
+        user: Any | None,
+        request_id: str | None,
+    ) -> list[SearchResultItem]:
+        """Vector hits over library chunks, one per document, best first.
+
+        Same gates as :meth:`_search_document_content` — ``document:read``, the
+        caller's own tenant in both the Pinecone filter and the SQL lookup, the
+        SQL ACL prefilter and the per-row library check — because these hits
+        surface in the same module. Empty when no vector index is configured.
+        """
+        results: list[SearchResultItem] = []
+        if not settings.search_semantic_enabled or user is None:
+            return results
+        if not self._user_has(user, PERM_DOCUMENT_READ):
+            return results
+        tenant_id = getattr(user, "tenant_id", None)
+        if tenant_id is None:
+            return results
+
+        try:
+            from src.domain.models.document import Document
+            from src.domain.models.document_library import DocumentCategory
+            from src.domain.services.document_ai_service import VectorSearchService
+
+            vector_service = VectorSearchService()
+            if not vector_service.api_key:
+                return results
+            matches = await vector_service.search(
+                query,
+                top_k=settings.search_semantic_top_k,
+                filter_dict={"tenant_id": {"$eq": tenant_id}},
+            )
+
+            best_by_document: dict[int, dict[str, Any]] = {}
+            for match in matches:
+                metadata = match.get("metadata") or {}
+                try:
+                    document_id = int(metadata.get("document_id"))
+                except (TypeError, ValueError):
+                    continue
+                best_by_document.setdefault(document_id, match)
+            if not best_by_document:
+                return results
+
+            rows = await self.db.execute(
+                select(Document, DocumentCategory.taxonomy_id)
+                .outerjoin(DocumentCategory, Document.category_id == DocumentCategory.id)
+                .where(Document.id.in_(list(best_by_document)))
+                .where(Document.tenant_id == tenant_id)
+                .where(Document.is_active.is_(True))
+                .where(self._library_acl_sql_predicate(user, Document, DocumentCategory))
+            )
+            documents = {document.id: (document, taxonomy_id) for document, taxonomy_id in rows.all()}
+
+            for document_id, match in best_by_document.items():
+                if document_id not in documents:
+                    continue
+                document, taxonomy_id = documents[document_id]
+                if not user_can_read_library_document(document, user, taxonomy_id=taxonomy_id):
+                    track_metric("search.document_content.acl_drop", 1)
+                    continue
+                metadata = match.get("metadata") or {}
+                preview = str(metadata.get("content_preview") or "")[:_CONTENT_SNIPPET_MAX_CHARS]
+                suppress = self._snippet_suppressed_for(document)
+                page_number = metadata.get("page_number") or None
+                results.append(
+                    SearchResultItem(
+                        id=document.reference_number or f"DOC-{document.id}",
+                        type="document_content",
+                        title=document.title or "Untitled Document",
+                        description="" if suppress else preview,
+                        module=DOCUMENT_CONTENT_MODULE,
+                        status=str(
+                            document.status.value
+                            if hasattr(document.status, "value")
+                            else document.status or "Available"
+                        ),
+                        date=str(document.created_at or ""),
+                        relevance=min(100.0, 60 + float(match.get("score") or 0) * 40),
+                        highlights=["snippet_suppressed"] if suppress else self._highlight_words(query, preview),
+                        entity_id=document.id,
+                        path=build_search_path("document_content", document.id, page_number=page_number),
+                    )
+                )
+        except (AttributeError, SQLAlchemyError, ValueError, TypeError) as e:
+            logger.warning(
+                "Search: semantic document query failed [request_id=%s]: %s",
+                request_id,
+                type(e).__name__,
+                exc_info=True,
+            )
+        return results
+
     @staticmethod
     def _compliance_schedule_is_available() -> bool:
         """Whether Compliance Schedule may appear in search at all.
@@ -976,14 +1372,19 @@ class SearchService:
         request_id: str | None,
         *,
         user: Any | None = None,
-    ) -> list[SearchResultItem]:
+        filters: SearchFilters | None = None,
+    ) -> SearchHits:
         """Compliance obligations, gated on ``compliance_schedule:read``.
 
         Deliberately unlike its tenant-only neighbours: a caller without the module's
         read permission gets nothing, so search cannot become a way to enumerate
         obligations the register itself would refuse to show.
+
+        Status here is derived from ``next_due_date`` rather than stored, so a
+        status filter stays in memory and the module reports no ``COUNT`` for it.
         """
-        results: list[SearchResultItem] = []
+        filters = filters or SearchFilters()
+        results = SearchHits(COMPLIANCE_SCHEDULE_MODULE)
         if user is None or tenant_id is None:
             return results
         # Fail closed on a caller whose own tenancy disagrees with the scope asked for.
@@ -998,24 +1399,27 @@ class SearchService:
             from src.domain.models.compliance_schedule import ComplianceRequirement
 
             search_filter = f"%{query}%"
+            conditions = [
+                ComplianceRequirement.tenant_id == tenant_id,
+                ComplianceRequirement.deleted_at.is_(None),
+                ComplianceRequirement.is_active.is_(True),
+                or_(
+                    ComplianceRequirement.title.ilike(search_filter),
+                    ComplianceRequirement.description.ilike(search_filter),
+                    ComplianceRequirement.reference_number.ilike(search_filter),
+                ),
+                *filters.date_predicates(ComplianceRequirement.next_due_date, timestamps=False),
+            ]
             stmt = (
                 select(ComplianceRequirement)
-                .where(ComplianceRequirement.tenant_id == tenant_id)
-                .where(ComplianceRequirement.deleted_at.is_(None))
-                .where(ComplianceRequirement.is_active.is_(True))
-                .where(
-                    or_(
-                        ComplianceRequirement.title.ilike(search_filter),
-                        ComplianceRequirement.description.ilike(search_filter),
-                        ComplianceRequirement.reference_number.ilike(search_filter),
-                    )
-                )
+                .where(*conditions)
                 .order_by(ComplianceRequirement.next_due_date.asc())
-                .limit(10)
+                .limit(filters.limit)
             )
             db_result = await self.db.execute(stmt)
             now = datetime.now(timezone.utc)
-            for requirement in db_result.scalars().all():
+            requirements = db_result.scalars().all()
+            for requirement in requirements:
                 results.append(
                     SearchResultItem(
                         id=requirement.reference_number or f"CSR-{requirement.id}",
@@ -1030,6 +1434,14 @@ class SearchService:
                         entity_id=requirement.id,
                     )
                 )
+            if not filters.statuses:
+                results.total = await self._matching_total(
+                    ComplianceRequirement,
+                    conditions,
+                    fetched=len(requirements),
+                    kept=len(results),
+                    limit=filters.limit,
+                )
         except (AttributeError, SQLAlchemyError, ValueError, TypeError) as e:
             logger.warning(
                 "Search: compliance requirement query failed [request_id=%s]: %s",
@@ -1,4 +1,12 @@
-"""Token revocation and management service."""
+"""Token revocation and management service.
+
+``token_blacklist`` is the durable record of revocations and answers every
+check by default. Request authentication passes ``prefilter=True`` so that,
+when Redis is configured, :mod:`src.infrastructure.security.token_revocation`
+can answer it without touching the table. Refresh, logout and password-reset
+paths keep the table as the final word: a revocation another worker has not
+heard of yet must still stop a replayed refresh token.
+"""
 
 from datetime import datetime, timezone
 
@@ -6,6 +14,7 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.models.token_blacklist import TokenBlacklist
+from src.infrastructure.security.token_revocation import get_token_revocation_store
 
 
 class TokenService:
@@ -28,9 +37,17 @@ class TokenService:
         )
         db.add(entry)
         await db.commit()
+        store = get_token_revocation_store()
+        if store is not None:
+            await store.revoke(jti, expires_at)
 
     @staticmethod
-    async def is_revoked(db: AsyncSession, jti: str) -> bool:
+    async def is_revoked(db: AsyncSession, jti: str, *, prefilter: bool = False) -> bool:
+        store = get_token_revocation_store() if prefilter else None
+        if store is not None:
+            revoked = await store.check(jti)
+            if revoked is not None:
+                return revoked
         result = await db.execute(select(TokenBlacklist.id).where(TokenBlacklist.jti == jti))
         return result.scalar_one_or_none() is not None
 
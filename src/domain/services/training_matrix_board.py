@@ -4,10 +4,19 @@ These functions take already-computed compliance rows (see
 ``training_matrix_compliance.evaluate_compliance``) and classify/summarise them for the
 board UI. Nothing here talks to the database — the route layer loads rows once and this
 module reshapes them.
+
+``BoardSnapshot`` is the board in columnar form: one scan over the rows keeps
+only what the rollups need, and ``summary(today)`` answers every hero figure
+from it with binary searches over sorted due dates. A snapshot built once per
+import can therefore be reused day after day — see
+``training_matrix_board_cache`` — because nothing in it depends on the day it
+was built.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Any, Mapping, Optional, Sequence
 
@@ -245,23 +254,166 @@ def top_overdue_courses(
     return [{"course_display_name": name, "count": count} for name, count in ranked[:limit]]
 
 
+# Statuses ``evaluate_compliance`` derives from the due date and the day it runs.
+_DATED_STATUSES = ("overdue", "due_soon", "compliant")
+# Sorts after every real due date: a person with no dated rows is never "not yet due".
+_NO_DUE = date.max.toordinal() + 1
+
+
+def _pct(ok: int, total: int) -> int:
+    return round(100 * ok / total) if total else 0
+
+
+@dataclass
+class _Scope:
+    """One hero scope (Overall or a board role) of a snapshot."""
+
+    rows: int = 0
+    fixed_ok: int = 0
+    dated_dues: list[int] = field(default_factory=list)
+    people: int = 0
+    people_fixed_ok_dues: list[int] = field(default_factory=list)
+
+
+@dataclass
+class BoardSnapshot:
+    """The board's rows reduced to counts and sorted due-date ordinals.
+
+    Built by one pass over compliance rows. Row OK-ness comes from ``status``,
+    except that with ``redate=True`` a row whose status ``evaluate_compliance``
+    derived from its due date (overdue / due_soon / compliant) is re-derived for
+    the day asked: OK exactly when ``qgp_due_on >= today``. That is what lets a
+    snapshot of yesterday's rows answer for today. Horizons only ever depend on
+    the due date, as in ``horizon_for_row``.
+    """
+
+    scopes: dict[Optional[str], _Scope]
+    dues: list[int]
+    undated: int
+    course_dues: dict[str, list[int]]
+    required_row_count: int
+    person_count: int
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Mapping[str, Any]], *, redate: bool = False) -> "BoardSnapshot":
+        scopes: dict[Optional[str], _Scope] = {None: _Scope(), **{role: _Scope() for role in BOARD_ROLES}}
+        roles: dict[tuple[Any, Any], Optional[str]] = {}
+        # atlas_name -> [role of first row, every fixed row OK, earliest re-dated due]
+        people: dict[str, list[Any]] = {}
+        dues: list[int] = []
+        course_dues: dict[str, list[int]] = {}
+        undated = 0
+
+        for row in rows:
+            role_key = (row.get("department"), row.get("board_role_override"))
+            role = roles.get(role_key)
+            if role is None and role_key not in roles:
+                role = roles[role_key] = resolve_board_role(*role_key)
+            status = (row.get("status") or "").strip().lower()
+            due_on = row.get("qgp_due_on")
+            due = due_on.toordinal() if due_on is not None else None
+            dated = redate and due is not None and status in _DATED_STATUSES
+            ok = status in _OK_STATUSES
+
+            for scope in (scopes[None], scopes[role]) if role else (scopes[None],):
+                scope.rows += 1
+                if dated and due is not None:
+                    scope.dated_dues.append(due)
+                elif ok:
+                    scope.fixed_ok += 1
+
+            if due is None:
+                undated += 1
+            else:
+                dues.append(due)
+                course_dues.setdefault(_course_label(row), []).append(due)
+
+            name = row.get("atlas_name")
+            if name:
+                person = people.get(str(name))
+                if person is None:
+                    person = people[str(name)] = [role, True, _NO_DUE]
+                if dated:
+                    person[2] = min(person[2], due)
+                elif not ok:
+                    person[1] = False
+
+        for role, fixed_ok, earliest in people.values():
+            for scope in (scopes[None], scopes[role]) if role else (scopes[None],):
+                scope.people += 1
+                if fixed_ok:
+                    scope.people_fixed_ok_dues.append(earliest)
+        for scope in scopes.values():
+            scope.dated_dues.sort()
+            scope.people_fixed_ok_dues.sort()
+        dues.sort()
+        for course in course_dues.values():
+            course.sort()
+        return cls(scopes, dues, undated, course_dues, len(rows), len(people))
+
+    def _scope_stats(self, today: int, metric: str) -> list[dict[str, Any]]:
+        out: list[dict[str, Any]] = []
+        for role in (None, *BOARD_ROLES):
+            scope = self.scopes[role]
+            if metric == "module_ok":
+                ok = scope.fixed_ok + len(scope.dated_dues) - bisect_left(scope.dated_dues, today)
+                total = scope.rows
+            else:
+                ok = len(scope.people_fixed_ok_dues) - bisect_left(scope.people_fixed_ok_dues, today)
+                total = scope.people
+            out.append({"role": role or "Overall", "ok": ok, "total": total, "pct": _pct(ok, total), "metric": metric})
+        return out
+
+    def horizon_counts(self, today: date) -> dict[str, int]:
+        """Same counts as ``compute_horizon_counts``."""
+        day = today.toordinal()
+        dues = self.dues
+
+        def upto(offset: int) -> int:
+            return bisect_right(dues, day + offset)
+
+        overdue = bisect_left(dues, day)
+        return {
+            "overdue": overdue,
+            "d30": upto(30) - overdue,
+            "d60": upto(60) - upto(30),
+            "d90": upto(90) - overdue,
+            "d180": upto(180) - upto(60),
+            "ok": self.undated + len(dues) - upto(180),
+        }
+
+    def top_overdue_courses(self, today: date, *, limit: int = 5) -> list[dict[str, Any]]:
+        day = today.toordinal()
+        counts = [(label, bisect_left(course, day)) for label, course in self.course_dues.items()]
+        ranked = sorted((item for item in counts if item[1]), key=lambda kv: (-kv[1], kv[0]))
+        return [{"course_display_name": name, "count": count} for name, count in ranked[:limit]]
+
+    def summary(self, today: Optional[date] = None) -> dict[str, Any]:
+        """The ``build_board_summary`` payload for ``today``."""
+        today = today or date.today()
+        day = today.toordinal()
+        return {
+            "module_ok": self._scope_stats(day, "module_ok"),
+            "people_fully_ok": self._scope_stats(day, "people_fully_ok"),
+            "horizons": self.horizon_counts(today),
+            "top_overdue_courses": self.top_overdue_courses(today),
+            "required_row_count": self.required_row_count,
+            "person_count": self.person_count,
+        }
+
+
 def build_board_summary(
     rows: Sequence[Mapping[str, Any]],
     *,
     today: Optional[date] = None,
 ) -> dict[str, Any]:
-    """SSOT payload for GET /training-matrix/summary (hero + analytics)."""
-    today = today or date.today()
-    module_stats = compute_module_role_stats(rows)
-    people_stats = compute_people_fully_ok_stats(rows)
-    return {
-        "module_ok": module_stats,
-        "people_fully_ok": people_stats,
-        "horizons": compute_horizon_counts(rows, today=today),
-        "top_overdue_courses": top_overdue_courses(rows, today=today),
-        "required_row_count": len(rows),
-        "person_count": len({str(r.get("atlas_name")) for r in rows if r.get("atlas_name")}),
-    }
+    """SSOT payload for GET /training-matrix/summary (hero + analytics).
+
+    One pass over ``rows``; equal to composing ``compute_module_role_stats``,
+    ``compute_people_fully_ok_stats``, ``compute_horizon_counts`` and
+    ``top_overdue_courses``, which each walk the rows again.
+    """
+    return BoardSnapshot.from_rows(rows).summary(today)
 
 
 def build_status_briefings(
@@ -0,0 +1,106 @@
+"""Per-import cache of the Training Matrix board snapshot.
+
+Building the board means evaluating every person x required course of the
+latest import, which for a full workforce is hundreds of thousands of rows, and
+``GET /training-matrix/summary`` used to do that on every view. The rows only
+change when something they are built from changes: a new import lands, cells or
+people or courses are written, a requirement is edited, or an employee mapping
+moves. ``board_fingerprint`` reads the row count and latest ``updated_at`` of
+each of those in one statement; while it is unchanged the cached
+``BoardSnapshot`` is served, re-dated for today (see ``BoardSnapshot``), so the
+date-dependent figures stay current without a rebuild.
+
+The cache is per process and bounded. A write that bypasses the ORM and leaves
+``updated_at`` alone (and does not change a row count) is not seen; call
+``invalidate_board_snapshots`` after one.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Awaitable, Callable, Mapping, Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.models.engineer import Engineer
+from src.domain.models.training_matrix import (
+    TrainingMatrixCell,
+    TrainingMatrixCourse,
+    TrainingMatrixPerson,
+    TrainingMatrixRequirement,
+)
+from src.domain.services.training_matrix_board import BoardSnapshot
+from src.infrastructure.monitoring.azure_monitor import track_metric
+
+MAX_CACHED_TENANTS = 64
+
+_snapshots: "OrderedDict[int, tuple[tuple[Any, ...], BoardSnapshot]]" = OrderedDict()
+
+
+def invalidate_board_snapshots(tenant_id: Optional[int] = None) -> None:
+    """Forget the cached snapshot for one tenant, or for every tenant."""
+    if tenant_id is None:
+        _snapshots.clear()
+    else:
+        _snapshots.pop(tenant_id, None)
+
+
+async def board_fingerprint(db: AsyncSession, tenant_id: int, import_id: int) -> tuple[Any, ...]:
+    """Row counts and latest ``updated_at`` of everything the board rows are built from."""
+    sources: tuple[tuple[Any, list[Any]], ...] = (
+        (TrainingMatrixCell, [TrainingMatrixCell.import_id == import_id]),
+        (TrainingMatrixPerson, []),
+        (TrainingMatrixCourse, []),
+        (TrainingMatrixRequirement, []),
+        (Engineer, []),
+    )
+    columns: list[Any] = []
+    for model, extra in sources:
+        scoped = [model.tenant_id == tenant_id, *extra]
+        columns.append(select(func.count()).select_from(model).where(*scoped).scalar_subquery())
+        columns.append(select(func.max(model.updated_at)).where(*scoped).scalar_subquery())
+    row = (await db.execute(select(*columns))).one()
+    return (import_id, *row)
+
+
+async def board_snapshot(
+    db: AsyncSession,
+    *,
+    tenant_id: int,
+    import_id: int,
+    load_rows: Callable[[], Awaitable[Sequence[Mapping[str, Any]]]],
+) -> BoardSnapshot:
+    """The tenant's snapshot for ``import_id``, rebuilt only when its inputs changed.
+
+    ``load_rows`` must return compliance rows as ``evaluate_compliance`` produced
+    them; the snapshot is built with ``redate=True`` on that basis.
+    """
+    fingerprint = await board_fingerprint(db, tenant_id, import_id)
+    cached = _snapshots.get(tenant_id)
+    if cached is not None and cached[0] == fingerprint:
+        _snapshots.move_to_end(tenant_id)
+        track_metric("training_matrix.board_snapshot", 1, {"result": "hit"})
+        return cached[1]
+
+    snapshot = BoardSnapshot.from_rows(await load_rows(), redate=True)
+    _snapshots[tenant_id] = (fingerprint, snapshot)
+    _snapshots.move_to_end(tenant_id)
+    while len(_snapshots) > MAX_CACHED_TENANTS:
+        _snapshots.popitem(last=False)
+    track_metric("training_matrix.board_snapshot", 1, {"result": "miss" if cached is None else "rebuild"})
+    return snapshot
+
+
+async def cached_board_summary(
+    db: AsyncSession,
+    *,
+    tenant_id: int,
+    import_id: int,
+    load_rows: Callable[[], Awaitable[Sequence[Mapping[str, Any]]]],
+    today: Optional[date] = None,
+) -> dict[str, Any]:
+    """``build_board_summary`` for the latest import, from the cached snapshot."""
+    snapshot = await board_snapshot(db, tenant_id=tenant_id, import_id=import_id, load_rows=load_rows)
+    return snapshot.summary(today)
@@ -36,56 +36,91 @@ def create_capa_from_defect_sync(
 
     Returns the new CAPA id, or None if a CAPA already exists for this defect.
     """
-    from src.domain.models.capa import CAPAAction, CAPASource, CAPAStatus, CAPAType
-
-    existing = (
-        db.query(CAPAAction)
-        .filter(
-            CAPAAction.source_type == CAPASource.VEHICLE_DEFECT.value,
-            CAPAAction.source_id == defect_id,
-        )
-        .first()
+    created = create_capas_from_defects_sync(
+        [
+            {
+                "id": defect_id,
+                "priority": defect_priority,
+                "vehicle_reg": vehicle_reg,
+                "check_field": check_field,
+                "check_value": check_value,
+            }
+        ],
+        db=db,
     )
-    if existing:
-        return None
+    return created[0] if created else None
 
-    sla_days = SLA_DAYS.get(defect_priority, 14)
-    capa_priority = PRIORITY_MAP.get(defect_priority, "medium")
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
 
-    count = db.query(CAPAAction).count()
-    ref = f"CAPA-{now.year}-{count + 1:04d}"
+def create_capas_from_defects_sync(defects: list[dict[str, Any]], db: Any) -> list[int]:
+    """Create CAPA actions for a batch of vehicle defects (synchronous, for Celery tasks).
 
-    action = CAPAAction(
-        reference_number=ref,
-        title=f"Vehicle Defect: {check_field} failed on {vehicle_reg}",
-        description=(
-            f"Auto-generated from vehicle defect.\n"
-            f"Vehicle: {vehicle_reg}\n"
-            f"Check: {check_field}\n"
-            f"Value: {check_value}\n"
-            f"Priority: {defect_priority}"
-        ),
-        capa_type=CAPAType.CORRECTIVE.value,
-        status=CAPAStatus.OPEN.value,
-        priority=capa_priority,
-        source_type=CAPASource.VEHICLE_DEFECT.value,
-        source_id=defect_id,
-        due_date=now + timedelta(days=sla_days),
-        created_by_id=1,
-        created_at=now,
-    )
-    db.add(action)
-    db.flush()
-    logger.info(
-        "Auto-created CAPA %s for defect %d (vehicle %s, priority %s, SLA %dd)",
-        ref,
-        defect_id,
-        vehicle_reg,
-        defect_priority,
-        sla_days,
+    Each defect is a dict with ``id``, ``priority``, ``vehicle_reg``,
+    ``check_field``, ``check_value`` and optionally ``tenant_id``. Defects that already have a CAPA are
+    skipped. Existing CAPAs are found with one query, reference numbers run on
+    from one count, and the new actions are inserted together. Returns their ids.
+    """
+    from sqlalchemy import func, insert, select
+
+    from src.domain.models.capa import CAPAAction, CAPASource, CAPAStatus, CAPAType
+
+    if not defects:
+        return []
+    existing = set(
+        db.scalars(
+            select(CAPAAction.source_id).where(
+                CAPAAction.source_type == CAPASource.VEHICLE_DEFECT.value,
+                CAPAAction.source_id.in_([defect["id"] for defect in defects]),
+            )
+        ).all()
     )
-    return int(action.id)
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    count = db.scalar(select(func.count(CAPAAction.id))) or 0
+    sources: list[dict[str, Any]] = []
+    actions: list[dict[str, Any]] = []
+    for defect in defects:
+        if defect["id"] in existing:
+            continue
+        existing.add(defect["id"])
+        sources.append(defect)
+        count += 1
+        priority = defect["priority"]
+        actions.append(
+            {
+                "reference_number": f"CAPA-{now.year}-{count:04d}",
+                "title": f"Vehicle Defect: {defect['check_field']} failed on {defect['vehicle_reg']}",
+                "description": (
+                    f"Auto-generated from vehicle defect.\n"
+                    f"Vehicle: {defect['vehicle_reg']}\n"
+                    f"Check: {defect['check_field']}\n"
+                    f"Value: {defect['check_value']}\n"
+                    f"Priority: {priority}"
+                ),
+                "capa_type": CAPAType.CORRECTIVE.value,
+                "status": CAPAStatus.OPEN.value,
+                "priority": PRIORITY_MAP.get(priority, "medium"),
+                "source_type": CAPASource.VEHICLE_DEFECT.value,
+                "source_id": defect["id"],
+                "due_date": now + timedelta(days=SLA_DAYS.get(priority, 14)),
+                "created_by_id": 1,
+                "tenant_id": defect.get("tenant_id"),
+                "created_at": now,
+            }
+        )
+    if not actions:
+        return []
+
+    ids = list(db.scalars(insert(CAPAAction).returning(CAPAAction.id, sort_by_parameter_order=True), actions).all())
+    for defect, action in zip(sources, actions):
+        logger.info(
+            "Auto-created CAPA %s for defect %d (vehicle %s, priority %s, SLA %dd)",
+            action["reference_number"],
+            defect["id"],
+            defect["vehicle_reg"],
+            defect["priority"],
+            SLA_DAYS.get(defect["priority"], 14),
+        )
+    return ids
 
 
 async def create_capa_from_defect_async(
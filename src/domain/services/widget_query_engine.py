@@ -0,0 +1,593 @@
+"""Declarative widget queries for custom analytics dashboards.
+
+A widget is described by its data source, aggregation, metric, optional
+``group_by`` dimension and equality filters. ``compile_widget`` turns that
+description into one tenant-scoped aggregate over a bucket grid, and
+``WidgetQueryEngine`` evaluates any number of widgets together: one cache read
+for all of them, one ``UNION ALL`` statement for the ones that missed, one cache
+write.
+
+Why the grid is calendar-aligned
+--------------------------------
+Buckets start at UTC midnight, Monday or the first of the month, and the period
+always ends at the close of the bucket containing "now". Every bucket except the
+last is therefore closed: a result can only change because of a write (which
+calls ``invalidate_tenant_cache`` for the source's namespace, and the widget keys
+live under that namespace) or because the open bucket moved on. The cache key
+carries the end of the open bucket and the TTL never runs past it, so a cached
+result is never served against the wrong grid.
+
+Each statement reads only what the widget's aggregation needs: per bucket (and
+per group) the row count, the count and sum of the metric, and its min and max.
+The previous period comes from the same statement — the grid is doubled rather
+than queried twice — and every aggregation is derived from those five numbers,
+so "average" over the whole period is an exact mean and not a mean of means.
+
+Data sources the engine cannot aggregate from a single table (actions span
+several stores; training, documents and compliance have no per-row event date)
+evaluate to an explicit ``unavailable`` result rather than a zero.
+"""
+
+from __future__ import annotations
+
+import calendar
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Protocol, Sequence, Tuple, Union
+
+from sqlalchemy import Float, String, and_, case, cast, func, literal_column, null, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.domain.exceptions import ValidationError
+from src.domain.models.analytics import AggregationType, DataSource, TimeGranularity
+from src.domain.models.audit import AuditRun
+from src.domain.models.complaint import Complaint
+from src.domain.models.incident import Incident
+from src.domain.models.risk_register import EnterpriseRisk
+from src.domain.services.risk_service import register_visibility_clause
+from src.domain.services.session_savepoint import read_savepoint
+from src.infrastructure.cache.redis_cache import InMemoryCache, RedisCache, get_cache, make_cache_key
+from src.infrastructure.monitoring.azure_monitor import track_metric
+
+logger = logging.getLogger(__name__)
+
+MEASURED = "measured"
+UNAVAILABLE = "unavailable"
+
+# One row per (bucket, group); a dashboard's widgets never come close, but an
+# unbounded group_by over a free-text column could.
+MAX_GROUPS = 50
+
+
+class WidgetDefinition(Protocol):
+    """What the engine reads from a widget: ``WidgetConfig`` and ``DashboardWidget`` both fit."""
+
+    @property
+    def data_source(self) -> str: ...
+
+    @property
+    def metric(self) -> str: ...
+
+    @property
+    def aggregation(self) -> str: ...
+
+    @property
+    def group_by(self) -> Optional[str]: ...
+
+    @property
+    def filters(self) -> Optional[Dict[str, Any]]: ...
+
+
+@dataclass(frozen=True)
+class Dimension:
+    """A column widgets may group or filter by.
+
+    ``casefold`` dimensions are enum-backed: legacy rows may hold upper-case
+    labels, so both the grouped value and the filter comparison are lower-cased.
+    """
+
+    column: Any
+    casefold: bool = False
+
+    def expression(self) -> Any:
+        if self.casefold:
+            return func.lower(cast(self.column, String))
+        return self.column
+
+    def matches(self, values: Tuple[str, ...]) -> Any:
+        expr = self.expression()
+        return expr == values[0] if len(values) == 1 else expr.in_(values)
+
+
+@dataclass(frozen=True)
+class WidgetSource:
+    """How one data source is aggregated: its table, event date and vocabulary."""
+
+    key: str
+    model: Any
+    occurred_at: Callable[[], Any]
+    naive: bool
+    cache_namespace: str
+    dimensions: Mapping[str, Dimension]
+    measures: Mapping[str, Any] = field(default_factory=dict)
+    population: Callable[[], List[Any]] = lambda: []
+
+
+WIDGET_SOURCES: Dict[str, WidgetSource] = {
+    DataSource.INCIDENTS.value: WidgetSource(
+        key=DataSource.INCIDENTS.value,
+        model=Incident,
+        occurred_at=lambda: Incident.incident_date,
+        naive=False,
+        cache_namespace="incidents",
+        dimensions={
+            "status": Dimension(Incident.status, casefold=True),
+            "severity": Dimension(Incident.severity, casefold=True),
+            "incident_type": Dimension(Incident.incident_type, casefold=True),
+            "department": Dimension(Incident.department),
+            "location": Dimension(Incident.location),
+        },
+    ),
+    DataSource.COMPLAINTS.value: WidgetSource(
+        key=DataSource.COMPLAINTS.value,
+        model=Complaint,
+        # Same event date the executive dashboard counts complaints by.
+        occurred_at=lambda: func.coalesce(Complaint.received_date, Complaint.created_at),
+        naive=False,
+        cache_namespace="complaints",
+        dimensions={
+            "status": Dimension(Complaint.status, casefold=True),
+            "priority": Dimension(Complaint.priority, casefold=True),
+            "complaint_type": Dimension(Complaint.complaint_type, casefold=True),
+            "department": Dimension(Complaint.department),
+            "source_type": Dimension(Complaint.source_type),
+        },
+    ),
+    DataSource.AUDITS.value: WidgetSource(
+        key=DataSource.AUDITS.value,
+        model=AuditRun,
+        occurred_at=lambda: func.coalesce(AuditRun.completed_at, AuditRun.scheduled_date, AuditRun.created_at),
+        naive=False,
+        cache_namespace="audits",
+        dimensions={
+            "status": Dimension(AuditRun.status, casefold=True),
+            "location": Dimension(AuditRun.location),
+            "assurance_scheme": Dimension(AuditRun.assurance_scheme),
+            "source_origin": Dimension(AuditRun.source_origin),
+        },
+        measures={"score_percentage": AuditRun.score_percentage, "score": AuditRun.score},
+    ),
+    DataSource.RISKS.value: WidgetSource(
+        key=DataSource.RISKS.value,
+        model=EnterpriseRisk,
+        occurred_at=lambda: func.coalesce(EnterpriseRisk.identified_date, EnterpriseRisk.created_at),
+        naive=True,
+        cache_namespace="risk_register",
+        dimensions={
+            "status": Dimension(EnterpriseRisk.status),
+            "category": Dimension(EnterpriseRisk.category),
+            "department": Dimension(EnterpriseRisk.department),
+        },
+        measures={"inherent_score": EnterpriseRisk.inherent_score, "residual_score": EnterpriseRisk.residual_score},
+        population=lambda: [register_visibility_clause()],
+    ),
+}
+
+_UNSUPPORTED_SOURCES: Dict[str, str] = {
+    DataSource.ACTIONS.value: "Actions span several stores with different status vocabularies; use /actions/summary.",
+    DataSource.TRAINING.value: "Training compliance is a matrix snapshot, not a stream of dated rows.",
+    DataSource.DOCUMENTS.value: "Documents have no per-row event date a widget period can be taken over.",
+    DataSource.COMPLIANCE.value: "Compliance is a computed score, not a stream of dated rows.",
+    DataSource.COMBINED.value: "Combined widgets are not aggregated from a single source.",
+}
+
+_MEASURED_AGGREGATIONS = {
+    AggregationType.SUM.value,
+    AggregationType.AVERAGE.value,
+    AggregationType.MIN.value,
+    AggregationType.MAX.value,
+}
+
+
+class WidgetSourceUnavailable(Exception):
+    """The widget is well-formed but its data source has no aggregate to read."""
+
+
+# ============================================================================
+# Bucket grid
+# ============================================================================
+
+
+def granularity_for_days(period_days: int) -> str:
+    if period_days <= 31:
+        return TimeGranularity.DAILY.value
+    if period_days <= 120:
+        return TimeGranularity.WEEKLY.value
+    return TimeGranularity.MONTHLY.value
+
+
+def _bucket_floor(moment: datetime, granularity: str) -> datetime:
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == TimeGranularity.WEEKLY.value:
+        return day - timedelta(days=day.weekday())
+    if granularity == TimeGranularity.MONTHLY.value:
+        return day.replace(day=1)
+    return day
+
+
+def _step(edge: datetime, granularity: str, buckets: int) -> datetime:
+    if granularity == TimeGranularity.MONTHLY.value:
+        months = edge.year * 12 + edge.month - 1 + buckets
+        year, month = divmod(months, 12)
+        return edge.replace(year=year, month=month + 1, day=min(edge.day, calendar.monthrange(year, month + 1)[1]))
+    days = 7 if granularity == TimeGranularity.WEEKLY.value else 1
+    return edge + timedelta(days=days * buckets)
+
+
+@dataclass(frozen=True)
+class BucketGrid:
+    """``2 * buckets + 1`` ascending edges: the previous period, then the current one."""
+
+    granularity: str
+    buckets: int
+    edges: Tuple[datetime, ...]
+
+    @classmethod
+    def for_period(cls, period_days: int, now: datetime) -> "BucketGrid":
+        granularity = granularity_for_days(period_days)
+        if granularity == TimeGranularity.DAILY.value:
+            buckets = period_days
+        elif granularity == TimeGranularity.WEEKLY.value:
+            buckets = math.ceil(period_days / 7)
+        else:
+            buckets = max(1, round(period_days / 30.4375))
+        end = _step(_bucket_floor(now, granularity), granularity, 1)
+        edges = tuple(_step(end, granularity, k - 2 * buckets) for k in range(2 * buckets + 1))
+        return cls(granularity, max(buckets, 1), edges)
+
+    @property
+    def start(self) -> datetime:
+        return self.edges[self.buckets]
+
+    @property
+    def end(self) -> datetime:
+        return self.edges[-1]
+
+    def bucket_days(self, index: int) -> float:
+        return (self.edges[index + 1] - self.edges[index]).total_seconds() / 86400
+
+
+# ============================================================================
+# Compilation
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class CompiledWidget:
+    """A validated widget bound to a bucket grid; ``statement`` is its aggregate."""
+
+    source: WidgetSource
+    aggregation: str
+    metric: Optional[str]
+    group_by: Optional[str]
+    filters: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    grid: BucketGrid
+
+    @property
+    def fingerprint(self) -> str:
+        return make_cache_key(
+            self.source.key,
+            self.aggregation,
+            self.metric,
+            self.group_by,
+            self.filters,
+            self.grid.granularity,
+            self.grid.buckets,
+        )
+
+    def cache_key(self, tenant_id: int) -> str:
+        # Under the namespace write paths invalidate, and pinned to the open bucket.
+        end = int(self.grid.end.timestamp())
+        return f"tenant:{tenant_id}:{self.source.cache_namespace}:widget:{self.fingerprint}:{end}"
+
+    def _edges(self) -> Tuple[datetime, ...]:
+        grid = self.grid
+        # A grouped widget needs only the two period totals per group.
+        edges = grid.edges if self.group_by is None else (grid.edges[0], grid.start, grid.end)
+        if self.source.naive:
+            return tuple(edge.replace(tzinfo=None) for edge in edges)
+        return edges
+
+    def statement(self, tenant_id: Optional[int], slot: int) -> Any:
+        """``slot, bucket, grp, n, m, s, lo, hi`` per bucket and group, for ``UNION ALL``."""
+        source = self.source
+        model = source.model
+        when = source.occurred_at()
+        edges = self._edges()
+        criteria: List[Any] = [when >= edges[0], when < edges[-1], *source.population()]
+        if tenant_id is not None:
+            criteria.append(model.tenant_id == tenant_id)
+        if hasattr(model, "deleted_at"):
+            criteria.append(model.deleted_at.is_(None))
+        matches = [source.dimensions[name].matches(values) for name, values in self.filters]
+
+        if self.aggregation == AggregationType.PERCENTAGE.value:
+            # The filters pick the numerator; the population is the denominator.
+            value: Any = case((and_(*matches), 1), else_=0)
+        else:
+            criteria.extend(matches)
+            value = source.measures[self.metric] if self.metric else null()
+        group: Any = null() if self.group_by is None else source.dimensions[self.group_by].expression()
+
+        bucket = case(*[(when < edge, index) for index, edge in enumerate(edges[1:])])
+        inner = select(
+            bucket.label("bucket"),
+            cast(group, String).label("grp"),
+            cast(value, Float).label("value"),
+        ).where(and_(*criteria))
+        rows = inner.subquery()
+        return select(
+            # Inline, not bound: an untyped parameter in a UNION branch has no type on PostgreSQL.
+            literal_column(str(int(slot))).label("slot"),
+            rows.c.bucket,
+            rows.c.grp,
+            func.count().label("n"),
+            func.count(rows.c.value).label("m"),
+            func.sum(rows.c.value).label("s"),
+            func.min(rows.c.value).label("lo"),
+            func.max(rows.c.value).label("hi"),
+        ).group_by(rows.c.bucket, rows.c.grp)
+
+
+def _filter_values(name: str, raw: Any, casefold: bool) -> Tuple[str, ...]:
+    values = raw if isinstance(raw, (list, tuple)) else [raw]
+    if not values or any(value is None or isinstance(value, (dict, list)) for value in values):
+        raise ValidationError(f"Filter '{name}' needs one value or a list of values")
+    text = [str(value.value if hasattr(value, "value") else value) for value in values]
+    return tuple(sorted({value.lower() if casefold else value for value in text}))
+
+
+def compile_widget(widget: WidgetDefinition, period_days: int, now: Optional[datetime] = None) -> CompiledWidget:
+    """Validate ``widget`` against its source and bind it to the period's grid.
+
+    Raises ``ValidationError`` for a configuration no source could answer and
+    ``WidgetSourceUnavailable`` for a known source that has no aggregate.
+    """
+    data_source = (widget.data_source or "").strip().lower()
+    if data_source in _UNSUPPORTED_SOURCES:
+        raise WidgetSourceUnavailable(_UNSUPPORTED_SOURCES[data_source])
+    source = WIDGET_SOURCES.get(data_source)
+    if source is None:
+        raise ValidationError(f"Unknown data source '{widget.data_source}'")
+
+    aggregation = (widget.aggregation or AggregationType.COUNT.value).strip().lower()
+    if aggregation not in {member.value for member in AggregationType}:
+        raise ValidationError(f"Unknown aggregation '{widget.aggregation}'")
+    metric: Optional[str] = None
+    if aggregation in _MEASURED_AGGREGATIONS:
+        metric = widget.metric
+        if metric not in source.measures:
+            allowed = ", ".join(sorted(source.measures)) or "none"
+            raise ValidationError(
+                f"Aggregation '{aggregation}' needs a numeric metric of {data_source} (available: {allowed})"
+            )
+    elif aggregation == AggregationType.PERCENTAGE.value and not widget.filters:
+        raise ValidationError("A percentage widget needs filters selecting the rows it is a percentage of")
+
+    group_by = widget.group_by or None
+    if group_by is not None and group_by not in source.dimensions:
+        raise ValidationError(f"Cannot group {data_source} by '{group_by}'")
+
+    filters = []
+    for name, raw in sorted((widget.filters or {}).items()):
+        dimension = source.dimensions.get(name)
+        if dimension is None:
+            raise ValidationError(f"Cannot filter {data_source} by '{name}'")
+        filters.append((name, _filter_values(name, raw, dimension.casefold)))
+
+    grid = BucketGrid.for_period(max(int(period_days), 1), now or datetime.now(timezone.utc))
+    return CompiledWidget(source, aggregation, metric, group_by, tuple(filters), grid)
+
+
+# ============================================================================
+# Evaluation
+# ============================================================================
+
+# (rows, metric values, metric sum, metric min, metric max)
+_Totals = Tuple[int, int, float, Optional[float], Optional[float]]
+_EMPTY: _Totals = (0, 0, 0.0, None, None)
+
+
+def _combine(a: _Totals, b: _Totals) -> _Totals:
+    lo = b[3] if a[3] is None else a[3] if b[3] is None else min(a[3], b[3])
+    hi = b[4] if a[4] is None else a[4] if b[4] is None else max(a[4], b[4])
+    return (a[0] + b[0], a[1] + b[1], a[2] + b[2], lo, hi)
+
+
+def _measure(aggregation: str, totals: _Totals, days: float) -> Optional[float]:
+    rows, measured, total, lo, hi = totals
+    if aggregation == AggregationType.SUM.value:
+        value: Optional[float] = total
+    elif aggregation == AggregationType.AVERAGE.value:
+        value = total / measured if measured else None
+    elif aggregation == AggregationType.MIN.value:
+        value = lo
+    elif aggregation == AggregationType.MAX.value:
+        value = hi
+    elif aggregation == AggregationType.PERCENTAGE.value:
+        value = 100.0 * total / rows if rows else None
+    elif aggregation == AggregationType.RATE.value:
+        value = rows / days if days else None
+    else:
+        return rows
+    return None if value is None else round(value, 2)
+
+
+def _unavailable(reason: str, detail: str) -> Dict[str, Any]:
+    return {"status": UNAVAILABLE, "reason": reason, "detail": detail}
+
+
+def _shape(widget: CompiledWidget, rows: Sequence[Any], computed_at: datetime) -> Dict[str, Any]:
+    """Fold ``(bucket, grp, n, m, s, lo, hi)`` rows into the widget payload."""
+    grid = widget.grid
+    grouped = widget.group_by is not None
+    current_index = 1 if grouped else grid.buckets
+    previous = current = _EMPTY
+    per_key: Dict[Any, _Totals] = {}
+    for row in rows:
+        totals: _Totals = (
+            int(row.n),
+            int(row.m),
+            float(row.s or 0.0),
+            None if row.lo is None else float(row.lo),
+            None if row.hi is None else float(row.hi),
+        )
+        if row.bucket < current_index:
+            previous = _combine(previous, totals)
+            continue
+        current = _combine(current, totals)
+        key = row.grp if grouped else row.bucket - current_index
+        per_key[key] = _combine(per_key.get(key, _EMPTY), totals)
+
+    days = (grid.end - grid.start).total_seconds() / 86400
+    value = _measure(widget.aggregation, current, days)
+    previous_value = _measure(widget.aggregation, previous, days)
+    change: Optional[float] = None
+    trend: Optional[str] = None
+    if value is not None and previous_value is not None:
+        trend = "up" if value > previous_value else "down" if value < previous_value else "stable"
+        if previous_value:
+            change = round((value - previous_value) / abs(previous_value) * 100, 1)
+
+    labels: List[Optional[str]]
+    values: List[Optional[float]]
+    if grouped:
+        measured = [(key, _measure(widget.aggregation, totals, days)) for key, totals in per_key.items()]
+        measured.sort(key=lambda item: (item[1] is None, -(item[1] or 0), str(item[0])))
+        measured = measured[:MAX_GROUPS]
+        labels = [key for key, _ in measured]
+        values = [v for _, v in measured]
+    else:
+        labels = [grid.edges[grid.buckets + i].date().isoformat() for i in range(grid.buckets)]
+        values = [
+            _measure(widget.aggregation, per_key.get(i, _EMPTY), grid.bucket_days(grid.buckets + i))
+            for i in range(grid.buckets)
+        ]
+
+    return {
+        "status": MEASURED,
+        "value": value,
+        "previous_value": previous_value,
+        "change": change,
+        "trend": trend,
+        "chart_data": {"labels": labels, "values": values},
+        "aggregation": widget.aggregation,
+        "granularity": grid.granularity,
+        "period": {"start": grid.start.isoformat(), "end": grid.end.isoformat()},
+        "computed_at": computed_at.isoformat(),
+    }
+
+
+class WidgetQueryEngine:
+    """Evaluate dashboard widgets for one tenant, batched and cached."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        tenant_id: Optional[int],
+        *,
+        cache: Optional[Union[InMemoryCache, RedisCache]] = None,
+        now: Optional[datetime] = None,
+    ) -> None:
+        self.db = db
+        self.tenant_id = tenant_id
+        self._cache = cache
+        self._now = now
+
+    async def evaluate(self, widget: WidgetDefinition, period_days: int, *, strict: bool = False) -> Dict[str, Any]:
+        return (await self.evaluate_many([widget], period_days, strict=strict))[0]
+
+    async def evaluate_many(
+        self, widgets: Sequence[WidgetDefinition], period_days: int, *, strict: bool = False
+    ) -> List[Dict[str, Any]]:
+        """One payload per widget, in order.
+
+        A widget that does not compile is reported ``unavailable`` in place, so one
+        bad tile cannot blank a dashboard; ``strict`` re-raises instead (preview).
+        Identical widgets are computed once.
+        """
+        now = self._now or datetime.now(timezone.utc)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(widgets)
+        compiled: Dict[int, CompiledWidget] = {}
+        for index, widget in enumerate(widgets):
+            try:
+                compiled[index] = compile_widget(widget, period_days, now)
+            except ValidationError as exc:
+                if strict:
+                    raise
+                results[index] = _unavailable("invalid_widget_config", exc.message)
+            except WidgetSourceUnavailable as exc:
+                results[index] = _unavailable("unsupported_data_source", str(exc))
+
+        distinct: Dict[str, CompiledWidget] = {}
+        for compiled_widget in compiled.values():
+            distinct.setdefault(compiled_widget.fingerprint, compiled_widget)
+
+        payloads: Dict[str, Dict[str, Any]] = {}
+        keys: Dict[str, str] = {}
+        cache: Optional[Union[InMemoryCache, RedisCache]] = None
+        # Without a tenant there is no namespace the write paths would invalidate.
+        if self.tenant_id is not None and distinct:
+            cache = self._cache or get_cache()
+            keys = {fp: item.cache_key(self.tenant_id) for fp, item in distinct.items()}
+            hits = await cache.get_many(list(keys.values()))
+            payloads = {fp: hits[key] for fp, key in keys.items() if key in hits}
+            track_metric("analytics.widget_cache.hits", len(payloads))
+
+        missing = [item for fp, item in distinct.items() if fp not in payloads]
+        if missing:
+            fresh = await self._query(missing, now)
+            payloads.update(fresh)
+            if cache is not None:
+                await cache.set_many(self._cache_writes(fresh, distinct, keys, now))
+            track_metric("analytics.widget_cache.misses", len(missing))
+
+        for index, compiled_widget in compiled.items():
+            results[index] = payloads[compiled_widget.fingerprint]
+        return [result or {} for result in results]
+
+    @staticmethod
+    def _cache_writes(
+        fresh: Dict[str, Dict[str, Any]],
+        distinct: Dict[str, CompiledWidget],
+        keys: Dict[str, str],
+        now: datetime,
+    ) -> Dict[str, Tuple[Any, int]]:
+        """Measured payloads only, each expiring no later than its open bucket closes."""
+        writes: Dict[str, Tuple[Any, int]] = {}
+        for fp, payload in fresh.items():
+            if payload["status"] != MEASURED:
+                continue
+            until_rollover = math.ceil((distinct[fp].grid.end - now).total_seconds())
+            writes[keys[fp]] = (payload, max(1, min(settings.analytics_widget_cache_ttl_seconds, until_rollover)))
+        return writes
+
+    async def _query(self, widgets: List[CompiledWidget], now: datetime) -> Dict[str, Dict[str, Any]]:
+        """Every widget's aggregate in one ``UNION ALL`` round trip."""
+        statements = [widget.statement(self.tenant_id, slot) for slot, widget in enumerate(widgets)]
+        combined = statements[0] if len(statements) == 1 else union_all(*statements)
+        try:
+            async with read_savepoint(self.db):
+                rows = (await self.db.execute(combined)).all()
+        except Exception:
+            logger.warning("widget_query_engine: batch of %d widget(s) failed", len(widgets), exc_info=True)
+            failed = _unavailable("query_failed", "The widget aggregate could not be read; no value is reported.")
+            return {widget.fingerprint: dict(failed) for widget in widgets}
+
+        by_slot: Dict[int, List[Any]] = {slot: [] for slot in range(len(widgets))}
+        for row in rows:
+            by_slot[int(row.slot)].append(row)
+        return {widget.fingerprint: _shape(widget, by_slot[slot], now) for slot, widget in enumerate(widgets)}
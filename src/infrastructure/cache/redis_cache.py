@@ -88,6 +88,21 @@ class InMemoryCache:
             self._stats["sets"] += 1
             return True
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values at once; missing or expired keys are omitted."""
+        found: dict[str, Any] = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set_many(self, items: dict[str, tuple[Any, int]]) -> bool:
+        """Set several ``key: (value, ttl)`` entries."""
+        for key, (value, ttl) in items.items():
+            await self.set(key, value, ttl)
+        return True
+
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
         async with self._lock:
@@ -197,6 +212,45 @@ class RedisCache:
             print(f"[Cache] Redis set error: {e}")
             return await self._fallback.set(key, value, ttl)
 
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """Get several values in one MGET; missing keys are omitted."""
+        if self._use_fallback or not keys:
+            return await self._fallback.get_many(keys)
+
+        redis = await self._get_redis()
+        if redis is None:
+            return await self._fallback.get_many(keys)
+
+        try:
+            values = await redis.mget([self._make_key(key) for key in keys])
+            return {key: json.loads(data) for key, data in zip(keys, values) if data is not None}
+        except Exception as e:
+            print(f"[Cache] Redis mget error: {e}")
+            return await self._fallback.get_many(keys)
+
+    async def set_many(self, items: dict[str, tuple[Any, int]]) -> bool:
+        """Set several ``key: (value, ttl)`` entries in one pipeline."""
+        if self._use_fallback or not items:
+            return await self._fallback.set_many(items)
+
+        redis = await self._get_redis()
+        if redis is None:
+            return await self._fallback.set_many(items)
+
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for key, (value, ttl) in items.items():
+                data = json.dumps(value, default=str)
+                if ttl > 0:
+                    pipe.setex(self._make_key(key), ttl, data)
+                else:
+                    pipe.set(self._make_key(key), data)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            print(f"[Cache] Redis pipeline set error: {e}")
+            return await self._fallback.set_many(items)
+
     async def delete(self, key: str) -> bool:
         """Delete key from Redis."""
         if self._use_fallback:
@@ -1,10 +1,13 @@
 """Database connection and session management."""
 
+import asyncio
 import logging
 import os
 import sys
 import time
-from typing import Any, AsyncGenerator
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from sqlalchemy import create_engine, event
@@ -14,6 +17,7 @@ from sqlalchemy.pool import NullPool
 
 from src.core.config import settings
 from src.domain.models.base import Base  # noqa: F401 – re-exported for metadata binding
+from src.infrastructure.monitoring.db_instrumentation import TimedAsyncAdaptedQueuePool, instrument_engine
 
 logger = logging.getLogger(__name__)
 
@@ -113,6 +117,8 @@ def _build_async_engine_kwargs(database_url: str, *, pooled: bool) -> dict[str,
     if pooled:
         kwargs.update(
             {
+                # Times checkout waits for the per-request instrumentation.
+                "poolclass": TimedAsyncAdaptedQueuePool,
                 "pool_pre_ping": True,
                 "pool_size": _PG_POOL_SIZE,
                 "max_overflow": _PG_MAX_OVERFLOW,
@@ -178,6 +184,8 @@ def _register_async_pool_usage_listeners() -> None:
 
 
 _register_async_pool_usage_listeners()
+# Statement count / SQL time per HTTP request; Celery's rebound engine is not instrumented.
+instrument_engine(engine.sync_engine)
 
 
 _worker_database_configured = False
@@ -273,6 +281,43 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Fan-out sessions from every request together hold at most this many pooled
+# connections, so a burst of concurrent searches cannot take the connections
+# ordinary request sessions are waiting for.
+_READ_FANOUT_LIMIT: int = max(1, (_PG_POOL_SIZE + _PG_MAX_OVERFLOW) // 3)
+_read_fanout_gates: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _read_fanout_gate() -> asyncio.Semaphore:
+    """The process-wide fan-out semaphore for the running loop (Celery and tests run several)."""
+    loop = asyncio.get_running_loop()
+    gate = _read_fanout_gates.get(loop)
+    if gate is None:
+        gate = _read_fanout_gates[loop] = asyncio.Semaphore(_READ_FANOUT_LIMIT)
+    return gate
+
+
+@asynccontextmanager
+async def tenant_read_session() -> AsyncIterator[AsyncSession]:
+    """A pooled session for reads fanned out beside the request's own session.
+
+    An ``AsyncSession`` runs one statement at a time, so work that wants several
+    queries in flight at once needs a session each. The request's tenant GUC is
+    bound once, up front, and the session stays in that one transaction; nothing
+    is committed, and closing the session returns its connection to the pool.
+    Entering waits while ``_READ_FANOUT_LIMIT`` such sessions are already open.
+    """
+    from src.infrastructure.middleware.tenant_context import apply_tenant_guc, get_request_tenant_id
+
+    async with _read_fanout_gate(), async_session_maker() as session:
+        tenant_id = get_request_tenant_id()
+        if tenant_id is not None:
+            await apply_tenant_guc(session, tenant_id)
+        yield session
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     async with engine.begin() as conn:
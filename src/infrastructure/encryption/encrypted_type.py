@@ -1,7 +1,25 @@
 """SQLAlchemy custom type for transparent field encryption."""
 
+from contextvars import ContextVar, Token
+from typing import Optional
+
 from sqlalchemy import String, TypeDecorator
 
+# Ciphertext -> plaintext for the current request, bound by ``begin_decrypt_memo``
+# (DecryptMemoMiddleware when ``field_decrypt_memo_enabled``). A row read twice in
+# one request, or the same value on many rows, runs Fernet once. Plaintext lives no
+# longer than the request, and the memo stops growing at _DECRYPT_MEMO_MAX_ENTRIES.
+_decrypt_memo: ContextVar[Optional[dict[str, str]]] = ContextVar("field_decrypt_memo", default=None)
+_DECRYPT_MEMO_MAX_ENTRIES = 4096
+
+
+def begin_decrypt_memo() -> Token:
+    return _decrypt_memo.set({})
+
+
+def end_decrypt_memo(token: Token) -> None:
+    _decrypt_memo.reset(token)
+
 
 class EncryptedString(TypeDecorator):
     impl = String
@@ -25,6 +43,14 @@ class EncryptedString(TypeDecorator):
         return value
 
     def process_result_value(self, value, dialect):
-        if value is not None:
+        if value is None:
+            return value
+        memo = _decrypt_memo.get()
+        if memo is None:
             return self.encryptor.decrypt(value)
-        return value
+        plaintext = memo.get(value)
+        if plaintext is None:
+            plaintext = self.encryptor.decrypt(value)
+            if len(memo) < _DECRYPT_MEMO_MAX_ENTRIES:
+                memo[value] = plaintext
+        return plaintext
@@ -0,0 +1,278 @@
+"""Online re-encryption of ``EncryptedString`` columns under the primary key.
+
+``FIELD_ENCRYPTION_KEY`` takes comma-separated keys, newest first; values
+written under an older key keep decrypting through ``MultiFernet`` until they
+are rewritten. Rotation rewrites them: it finds every ``EncryptedString``
+column in the model metadata and walks each table in primary-key order, in
+batches, with the Fernet work fanned out to a process pool.
+
+The job is idempotent. A value the primary key already decrypts is left alone,
+so a rerun (or a resume after a crash) only pays a decrypt per value it has
+already done. Legacy plaintext, which ``EncryptedString`` still reads as-is,
+is encrypted. A token no configured key opens is counted and left untouched.
+
+Writes are compare-and-set on the ciphertext that was read, so a row the
+application updates mid-batch keeps the application's value (which is already
+under the primary key) rather than a rotated copy of the old one.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy import Column, MetaData, String, Table, bindparam, select, type_coerce, update
+from sqlalchemy.engine import Engine
+
+from src.infrastructure.encryption.encrypted_type import EncryptedString
+
+logger = logging.getLogger(__name__)
+
+#: Every Fernet token starts with the version byte 0x80, which base64 renders as this.
+_FERNET_TOKEN_PREFIX = "gAAAAA"
+
+
+class ValueOutcome(str, Enum):
+    ROTATED = "rotated"  # was under an older key, now under the primary
+    ENCRYPTED = "encrypted"  # was plaintext
+    CURRENT = "current"  # already under the primary key
+    UNREADABLE = "unreadable"  # a Fernet token no configured key opens
+    EMPTY = "empty"
+
+
+@dataclass
+class RotationProgress:
+    """One table's pass: where it is and what it has done. Serialisable for resume."""
+
+    table: str
+    columns: list[str]
+    last_key: Any = None
+    rows_scanned: int = 0
+    counts: dict[str, int] = field(default_factory=dict)
+    done: bool = False
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return round(self.rows_scanned / self.seconds, 1) if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "table": self.table,
+            "columns": self.columns,
+            "last_key": self.last_key,
+            "rows_scanned": self.rows_scanned,
+            "counts": self.counts,
+            "done": self.done,
+            "seconds": self.seconds,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RotationProgress:
+        return cls(**data)
+
+
+def discover_encrypted_columns(metadata: MetaData) -> dict[Table, list[Column]]:
+    """Tables with at least one ``EncryptedString`` column, in dependency order."""
+    found: dict[Table, list[Column]] = {}
+    for table in metadata.sorted_tables:
+        columns = [column for column in table.columns if isinstance(column.type, EncryptedString)]
+        if columns:
+            found[table] = columns
+    return found
+
+
+# --------------------------------------------------------------------------- #
+# Fernet work (runs in pool processes; module level so it pickles)
+# --------------------------------------------------------------------------- #
+
+_worker_ciphers: Optional[tuple[Any, Any]] = None
+
+
+def _ciphers(key: str) -> tuple[Any, Any]:
+    """(primary Fernet, MultiFernet over every configured key)."""
+    from cryptography.fernet import Fernet, MultiFernet
+
+    fernets = [Fernet(part.strip().encode()) for part in key.split(",") if part.strip()]
+    return fernets[0], MultiFernet(fernets)
+
+
+def _init_worker(key: str) -> None:
+    global _worker_ciphers
+    _worker_ciphers = _ciphers(key)
+
+
+def _rotate_values(values: list[Optional[str]]) -> list[tuple[ValueOutcome, Optional[str]]]:
+    """Rotate one chunk in a pool process set up by ``_init_worker``."""
+    assert _worker_ciphers is not None  # nosec B101 - set by the pool initializer
+    return rotate_values(values, *_worker_ciphers)
+
+
+def rotate_values(
+    values: Iterable[Optional[str]], primary: Any, multi: Any
+) -> list[tuple[ValueOutcome, Optional[str]]]:
+    """Outcome and, where it changes, the new ciphertext for each value."""
+    from cryptography.fernet import InvalidToken
+
+    results: list[tuple[ValueOutcome, Optional[str]]] = []
+    for value in values:
+        if not value:
+            results.append((ValueOutcome.EMPTY, None))
+            continue
+        token = value.encode()
+        try:
+            primary.decrypt(token)
+            results.append((ValueOutcome.CURRENT, None))
+            continue
+        except InvalidToken:
+            pass
+        try:
+            results.append((ValueOutcome.ROTATED, multi.rotate(token).decode()))
+        except InvalidToken:
+            if value.startswith(_FERNET_TOKEN_PREFIX):
+                results.append((ValueOutcome.UNREADABLE, None))
+            else:
+                results.append((ValueOutcome.ENCRYPTED, primary.encrypt(token).decode()))
+    return results
+
+
+# --------------------------------------------------------------------------- #
+# Table passes
+# --------------------------------------------------------------------------- #
+
+
+def _chunks(values: list[Optional[str]], parts: int) -> list[list[Optional[str]]]:
+    size = max(1, -(-len(values) // parts))
+    return [values[start : start + size] for start in range(0, len(values), size)]
+
+
+def rotate_table(
+    engine: Engine,
+    table: Table,
+    columns: list[Column],
+    progress: RotationProgress,
+    *,
+    key: str,
+    batch_size: int,
+    executor: Optional[Executor] = None,
+    workers: int = 1,
+    on_batch: Optional[Callable[[RotationProgress], None]] = None,
+) -> RotationProgress:
+    """Rotate ``columns`` of ``table`` from ``progress.last_key`` to the end.
+
+    Each batch is read, rotated (in ``executor`` when given) and written back in
+    its own transaction, then ``on_batch`` is called so the caller can persist
+    ``progress``; a resumed pass starts strictly after the last committed key.
+    """
+    [pk] = table.primary_key.columns
+    # type_coerce to String: the raw ciphertext, not EncryptedString's decryption.
+    raw = [type_coerce(column, String).label(column.name) for column in columns]
+    writes = {
+        column.name: update(table)
+        .where(pk == bindparam("_pk"), type_coerce(column, String) == bindparam("_old", type_=String))
+        .values({column.name: bindparam("_new", type_=String)})
+        for column in columns
+    }
+    primary, multi = _ciphers(key) if executor is None else (None, None)
+    started = time.monotonic() - progress.seconds
+
+    while True:
+        query = select(pk, *raw).order_by(pk).limit(batch_size)
+        if progress.last_key is not None:
+            query = query.where(pk > progress.last_key)
+        with engine.connect() as conn:
+            rows = conn.execute(query).all()
+        if not rows:
+            break
+
+        values = [row[index + 1] for row in rows for index in range(len(columns))]
+        if executor is None:
+            outcomes = rotate_values(values, primary, multi)
+        else:
+            outcomes = [
+                outcome for chunk in executor.map(_rotate_values, _chunks(values, workers)) for outcome in chunk
+            ]
+
+        params: dict[str, list[dict[str, Any]]] = {column.name: [] for column in columns}
+        for position, (outcome, new) in enumerate(outcomes):
+            progress.counts[outcome.value] = progress.counts.get(outcome.value, 0) + 1
+            if new is not None:
+                row = rows[position // len(columns)]
+                name = columns[position % len(columns)].name
+                params[name].append({"_pk": row[0], "_old": values[position], "_new": new})
+        with engine.begin() as conn:
+            for name, batch in params.items():
+                if batch:
+                    conn.execute(writes[name], batch)
+
+        progress.last_key = rows[-1][0]
+        progress.rows_scanned += len(rows)
+        progress.seconds = time.monotonic() - started
+        if on_batch is not None:
+            on_batch(progress)
+
+    progress.done = True
+    progress.seconds = time.monotonic() - started
+    if on_batch is not None:
+        on_batch(progress)
+    return progress
+
+
+def rotate_encrypted_columns(
+    engine: Engine,
+    metadata: MetaData,
+    *,
+    key: Optional[str] = None,
+    batch_size: int = 500,
+    workers: int = 0,
+    progress: Optional[dict[str, RotationProgress]] = None,
+    on_batch: Optional[Callable[[RotationProgress], None]] = None,
+) -> dict[str, RotationProgress]:
+    """Re-encrypt every ``EncryptedString`` column in ``metadata`` under the primary key.
+
+    ``key`` defaults to ``FIELD_ENCRYPTION_KEY``. ``workers`` > 0 runs the Fernet
+    work in that many processes; 0 keeps it in this one. ``progress`` from an
+    earlier, interrupted run resumes it: finished tables are skipped and the rest
+    continue after their last committed key.
+    """
+    key = key or os.environ.get("FIELD_ENCRYPTION_KEY", "")
+    if not key:
+        raise ValueError("FIELD_ENCRYPTION_KEY is not set; there is nothing to rotate to")
+    progress = progress if progress is not None else {}
+
+    executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(key,)) if workers > 0 else None
+    try:
+        for table, columns in discover_encrypted_columns(metadata).items():
+            if len(table.primary_key.columns) != 1:
+                logger.warning("Key rotation: %s skipped, keyset batches need a single-column primary key", table.name)
+                continue
+            state = progress.setdefault(table.name, RotationProgress(table.name, [column.name for column in columns]))
+            if state.done:
+                continue
+            rotate_table(
+                engine,
+                table,
+                columns,
+                state,
+                key=key,
+                batch_size=batch_size,
+                executor=executor,
+                workers=workers,
+                on_batch=on_batch,
+            )
+            logger.info(
+                "Key rotation: %s done, %d rows at %.1f rows/s, %s",
+                table.name,
+                state.rows_scanned,
+                state.rows_per_second,
+                state.counts,
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return progress
@@ -2,6 +2,7 @@
 
 from src.infrastructure.middleware.rate_limiter import (
     RateLimitConfig,
+    evaluate_rate_limit,
     get_rate_limiter,
     rate_limit,
     rate_limit_middleware,
@@ -9,6 +10,7 @@ from src.infrastructure.middleware.rate_limiter import (
 
 __all__ = [
     "RateLimitConfig",
+    "evaluate_rate_limit",
     "get_rate_limiter",
     "rate_limit",
     "rate_limit_middleware",
@@ -0,0 +1,27 @@
+"""Per-request ``EncryptedString`` decryption memo."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.config import settings
+from src.infrastructure.encryption.encrypted_type import begin_decrypt_memo, end_decrypt_memo
+
+
+class DecryptMemoMiddleware:
+    """Bind the decryption memo for the request when ``field_decrypt_memo_enabled``.
+
+    The memo is reset in ``finally``, so no plaintext outlives the request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.field_decrypt_memo_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        token = begin_decrypt_memo()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            end_decrypt_memo(token)
@@ -4,20 +4,19 @@ Rate Limiting Middleware for FastAPI
 Features:
 - Configurable rate limits per endpoint
 - IP-based and user-based limiting
-- Redis backend for distributed rate limiting
+- Redis backend for distributed rate limiting (GCRA, one script call per check)
 - Graceful fallback to in-memory when Redis unavailable
 - Different limits for authenticated vs anonymous users
 """
 
-import asyncio
 import hashlib
 import logging
+import math
 import os
 import time
-from collections import defaultdict
 from dataclasses import dataclass
 from functools import wraps
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 from fastapi import HTTPException, Request, Response, status
 from fastapi.routing import APIRoute
@@ -35,12 +34,33 @@ class RateLimitConfig:
     authenticated_multiplier: float = 2.0  # Authenticated users get 2x limits
 
 
+# Generic cell rate algorithm (GCRA). Each key holds one number, its theoretical
+# arrival time (TAT): the instant the key's quota would be fully spent at the
+# current pace. A request costs one emission interval (window / limit) and is
+# admitted while TAT stays within one window of now, which allows ``limit``
+# requests per window with bursts up to ``limit``. Denied requests change nothing.
+def _gcra(tat: float, now: float, interval: float, window: float) -> tuple[bool, float, int, int]:
+    """Decide one request; returns (allowed, new_tat, remaining, reset_time)."""
+    new_tat = max(tat, now) + interval
+    # The tolerance absorbs float error from summing ``limit`` intervals.
+    if new_tat - now > window + 1e-6:
+        return False, tat, 0, math.ceil(new_tat - window)
+    return True, new_tat, int((window - (new_tat - now)) / interval), math.ceil(new_tat)
+
+
+# Entries the in-memory limiter holds before it sweeps expired keys; the
+# threshold doubles with the live key count so sweeps stay amortised O(1).
+_SWEEP_MIN_KEYS = 10_000
+
+
 class InMemoryRateLimiter:
-    """In-memory rate limiter using sliding window algorithm."""
+    """In-memory GCRA rate limiter (one float per key, no lock)."""
 
     def __init__(self):
-        self._requests: dict[str, list[float]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        # key -> theoretical arrival time. is_allowed never awaits, so updates are
+        # atomic on the event loop without a lock.
+        self._requests: dict[str, float] = {}
+        self._sweep_at = _SWEEP_MIN_KEYS
 
     async def is_allowed(
         self,
@@ -54,40 +74,90 @@ class InMemoryRateLimiter:
         Returns:
             Tuple of (is_allowed, remaining, reset_time)
         """
-        async with self._lock:
-            now = time.time()
-            window_start = now - window_seconds
+        now = time.time()
+        allowed, tat, remaining, reset_time = _gcra(
+            self._requests.get(key, now), now, window_seconds / limit, window_seconds
+        )
+        if allowed:
+            self._requests[key] = tat
+            if len(self._requests) >= self._sweep_at:
+                self._sweep(now)
+        return allowed, remaining, reset_time
 
-            # Clean old requests
-            self._requests[key] = [ts for ts in self._requests[key] if ts > window_start]
+    def _sweep(self, now: float) -> None:
+        self._requests = {key: tat for key, tat in self._requests.items() if tat > now}
+        self._sweep_at = max(_SWEEP_MIN_KEYS, 2 * len(self._requests))
 
-            current_count = len(self._requests[key])
-            remaining = max(0, limit - current_count)
-            reset_time = int(window_start + window_seconds)
+    async def cleanup(self):
+        """Remove expired entries."""
+        self._sweep(time.time())
+
+
+# One round trip per decision: read the TAT, apply any refund of unused leased
+# units, admit ``cost`` units (falling back to one unless as many again would
+# still be spare), and write the TAT back with a TTL. Times are integer
+# microseconds so the stored value survives Lua's number formatting.
+# KEYS[1] = limiter key; ARGV = now, interval, window, cost, refund.
+# Returns {allowed, granted, remaining, reset_time (unix seconds)}.
+_GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local window = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local refund = tonumber(ARGV[5])
+
+local stored = redis.call('GET', KEYS[1])
+local tat = now
+if stored then
+    tat = math.max(tonumber(stored) - refund * interval, now)
+end
+if cost > 1 and tat + (2 * cost - 1) * interval - now > window then
+    cost = 1
+end
+local new_tat = tat + cost * interval
+if new_tat - now > window then
+    if stored and refund > 0 then
+        redis.call('SET', KEYS[1], string.format('%d', tat), 'PX', math.ceil((tat - now) / 1000))
+    end
+    return {0, 0, 0, math.ceil((new_tat - window) / 1000000)}
+end
+redis.call('SET', KEYS[1], string.format('%d', new_tat), 'PX', math.ceil((new_tat - now) / 1000))
+return {1, cost, math.floor((window - (new_tat - now)) / interval), math.ceil(new_tat / 1000000)}
+"""
 
-            if current_count >= limit:
-                return False, 0, reset_time
 
-            self._requests[key].append(now)
-            return True, remaining - 1, reset_time
+@dataclass(slots=True)
+class _Lease:
+    """Units a process took from Redis in advance for one key."""
 
-    async def cleanup(self):
-        """Remove expired entries."""
-        async with self._lock:
-            now = time.time()
-            for key in list(self._requests.keys()):
-                self._requests[key] = [ts for ts in self._requests[key] if ts > now - 3600]
-                if not self._requests[key]:
-                    del self._requests[key]
+    tokens: int
+    remaining: int
+    reset_time: int
+    expires_at: float
 
 
 class RedisRateLimiter:
-    """Redis-backed rate limiter for distributed deployments."""
+    """
+    Redis-backed GCRA rate limiter for distributed deployments.
+
+    Each decision is one atomic script call on a single string key. With
+    ``local_lease`` > 1, a client that is well under its limit is granted a
+    lease of several units in that call and this process admits its next
+    requests locally until the lease is spent or ``lease_ttl_seconds`` passes;
+    unused units are refunded on the key's next call. Leases are taken from the
+    shared budget, so workers together never admit more than the limit. Limits
+    below ten per window are never leased.
+    """
 
-    def __init__(self, redis_url: str):
+    def __init__(self, redis_url: str, local_lease: int = 0, lease_ttl_seconds: float = 1.0):
         self._redis_url = redis_url
-        self._redis = None
+        self._redis: Any = None
+        self._script: Any = None
         self._fallback = InMemoryRateLimiter()
+        self._local_lease = local_lease
+        self._lease_ttl = lease_ttl_seconds
+        self._leases: dict[str, _Lease] = {}
+        self._sweep_at = _SWEEP_MIN_KEYS
 
     async def _get_redis(self):
         """Lazy-load Redis connection."""
@@ -97,6 +167,7 @@ class RedisRateLimiter:
 
                 self._redis = redis.from_url(self._redis_url)
                 await self._redis.ping()
+                self._script = self._redis.register_script(_GCRA_SCRIPT)
             except Exception as e:
                 logger.warning("Redis unavailable, using in-memory rate limiter: %s", e)
                 self._redis = None
@@ -108,39 +179,43 @@ class RedisRateLimiter:
         limit: int,
         window_seconds: int,
     ) -> tuple[bool, int, int]:
-        """Check if request is allowed using Redis sliding window."""
+        """Check if request is allowed using the Redis GCRA script."""
+        now = time.time()
+        refund = 0
+        lease = self._leases.pop(key, None)
+        if lease is not None:
+            if lease.tokens and now < lease.expires_at:
+                lease.tokens -= 1
+                self._leases[key] = lease
+                return True, lease.remaining + lease.tokens, lease.reset_time
+            refund = lease.tokens
+
         redis = await self._get_redis()
 
         if redis is None:
             return await self._fallback.is_allowed(key, limit, window_seconds)
 
+        window_us = window_seconds * 1_000_000
+        cost = min(self._local_lease, limit // 10)
         try:
-            now = time.time()
-            window_start = now - window_seconds
-            redis_key = f"ratelimit:{key}"
-
-            # Use pipeline for atomic operations
-            pipe = redis.pipeline()
-            pipe.zremrangebyscore(redis_key, 0, window_start)
-            pipe.zcard(redis_key)
-            pipe.zadd(redis_key, {str(now): now})
-            pipe.expire(redis_key, window_seconds)
-
-            results = await pipe.execute()
-            current_count = results[1]
-
-            remaining = max(0, limit - current_count)
-            reset_time = int(window_start + window_seconds)
-
-            if current_count >= limit:
-                return False, 0, reset_time
-
-            return True, remaining - 1, reset_time
-
+            allowed, granted, remaining, reset_time = await self._script(
+                keys=[f"ratelimit:{key}"],
+                args=[int(now * 1_000_000), max(1, window_us // limit), window_us, max(1, cost), refund],
+            )
         except Exception as e:
             logger.warning("Redis error, falling back to in-memory: %s", e)
             return await self._fallback.is_allowed(key, limit, window_seconds)
 
+        if not allowed:
+            return False, 0, reset_time
+        if granted > 1:
+            self._leases[key] = _Lease(granted - 1, remaining, reset_time, now + self._lease_ttl)
+            if len(self._leases) >= self._sweep_at:
+                # Expired leases are dropped unrefunded; that only under-admits.
+                self._leases = {k: held for k, held in self._leases.items() if held.expires_at > now}
+                self._sweep_at = max(_SWEEP_MIN_KEYS, 2 * len(self._leases))
+        return True, remaining + granted - 1, reset_time
+
 
 # Global rate limiter instance
 _rate_limiter: Optional[InMemoryRateLimiter | RedisRateLimiter] = None
@@ -152,9 +227,15 @@ def get_rate_limiter() -> InMemoryRateLimiter | RedisRateLimiter:
     if _rate_limiter is None:
         import os
 
+        from src.core.config import settings
+
         redis_url = os.getenv("REDIS_URL")
         if redis_url:
-            _rate_limiter = RedisRateLimiter(redis_url)
+            _rate_limiter = RedisRateLimiter(
+                redis_url,
+                local_lease=settings.rate_limit_local_lease,
+                lease_ttl_seconds=settings.rate_limit_lease_ttl_seconds,
+            )
         else:
             _rate_limiter = InMemoryRateLimiter()
     return _rate_limiter
@@ -262,19 +343,19 @@ def get_limit_config(path: str) -> RateLimitConfig:
     return ENDPOINT_LIMITS["default"]
 
 
-async def rate_limit_middleware(request: Request, call_next: Callable) -> Response:
+async def evaluate_rate_limit(request: Request) -> tuple[Optional[Response], dict[str, str]]:
     """
-    Rate limiting middleware for FastAPI.
+    Decide a request against its endpoint's limit.
 
-    Adds X-RateLimit headers to responses:
-    - X-RateLimit-Limit: Maximum requests allowed
-    - X-RateLimit-Remaining: Requests remaining in window
-    - X-RateLimit-Reset: Unix timestamp when limit resets
+    Returns ``(rejection, headers)``: ``rejection`` is the 429 to send instead of
+    the handler (None when the request may proceed), and ``headers`` are the
+    X-RateLimit values to add to the handler's response — empty for requests the
+    limiter does not apply to.
     """
     # Explicit bypass (RATE_LIMIT_BYPASS) or legacy TESTING=1 — unless loadtest
     # profile is active, which must still hit the limiter (C-59).
     if should_bypass_rate_limiting():
-        return await call_next(request)
+        return None, {}
 
     # Skip rate limiting for health checks and public privacy disclosure
     if request.url.path in [
@@ -286,12 +367,12 @@ async def rate_limit_middleware(request: Request, call_next: Callable) -> Respon
         "/.well-known/security.txt",
         "/api/v1/privacy/contact",
     ]:
-        return await call_next(request)
+        return None, {}
 
     # Skip rate limiting for CORS preflight requests (OPTIONS)
     # These must pass through to CORSMiddleware without interference
     if request.method == "OPTIONS":
-        return await call_next(request)
+        return None, {}
 
     limiter = get_rate_limiter()
     client_id = get_client_identifier(request)
@@ -315,7 +396,7 @@ async def rate_limit_middleware(request: Request, call_next: Callable) -> Respon
     )
 
     if not is_allowed:
-        return Response(
+        rejection = Response(
             content='{"detail": "Rate limit exceeded. Please try again later."}',
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             media_type="application/json",
@@ -326,14 +407,33 @@ async def rate_limit_middleware(request: Request, call_next: Callable) -> Respon
                 "Retry-After": str(max(1, reset_time - int(time.time()))),
             },
         )
+        return rejection, {}
+
+    return None, {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset_time),
+    }
+
+
+async def rate_limit_middleware(request: Request, call_next: Callable) -> Response:
+    """
+    Rate limiting middleware for FastAPI.
+
+    Adds X-RateLimit headers to responses:
+    - X-RateLimit-Limit: Maximum requests allowed
+    - X-RateLimit-Remaining: Requests remaining in window
+    - X-RateLimit-Reset: Unix timestamp when limit resets
+    """
+    rejection, headers = await evaluate_rate_limit(request)
+    if rejection is not None:
+        return rejection
 
     # Process request
     response = await call_next(request)
 
     # Add rate limit headers
-    response.headers["X-RateLimit-Limit"] = str(limit)
-    response.headers["X-RateLimit-Remaining"] = str(remaining)
-    response.headers["X-RateLimit-Reset"] = str(reset_time)
+    response.headers.update(headers)
 
     return response
 
@@ -3,38 +3,71 @@
 import logging
 import time
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.infrastructure.monitoring.db_instrumentation import (
+    begin_request_db_stats,
+    end_request_db_stats,
+    record_request_db_stats,
+)
 
 logger = logging.getLogger("request")
 
 
-class RequestLoggerMiddleware(BaseHTTPMiddleware):
-    """Log every HTTP request with method, path, status, and latency."""
+class RequestLoggerMiddleware:
+    """Log every HTTP request with method, path, status, and latency.
+
+    Latency runs to the start of the response (status and headers), which is
+    also when the line is logged and ``X-Response-Time`` is added; a streamed
+    body is not waited for.
+
+    The request's database work (see ``db_instrumentation``) is measured over
+    the same span: statement count and SQL time go into the log line, the
+    ``Server-Timing`` header and the ``db.request.*`` histograms, keyed by the
+    matched route template.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next) -> Response:
         start = time.perf_counter()
-        response: Response = await call_next(request)
-        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
-
-        request_id = getattr(request.state, "request_id", "-")
-        user_id = getattr(request.state, "user_id", None)
-
-        logger.info(
-            "%s %s %s %.1fms",
-            request.method,
-            request.url.path,
-            response.status_code,
-            elapsed_ms,
-            extra={
-                "request_id": request_id,
-                "method": request.method,
-                "path": request.url.path,
-                "status": response.status_code,
-                "latency_ms": elapsed_ms,
-                "user_id": user_id,
-            },
-        )
-
-        response.headers["X-Response-Time"] = f"{elapsed_ms}ms"
-        return response
+        db_stats, db_token = begin_request_db_stats() if settings.db_request_instrumentation_enabled else (None, None)
+
+        async def send_logged(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+                state = scope.get("state", {})
+                request_id = state.get("request_id", "-")
+                user_id = state.get("user_id")
+                method, path, status = scope["method"], scope["path"], message["status"]
+                extra = {
+                    "request_id": request_id,
+                    "method": method,
+                    "path": path,
+                    "status": status,
+                    "latency_ms": elapsed_ms,
+                    "user_id": user_id,
+                }
+                headers = MutableHeaders(scope=message)
+                if db_stats is not None:
+                    route = getattr(scope.get("route"), "path", "<unmatched>")
+                    extra.update(db_statements=db_stats.statements, db_time_ms=round(db_stats.db_time_ms, 1))
+                    headers.append("Server-Timing", db_stats.server_timing())
+                    record_request_db_stats(db_stats, route, request_id)
+
+                logger.info("%s %s %s %.1fms", method, path, status, elapsed_ms, extra=extra)
+                headers["X-Response-Time"] = f"{elapsed_ms}ms"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_logged)
+        finally:
+            if db_token is not None:
+                end_request_db_stats(db_token)
@@ -8,7 +8,7 @@ connection. Instead it:
 2. Reads tenant_id from ``request.state`` when present (or from ``request.state.user``)
 3. Sets a ContextVar so ``get_db`` can re-apply the GUC on ``after_begin``
 4. Stores ``request.state.tenant_id`` for downstream code
-5. Clears the ContextVar in ``finally``
+5. Restores the ContextVar in ``finally``, including a tenant auth bound later
 
 The actual ``set_config('app.current_tenant_id', ..., true)`` bind happens on
 the real request session via ``apply_tenant_guc`` from auth dependencies
@@ -23,10 +23,10 @@ from __future__ import annotations
 
 import logging
 from contextvars import ContextVar, Token
-from typing import Callable, Optional
+from typing import Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -174,7 +174,7 @@ async def apply_tenant_guc(session, tenant_id: int) -> None:
         )
 
 
-class TenantContextMiddleware(BaseHTTPMiddleware):
+class TenantContextMiddleware:
     """Propagate tenant intent for RLS; GUC bind happens on the request session.
 
     Middleware runs before auth, and ``get_current_user`` Depends on ``get_db``,
@@ -185,28 +185,34 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
     GUC on ``after_begin`` for later transactions in the same request.
 
     Skipped for health-check / docs endpoints. When ``tenant_id`` is missing,
-    no ContextVar is set (fail-closed under FORCE RLS). App superusers with a
+    no tenant is bound (fail-closed under FORCE RLS). App superusers with a
     tenant_id still receive the GUC (tenant-scoped); cross-tenant access needs
     BYPASSRLS on the DB role.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        if request.url.path in SKIP_PATHS:
-            return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         tenant_id = getattr(request.state, "tenant_id", None)
         if tenant_id is None:
             user = getattr(request.state, "user", None)
             if user is not None and hasattr(user, "tenant_id"):
                 tenant_id = user.tenant_id
 
-        token: Optional[Token] = None
+        if tenant_id is not None:
+            request.state.tenant_id = tenant_id
+            request.state.rls_intent = True
+        # Always take a token, even to bind None: the handler runs in this task
+        # rather than a child task, and the auth dependency binds the tenant it
+        # resolves, so resetting here is what keeps it from outliving the request.
+        token = set_request_tenant_id(int(tenant_id) if tenant_id is not None else get_request_tenant_id())
         try:
-            if tenant_id is not None:
-                request.state.tenant_id = tenant_id
-                request.state.rls_intent = True
-                token = set_request_tenant_id(int(tenant_id))
-            return await call_next(request)
+            await self.app(scope, receive, send)
         finally:
-            if token is not None:
-                reset_request_tenant_id(token)
+            reset_request_tenant_id(token)
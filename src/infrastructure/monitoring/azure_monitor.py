@@ -10,7 +10,6 @@ from typing import Any
 try:
     from opentelemetry import metrics, trace
     from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor  # noqa: F401
-    from opentelemetry.metrics import Counter, Histogram, UpDownCounter  # noqa: F401
     from opentelemetry.sdk.metrics import MeterProvider  # noqa: F401
     from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader  # noqa: F401
     from opentelemetry.sdk.resources import Resource  # noqa: F401
@@ -24,6 +23,8 @@ except ImportError:
     metrics = None  # type: ignore[assignment]
     trace = None  # type: ignore[assignment]
 
+from src.infrastructure.monitoring.metric_registry import MetricKind, MetricRegistry, MetricSpec
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,30 +60,61 @@ class StructuredLogger:
 _tracer: trace.Tracer | None = None
 _meter: metrics.Meter | None = None
 
-# Business metric counters
-_incidents_created: Counter | None = None
-_incidents_resolved: Counter | None = None
-_audits_completed: Counter | None = None
-_audit_findings: Counter | None = None
-_api_response_time: Histogram | None = None
-_db_query_time: Histogram | None = None
-_cache_hit_rate: UpDownCounter | None = None
-_capa_created: Counter | None = None
-_capa_closed: Counter | None = None
-_complaints_created: Counter | None = None
-_risks_created: Counter | None = None
-_auth_login: Counter | None = None
-_auth_logout: Counter | None = None
-_documents_uploaded: Counter | None = None
-_workflows_completed: Counter | None = None
-_workflow_completion_time: Histogram | None = None
-_error_rate_5xx: Counter | None = None
-_cache_miss_rate: Counter | None = None
-_db_pool_usage: UpDownCounter | None = None
-_celery_task_failures: Counter | None = None
-_celery_queue_depth: UpDownCounter | None = None
-_auth_failures: Counter | None = None
-_external_audit_promote: Counter | None = None
+_COUNTER, _UP_DOWN, _HISTOGRAM = MetricKind.COUNTER, MetricKind.UP_DOWN_COUNTER, MetricKind.HISTOGRAM
+
+# Metrics with a declared kind; any other name passed to track_metric is a counter.
+METRIC_SPECS: dict[str, MetricSpec] = {
+    # Business metrics
+    "incidents.created": MetricSpec(_COUNTER, "Number of incidents created"),
+    "incidents.resolved": MetricSpec(_COUNTER, "Number of incidents resolved"),
+    "audits.completed": MetricSpec(_COUNTER, "Number of audits completed"),
+    "audits.findings": MetricSpec(_COUNTER, "Number of audit findings"),
+    "capa.created": MetricSpec(_COUNTER, "Number of CAPA actions created"),
+    "capa.closed": MetricSpec(_COUNTER, "Number of CAPA actions closed"),
+    "complaints.created": MetricSpec(_COUNTER, "Number of complaints created"),
+    "risks.created": MetricSpec(_COUNTER, "Number of risks created"),
+    "auth.login": MetricSpec(_COUNTER, "Number of user logins"),
+    "auth.logout": MetricSpec(_COUNTER, "Number of user logouts"),
+    "auth.failures": MetricSpec(_COUNTER, "Count of authentication failures"),
+    "documents.uploaded": MetricSpec(_COUNTER, "Number of documents uploaded"),
+    "workflows.completed": MetricSpec(_COUNTER, "Number of workflows completed"),
+    "workflow.completion_time_hours": MetricSpec(_HISTOGRAM, "Workflow completion time in hours", "h"),
+    "external_audit_import.promote": MetricSpec(_COUNTER, "External audit import promotion attempts by outcome"),
+    # Platform metrics
+    "api.response_time_ms": MetricSpec(_HISTOGRAM, "API response time in milliseconds", "ms"),
+    "api.error_rate_5xx": MetricSpec(_COUNTER, "Count of 5xx HTTP errors"),
+    "cache.operations": MetricSpec(_UP_DOWN, "Cache hit/miss counter"),
+    "cache.miss_rate": MetricSpec(_COUNTER, "Count of cache misses"),
+    "db.query_time_ms": MetricSpec(_HISTOGRAM, "Database query time in milliseconds", "ms"),
+    "db.pool_usage_percent": MetricSpec(_UP_DOWN, "Database connection pool usage percentage"),
+    "db.request.statements": MetricSpec(_HISTOGRAM, "SQL statements executed per HTTP request"),
+    "db.request.time_ms": MetricSpec(_HISTOGRAM, "Time spent executing SQL per HTTP request", "ms"),
+    "db.request.pool_wait_ms": MetricSpec(
+        _HISTOGRAM, "Time spent waiting for a pooled connection per HTTP request", "ms"
+    ),
+    "db.n_plus_one_suspected": MetricSpec(_COUNTER, "Statements repeated past the N+1 threshold within one request"),
+    "celery.task_failures": MetricSpec(_COUNTER, "Count of failed Celery tasks"),
+    "celery.queue_depth": MetricSpec(_UP_DOWN, "Current depth of Celery task queue"),
+    "search.module_latency_ms": MetricSpec(_HISTOGRAM, "Global search latency per module", "ms"),
+}
+
+metric_registry = MetricRegistry(METRIC_SPECS)
+
+# Series reported with the same attributes on every call, bound once.
+_incidents_created = metric_registry.bind("incidents.created")
+_incidents_resolved = metric_registry.bind("incidents.resolved")
+_audits_completed = metric_registry.bind("audits.completed")
+_risks_created = metric_registry.bind("risks.created")
+_auth_login = metric_registry.bind("auth.login")
+_auth_logout = metric_registry.bind("auth.logout")
+_auth_failures = metric_registry.bind("auth.failures")
+_documents_uploaded = metric_registry.bind("documents.uploaded")
+_workflows_completed = metric_registry.bind("workflows.completed")
+_error_rate_5xx = metric_registry.bind("api.error_rate_5xx")
+_cache_miss_rate = metric_registry.bind("cache.miss_rate")
+_cache_hits = metric_registry.bind("cache.operations", result="hit")
+_cache_misses = metric_registry.bind("cache.operations", result="miss")
+_celery_task_failures = metric_registry.bind("celery.task_failures")
 
 
 def setup_telemetry(app: Any = None, service_name: str = "quality-governance-platform") -> None:
@@ -92,9 +124,6 @@ def setup_telemetry(app: Any = None, service_name: str = "quality-governance-pla
         return
 
     global _tracer, _meter
-    global _incidents_created, _incidents_resolved
-    global _audits_completed, _audit_findings
-    global _api_response_time, _db_query_time, _cache_hit_rate
 
     from src.core.config import settings
 
@@ -142,55 +171,7 @@ def setup_telemetry(app: Any = None, service_name: str = "quality-governance-pla
     _tracer = trace.get_tracer(__name__)
     _meter = metrics.get_meter(__name__)
 
-    _incidents_created = _meter.create_counter("incidents.created", description="Number of incidents created")
-    _incidents_resolved = _meter.create_counter("incidents.resolved", description="Number of incidents resolved")
-    _audits_completed = _meter.create_counter("audits.completed", description="Number of audits completed")
-    _audit_findings = _meter.create_counter("audits.findings", description="Number of audit findings")
-    _api_response_time = _meter.create_histogram(
-        "api.response_time_ms",
-        description="API response time in milliseconds",
-        unit="ms",
-    )
-    _db_query_time = _meter.create_histogram(
-        "db.query_time_ms", description="Database query time in milliseconds", unit="ms"
-    )
-    _cache_hit_rate = _meter.create_up_down_counter("cache.operations", description="Cache hit/miss counter")
-
-    # Additional business metrics
-    global _capa_created, _capa_closed, _complaints_created, _risks_created
-    global _auth_login, _auth_logout, _documents_uploaded, _workflows_completed
-    global _workflow_completion_time
-    global _error_rate_5xx, _cache_miss_rate, _db_pool_usage
-    global _celery_task_failures, _celery_queue_depth, _auth_failures, _external_audit_promote
-
-    _capa_created = _meter.create_counter("capa.created", description="Number of CAPA actions created")
-    _capa_closed = _meter.create_counter("capa.closed", description="Number of CAPA actions closed")
-    _complaints_created = _meter.create_counter("complaints.created", description="Number of complaints created")
-    _risks_created = _meter.create_counter("risks.created", description="Number of risks created")
-    _auth_login = _meter.create_counter("auth.login", description="Number of user logins")
-    _auth_logout = _meter.create_counter("auth.logout", description="Number of user logouts")
-    _documents_uploaded = _meter.create_counter("documents.uploaded", description="Number of documents uploaded")
-    _workflows_completed = _meter.create_counter("workflows.completed", description="Number of workflows completed")
-    _workflow_completion_time = _meter.create_histogram(
-        "workflow.completion_time_hours",
-        description="Workflow completion time in hours",
-        unit="h",
-    )
-
-    _error_rate_5xx = _meter.create_counter("api.error_rate_5xx", description="Count of 5xx HTTP errors")
-    _cache_miss_rate = _meter.create_counter("cache.miss_rate", description="Count of cache misses")
-    _db_pool_usage = _meter.create_up_down_counter(
-        "db.pool_usage_percent", description="Database connection pool usage percentage"
-    )
-    _celery_task_failures = _meter.create_counter("celery.task_failures", description="Count of failed Celery tasks")
-    _celery_queue_depth = _meter.create_up_down_counter(
-        "celery.queue_depth", description="Current depth of Celery task queue"
-    )
-    _auth_failures = _meter.create_counter("auth.failures", description="Count of authentication failures")
-    _external_audit_promote = _meter.create_counter(
-        "external_audit_import.promote",
-        description="External audit import promotion attempts by outcome",
-    )
+    metric_registry.bind_meter(_meter)
 
     if app:
         FastAPIInstrumentor.instrument_app(app)
@@ -211,53 +192,38 @@ def setup_telemetry(app: Any = None, service_name: str = "quality-governance-pla
 
 
 def track_metric(name: str, value: float = 1.0, tags: dict[str, str] | None = None) -> None:
-    """Track a business metric."""
-
-    metric_map: dict[str, Counter | UpDownCounter | None] = {
-        "incidents.created": _incidents_created,
-        "incidents.resolved": _incidents_resolved,
-        "audits.completed": _audits_completed,
-        "audits.findings": _audit_findings,
-        "capa.created": _capa_created,
-        "capa.closed": _capa_closed,
-        "complaints.created": _complaints_created,
-        "risks.created": _risks_created,
-        "auth.login": _auth_login,
-        "auth.logout": _auth_logout,
-        "documents.uploaded": _documents_uploaded,
-        "workflows.completed": _workflows_completed,
-        "api.error_rate_5xx": _error_rate_5xx,
-        "cache.miss_rate": _cache_miss_rate,
-        "db.pool_usage_percent": _db_pool_usage,
-        "celery.task_failures": _celery_task_failures,
-        "celery.queue_depth": _celery_queue_depth,
-        "auth.failures": _auth_failures,
-    }
-
-    counter = metric_map.get(name)
-    if counter:
-        counter.add(int(value), attributes=tags or {})
-    elif _meter:
-        dynamic = _meter.create_counter(name, description=f"Dynamic metric: {name}")
-        dynamic.add(int(value), attributes=tags or {})
+    """Track a metric by name; its kind comes from ``METRIC_SPECS`` (counter otherwise)."""
+    metric_registry.add(name, value, tags)
 
 
 def track_response_time(endpoint: str, duration_ms: float) -> None:
     """Record API response time."""
-    if _api_response_time:
-        _api_response_time.record(duration_ms, attributes={"endpoint": endpoint})
+    metric_registry.add("api.response_time_ms", duration_ms, {"endpoint": endpoint})
 
 
 def track_query_time(query: str, duration_ms: float) -> None:
     """Record database query time."""
-    if _db_query_time:
-        _db_query_time.record(duration_ms, attributes={"query": query[:100]})
+    metric_registry.add("db.query_time_ms", duration_ms, {"query": query[:100]})
+
+
+def track_request_db_stats(route: str, statements: int, db_time_ms: float, pool_wait_ms: float) -> None:
+    """Record one request's SQL statement count, SQL time and pool wait."""
+    attributes = {"route": route}
+    metric_registry.add("db.request.statements", statements, attributes)
+    metric_registry.add("db.request.time_ms", db_time_ms, attributes)
+    metric_registry.add("db.request.pool_wait_ms", pool_wait_ms, attributes)
+
+
+def record_n_plus_one_suspected(route: str) -> None:
+    metric_registry.add("db.n_plus_one_suspected", 1, {"route": route})
 
 
 def track_cache_operation(hit: bool) -> None:
     """Record a cache hit or miss."""
-    if _cache_hit_rate:
-        _cache_hit_rate.add(1 if hit else -1, attributes={"result": "hit" if hit else "miss"})
+    if hit:
+        _cache_hits.add(1)
+    else:
+        _cache_misses.add(-1)
 
 
 def track_business_event(event_name: str, properties: dict[str, str] | None = None) -> None:
@@ -268,71 +234,58 @@ def track_business_event(event_name: str, properties: dict[str, str] | None = No
 
 
 def record_incident_created() -> None:
-    if _incidents_created:
-        _incidents_created.add(1)
+    _incidents_created.add()
 
 
 def record_incident_resolved() -> None:
-    if _incidents_resolved:
-        _incidents_resolved.add(1)
+    _incidents_resolved.add()
 
 
 def record_audit_completed() -> None:
-    if _audits_completed:
-        _audits_completed.add(1)
+    _audits_completed.add()
 
 
 def record_risk_created() -> None:
-    if _risks_created:
-        _risks_created.add(1)
+    _risks_created.add()
 
 
 def record_auth_login() -> None:
-    if _auth_login:
-        _auth_login.add(1)
+    _auth_login.add()
 
 
 def record_auth_logout() -> None:
-    if _auth_logout:
-        _auth_logout.add(1)
+    _auth_logout.add()
 
 
 def record_auth_failure() -> None:
-    if _auth_failures:
-        _auth_failures.add(1)
+    _auth_failures.add()
 
 
 def record_document_uploaded() -> None:
-    if _documents_uploaded:
-        _documents_uploaded.add(1)
+    _documents_uploaded.add()
 
 
 def record_workflow_completed(duration_hours: float | None = None) -> None:
-    if _workflows_completed:
-        _workflows_completed.add(1)
-    if duration_hours is not None and _workflow_completion_time:
-        _workflow_completion_time.record(duration_hours)
+    _workflows_completed.add()
+    if duration_hours is not None:
+        metric_registry.add("workflow.completion_time_hours", duration_hours)
 
 
 def record_5xx_error() -> None:
-    if _error_rate_5xx:
-        _error_rate_5xx.add(1)
+    _error_rate_5xx.add()
 
 
 def record_external_audit_promote_outcome(outcome: str) -> None:
     """Record promotion result: completed | partial | all_failed | error."""
-    if _external_audit_promote:
-        _external_audit_promote.add(1, {"outcome": outcome})
+    metric_registry.add("external_audit_import.promote", 1, {"outcome": outcome})
 
 
 def record_cache_miss() -> None:
-    if _cache_miss_rate:
-        _cache_miss_rate.add(1)
+    _cache_miss_rate.add()
 
 
 def record_celery_task_failure() -> None:
-    if _celery_task_failures:
-        _celery_task_failures.add(1)
+    _celery_task_failures.add()
 
 
 def get_tracer() -> "trace.Tracer | None":
@@ -0,0 +1,148 @@
+"""Per-request database instrumentation.
+
+SQLAlchemy engine and pool events charge every statement, its execution time
+and the wait for a pooled connection to the HTTP request that issued it. The
+request is found through a ContextVar bound by ``RequestLoggerMiddleware``;
+outside a request (Celery tasks, startup) the hooks return after one lookup.
+
+A sampled share of requests also fingerprints each statement, so the same
+normalized statement run more than ``db_n_plus_one_threshold`` times in one
+request is reported as a suspected N+1, with the route that ran it.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from src.core.config import settings
+from src.infrastructure.monitoring.azure_monitor import (
+    record_n_plus_one_suspected,
+    track_query_time,
+    track_request_db_stats,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class RequestDbStats:
+    """Database work attributed to one request."""
+
+    statements: int = 0
+    db_time_ms: float = 0.0
+    pool_wait_ms: float = 0.0
+    # Only populated for sampled requests: normalized statement -> executions.
+    fingerprints: Optional[Counter[str]] = None
+
+    def server_timing(self) -> str:
+        """``Server-Timing`` header value for this request."""
+        return f'db;dur={self.db_time_ms:.1f};desc="{self.statements} queries", db-pool;dur={self.pool_wait_ms:.1f}'
+
+    def suspected_n_plus_one(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements executed more than ``threshold`` times, most frequent first."""
+        if not self.fingerprints:
+            return []
+        return [(sql, count) for sql, count in self.fingerprints.most_common() if count > threshold]
+
+
+_request_db_stats: ContextVar[Optional[RequestDbStats]] = ContextVar("request_db_stats", default=None)
+
+
+def begin_request_db_stats() -> tuple[RequestDbStats, Token]:
+    """Bind fresh stats for the current request; the sample decision is made here."""
+    stats = RequestDbStats()
+    if random.random() < settings.db_statement_sample_rate:
+        stats.fingerprints = Counter()
+    return stats, _request_db_stats.set(stats)
+
+
+def end_request_db_stats(token: Token) -> None:
+    _request_db_stats.reset(token)
+
+
+def get_request_db_stats() -> Optional[RequestDbStats]:
+    return _request_db_stats.get()
+
+
+def record_request_db_stats(stats: RequestDbStats, route: str, request_id: str) -> None:
+    """Emit the request's histograms and log any suspected N+1 statements."""
+    track_request_db_stats(route, stats.statements, stats.db_time_ms, stats.pool_wait_ms)
+    for statement, count in stats.suspected_n_plus_one(settings.db_n_plus_one_threshold):
+        record_n_plus_one_suspected(route)
+        logger.warning(
+            "Suspected N+1 on %s: statement ran %d times: %s",
+            route,
+            count,
+            statement[:300],
+            extra={"request_id": request_id, "route": route, "executions": count},
+        )
+
+
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|\?|(?<!:):\w+")
+_PLACEHOLDER_LIST = re.compile(r"\(\?(?:\s*,\s*\?)+\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_statement(statement: str) -> str:
+    """Fingerprint a statement: placeholders become ``?`` and IN lists ``(?)``."""
+    normalized = _PLACEHOLDER.sub("?", _WHITESPACE.sub(" ", statement).strip())
+    return _PLACEHOLDER_LIST.sub("(?)", normalized)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None and _request_db_stats.get() is not None:
+        context._request_db_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _request_db_stats.get()
+    started = getattr(context, "_request_db_started", None)
+    if stats is None or started is None:
+        return
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    stats.statements += 1
+    stats.db_time_ms += elapsed_ms
+    if stats.fingerprints is not None:
+        fingerprint = normalize_statement(statement)
+        stats.fingerprints[fingerprint] += 1
+        track_query_time(fingerprint, elapsed_ms)
+
+
+def instrument_engine(sync_engine: Engine) -> None:
+    """Register the per-request statement hooks on an engine (idempotent)."""
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that charges checkout wait to the current request.
+
+    SQLAlchemy has no event before a checkout starts, so the wait is timed
+    around ``connect``; it includes opening a new connection when the pool
+    has to grow.
+    """
+
+    def connect(self) -> PoolProxiedConnection:
+        stats = _request_db_stats.get()
+        if stats is None:
+            return super().connect()
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            stats.pool_wait_ms += (time.perf_counter() - started) * 1000
@@ -0,0 +1,166 @@
+"""Named OpenTelemetry instruments, created once and fed cheaply.
+
+``track_metric`` used to rebuild its name -> instrument map on every call and ask
+the meter for a fresh counter for any name outside it. The registry resolves
+each name to one instrument of its declared kind (undeclared names become
+counters) the first time it is used, and keeps it.
+
+Counter and up/down-counter increments are batched in process: an add only
+bumps a running total for its (name, attributes) pair under a lock, and the
+instrument is an observable one whose callback reports those totals when the
+metric reader collects. Histograms need every sample, so they are recorded
+directly. ``bind`` pre-resolves a name and attribute set for call sites that
+report the same series repeatedly.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Optional
+
+if TYPE_CHECKING:
+    from opentelemetry.metrics import CallbackOptions, Observation
+
+_AttributesKey = tuple[tuple[str, str], ...]
+
+
+class MetricKind(str, Enum):
+    COUNTER = "counter"
+    UP_DOWN_COUNTER = "up_down_counter"
+    HISTOGRAM = "histogram"
+
+
+@dataclass(frozen=True, slots=True)
+class MetricSpec:
+    kind: MetricKind
+    description: str = ""
+    unit: str = ""
+
+
+def _attributes_key(attributes: Optional[Mapping[str, str]]) -> _AttributesKey:
+    if not attributes:
+        return ()
+    if len(attributes) == 1:
+        return tuple(attributes.items())
+    return tuple(sorted(attributes.items()))
+
+
+class _Series:
+    """One metric name: its instrument and, for sums, the pending totals."""
+
+    __slots__ = ("name", "kind", "instrument", "totals")
+
+    def __init__(self, name: str, kind: MetricKind) -> None:
+        self.name = name
+        self.kind = kind
+        self.instrument: Any = None
+        self.totals: dict[_AttributesKey, float] = {}
+
+
+class BoundMetric:
+    """A metric name with a fixed attribute set, resolved once."""
+
+    __slots__ = ("_registry", "_series", "_key", "_attributes")
+
+    def __init__(self, registry: MetricRegistry, series: _Series, attributes: Mapping[str, str]) -> None:
+        self._registry = registry
+        self._series = series
+        self._key = _attributes_key(attributes)
+        self._attributes = dict(attributes)
+
+    def add(self, value: float = 1) -> None:
+        registry, series = self._registry, self._series
+        if registry._meter is None or (value < 0 and series.kind is MetricKind.COUNTER):
+            return
+        if series.kind is MetricKind.HISTOGRAM:
+            registry._instrument(series).record(value, attributes=self._attributes)
+            return
+        if series.instrument is None:
+            registry._instrument(series)
+        with registry._lock:
+            series.totals[self._key] = series.totals.get(self._key, 0) + value
+
+    record = add
+
+
+class MetricRegistry:
+    """Instruments by name, of the kinds declared up front (counters otherwise)."""
+
+    def __init__(self, specs: Optional[Mapping[str, MetricSpec]] = None) -> None:
+        self._specs: dict[str, MetricSpec] = dict(specs or {})
+        self._series: dict[str, _Series] = {}
+        self._meter: Any = None
+        self._lock = threading.Lock()
+
+    def declare(self, name: str, kind: MetricKind, description: str = "", unit: str = "") -> None:
+        self._specs[name] = MetricSpec(kind, description, unit)
+
+    def bind_meter(self, meter: Any) -> None:
+        """Report through ``meter`` (None detaches); instruments are created on first use.
+
+        Totals restart with the new meter: its observable instruments begin fresh
+        cumulative streams.
+        """
+        with self._lock:
+            self._meter = meter
+            for series in self._series.values():
+                series.totals.clear()
+                series.instrument = self._create(series) if meter is not None else None
+
+    def add(self, name: str, value: float = 1, attributes: Optional[Mapping[str, str]] = None) -> None:
+        """Add to a counter / up-down counter, or record a histogram sample."""
+        if self._meter is None:
+            return
+        series = self._series.get(name) or self._new_series(name)
+        if series.kind is MetricKind.HISTOGRAM:
+            self._instrument(series).record(value, attributes=attributes or {})
+            return
+        if value < 0 and series.kind is MetricKind.COUNTER:
+            return  # counters are monotonic; the SDK drops these too
+        if series.instrument is None:
+            self._instrument(series)
+        key = _attributes_key(attributes)
+        with self._lock:
+            series.totals[key] = series.totals.get(key, 0) + value
+
+    def bind(self, name: str, **attributes: str) -> BoundMetric:
+        return BoundMetric(self, self._series.get(name) or self._new_series(name), attributes)
+
+    def _new_series(self, name: str) -> _Series:
+        spec = self._specs.get(name)
+        with self._lock:
+            return self._series.setdefault(name, _Series(name, spec.kind if spec else MetricKind.COUNTER))
+
+    def _instrument(self, series: _Series) -> Any:
+        instrument = series.instrument
+        if instrument is None:
+            with self._lock:
+                if series.instrument is None:
+                    series.instrument = self._create(series)
+                instrument = series.instrument
+        return instrument
+
+    def _create(self, series: _Series) -> Any:
+        spec = self._specs.get(series.name) or MetricSpec(MetricKind.COUNTER, f"Dynamic metric: {series.name}")
+        meter, name = self._meter, series.name
+        if series.kind is MetricKind.HISTOGRAM:
+            return meter.create_histogram(name, description=spec.description, unit=spec.unit)
+        create = (
+            meter.create_observable_counter
+            if series.kind is MetricKind.COUNTER
+            else meter.create_observable_up_down_counter
+        )
+        return create(name, callbacks=[self._observer(series)], description=spec.description, unit=spec.unit)
+
+    def _observer(self, series: _Series):
+        # Only reached once a meter exists, so OTel (an optional dependency) is installed.
+        from opentelemetry import metrics as otel_metrics
+
+        def observe(options: "CallbackOptions") -> Iterable["Observation"]:
+            with self._lock:
+                totals = list(series.totals.items())
+            return [otel_metrics.Observation(total, dict(key)) for key, total in totals]
+
+        return observe
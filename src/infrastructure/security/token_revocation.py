@@ -0,0 +1,358 @@
+"""Token revocation store — Redis keyed by ``jti`` behind an in-process Bloom filter.
+
+Every authenticated request asks whether its token's ``jti`` was revoked, and
+the answer is almost always no. Each process keeps a Bloom filter of revoked
+``jti`` values: a miss is a definite "not revoked" and costs no I/O. A hit (a
+real revocation or a rare false positive) is confirmed in Redis, where a
+revocation lives under ``qgp:revoked_jti:<jti>`` until the token would have
+expired anyway. A ``jti`` Redis does not hold is left to the
+``token_blacklist`` table, which stays the durable record.
+
+The filter is built from the table's unexpired rows and rebuilt every
+``token_revocation_filter_refresh_seconds``, which also sheds expired entries.
+Between rebuilds, revocations reach every process over the ``qgp:revoked_jti``
+pub/sub channel; the listener subscribes before it reads the table, so a
+revocation made during a rebuild is not missed. While the filter is not ready
+(startup, lost subscription), checks skip it and ask Redis and the table.
+
+Pub/sub is at-most-once. When a revocation cannot be published (Redis down
+at logout), the revoking process drops its own filter, keeps the revocation
+and republishes it, then rebuilds, once Redis is reachable again. Other
+processes may go on trusting their filters until then, so the store only
+serves per-request access-token checks; refresh, logout and password-reset
+paths always read the table (see ``TokenService.is_revoked``). The table row
+is committed first, so the revocation itself is never lost.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+_REDIS_KEY_PREFIX = "qgp:revoked_jti:"
+_CHANNEL = "qgp:revoked_jti"
+_MAX_LISTENER_BACKOFF_SECONDS = 60.0
+# After a failed connect, checks go straight to the table for this long.
+_RECONNECT_COOLDOWN_SECONDS = 5.0
+
+RevokedJtiLoader = Callable[[], Awaitable[Iterable[str]]]
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing of one BLAKE2b digest)."""
+
+    __slots__ = ("_bits", "_size", "_hashes", "count")
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        capacity = max(1, capacity)
+        self._size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little") | 1
+        size = self._size
+        return [(first + n * step) % size for n in range(self._hashes)]
+
+    def add(self, item: str) -> None:
+        bits = self._bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+        bits = self._bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class RedisTokenRevocationStore:
+    """Revoked ``jti`` values in Redis, prefiltered by a pub/sub-maintained Bloom filter."""
+
+    def __init__(
+        self,
+        redis_url: str,
+        loader: RevokedJtiLoader,
+        *,
+        refresh_seconds: float = 300.0,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+    ) -> None:
+        self._redis_url = redis_url
+        self._loader = loader
+        self._refresh_seconds = refresh_seconds
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._redis: Any = None
+        self._retry_connect_at = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._filter: Optional[BloomFilter] = None
+        self._published_during_rebuild: Optional[list[str]] = None
+        # Revocations not yet published, by jti, with their token expiry.
+        self._unpublished: dict[str, datetime] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        """True while the filter is current and misses can be trusted."""
+        return self._filter is not None
+
+    async def check(self, jti: str) -> Optional[bool]:
+        """``False`` or ``True`` when the store can answer; ``None`` means ask the table."""
+        self._ensure_listener()
+        bloom = self._filter
+        if bloom is not None and jti not in bloom:
+            return False
+        client = await self._get_redis()
+        if client is None:
+            return None
+        try:
+            if await client.exists(self._key(jti)):
+                return True
+        except Exception as exc:  # noqa: BLE001 — the table still answers
+            logger.warning("Redis revocation lookup failed, using the table: %s", exc)
+        return None
+
+    async def revoke(self, jti: str, expires_at: datetime) -> None:
+        """Record a revocation already committed to the table and tell every process."""
+        self._ensure_listener()
+        self._add(jti)
+        ttl = self._ttl_seconds(expires_at)
+        if ttl <= 0:
+            return
+        client = await self._get_redis()
+        if client is None:
+            self._missed_publish(jti, expires_at, "Redis unavailable")
+            return
+        try:
+            pipe = client.pipeline()
+            pipe.set(self._key(jti), b"1", ex=ttl)
+            pipe.publish(_CHANNEL, jti)
+            await pipe.execute()
+        except Exception as exc:  # noqa: BLE001 — republished by the listener
+            self._missed_publish(jti, expires_at, str(exc))
+
+    async def rebuild(self) -> None:
+        """Replace the filter with one built from the table.
+
+        Revocations published while the table is read are kept aside and
+        added to the new filter, so none is lost in the swap.
+        """
+        published: list[str] = []
+        self._published_during_rebuild = published
+        try:
+            jtis = list(await self._loader())
+        finally:
+            self._published_during_rebuild = None
+        if 2 * len(jtis) > self._capacity:
+            logger.warning(
+                "token_revocation_filter_capacity=%s is below twice the %s unexpired revocations",
+                self._capacity,
+                len(jtis),
+            )
+        fresh = BloomFilter(max(self._capacity, 2 * len(jtis)), self._error_rate)
+        for jti in jtis:
+            fresh.add(jti)
+        for jti in published:
+            fresh.add(jti)
+        self._filter = fresh
+
+    async def close(self) -> None:
+        listener, self._listener = self._listener, None
+        if listener is not None and not listener.done():
+            listener.cancel()
+            try:
+                await listener
+            except asyncio.CancelledError:
+                pass
+        self._filter = None
+
+    def _missed_publish(self, jti: str, expires_at: datetime, error: str) -> None:
+        """Other processes did not hear of ``jti``: stop trusting this filter and republish it."""
+        logger.warning("Token revocation not published, bypassing the filter until it is: %s", error)
+        self._unpublished[jti] = expires_at
+        self._filter = None
+
+    async def _republish(self, client: Any) -> None:
+        pending, self._unpublished = self._unpublished, {}
+        if not pending:
+            return
+        pipe = client.pipeline()
+        for jti, expires_at in pending.items():
+            ttl = self._ttl_seconds(expires_at)
+            if ttl > 0:
+                pipe.set(self._key(jti), b"1", ex=ttl)
+                pipe.publish(_CHANNEL, jti)
+        try:
+            await pipe.execute()
+        except Exception:
+            self._unpublished = {**pending, **self._unpublished}
+            raise
+
+    def _add(self, jti: str) -> None:
+        if self._filter is not None:
+            self._filter.add(jti)
+        if self._published_during_rebuild is not None:
+            self._published_during_rebuild.append(jti)
+
+    def _bind_loop(self) -> bool:
+        """Forget loop-bound state when called from a different event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if loop is not self._loop:
+            self._loop = loop
+            self._redis = None
+            self._listener = None
+            self._filter = None
+        return True
+
+    def _ensure_listener(self) -> None:
+        if not self._bind_loop():
+            return
+        listener = self._listener
+        if listener is None or listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+        while True:
+            pubsub = None
+            try:
+                client = await self._get_redis()
+                if client is None:
+                    await asyncio.sleep(backoff)
+                    backoff = min(backoff * 2, _MAX_LISTENER_BACKOFF_SECONDS)
+                    continue
+                pubsub = client.pubsub()
+                await pubsub.subscribe(_CHANNEL)
+                await self._republish(client)
+                await self._rebuild_while_listening(pubsub)
+                backoff = 1.0
+                next_rebuild = time.monotonic() + self._refresh_seconds
+                while True:
+                    await self._drain(pubsub, timeout=1.0)
+                    if self._unpublished or self._filter is None or time.monotonic() >= next_rebuild:
+                        await self._republish(client)
+                        await self._rebuild_while_listening(pubsub)
+                        next_rebuild = time.monotonic() + self._refresh_seconds
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001 — checks use Redis and the table until resubscribed
+                logger.warning("Token revocation listener lost, bypassing the filter: %s", exc)
+                self._filter = None
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _MAX_LISTENER_BACKOFF_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:  # noqa: BLE001
+                        pass
+
+    async def _rebuild_while_listening(self, pubsub: Any) -> None:
+        rebuild = asyncio.ensure_future(self.rebuild())
+        try:
+            while not rebuild.done():
+                await self._drain(pubsub, timeout=0.05)
+        finally:
+            if not rebuild.done():
+                rebuild.cancel()
+        rebuild.result()
+
+    async def _drain(self, pubsub: Any, timeout: float) -> None:
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if message is not None and message.get("type") == "message":
+            data = message["data"]
+            self._add(data.decode() if isinstance(data, bytes) else str(data))
+
+    async def _get_redis(self) -> Any:
+        if self._redis is None:
+            if time.monotonic() < self._retry_connect_at:
+                return None
+            try:
+                import redis.asyncio as redis
+
+                self._redis = redis.from_url(self._redis_url)
+                await self._redis.ping()
+            except Exception as exc:  # noqa: BLE001 — revocation checks must never break auth
+                logger.warning("Redis unavailable for token revocation, using the table: %s", exc)
+                self._redis = None
+                self._retry_connect_at = time.monotonic() + _RECONNECT_COOLDOWN_SECONDS
+        return self._redis
+
+    @staticmethod
+    def _key(jti: str) -> str:
+        return f"{_REDIS_KEY_PREFIX}{jti}"
+
+    @staticmethod
+    def _ttl_seconds(expires_at: datetime) -> int:
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return math.ceil((expires_at - datetime.now(timezone.utc)).total_seconds())
+
+
+async def load_unexpired_revoked_jtis() -> list[str]:
+    """``jti`` of every ``token_blacklist`` row whose token has not yet expired."""
+    from sqlalchemy import select
+
+    from src.domain.models.token_blacklist import TokenBlacklist
+    from src.infrastructure.database import async_session_maker
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    async with async_session_maker() as session:
+        result = await session.execute(select(TokenBlacklist.jti).where(TokenBlacklist.expires_at > now))
+        return list(result.scalars())
+
+
+_token_revocation_store: Optional[RedisTokenRevocationStore] = None
+
+
+def get_token_revocation_store() -> Optional[RedisTokenRevocationStore]:
+    """Return the process-wide store, or ``None`` to use the table alone (no Redis)."""
+    global _token_revocation_store
+    if _token_revocation_store is None:
+        from src.core.config import settings
+
+        redis_url = (os.getenv("REDIS_URL") or "").strip()
+        if not redis_url or not settings.token_revocation_filter_enabled:
+            return None
+        _token_revocation_store = RedisTokenRevocationStore(
+            redis_url,
+            load_unexpired_revoked_jtis,
+            refresh_seconds=settings.token_revocation_filter_refresh_seconds,
+            capacity=settings.token_revocation_filter_capacity,
+            error_rate=settings.token_revocation_filter_error_rate,
+        )
+    return _token_revocation_store
+
+
+def reset_token_revocation_store_for_tests() -> None:
+    """Clear the singleton — test helper only."""
+    global _token_revocation_store
+    _token_revocation_store = None
+
+
+__all__ = [
+    "BloomFilter",
+    "RedisTokenRevocationStore",
+    "get_token_revocation_store",
+    "load_unexpired_revoked_jtis",
+    "reset_token_revocation_store_for_tests",
+]
@@ -8,6 +8,7 @@ import hashlib
 import hmac
 import logging
 import os
+import shutil
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -74,6 +75,20 @@ class BlobStorageService(ABC):
         """
         pass
 
+    async def upload_file(
+        self,
+        storage_key: str,
+        path: Path,
+        content_type: str,
+        metadata: Optional[dict] = None,
+    ) -> str:
+        """Upload a file from local disk.
+
+        Backends that can stream from a file handle override this; the default
+        reads the file into memory and calls ``upload``.
+        """
+        return await self.upload(storage_key, Path(path).read_bytes(), content_type, metadata)
+
     @abstractmethod
     async def download(self, storage_key: str) -> bytes:
         """Download a file from blob storage.
@@ -194,6 +209,36 @@ class LocalFileStorageService(BlobStorageService):
             logger.error(f"Local storage upload failed: {e}")
             raise StorageError(f"Upload failed: {e}") from e
 
+    async def upload_file(
+        self,
+        storage_key: str,
+        path: Path,
+        content_type: str,
+        metadata: Optional[dict] = None,
+    ) -> str:
+        """Copy a file into local storage without reading it into memory."""
+        try:
+            full_path = self._get_full_path(storage_key)
+            shutil.copyfile(path, full_path)
+            if metadata:
+                import json
+
+                meta_path = full_path.with_suffix(full_path.suffix + ".meta.json")
+                meta_path.write_text(
+                    json.dumps(
+                        {
+                            "content_type": content_type,
+                            "metadata": metadata,
+                            "uploaded_at": datetime.now(timezone.utc).isoformat(),
+                        }
+                    )
+                )
+            logger.info(f"Uploaded file to local storage: {storage_key} ({full_path.stat().st_size} bytes)")
+            return storage_key
+        except Exception as e:
+            logger.error(f"Local storage upload failed: {e}")
+            raise StorageError(f"Upload failed: {e}") from e
+
     async def download(self, storage_key: str) -> bytes:
         """Download file from local filesystem."""
         try:
@@ -357,6 +402,38 @@ class AzureBlobStorageService(BlobStorageService):
 
         return await call_via_upstream_breaker(_BLOB_UPSTREAM_BREAKER, _do_upload)
 
+    async def upload_file(
+        self,
+        storage_key: str,
+        path: Path,
+        content_type: str,
+        metadata: Optional[dict] = None,
+    ) -> str:
+        """Stream a file to Azure Blob Storage; the SDK uploads it in blocks."""
+
+        async def _do_upload() -> str:
+            try:
+                await self._ensure_container_available(auto_create=True)
+                blob_client = self._get_blob_client(storage_key)
+                size = Path(path).stat().st_size
+                with open(path, "rb") as handle:
+                    blob_client.upload_blob(
+                        handle,
+                        length=size,
+                        content_type=content_type,
+                        metadata=metadata,
+                        overwrite=True,
+                    )
+                logger.info(f"Uploaded file to Azure Storage: {storage_key} ({size} bytes)")
+                return storage_key
+            except StorageDependencyError:
+                raise
+            except Exception as e:
+                logger.error(f"Azure storage upload failed: {e}")
+                raise StorageError(f"Upload failed: {e}") from e
+
+        return await call_via_upstream_breaker(_BLOB_UPSTREAM_BREAKER, _do_upload)
+
     async def download(self, storage_key: str) -> bytes:
         """Download file from Azure Blob Storage via Preferred ``blob_storage`` breaker."""
 
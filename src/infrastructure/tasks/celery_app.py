@@ -85,6 +85,7 @@ CELERY_TASK_MODULES = (
     "src.infrastructure.tasks.document_campaign_tasks",
     "src.infrastructure.tasks.document_index_tasks",
     "src.infrastructure.tasks.email_tasks",
+    "src.infrastructure.tasks.export_tasks",
     "src.infrastructure.tasks.external_audit_import_tasks",
     "src.infrastructure.tasks.monitor_tasks",
     "src.infrastructure.tasks.notification_tasks",
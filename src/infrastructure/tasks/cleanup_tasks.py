@@ -1,8 +1,14 @@
 """Data retention and cleanup tasks."""
 
 import logging
+import time
 from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
 
+from sqlalchemy import delete, insert, select, text, update
+
+from src.core.config import settings
 from src.core.retention_config import DEFAULT_RETENTION_POLICIES
 from src.infrastructure.tasks.celery_app import celery_app
 
@@ -29,6 +35,8 @@ class RetentionRule:
     date_column: str
     policy_key: str | None = None
     operational_days: int | None = None
+    #: Ascending, unique column the purge pages through (see ``_purge_in_batches``).
+    key_column: str = "id"
 
     def __post_init__(self) -> None:
         if (self.policy_key is None) == (self.operational_days is None):
@@ -80,14 +88,139 @@ RETENTION_RULES: tuple[RetentionRule, ...] = (
 )
 
 
+@dataclass
+class PurgeOutcome:
+    """What one table's purge did in this run."""
+
+    deleted: int
+    batches: int
+    seconds: float
+    cutoff: datetime
+    resumed: bool = False
+
+    @property
+    def rows_per_second(self) -> float:
+        return round(self.deleted / self.seconds, 1) if self.seconds > 0 else 0.0
+
+
+class _SweepCursors:
+    """``retention_sweep_cursors`` rows: where an unfinished pass resumes.
+
+    A database without the table (a scratch SQLite file, a schema behind its
+    migrations) still purges, it just cannot resume; that is logged once, here.
+    """
+
+    def __init__(self, engine: Any) -> None:
+        from src.domain.models.retention_sweep_cursor import RetentionSweepCursor
+
+        self.model = RetentionSweepCursor
+        self.saved: dict[str, Any] = {}
+        self.enabled = True
+        try:
+            with engine.connect() as conn:
+                self.saved = {row.table_name: row for row in conn.execute(select(self.model.__table__))}
+        except Exception as exc:
+            self.enabled = False
+            logger.warning(
+                "Retention: sweep cursors unavailable, an interrupted purge will restart: %s: %s",
+                type(exc).__name__,
+                exc,
+            )
+
+    def save(self, conn: Any, table: str, cutoff: datetime, last_key: Any, rows_deleted: int, *, new: bool) -> None:
+        if not self.enabled:
+            return
+        values = {"cutoff": cutoff, "last_key": last_key, "rows_deleted": rows_deleted, "updated_at": datetime.utcnow()}
+        if new:
+            conn.execute(insert(self.model).values(table_name=table, **values))
+        else:
+            conn.execute(update(self.model).where(self.model.table_name == table).values(**values))
+
+    def clear(self, conn: Any, table: str) -> None:
+        if self.enabled:
+            conn.execute(delete(self.model).where(self.model.table_name == table))
+
+
+def _purge_in_batches(
+    engine: Any, rule: RetentionRule, cutoff: datetime, cursors: _SweepCursors | None
+) -> PurgeOutcome:
+    """Delete ``rule.table`` rows older than ``cutoff``, one committed batch at a time.
+
+    Each batch is the next ``retention_batch_size`` expired keys above the last one
+    purged (keyset, so no batch rescans what earlier ones removed), deleted by key
+    range in its own transaction together with the cursor update. Locks and WAL
+    are bounded by the batch, no statement nears ``statement_timeout``, and a
+    failure loses at most the batch in flight. ``retention_batch_pause_seconds``
+    between batches leaves room for replication and foreground traffic.
+
+    With ``cursors``, a pass the previous run left unfinished resumes from its
+    saved key and with its saved cutoff, so it removes exactly the rows it would
+    have; the cursor is dropped when the pass completes.
+    """
+    table, date_col, key = rule.table, rule.date_column, rule.key_column
+    saved = cursors.saved.get(table) if cursors else None
+    after: Any = saved.last_key if saved else None
+    if saved:
+        cutoff = saved.cutoff
+    batch_size, pause = settings.retention_batch_size, settings.retention_batch_pause_seconds
+
+    def statements(after_clause: str) -> tuple[Any, Any]:
+        # Identifiers come from RETENTION_RULES, never from input.
+        where = f"{date_col} < :cutoff{after_clause}"
+        return (
+            text(
+                f"SELECT max(k) FROM (SELECT {key} AS k FROM {table} "  # nosec B608  # noqa: S608
+                f"WHERE {where} ORDER BY {key} LIMIT :limit) AS batch"
+            ),
+            text(f"DELETE FROM {table} WHERE {where} AND {key} <= :upper"),  # nosec B608  # noqa: S608
+        )
+
+    keyset = statements(f" AND {key} > :after")
+    next_batch, delete_batch = statements("") if after is None else keyset
+
+    deleted = batches = 0
+    started = time.monotonic()
+    while True:
+        params: dict[str, Any] = {"cutoff": cutoff, "limit": batch_size, "after": after}
+        with engine.begin() as conn:
+            upper = conn.execute(next_batch, params).scalar()
+            if upper is None:
+                if cursors and (saved or batches):
+                    cursors.clear(conn, table)
+                break
+            deleted += conn.execute(delete_batch, {**params, "upper": upper}).rowcount or 0
+            if cursors:
+                prior = saved.rows_deleted if saved else 0
+                cursors.save(conn, table, cutoff, upper, prior + deleted, new=not saved and not batches)
+        batches += 1
+        after, (next_batch, delete_batch) = upper, keyset
+        if pause > 0:
+            time.sleep(pause)
+    return PurgeOutcome(deleted, batches, time.monotonic() - started, cutoff, resumed=saved is not None)
+
+
 @celery_app.task(
     name="src.infrastructure.tasks.cleanup_tasks.cleanup_expired_tokens",
     queue="cleanup",
 )
 def cleanup_expired_tokens() -> dict:
-    """Remove expired entries from the token blacklist. Runs hourly via beat."""
-    logger.info("Cleaning up expired token blacklist entries")
-    return {"status": "completed"}
+    """Remove expired entries from the token blacklist. Runs hourly via beat.
+
+    A revoked token past its own expiry is rejected on signature checks anyway,
+    so its blacklist row is dead weight; purging them keeps the table bounded by
+    the number of tokens revoked within one token lifetime.
+    """
+    from src.infrastructure.database import sync_engine
+
+    rule = next(rule for rule in RETENTION_RULES if rule.table == "token_blacklist")
+    outcome = _purge_in_batches(sync_engine, rule, datetime.utcnow(), cursors=None)
+    logger.info(
+        "Token blacklist cleanup: purged %d expired entries in %d batches (%.1f rows/s)",
+        outcome.deleted,
+        outcome.batches,
+        outcome.rows_per_second,
+    )
+    return {"status": "completed", "purged": outcome.deleted, "rows_per_second": outcome.rows_per_second}
 
 
 @celery_app.task(
@@ -99,76 +232,73 @@ def cleanup_expired_tokens() -> dict:
 def run_data_retention(self) -> dict:  # type: ignore[override]
     """Run all data retention policies per docs/privacy/data-retention-policy.md.
 
-    Processes retention rules in batches, with audit logging for compliance.
+    Each table is purged in committed keyset batches (``_purge_in_batches``); a
+    retry after a failure resumes every unfinished table from its cursor.
     Runs nightly via beat.
     """
-    from datetime import datetime, timedelta
-
-    from sqlalchemy import text
-
     from src.infrastructure.database import sync_engine as engine_ref
 
     logger.info("Starting data retention sweep")
     results: dict[str, int] = {}
+    rates: dict[str, float] = {}
     held: dict[str, str] = {}
     engine = engine_ref
     now = datetime.utcnow()
 
     try:
-        with engine.begin() as conn:
-            for rule in RETENTION_RULES:
-                table, date_col = rule.table, rule.date_column
-                if not rule.may_hard_delete:
-                    # Checked before any SQL is built, so a policy-governed table cannot be
-                    # destroyed by a later refactor of the statement below.
-                    held[table] = f"{rule.policy_key} requires soft delete first"
-                    logger.info(
-                        "Retention: %s held, policy %s requires soft delete first (%d day horizon)",
-                        table,
-                        rule.policy_key,
-                        rule.retention_days,
-                    )
-                    continue
-
-                cutoff = now - timedelta(days=rule.retention_days)
-                try:
-                    # SAVEPOINT per table because on PostgreSQL the first failing
-                    # statement aborts the whole transaction: without unwinding to a
-                    # savepoint, one bad target makes every later DELETE raise
-                    # InFailedSqlTransaction and turns the closing COMMIT into a
-                    # rollback, so the counts below are reported for rows that were
-                    # never actually purged. Same C-8 shape as ``_read_savepoint``.
-                    with conn.begin_nested():
-                        result = conn.execute(
-                            text(f"DELETE FROM {table} WHERE {date_col} < :cutoff"),  # nosec B608  # noqa: S608
-                            {"cutoff": cutoff},
-                        )
-                        deleted = result.rowcount or 0
-                except Exception as exc:
-                    # Names the table *and* the error: the previous wording asserted
-                    # "may not exist" without checking, which is how a misnamed
-                    # target read as routine for as long as it did.
-                    logger.warning(
-                        "Retention: table %s NOT purged, rule had no effect: %s: %s",
-                        table,
-                        type(exc).__name__,
-                        exc,
-                        exc_info=True,
-                    )
-                    results[table] = -1
-                    continue
-
-                results[table] = deleted
-                if deleted > 0:
-                    logger.info(
-                        "Retention: purged %d rows from %s (cutoff=%s)",
-                        deleted,
-                        table,
-                        cutoff.isoformat(),
-                    )
+        cursors = _SweepCursors(engine)
+        for rule in RETENTION_RULES:
+            table = rule.table
+            if not rule.may_hard_delete:
+                # Checked before any SQL is built, so a policy-governed table cannot be
+                # destroyed by a later refactor of the statements below.
+                held[table] = f"{rule.policy_key} requires soft delete first"
+                logger.info(
+                    "Retention: %s held, policy %s requires soft delete first (%d day horizon)",
+                    table,
+                    rule.policy_key,
+                    rule.retention_days,
+                )
+                continue
+
+            cutoff = now - timedelta(days=rule.retention_days)
+            try:
+                # Every batch is its own transaction, which also keeps tables apart:
+                # on PostgreSQL the first failing statement aborts its transaction,
+                # and when every rule shared one, one bad target turned the closing
+                # COMMIT into a rollback while the counts still reported rows that
+                # were never purged. Same C-8 shape as ``_read_savepoint``.
+                outcome = _purge_in_batches(engine, rule, cutoff, cursors)
+            except Exception as exc:
+                # Names the table *and* the error: the previous wording asserted
+                # "may not exist" without checking, which is how a misnamed
+                # target read as routine for as long as it did. Batches committed
+                # before the failure stay purged; the cursor resumes the rest.
+                logger.warning(
+                    "Retention: table %s NOT purged, rule did not complete: %s: %s",
+                    table,
+                    type(exc).__name__,
+                    exc,
+                    exc_info=True,
+                )
+                results[table] = -1
+                continue
+
+            results[table] = outcome.deleted
+            rates[table] = outcome.rows_per_second
+            if outcome.deleted > 0 or outcome.resumed:
+                logger.info(
+                    "Retention: purged %d rows from %s in %d batches, %.1f rows/s (cutoff=%s%s)",
+                    outcome.deleted,
+                    table,
+                    outcome.batches,
+                    outcome.rows_per_second,
+                    outcome.cutoff.isoformat(),
+                    ", resumed" if outcome.resumed else "",
+                )
 
         logger.info("Data retention sweep complete: purged=%s held=%s", results, held)
-        return {"status": "completed", "purged": results, "held": held}
+        return {"status": "completed", "purged": results, "rows_per_second": rates, "held": held}
 
     except Exception as exc:
         logger.error("Data retention failed: %s", exc)
@@ -49,7 +49,19 @@ def process_document_index_job(
         async with async_session_maker() as session:
             service = IndexJobService(session)
             current_user = await session.get(User, user_id) if user_id else None
-            job = await service.process_job(job_id, tenant_id=tenant_id, current_user=current_user)
+
+            async def _checkpoint(_job: IndexJob) -> None:
+                # Make progress durable so a crashed run resumes from here, then
+                # drop the vectors the just-committed documents superseded.
+                await session.commit()
+                await service.delete_pending_stale_vectors()
+
+            job = await service.process_job(
+                job_id,
+                tenant_id=tenant_id,
+                current_user=current_user,
+                checkpoint=_checkpoint,
+            )
             await session.commit()
             # Only now are the new chunk rows durable, so superseded vectors can go.
             await service.delete_pending_stale_vectors()
@@ -0,0 +1,119 @@
+"""Celery tasks for Export Center jobs: full exports written to blob storage.
+
+A job streams the whole module (no ``SYNC_ROW_LIMIT``) into a temporary file,
+uploads it under ``exports/<tenant>/<job id>/`` and returns the storage key and
+a signed download URL. The return value, kept by the Celery result backend, is
+the job record that ``GET /exports/jobs/{job_id}`` reads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from src.infrastructure.database import async_session_maker
+from src.infrastructure.tasks.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+# Lifetime of the download URL handed back with a finished job (refreshed on each status read).
+EXPORT_URL_TTL_SECONDS = 3600
+
+
+def export_storage_key(tenant_id: int, job_id: str, filename: str) -> str:
+    return f"exports/{tenant_id}/{job_id}/{filename}"
+
+
+def export_download_url(storage_key: str, filename: str) -> str:
+    from src.infrastructure.storage import storage_service
+
+    return storage_service().get_signed_url(
+        storage_key,
+        expires_in_seconds=EXPORT_URL_TTL_SECONDS,
+        content_disposition=f'attachment; filename="{filename}"',
+    )
+
+
+async def _run_export(
+    job_id: str,
+    tenant_id: int,
+    module: str,
+    export_format: str,
+    user_id: Optional[int],
+) -> dict[str, Any]:
+    from src.domain.models.user import User
+    from src.domain.services.export_center_service import ExportCenterService
+    from src.infrastructure.storage import storage_service
+
+    async with async_session_maker() as session:
+        user = None
+        if user_id is not None:
+            user = (
+                await session.execute(select(User).options(selectinload(User.roles)).where(User.id == user_id))
+            ).scalar_one_or_none()
+        with tempfile.TemporaryDirectory(prefix="export-") as scratch:
+            result = await ExportCenterService(session).write_export(
+                tenant_id, module, export_format, Path(scratch), user=user
+            )
+            storage_key = export_storage_key(tenant_id, job_id, result.filename)
+            await storage_service().upload_file(
+                storage_key,
+                result.path,
+                result.media_type,
+                metadata={"tenant_id": str(tenant_id), "module": result.module, "rows": str(result.row_count)},
+            )
+
+    logger.info(
+        "Export job %s: %s %s, %d rows -> %s",
+        job_id,
+        result.module,
+        export_format,
+        result.row_count,
+        storage_key,
+    )
+    return {
+        "status": "completed",
+        "tenant_id": tenant_id,
+        "user_id": user_id,
+        "module": result.module,
+        "format": export_format,
+        "filename": result.filename,
+        "media_type": result.media_type,
+        "row_count": result.row_count,
+        "storage_key": storage_key,
+        "download_url": export_download_url(storage_key, result.filename),
+        "expires_in_seconds": EXPORT_URL_TTL_SECONDS,
+    }
+
+
+@celery_app.task(
+    name="src.infrastructure.tasks.export_tasks.run_export_job",
+    bind=True,
+    queue="reports",
+    max_retries=2,
+    soft_time_limit=3300,
+    time_limit=3600,
+)
+def run_export_job(
+    self,
+    tenant_id: int,
+    module: str,
+    export_format: str = "csv",
+    user_id: Optional[int] = None,
+) -> dict[str, Any]:
+    """Write a full module export to blob storage and return its signed URL."""
+    from src.domain.exceptions import BadRequestError
+
+    try:
+        return asyncio.run(_run_export(self.request.id, tenant_id, module, export_format, user_id))
+    except BadRequestError:
+        raise
+    except Exception as exc:
+        logger.exception("Export job %s failed", self.request.id)
+        raise self.retry(exc=exc, countdown=30)
@@ -7,7 +7,7 @@ scanned and draft defect records are auto-created for governance review.
 
 import logging
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Optional
 
 from src.core.config import settings
 from src.infrastructure.tasks.celery_app import celery_app
@@ -78,6 +78,8 @@ def _sync_table(
                 else []
             )
             cache_index = {row.pams_id: row for row in existing_cache_rows}
+            scanner = _FailScanner()
+            synced: list[tuple[int, dict[str, Any]]] = []
 
             for row in pams_rows:
                 row_dict = {k: _safe_serialize(v) for k, v in dict(row).items()}
@@ -96,12 +98,11 @@ def _sync_table(
                     db.add(cache_row)
 
                 rows_synced += 1
+                synced.append((pams_id, row_dict))
 
-                detected = _auto_detect_defects(row_dict, pams_id, table_name, defect_cls, db)
-                defects_detected += detected
-
-                _upsert_vehicle_registry(row_dict, table_name, defect_cls, db)
+                _upsert_vehicle_registry(row_dict, table_name, defect_cls, db, scanner)
 
+            defects_detected = _auto_detect_defects(synced, table_name, defect_cls, db, scanner)
             db.commit()
         except Exception:
             db.rollback()
@@ -153,6 +154,7 @@ def _upsert_vehicle_registry(
     table_name: str,
     defect_cls: type,
     db: Any,
+    scanner: Optional["_FailScanner"] = None,
 ) -> None:
     """Create or update a VehicleRegistry row from a PAMS checklist record."""
     from src.domain.models.vehicle_registry import ComplianceStatus, FleetStatus, VehicleRegistry
@@ -179,12 +181,7 @@ def _upsert_vehicle_registry(
     if table_name == "vanchecklist":
         if check_dt and (entry.last_daily_check_at is None or check_dt > entry.last_daily_check_at):
             entry.last_daily_check_at = check_dt
-            all_pass = not any(
-                str(v).strip().lower() in FAIL_VALUES
-                for k, v in row_dict.items()
-                if k not in _SKIP_KEYS_FOR_PASS and v is not None
-            )
-            entry.last_daily_check_pass = all_pass
+            entry.last_daily_check_pass = not (scanner or _FailScanner()).failures(row_dict)
     elif table_name == "vanchecklistmonthly":
         if check_dt and (entry.last_monthly_check_at is None or check_dt > entry.last_monthly_check_at):
             entry.last_monthly_check_at = check_dt
@@ -204,7 +201,7 @@ def _upsert_vehicle_registry(
         .filter(
             defect_cls.vehicle_reg == vehicle_reg,
             defect_cls.priority.in_(["P1", "P2"]),
-            defect_cls.status.in_(["open", "auto_detected", "acknowledged", "action_assigned"]),
+            defect_cls.status.in_(OPEN_DEFECT_STATUSES),
         )
         .count()
     )
@@ -214,53 +211,8 @@ def _upsert_vehicle_registry(
         entry.compliance_status = ComplianceStatus.COMPLIANT
 
 
-_SKIP_KEYS_FOR_PASS = {
-    "id",
-    "ID",
-    "inc_id",
-    "created_at",
-    "updated_at",
-    "date",
-    "driver",
-    "vehicle",
-    "registration",
-    "reg",
-    "VehicleReg",
-    "DriverName",
-    "DateSubmitted",
-    "userName",
-    "vanID",
-    "vanReg",
-    "startTimeDate",
-    "endTimeDate",
-    "technician",
-    "comments",
-    "notes",
-    "mileage",
-    "Mileage",
-    "bodyWorkDamage",
-    "defects",
-    "uploaded",
-    "roadTaxExpiryDate",
-    "toolingCalibrationExpiryDate",
-    "fireExtinguisherExpiryDate",
-}
-
-FAIL_VALUES = {"fail", "no", "0", "false", "failed", "n"}
-
-
-def _auto_detect_defects(
-    row_dict: dict[str, Any],
-    pams_id: int,
-    table_name: str,
-    defect_cls: type,
-    db: Any,
-) -> int:
-    """Scan a row for pass/fail column values and auto-create draft defects."""
-    pams_table_label = "daily" if table_name == "vanchecklist" else "monthly"
-    detected = 0
-
-    skip_keys = {
+_SKIP_KEYS_FOR_PASS = frozenset(
+    {
         "id",
         "ID",
         "inc_id",
@@ -291,79 +243,151 @@ def _auto_detect_defects(
         "toolingCalibrationExpiryDate",
         "fireExtinguisherExpiryDate",
     }
+)
 
-    for col_name, col_value in row_dict.items():
-        if col_name in skip_keys:
-            continue
-        str_val = str(col_value).strip().lower() if col_value is not None else ""
-        if str_val not in FAIL_VALUES:
-            continue
+FAIL_VALUES = frozenset({"fail", "no", "0", "false", "failed", "n"})
 
-        existing_defect = (
-            db.query(defect_cls)
-            .filter(
-                defect_cls.pams_table == pams_table_label,
-                defect_cls.pams_record_id == pams_id,
-                defect_cls.check_field == col_name,
-                defect_cls.status.in_(["open", "auto_detected", "acknowledged", "action_assigned"]),
-            )
-            .first()
+OPEN_DEFECT_STATUSES = ("open", "auto_detected", "acknowledged", "action_assigned")
+
+# Rows per INSERT when writing auto-detected defects, and record ids per
+# open-defect lookup.
+DEFECT_INSERT_BATCH = 1000
+
+
+class _FailScanner:
+    """Pass/fail column matching, set up once per sync.
+
+    Rows from one PAMS table share a column layout, so the columns worth
+    checking are worked out once per layout; string answers come from a small
+    vocabulary ("Pass", "Fail", "Yes", ...), so each distinct one is
+    normalised and looked up once.
+    """
+
+    _MAX_CACHED_VALUES = 10_000
+
+    def __init__(self, skip_keys: frozenset[str] = _SKIP_KEYS_FOR_PASS, fail_values: frozenset[str] = FAIL_VALUES):
+        self._skip_keys = skip_keys
+        self._fail_values = fail_values
+        self._checked: dict[tuple[str, ...], tuple[str, ...]] = {}
+        self._string_verdicts: dict[str, bool] = {}
+
+    def failures(self, row_dict: dict[str, Any]) -> list[tuple[str, Any]]:
+        """(column, value) for each checked column whose value reads as a fail."""
+        layout = tuple(row_dict)
+        columns = self._checked.get(layout)
+        if columns is None:
+            columns = self._checked[layout] = tuple(key for key in layout if key not in self._skip_keys)
+        failed: list[tuple[str, Any]] = []
+        for column in columns:
+            value = row_dict[column]
+            if value is None:
+                continue
+            if type(value) is str:
+                verdict = self._string_verdicts.get(value)
+                if verdict is None:
+                    verdict = value.strip().lower() in self._fail_values
+                    if len(self._string_verdicts) < self._MAX_CACHED_VALUES:
+                        self._string_verdicts[value] = verdict
+            else:
+                verdict = str(value).strip().lower() in self._fail_values
+            if verdict:
+                failed.append((column, value))
+        return failed
+
+
+def _auto_detect_defects(
+    rows: list[tuple[int, dict[str, Any]]],
+    table_name: str,
+    defect_cls: type,
+    db: Any,
+    scanner: Optional[_FailScanner] = None,
+) -> int:
+    """Create draft defects for every failed check in a batch of synced rows.
+
+    A (record, check) pair that already has an open defect is skipped. The open
+    pairs for the failing records come from one query per ``DEFECT_INSERT_BATCH``
+    record ids rather than one per failure, so the cost follows the batch, not
+    the table's open-defect backlog. New defects are inserted in bulk, then
+    CAPAs for any P1/P2 among them.
+    """
+    from sqlalchemy import insert, select
+
+    pams_table_label = "daily" if table_name == "vanchecklist" else "monthly"
+    scanner = scanner or _FailScanner()
+
+    failures = [
+        (pams_id, row_dict, column, value) for pams_id, row_dict in rows for column, value in scanner.failures(row_dict)
+    ]
+    if not failures:
+        return 0
+
+    failing_ids = sorted({pams_id for pams_id, _row, _column, _value in failures})
+    open_pairs: set[tuple[int, str]] = set()
+    for start in range(0, len(failing_ids), DEFECT_INSERT_BATCH):
+        open_pairs.update(
+            db.execute(
+                select(defect_cls.pams_record_id, defect_cls.check_field).where(
+                    defect_cls.pams_table == pams_table_label,
+                    defect_cls.status.in_(OPEN_DEFECT_STATUSES),
+                    defect_cls.pams_record_id.in_(failing_ids[start : start + DEFECT_INSERT_BATCH]),
+                )
+            ).all()
         )
-        if existing_defect:
-            continue
 
-        vehicle_reg = str(
-            row_dict.get("vanID")
-            or row_dict.get("vanReg")
-            or row_dict.get("registration")
-            or row_dict.get("reg")
-            or row_dict.get("VehicleReg")
-            or ""
-        ).strip()
-
-        defect = defect_cls(
-            pams_table=pams_table_label,
-            pams_record_id=pams_id,
-            check_field=col_name,
-            check_value=str(col_value),
-            priority="P3",
-            status="auto_detected",
-            notes="Auto-detected during PAMS sync",
-            vehicle_reg=vehicle_reg,
+    new_defects: list[dict[str, Any]] = []
+    for pams_id, row_dict, column, value in failures:
+        if (pams_id, column) in open_pairs:
+            continue
+        open_pairs.add((pams_id, column))
+        new_defects.append(
+            {
+                "pams_table": pams_table_label,
+                "pams_record_id": pams_id,
+                "check_field": column,
+                "check_value": str(value),
+                "priority": "P3",
+                "status": "auto_detected",
+                "notes": "Auto-detected during PAMS sync",
+                "vehicle_reg": str(
+                    row_dict.get("vanID")
+                    or row_dict.get("vanReg")
+                    or row_dict.get("registration")
+                    or row_dict.get("reg")
+                    or row_dict.get("VehicleReg")
+                    or ""
+                ).strip(),
+            }
         )
-        db.add(defect)
-        db.flush()
-        detected += 1
+    if not new_defects:
+        return 0
 
-        _auto_create_capa_for_defect(defect, vehicle_reg, col_name, str(col_value), db)
+    statement = insert(defect_cls).returning(defect_cls.id, sort_by_parameter_order=True)
+    for start in range(0, len(new_defects), DEFECT_INSERT_BATCH):
+        batch = new_defects[start : start + DEFECT_INSERT_BATCH]
+        for defect, defect_id in zip(batch, db.scalars(statement, batch).all()):
+            defect["id"] = defect_id
 
-    return detected
+    _auto_create_capas_for_defects([defect for defect in new_defects if defect["priority"] in ("P1", "P2")], db)
+    return len(new_defects)
 
 
-def _auto_create_capa_for_defect(
-    defect: Any,
-    vehicle_reg: str,
-    check_field: str,
-    check_value: str,
-    db: Any,
-) -> None:
-    """Auto-create a CAPA action for P1/P2 defects during sync."""
-    priority = getattr(defect, "priority", "P3")
-    if priority not in ("P1", "P2"):
+def _auto_create_capas_for_defects(defects: list[dict[str, Any]], db: Any) -> None:
+    """Auto-create CAPA actions for newly detected P1/P2 defects during sync."""
+    if not defects:
         return
     try:
-        from src.domain.services.vehicle_capa_pipeline import create_capa_from_defect_sync
+        from src.domain.services.vehicle_capa_pipeline import create_capas_from_defects_sync
 
-        create_capa_from_defect_sync(
-            defect_id=defect.id,
-            defect_priority=priority,
-            vehicle_reg=vehicle_reg,
-            check_field=check_field,
-            check_value=check_value,
-            db=db,
-        )
+        # A savepoint, so a CAPA failure leaves the defects and the sync intact.
+        with db.begin_nested():
+            create_capas_from_defects_sync(defects, db=db)
     except Exception:
-        logger.warning("Failed to auto-create CAPA for defect %s", defect.id, exc_info=True)
+        logger.warning(
+            "Failed to auto-create CAPAs for %d defect(s) %s",
+            len(defects),
+            [defect["id"] for defect in defects[:20]],
+            exc_info=True,
+        )
 
 
 def _safe_serialize(v: Any) -> Any:
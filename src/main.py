@@ -11,16 +11,20 @@ from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from pythonjsonlogger import jsonlogger
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.middleware import Middleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.api import router as api_router
 from src.api.middleware.audit_middleware import AuditLoggingMiddleware
 from src.api.middleware.error_handler import register_exception_handlers
 from src.api.middleware.idempotency import IdempotencyMiddleware
 from src.core.config import settings
-from src.core.middleware import RequestStateMiddleware
+from src.core.middleware import RequestPipeline, RequestStateMiddleware
 from src.core.uat_safety import UATSafetyMiddleware
+from src.domain.services.document_extraction_executor import shutdown_document_extraction_executor
 from src.infrastructure.database import close_db, emit_db_pool_usage_metric, init_db
+from src.infrastructure.middleware.decrypt_memo import DecryptMemoMiddleware
 from src.infrastructure.middleware.request_logger import RequestLoggerMiddleware
 from src.infrastructure.middleware.tenant_context import TenantContextMiddleware
 from src.infrastructure.monitoring.azure_monitor import setup_telemetry
@@ -132,52 +136,69 @@ class FlagAwareOpenAPI(FastAPI):
         return schema
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+# Security headers for every response; values are fixed, so they are encoded once.
+_SECURITY_HEADERS = {
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "0",
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    "Permissions-Policy": "geolocation=(), microphone=(), camera=()",
+    "Cross-Origin-Opener-Policy": "same-origin",
+    "Content-Security-Policy": (
+        "default-src 'self'; "
+        "script-src 'self'; "
+        "style-src 'self' 'unsafe-inline'; "
+        "img-src 'self' data: blob:; "
+        "font-src 'self'; "
+        "connect-src 'self'; "
+        "frame-ancestors 'none'; "
+        "base-uri 'self'; "
+        "form-action 'self'"
+    ),
+}
+
+
+class SecurityHeadersMiddleware:
     """Add security headers to all responses."""
 
-    async def dispatch(self, request: Request, call_next):
-        response: Response = await call_next(request)
-
-        # Security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "0"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-        response.headers["Cross-Origin-Opener-Policy"] = "same-origin"
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
         # Default: lock resources to same-origin. Public liveness/readiness paths
         # use cross-origin so SWA (different site) can warm up without ORB/CORP blocks.
-        response.headers["Cross-Origin-Resource-Policy"] = "same-origin"
-        path = request.url.path
+        resource_policy = "same-origin"
         if (
             path in ("/healthz", "/readyz", "/health", "/.well-known/security.txt")
             or path.startswith("/api/v1/health/")
             or path.startswith("/api/v1/meta/")
             or path.startswith("/api/v1/privacy/")
         ):
-            response.headers["Cross-Origin-Resource-Policy"] = "cross-origin"
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data: blob:; "
-            "font-src 'self'; "
-            "connect-src 'self'; "
-            "frame-ancestors 'none'; "
-            "base-uri 'self'; "
-            "form-action 'self'"
-        )
-
+            resource_policy = "cross-origin"
         # Cache control for security
-        if "/api/" in request.url.path:
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
-            response.headers["Pragma"] = "no-cache"
+        no_store = "/api/" in path
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in _SECURITY_HEADERS.items():
+                    headers[name] = value
+                headers["Cross-Origin-Resource-Policy"] = resource_policy
+                if no_store:
+                    headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
+                    headers["Pragma"] = "no-cache"
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
     Rate limiting middleware using sophisticated per-endpoint limits.
 
@@ -189,10 +210,30 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     - Different limits for authenticated vs anonymous users
     """
 
-    async def dispatch(self, request: Request, call_next):
-        from src.infrastructure.middleware.rate_limiter import rate_limit_middleware
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        return await rate_limit_middleware(request, call_next)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        from src.infrastructure.middleware.rate_limiter import evaluate_rate_limit
+
+        rejection, rate_headers = await evaluate_rate_limit(Request(scope))
+        if rejection is not None:
+            await rejection(scope, receive, send)
+            return
+        if not rate_headers:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_limits(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(rate_headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_limits)
 
 
 @asynccontextmanager
@@ -281,6 +322,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             pass
     await close_pams()
     await close_db()
+    shutdown_document_extraction_executor()
 
 
 def configure_logging():
@@ -421,35 +463,34 @@ def create_application() -> FastAPI:
 
     setup_telemetry(app=app)
 
-    # GZip compression — outermost so all responses are compressed
-    app.add_middleware(GZipMiddleware, minimum_size=500)
-
-    # Add Request State Middleware (must be first for request_id propagation)
-    app.add_middleware(RequestStateMiddleware)
-
-    # Add UAT Safety Middleware (production read-only mode)
-    # Must be early in stack to block writes before they reach handlers
-    app.add_middleware(UATSafetyMiddleware)
-
-    # Tenant RLS context (after RequestState so request.state exists).
-    # Does not SET LOCAL on a throwaway session — GUC bind happens on the
-    # real get_db session after auth resolves tenant (ContextVar + apply_tenant_guc).
-    app.add_middleware(TenantContextMiddleware)
-
-    # Add Security Headers Middleware
-    app.add_middleware(SecurityHeadersMiddleware)
-
-    # Request logging (method, path, status, latency)
-    app.add_middleware(RequestLoggerMiddleware)
-
-    # Add Rate Limiting Middleware (uses per-endpoint configurable limits)
-    app.add_middleware(RateLimitMiddleware)
-
-    # Add Idempotency Middleware (caches POST responses by Idempotency-Key header)
-    app.add_middleware(IdempotencyMiddleware)
-
-    # Add Audit Logging Middleware (logs POST/PUT/PATCH/DELETE with PII masking)
-    app.add_middleware(AuditLoggingMiddleware)
+    # The application's own middleware as one pure-ASGI pipeline, outermost
+    # first; CORS, registered below, wraps it.
+    app.add_middleware(
+        RequestPipeline,
+        stages=[
+            # Logs POST/PUT/PATCH/DELETE with PII masking, after the response is sent
+            Middleware(AuditLoggingMiddleware),
+            # Caches POST/PUT/PATCH responses by Idempotency-Key header
+            Middleware(IdempotencyMiddleware),
+            # Per-endpoint configurable limits
+            Middleware(RateLimitMiddleware),
+            # Request logging (method, path, status, latency)
+            Middleware(RequestLoggerMiddleware),
+            Middleware(SecurityHeadersMiddleware),
+            # Tenant RLS context. Does not SET LOCAL on a throwaway session — GUC
+            # bind happens on the real get_db session after auth resolves tenant
+            # (ContextVar + apply_tenant_guc).
+            Middleware(TenantContextMiddleware),
+            # Production read-only mode: blocks writes before they reach handlers
+            Middleware(UATSafetyMiddleware),
+            # request_id, authenticated user id and audit client context on request.state
+            Middleware(RequestStateMiddleware),
+            # Per-request EncryptedString decryption memo (field_decrypt_memo_enabled)
+            Middleware(DecryptMemoMiddleware),
+            # Innermost, so it compresses handler output only
+            Middleware(GZipMiddleware, minimum_size=500),
+        ],
+    )
 
     # Configure CORS - explicit allowlist + regex for our own SWA environments.
     #
@@ -491,6 +532,7 @@ def create_application() -> FastAPI:
             "X-RateLimit-Remaining",
             "X-RateLimit-Reset",
             "Retry-After",
+            "Server-Timing",
         ],
         max_age=86400,  # Cache preflight for 24 hours
     )
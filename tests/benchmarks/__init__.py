@@ -0,0 +1 @@
+"""In-process service benchmarks (opt-in, ``--benchmarks``)."""
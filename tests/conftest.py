@@ -367,6 +367,31 @@ def generate_test_reference(prefix: str = "TEST") -> str:
 # ============================================================================
 
 
+def pytest_addoption(parser):
+    """Options for the opt-in service benchmarks (tests/benchmarks/conftest.py)."""
+    group = parser.getgroup("benchmarks", "service-layer benchmarks")
+    group.addoption("--benchmarks", action="store_true", default=False, help="run tests/benchmarks")
+    group.addoption(
+        "--bench-scale",
+        default="large",
+        choices=("smoke", "medium", "large"),
+        help="synthetic tenant size (tests/factories/large_tenant.py)",
+    )
+    group.addoption(
+        "--bench-database-url",
+        default=os.environ.get("BENCH_DATABASE_URL", ""),
+        help="async URL of a local PostgreSQL to benchmark on (default: a SQLite file)",
+    )
+    group.addoption("--bench-rounds", type=int, default=5, help="timed rounds per benchmark, after one warm-up")
+    group.addoption(
+        "--bench-threshold",
+        type=float,
+        default=0.25,
+        help="fail when a median exceeds its baseline by more than this fraction",
+    )
+    group.addoption("--bench-save", action="store_true", default=False, help="write this run's medians as baselines")
+
+
 def pytest_configure(config):
     """Configure custom pytest markers."""
     config.addinivalue_line("markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')")
@@ -14,9 +14,11 @@ from tests.factories.core import (
     GOLDEN_INCIDENT,
     GOLDEN_RISK,
     GOLDEN_RTA,
+    AuditLogEntryFactory,
     AuditTemplateFactory,
     CAPAActionFactory,
     ComplaintFactory,
+    DocumentFactory,
     IncidentActionFactory,
     IncidentFactory,
     NearMissFactory,
@@ -41,6 +43,8 @@ __all__ = [
     "PolicyFactory",
     "RTAFactory",
     "RTAActionFactory",
+    "DocumentFactory",
+    "AuditLogEntryFactory",
     "GOLDEN_INCIDENT",
     "GOLDEN_RISK",
     "GOLDEN_RTA",
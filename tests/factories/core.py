@@ -16,8 +16,11 @@ import factory
 from src.domain.models.audit import AuditFinding as AuditFindingModel
 from src.domain.models.audit import AuditRun as AuditRunModel
 from src.domain.models.audit import AuditTemplate
+from src.domain.models.audit_log import AuditLogEntry
 from src.domain.models.capa import CAPAAction
 from src.domain.models.complaint import Complaint
+from src.domain.models.document import Document, FileType
+from src.domain.models.enums import DocumentStatus
 from src.domain.models.evidence_asset import EvidenceAsset
 from src.domain.models.external_audit_import import ExternalAuditImportJob
 from src.domain.models.incident import ActionStatus, Incident, IncidentAction
@@ -459,3 +462,44 @@ class ExternalAuditImportJobFactory(factory.Factory):
     tenant_id = 1
     created_at = factory.LazyFunction(_fixed_ts)
     updated_at = factory.LazyFunction(_fixed_ts)
+
+
+# ---------------------------------------------------------------------------
+# Document
+# ---------------------------------------------------------------------------
+
+
+class DocumentFactory(factory.Factory):
+    class Meta:
+        model = Document
+
+    title = factory.Sequence(lambda n: f"Test Document {n}")
+    description = factory.Sequence(lambda n: f"Document description for item {n}.")
+    reference_number = _ref("DOC")
+    file_name = factory.Sequence(lambda n: f"document-{n}.pdf")
+    file_type = FileType.PDF
+    file_size = 102400
+    file_path = factory.Sequence(lambda n: f"documents/document-{n}.pdf")
+    status = DocumentStatus.INDEXED
+    tenant_id = 1
+    created_at = factory.LazyFunction(_fixed_ts)
+    updated_at = factory.LazyFunction(_fixed_ts)
+
+
+# ---------------------------------------------------------------------------
+# Audit Log Entry
+# ---------------------------------------------------------------------------
+
+
+class AuditLogEntryFactory(factory.Factory):
+    """Chain fields (sequence, hashes) are the caller's: they depend on the predecessor."""
+
+    class Meta:
+        model = AuditLogEntry
+
+    entity_type = "incident"
+    entity_id = factory.Sequence(lambda n: str(n + 1))
+    action = "update"
+    action_category = "data"
+    tenant_id = 1
+    timestamp = factory.LazyFunction(lambda: FIXED_EPOCH.replace(tzinfo=None))
@@ -0,0 +1,364 @@
+"""Deterministic synthetic tenant at benchmark scale.
+
+Each model's row template comes from its factory in :mod:`tests.factories.core`
+(one ``.build()``), so defaults stay in one place. The generator varies the
+templates with a seeded RNG and writes them with bulk Core inserts, because a
+million ORM flushes would take longer than the benchmarks that read them. The
+same scale and seed give the same rows on SQLite and PostgreSQL.
+
+Usage:
+
+    from tests.factories.large_tenant import TENANT_SCALES, generate_tenant
+
+    await generate_tenant(engine, TENANT_SCALES["smoke"])
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterator
+
+import factory
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.domain.models.audit import AuditFinding, AuditRun, AuditTemplate
+from src.domain.models.audit_log import AuditLogEntry
+from src.domain.models.capa import CAPAAction, CAPAPriority, CAPAStatus, CAPAType
+from src.domain.models.document import Document, FileType
+from src.domain.models.enums import DocumentStatus
+from src.domain.models.incident import ActionStatus, Incident, IncidentAction, IncidentSeverity, IncidentStatus
+from src.domain.models.risk import Risk
+from src.domain.models.tenant import Tenant
+from src.domain.models.user import User
+from tests.factories.core import (
+    FIXED_EPOCH,
+    AuditFindingFactory,
+    AuditLogEntryFactory,
+    AuditRunFactory,
+    AuditTemplateFactory,
+    CAPAActionFactory,
+    DocumentFactory,
+    IncidentActionFactory,
+    IncidentFactory,
+    RiskFactory,
+    TenantFactory,
+    UserFactory,
+)
+
+TENANT_ID = 1
+USER_ID = 1
+# Records are spread over the year before FIXED_EPOCH.
+SPAN_DAYS = 365
+INSERT_BATCH = 10_000
+
+HAZARDS = (
+    "slip on wet floor",
+    "hydraulic oil leak",
+    "manual handling strain",
+    "scaffold tag missing",
+    "forklift near miss",
+    "cable strike",
+    "dust exposure",
+    "noise above action level",
+    "guard removed from grinder",
+    "working at height without harness",
+)
+SITES = ("Depot North", "Depot South", "Yard 3", "Plant Room", "Compound B", "Workshop")
+CLAUSES = ("4.1", "5.2", "6.1", "7.2", "7.3", "7.5", "8.1", "8.5", "9.1", "9.2", "10.2")
+STANDARDS = ("9001", "14001", "45001")
+
+
+@dataclass(frozen=True)
+class TenantScale:
+    """Row counts for one synthetic tenant; the defaults are a large tenant."""
+
+    incidents: int = 100_000
+    actions: int = 50_000  # four incident actions to every CAPA
+    documents: int = 20_000
+    audit_log_entries: int = 1_000_000
+    audit_findings: int = 2_000
+    risks: int = 1_000
+
+    def scaled(self, factor: float) -> "TenantScale":
+        return TenantScale(**{f.name: max(1, int(getattr(self, f.name) * factor)) for f in fields(self)})
+
+
+TENANT_SCALES = {
+    "large": TenantScale(),
+    "medium": TenantScale().scaled(0.1),
+    "smoke": TenantScale().scaled(0.01),
+}
+
+
+def _template(factory_cls: type[factory.Factory], **overrides: Any) -> dict[str, Any]:
+    """Column values of one factory build, minus the primary key and unset columns."""
+    instance = factory_cls.build(**overrides)
+    table = sa.inspect(instance).mapper.local_table
+    row = {}
+    for attr in sa.inspect(instance).mapper.column_attrs:
+        value = getattr(instance, attr.key)
+        column = attr.columns[0]
+        if column.primary_key or value is None or column.table is not table:
+            continue
+        row[column.key] = _fit(column, value)
+    return row
+
+
+def _fit(column: sa.Column, value: Any) -> Any:
+    """Naive UTC for ``TIMESTAMP WITHOUT TIME ZONE`` columns (asyncpg rejects aware values)."""
+    if isinstance(value, datetime) and isinstance(column.type, sa.DateTime) and not column.type.timezone:
+        return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+    return value
+
+
+def _stamper(model: type) -> Callable[[str, datetime], datetime]:
+    table = sa.inspect(model).local_table
+
+    def stamp(column: str, value: datetime) -> datetime:
+        return _fit(table.c[column], value)
+
+    return stamp
+
+
+def _when(rng: random.Random) -> datetime:
+    return FIXED_EPOCH - timedelta(minutes=rng.randrange(SPAN_DAYS * 24 * 60))
+
+
+def _text(rng: random.Random) -> tuple[str, str]:
+    hazard, site = rng.choice(HAZARDS), rng.choice(SITES)
+    return f"{hazard.capitalize()} at {site}", f"Reported {hazard} at {site}; area made safe and supervisor informed."
+
+
+def _incidents(rng: random.Random, count: int) -> Iterator[dict[str, Any]]:
+    template = _template(IncidentFactory, tenant_id=TENANT_ID)
+    stamp = _stamper(Incident)
+    severities, statuses = list(IncidentSeverity), list(IncidentStatus)
+    for n in range(count):
+        title, description = _text(rng)
+        occurred = _when(rng)
+        status = statuses[n % len(statuses)]
+        yield {
+            **template,
+            "reference_number": f"INC-{n + 1:07d}",
+            "title": title,
+            "description": description,
+            "severity": severities[n % len(severities)],
+            "status": status,
+            "incident_date": stamp("incident_date", occurred),
+            "reported_date": stamp("reported_date", occurred + timedelta(hours=2)),
+            "closed_at": stamp("closed_at", occurred + timedelta(days=7)) if status == IncidentStatus.CLOSED else None,
+            "created_at": stamp("created_at", occurred),
+            "updated_at": stamp("updated_at", occurred),
+        }
+
+
+def _incident_actions(rng: random.Random, count: int, incidents: int) -> Iterator[dict[str, Any]]:
+    template = _template(IncidentActionFactory)
+    stamp = _stamper(IncidentAction)
+    statuses = list(ActionStatus)
+    for n in range(count):
+        title, description = _text(rng)
+        created = _when(rng)
+        yield {
+            **template,
+            "tenant_id": TENANT_ID,
+            "incident_id": 1 + n % incidents,
+            "reference_number": f"ACT-{n + 1:07d}",
+            "title": f"Remediate: {title}",
+            "description": description,
+            "status": statuses[n % len(statuses)],
+            "created_at": stamp("created_at", created),
+            "updated_at": stamp("updated_at", created),
+        }
+
+
+def _capa_actions(rng: random.Random, count: int) -> Iterator[dict[str, Any]]:
+    template = _template(
+        CAPAActionFactory,
+        tenant_id=TENANT_ID,
+        created_by_id=USER_ID,
+        capa_type=CAPAType.CORRECTIVE,
+        status=CAPAStatus.OPEN,
+        priority=CAPAPriority.MEDIUM,
+    )
+    stamp = _stamper(CAPAAction)
+    statuses, priorities = list(CAPAStatus), list(CAPAPriority)
+    for n in range(count):
+        title, description = _text(rng)
+        created = _when(rng)
+        yield {
+            **template,
+            "reference_number": f"CAPA-{n + 1:07d}",
+            "title": f"Corrective action: {title}",
+            "description": description,
+            "status": statuses[n % len(statuses)],
+            "priority": priorities[n % len(priorities)],
+            "iso_standard": STANDARDS[n % len(STANDARDS)],
+            "clause_reference": rng.choice(CLAUSES),
+            "due_date": stamp("due_date", created + timedelta(days=30)),
+            "created_at": stamp("created_at", created),
+        }
+
+
+def _audit_runs(count: int) -> Iterator[dict[str, Any]]:
+    template = _template(AuditRunFactory, tenant_id=TENANT_ID, template_id=1)
+    for n in range(count):
+        yield {**template, "reference_number": f"AUD-{n + 1:07d}", "title": f"Site inspection {n + 1}"}
+
+
+def _audit_findings(rng: random.Random, count: int, runs: int) -> Iterator[dict[str, Any]]:
+    template = _template(AuditFindingFactory, tenant_id=TENANT_ID)
+    stamp = _stamper(AuditFinding)
+    for n in range(count):
+        title, description = _text(rng)
+        created = _when(rng)
+        yield {
+            **template,
+            "run_id": 1 + n % runs,
+            "reference_number": f"FND-{n + 1:07d}",
+            "title": title,
+            "description": description,
+            "status": "closed" if n % 3 == 0 else "open",
+            "clause_ids_json_legacy": [rng.choice(CLAUSES)],
+            "created_at": stamp("created_at", created),
+            "updated_at": stamp("updated_at", created),
+        }
+
+
+def _risks(rng: random.Random, count: int) -> Iterator[dict[str, Any]]:
+    template = _template(RiskFactory, tenant_id=TENANT_ID)
+    for n in range(count):
+        title, description = _text(rng)
+        likelihood, impact = 1 + n % 5, 1 + (n // 5) % 5
+        yield {
+            **template,
+            "reference_number": f"RSK-{n + 1:07d}",
+            "title": f"Risk of {title.lower()}",
+            "description": description,
+            "likelihood": likelihood,
+            "impact": impact,
+            "risk_score": likelihood * impact,
+        }
+
+
+def _documents(rng: random.Random, count: int) -> Iterator[dict[str, Any]]:
+    template = _template(DocumentFactory, tenant_id=TENANT_ID)
+    stamp = _stamper(Document)
+    file_types = (FileType.PDF, FileType.DOCX, FileType.XLSX)
+    for n in range(count):
+        hazard, site = rng.choice(HAZARDS), rng.choice(SITES)
+        created = _when(rng)
+        file_type = file_types[n % len(file_types)]
+        yield {
+            **template,
+            "reference_number": f"DOC-{n + 1:07d}",
+            "title": f"Safe system of work: {hazard} ({site})",
+            "description": f"Controls for {hazard} at {site}.",
+            "file_name": f"ssow-{n + 1}.{file_type.value}",
+            "file_type": file_type,
+            "file_path": f"documents/{TENANT_ID}/ssow-{n + 1}.{file_type.value}",
+            "file_size": 20_000 + n % 500_000,
+            "status": DocumentStatus.INDEXED,
+            "created_at": stamp("created_at", created),
+            "updated_at": stamp("updated_at", created),
+        }
+
+
+def _audit_log(rng: random.Random, count: int) -> Iterator[dict[str, Any]]:
+    """A valid hash chain, oldest first, as :meth:`AuditLogService.log` would write it."""
+    template = _template(AuditLogEntryFactory, tenant_id=TENANT_ID)
+    start = FIXED_EPOCH.replace(tzinfo=None) - timedelta(days=SPAN_DAYS)
+    step = timedelta(days=SPAN_DAYS) / max(1, count)
+    previous_hash = "0" * 64
+    for sequence in range(1, count + 1):
+        entity_id = str(rng.randrange(1, 100_000))
+        timestamp = start + step * sequence
+        old_values = {"status": "reported"}
+        new_values = {"status": "under_investigation"}
+        entry_hash = AuditLogEntry.compute_hash(
+            sequence=sequence,
+            previous_hash=previous_hash,
+            entity_type="incident",
+            entity_id=entity_id,
+            action="update",
+            user_id=USER_ID,
+            timestamp=timestamp,
+            old_values=old_values,
+            new_values=new_values,
+        )
+        yield {
+            **template,
+            "sequence": sequence,
+            "entry_hash": entry_hash,
+            "previous_hash": previous_hash,
+            "entity_id": entity_id,
+            "old_values": old_values,
+            "new_values": new_values,
+            "changed_fields": ["status"],
+            "user_id": USER_ID,
+            "timestamp": timestamp,
+        }
+        previous_hash = entry_hash
+
+
+async def _insert(conn: AsyncConnection, model: type, rows: Iterator[dict[str, Any]]) -> None:
+    table = sa.inspect(model).local_table
+    batch: list[dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == INSERT_BATCH:
+            await conn.execute(sa.insert(table), batch)
+            batch = []
+    if batch:
+        await conn.execute(sa.insert(table), batch)
+
+
+async def generate_tenant(engine: AsyncEngine, scale: TenantScale, *, seed: int = 50) -> None:
+    """Write one tenant at ``scale`` into an empty schema (tenant and user id 1)."""
+    rng = random.Random(seed)
+    capa_count = max(1, scale.actions // 5)
+    runs = max(1, scale.audit_findings // 20)
+    async with engine.begin() as conn:
+        tenant = _template(TenantFactory, name="Benchmark Tenant", slug="benchmark-tenant")
+        await conn.execute(sa.insert(sa.inspect(Tenant).local_table), [{**tenant, "id": TENANT_ID}])
+        user = _template(UserFactory, email="bench@example.com", is_superuser=True)
+        await conn.execute(sa.insert(sa.inspect(User).local_table), [{**user, "id": USER_ID, "tenant_id": TENANT_ID}])
+        audit_template = _template(AuditTemplateFactory, tenant_id=TENANT_ID)
+        await conn.execute(sa.insert(sa.inspect(AuditTemplate).local_table), [{**audit_template, "id": 1}])
+
+        await _insert(conn, Incident, _incidents(rng, scale.incidents))
+        await _insert(conn, IncidentAction, _incident_actions(rng, scale.actions - capa_count, scale.incidents))
+        await _insert(conn, CAPAAction, _capa_actions(rng, capa_count))
+        await _insert(conn, AuditRun, _audit_runs(runs))
+        await _insert(conn, AuditFinding, _audit_findings(rng, scale.audit_findings, runs))
+        await _insert(conn, Risk, _risks(rng, scale.risks))
+        await _insert(conn, Document, _documents(rng, scale.documents))
+        await _insert(conn, AuditLogEntry, _audit_log(rng, scale.audit_log_entries))
+
+
+async def tenant_scale_of(engine: AsyncEngine) -> TenantScale | None:
+    """The scale already generated into ``engine``, or ``None`` when it holds no benchmark tenant."""
+    counts: dict[str, int] = {}
+    async with engine.connect() as conn:
+        for name, models in (
+            ("incidents", (Incident,)),
+            ("actions", (IncidentAction, CAPAAction)),
+            ("documents", (Document,)),
+            ("audit_log_entries", (AuditLogEntry,)),
+            ("audit_findings", (AuditFinding,)),
+            ("risks", (Risk,)),
+        ):
+            total = 0
+            for model in models:
+                table = sa.inspect(model).local_table
+                try:
+                    total += (await conn.execute(sa.select(sa.func.count()).select_from(table))).scalar_one()
+                except sa.exc.DBAPIError:
+                    return None
+            counts[name] = total
+    if not counts["incidents"]:
+        return None
+    return TenantScale(**counts)
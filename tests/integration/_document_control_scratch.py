@@ -35,6 +35,8 @@ import uuid
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
+from src.domain.services.schema_presence import invalidate_schema_catalogue
+
 # The seven document-control tables with no create migration, verified absent
 # from production. Listed child-first so the drops do not need CASCADE on a
 # backend that lacks it.
@@ -79,6 +81,9 @@ class ScratchDatabase:
         async with self.engine.begin() as conn:
             for name in names:
                 await conn.execute(sa.text(f"DROP TABLE IF EXISTS {name}{suffix}"))
+        # DDL outside a migration leaves the revision alone, so tell the cached
+        # catalogue behind absent_tables that these tables are gone.
+        invalidate_schema_catalogue()
 
     async def has_table(self, name: str) -> bool:
         async with self.engine.connect() as conn:
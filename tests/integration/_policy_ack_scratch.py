@@ -35,6 +35,8 @@ from datetime import datetime, timedelta, timezone
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
+from src.domain.services.schema_presence import invalidate_schema_catalogue
+
 BACKING_TABLE = "policy_acknowledgments"
 
 TENANT_ID = 1
@@ -51,6 +53,8 @@ class ScratchDatabase:
     async def drop_backing_table(self) -> None:
         async with self.engine.begin() as conn:
             await conn.execute(sa.text(f"DROP TABLE IF EXISTS {BACKING_TABLE}"))
+        # Not a migration, so the cached catalogue behind absent_tables must be told.
+        invalidate_schema_catalogue()
 
     async def has_backing_table(self) -> bool:
         async with self.engine.connect() as conn:
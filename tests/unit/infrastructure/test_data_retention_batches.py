@@ -0,0 +1,141 @@
+"""Retention purges in committed keyset batches and resumes where it stopped.
+
+SQLite is enough here: what is pinned is the batching arithmetic, the cursor's
+life cycle and the resume after a failure, none of which depend on how the
+server treats a failed statement (that is ``test_data_retention_sweep.py``).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+import sqlalchemy as sa
+
+import src.infrastructure.database as database_module
+from src.core.config import settings
+from src.domain.models.push_notification import NotificationLog
+from src.domain.models.retention_sweep_cursor import RetentionSweepCursor
+from src.domain.models.token_blacklist import TokenBlacklist
+from src.infrastructure.tasks import cleanup_tasks
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    engine = sa.create_engine(f"sqlite+pysqlite:///{tmp_path / 'retention.db'}")
+    for model in (NotificationLog, RetentionSweepCursor, TokenBlacklist):
+        model.__table__.create(engine)
+    monkeypatch.setattr(database_module, "sync_engine", engine)
+    monkeypatch.setattr(settings, "retention_batch_size", 3)
+    monkeypatch.setattr(settings, "retention_batch_pause_seconds", 0)
+    monkeypatch.setattr(
+        cleanup_tasks,
+        "RETENTION_RULES",
+        (
+            cleanup_tasks.RetentionRule("token_blacklist", "expires_at", operational_days=0),
+            cleanup_tasks.RetentionRule("notification_logs", "created_at", operational_days=90),
+        ),
+    )
+    yield engine
+    engine.dispose()
+
+
+def _seed_logs(engine, ages_in_days: list[int]) -> None:
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(
+            sa.text(
+                "INSERT INTO notification_logs (notification_type, title, channel, created_at) "
+                "VALUES ('push', :title, 'push', :created_at)"
+            ),
+            [
+                {"title": f"age-{age}-{n}", "created_at": now - timedelta(days=age)}
+                for n, age in enumerate(ages_in_days)
+            ],
+        )
+
+
+def _remaining_ages(engine) -> list[int]:
+    with engine.connect() as conn:
+        titles = conn.execute(sa.text("SELECT title FROM notification_logs ORDER BY id")).scalars().all()
+    return [int(title.split("-")[1]) for title in titles]
+
+
+def _cursors(engine) -> list:
+    with engine.connect() as conn:
+        return conn.execute(RetentionSweepCursor.__table__.select()).all()
+
+
+def test_expired_rows_go_in_batches_and_the_cursor_is_dropped(engine):
+    # Expired and recent rows interleaved, so batches are key ranges with survivors inside.
+    _seed_logs(engine, [200, 1, 120, 150, 2, 95, 400, 3, 91, 100, 5])
+
+    result = cleanup_tasks.run_data_retention.apply().get()
+
+    assert result["purged"]["notification_logs"] == 7
+    assert result["rows_per_second"]["notification_logs"] > 0
+    assert _remaining_ages(engine) == [1, 2, 3, 5]
+    assert _cursors(engine) == []
+
+
+def test_a_failed_pass_resumes_from_its_cursor_with_its_own_cutoff(engine, monkeypatch):
+    _seed_logs(engine, [200] * 7 + [10])
+    executed = {"batches": 0}
+    real_sleep = cleanup_tasks.time.sleep
+
+    def fail_after_two_batches(seconds: float) -> None:
+        executed["batches"] += 1
+        if executed["batches"] == 2:
+            raise RuntimeError("worker lost")
+        real_sleep(seconds)
+
+    monkeypatch.setattr(settings, "retention_batch_pause_seconds", 0.001)
+    monkeypatch.setattr(cleanup_tasks.time, "sleep", fail_after_two_batches)
+    first = cleanup_tasks.run_data_retention.apply().get()
+
+    assert first["purged"]["notification_logs"] == -1
+    assert _remaining_ages(engine) == [200, 10]
+    [cursor] = _cursors(engine)
+    assert cursor.table_name == "notification_logs" and cursor.rows_deleted == 6
+
+    # The next run's horizon would also take the 10-day row; the resumed pass must not.
+    monkeypatch.setattr(cleanup_tasks.time, "sleep", real_sleep)
+    monkeypatch.setattr(
+        cleanup_tasks,
+        "RETENTION_RULES",
+        (cleanup_tasks.RetentionRule("notification_logs", "created_at", operational_days=5),),
+    )
+    second = cleanup_tasks.run_data_retention.apply().get()
+
+    assert second["purged"]["notification_logs"] == 1
+    assert _remaining_ages(engine) == [10]
+    assert _cursors(engine) == []
+
+
+def test_without_the_cursor_table_the_sweep_still_purges(engine, caplog):
+    RetentionSweepCursor.__table__.drop(engine)
+    _seed_logs(engine, [200, 120, 1, 95, 150])
+
+    with caplog.at_level("WARNING"):
+        result = cleanup_tasks.run_data_retention.apply().get()
+
+    assert result["purged"]["notification_logs"] == 4
+    assert _remaining_ages(engine) == [1]
+    assert any("sweep cursors unavailable" in record.getMessage() for record in caplog.records)
+
+
+def test_cleanup_expired_tokens_removes_only_expired_entries(engine):
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(
+            TokenBlacklist.__table__.insert(),
+            [{"jti": f"jti-{n}", "expires_at": now + timedelta(minutes=30 if n % 4 == 0 else -30)} for n in range(10)],
+        )
+
+    result = cleanup_tasks.cleanup_expired_tokens.apply().get()
+
+    assert result["purged"] == 7
+    with engine.connect() as conn:
+        remaining = conn.execute(sa.text("SELECT jti FROM token_blacklist ORDER BY id")).scalars().all()
+    assert remaining == ["jti-0", "jti-4", "jti-8"]
+    assert _cursors(engine) == []
@@ -0,0 +1,256 @@
+"""The ``pending_decisions`` projection must give the answer the live readers give.
+
+``collect_my_decisions`` can read the inbox from the projection instead of the
+three domains. That is only safe while the projection tracks every change the
+domains go through, so these tests drive the domains through the ORM — the path
+the ``after_flush`` listener maintains — and compare the projected inbox with the
+live one after each step. The last tests bypass the session on purpose: the
+checker has to notice, and a rebuild has to put it right.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.config import settings
+from src.domain.models.digital_signature import SignatureRequest, SignatureRequestSigner
+from src.domain.models.document_control import ControlledDocument, DocumentApprovalInstance, DocumentApprovalWorkflow
+from src.domain.models.investigation import AssignedEntityType, InvestigationRun, InvestigationStatus
+from src.domain.models.pending_decision import PendingDecisionProjection
+from src.domain.models.user import User
+from src.domain.services.approvals_inbox_projection import (
+    _comparable,
+    check_pending_decisions,
+    rebuild_pending_decisions,
+)
+from src.domain.services.approvals_read_model import (
+    SOURCE_DOCUMENT_APPROVAL,
+    SOURCE_INVESTIGATION_REVIEW,
+    SOURCE_SIGNATURE_REQUEST,
+    collect_my_decisions,
+)
+
+TENANT_ID = 1
+APPROVER = 7
+OTHER_APPROVER = 9
+APPROVER_EMAIL = "approver@example.com"
+
+
+def _naive_utc(offset_days: int = 0) -> datetime:
+    return (datetime.now(timezone.utc) + timedelta(days=offset_days)).replace(tzinfo=None)
+
+
+@pytest.fixture
+async def engine(monkeypatch):
+    monkeypatch.setattr(settings, "approvals_inbox_projection_enabled", True)
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for model in (
+            User,
+            InvestigationRun,
+            ControlledDocument,
+            DocumentApprovalWorkflow,
+            DocumentApprovalInstance,
+            SignatureRequest,
+            SignatureRequestSigner,
+            PendingDecisionProjection,
+        ):
+            await conn.run_sync(model.__table__.create)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(engine):
+    factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    async with factory() as db:
+        yield db
+
+
+async def _document_approval(db: AsyncSession, steps: list[Any], *, n: int = 1) -> DocumentApprovalInstance:
+    document = ControlledDocument(
+        tenant_id=TENANT_ID,
+        document_number=f"DOC-{n:04d}",
+        title=f"Procedure {n}",
+        document_type="procedure",
+        category="quality",
+    )
+    workflow = DocumentApprovalWorkflow(
+        tenant_id=TENANT_ID, name="Approval", applicable_document_types=["procedure"], workflow_steps=steps
+    )
+    db.add_all([document, workflow])
+    await db.flush()
+    instance = DocumentApprovalInstance(
+        tenant_id=TENANT_ID,
+        document_id=document.id,
+        workflow_id=workflow.id,
+        current_step=1,
+        status="pending",
+        initiated_date=_naive_utc(-n),
+        due_date=_naive_utc(n),
+    )
+    db.add(instance)
+    await db.commit()
+    return instance
+
+
+async def _investigation(db: AsyncSession, reviewer: int | None, *, n: int = 1) -> InvestigationRun:
+    run = InvestigationRun(
+        tenant_id=TENANT_ID,
+        template_id=1,
+        assigned_entity_type=AssignedEntityType.REPORTING_INCIDENT,
+        assigned_entity_id=n,
+        title=f"Investigation {n}",
+        reference_number=f"INV-{n:04d}",
+        status=InvestigationStatus.UNDER_REVIEW,
+        reviewer_user_id=reviewer,
+    )
+    db.add(run)
+    await db.commit()
+    return run
+
+
+async def _signature_request(db: AsyncSession, *, n: int = 1) -> SignatureRequest:
+    request = SignatureRequest(
+        tenant_id=TENANT_ID,
+        reference_number=f"SIG-{n:04d}",
+        title=f"Policy pack {n}",
+        document_type="policy",
+        status="pending",
+        initiated_by_id=1,
+        created_at=_naive_utc(-2),
+        expires_at=_naive_utc(10),
+    )
+    db.add(request)
+    await db.flush()
+    # Named twice — as an account and by address — which is still one decision.
+    db.add_all(
+        [
+            SignatureRequestSigner(request_id=request.id, user_id=APPROVER, email="x@example.com", name="A"),
+            SignatureRequestSigner(request_id=request.id, user_id=None, email=APPROVER_EMAIL.upper(), name="A"),
+        ]
+    )
+    await db.commit()
+    return request
+
+
+async def _both_ways(db: AsyncSession, user_id: int = APPROVER, email: str | None = APPROVER_EMAIL):
+    projected = await collect_my_decisions(
+        db, tenant_id=TENANT_ID, user_id=user_id, user_email=email, use_projection=True
+    )
+    live = await collect_my_decisions(db, tenant_id=TENANT_ID, user_id=user_id, user_email=email, use_projection=False)
+    return projected, live
+
+
+@pytest.mark.asyncio
+async def test_flushes_keep_the_projection_in_step_with_the_domains(session):
+    instance = await _document_approval(session, [{"approvers": [APPROVER, OTHER_APPROVER]}, {"approvers": [3]}])
+    run = await _investigation(session, APPROVER)
+    request = await _signature_request(session)
+
+    projected, live = await _both_ways(session)
+    assert {item.key for item in projected.items} == {
+        f"{SOURCE_DOCUMENT_APPROVAL}:{instance.id}",
+        f"{SOURCE_INVESTIGATION_REVIEW}:{run.id}",
+        f"{SOURCE_SIGNATURE_REQUEST}:{request.id}",
+    }
+    assert _comparable(projected) == _comparable(live)
+
+    # The approval moves on to a step naming someone else.
+    instance.current_step = 2
+    # The reviewer signs off, and the signer signs both rows.
+    run.status = InvestigationStatus.COMPLETED
+    signers = (await session.execute(select(SignatureRequestSigner))).scalars().all()
+    for signer in signers:
+        signer.status = "signed"
+    await session.commit()
+
+    projected, live = await _both_ways(session)
+    assert projected.items == ()
+    assert _comparable(projected) == _comparable(live)
+    third_step, third_live = await _both_ways(session, user_id=3, email=None)
+    assert [item.key for item in third_step.items] == [f"{SOURCE_DOCUMENT_APPROVAL}:{instance.id}"]
+    assert _comparable(third_step) == _comparable(third_live)
+
+
+@pytest.mark.asyncio
+async def test_workflow_and_document_edits_reach_pending_instances(session):
+    instance = await _document_approval(session, [{"approvers": [OTHER_APPROVER]}])
+    workflow = await session.get(DocumentApprovalWorkflow, instance.workflow_id)
+    document = await session.get(ControlledDocument, instance.document_id)
+    assert workflow is not None and document is not None
+
+    workflow.workflow_steps = [{"approvers": [APPROVER]}]
+    document.title = "Procedure, retitled"
+    await session.commit()
+
+    projected, live = await _both_ways(session)
+    assert [item.title for item in projected.items] == ["Procedure, retitled"]
+    assert _comparable(projected) == _comparable(live)
+
+    # On PostgreSQL, ON DELETE CASCADE removes the instance without the session
+    # seeing it; SQLite does not enforce foreign keys, so do its part by hand.
+    await session.execute(DocumentApprovalInstance.__table__.delete())
+    await session.delete(document)
+    await session.commit()
+    remaining = await session.execute(select(func.count()).select_from(PendingDecisionProjection))
+    assert remaining.scalar_one() == 0
+
+
+@pytest.mark.asyncio
+async def test_unattributed_rows_are_counted_like_the_live_readers_count_them(session):
+    await _document_approval(session, [{"role": "reviewer"}], n=1)
+    await _document_approval(session, [{"approvers": []}], n=2)
+    await _investigation(session, None)
+
+    projected, live = await _both_ways(session)
+
+    unattributed = {source.key: source.unattributed for source in projected.sources}
+    assert unattributed == {
+        SOURCE_INVESTIGATION_REVIEW: 1,
+        SOURCE_DOCUMENT_APPROVAL: 2,
+        SOURCE_SIGNATURE_REQUEST: 0,
+    }
+    assert projected.sources == live.sources
+
+
+@pytest.mark.asyncio
+async def test_checker_reports_writes_that_bypass_the_session_and_rebuild_repairs_them(session):
+    instance = await _document_approval(session, [{"approvers": [APPROVER]}])
+    await _investigation(session, APPROVER)
+    session.add(User(id=APPROVER, email=APPROVER_EMAIL, hashed_password="x", first_name="A", last_name="P"))
+    await session.commit()
+    assert (await check_pending_decisions(session, tenant_id=TENANT_ID)).is_consistent
+
+    # Core DML is not a flush: the listener never sees it.
+    await session.execute(
+        update(DocumentApprovalInstance).where(DocumentApprovalInstance.id == instance.id).values(status="approved")
+    )
+    await session.commit()
+
+    drift = await check_pending_decisions(session, tenant_id=TENANT_ID)
+    assert not drift.is_consistent
+    assert drift.missing == ()
+    assert len(drift.unexpected) == 1
+    assert drift.reader_mismatches == (APPROVER,)
+
+    assert await rebuild_pending_decisions(session, tenant_id=TENANT_ID) == 1
+    await session.commit()
+    assert (await check_pending_decisions(session, tenant_id=TENANT_ID)).is_consistent
+
+
+@pytest.mark.asyncio
+async def test_a_missing_projection_table_falls_back_to_the_live_readers(session, engine):
+    await _investigation(session, APPROVER)
+    async with engine.begin() as conn:
+        await conn.run_sync(PendingDecisionProjection.__table__.drop)
+
+    projected, live = await _both_ways(session)
+
+    assert projected == live
+    assert len(projected.items) == 1
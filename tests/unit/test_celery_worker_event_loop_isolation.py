@@ -45,7 +45,8 @@ def test_web_engine_keeps_connection_pooling(monkeypatch: pytest.MonkeyPatch) ->
 
     kwargs = database._build_async_engine_kwargs(_POSTGRES_URL, pooled=True)
 
-    assert "poolclass" not in kwargs
+    # A queue pool that also times checkout waits for per-request instrumentation.
+    assert issubclass(kwargs["poolclass"], AsyncAdaptedQueuePool)
     assert kwargs["pool_size"] == database._PG_POOL_SIZE
     assert kwargs["max_overflow"] == database._PG_MAX_OVERFLOW
     assert kwargs["pool_pre_ping"] is True
@@ -236,6 +237,8 @@ def recorded_checkouts(monkeypatch: pytest.MonkeyPatch) -> list[_Checkout]:
         tenant_id: int | None = None,
         content_cache: dict[int, bytes] | None = None,
         current_user: Any = None,
+        concurrency: int | None = None,
+        checkpoint: Any = None,
     ) -> Any:
         await self.db.execute(text("SELECT 1"))
         connection = await self.db.connection()
@@ -14,8 +14,9 @@ import pytest
 
 from src.core.config import settings
 from src.domain.models.compliance_schedule import ComplianceFilingStatus, ComplianceRecord, ComplianceRecordOutcome
-from src.domain.models.document import DocumentStatus, IndexJobStatus
+from src.domain.models.document import DocumentStatus, FileType, IndexJobStatus
 from src.domain.services import compliance_schedule_filing_service as filing
+from src.domain.services.document_intelligence_service import DocumentIntelligenceResult
 from src.domain.services.index_job_service import IndexJobService, maybe_create_filing_index_job
 
 FILING_MODULE = "src.domain.services.compliance_schedule_filing_service"
@@ -191,6 +192,8 @@ def _make_category_process_fixture(monkeypatch: pytest.MonkeyPatch, *, hard_ocr:
         tenant_id=1,
         file_name="fra.pdf",
         file_path="documents/fra.pdf",
+        file_type=FileType.PDF,
+        mime_type="application/pdf",
         document_type=SimpleNamespace(value="record"),
         status=DocumentStatus.DRAFT,
         category_id=42,
@@ -228,6 +231,7 @@ def _make_category_process_fixture(monkeypatch: pytest.MonkeyPatch, *, hard_ocr:
     db = AsyncMock()
     db.get = AsyncMock(return_value=document)
     db.flush = AsyncMock()
+    db.begin_nested = MagicMock()
     previous_chunks_result = MagicMock()
     previous_chunks_result.all.return_value = []
     db.execute = AsyncMock(return_value=previous_chunks_result)
@@ -236,12 +240,20 @@ def _make_category_process_fixture(monkeypatch: pytest.MonkeyPatch, *, hard_ocr:
     service.get_job = AsyncMock(return_value=job)
     service._append_error = AsyncMock()
     if hard_ocr:
-        service.intelligence_service.process = AsyncMock(
-            return_value=SimpleNamespace(text="", hard_ocr_failure=True, note="unreadable scan")
+        service.intelligence_service.extract_bytes = AsyncMock(
+            return_value=DocumentIntelligenceResult(
+                text="", page_texts=[], extraction_method="native", hard_ocr_failure=True, note="unreadable scan"
+            )
         )
     else:
-        service.intelligence_service.process = AsyncMock(
-            return_value=SimpleNamespace(text="Sample FRA text for indexing.", hard_ocr_failure=False, note=None)
+        service.intelligence_service.extract_bytes = AsyncMock(
+            return_value=DocumentIntelligenceResult(
+                text="Sample FRA text for indexing.",
+                page_texts=[],
+                extraction_method="native",
+                hard_ocr_failure=False,
+                note=None,
+            )
         )
     monkeypatch.setattr(
         "src.domain.services.index_job_service.storage_service",
@@ -0,0 +1,149 @@
+"""The as-of timelines must agree with the row-at-a-time definitions they replace.
+
+``ToolComplianceTimeline`` and ``TrainingComplianceTimeline`` answer every weekly
+cut-off from sorted columns. The dashboard previously rescanned every row per
+week through ``aggregate_asset_health_kpis`` and ``training_cell_is_compliant``;
+those stay the definitions, so each test here recomputes them the old way over
+randomised rows and compares, including the day-boundary cases.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, Optional, cast
+
+import pytest
+
+from src.domain.models.asset import AssetStatus
+from src.domain.services.asset_health_analytics_service import AssetHealthRow, aggregate_asset_health_kpis
+from src.domain.services.compliance_timeline import ToolComplianceTimeline, TrainingComplianceTimeline
+from src.domain.services.executive_dashboard import training_cell_is_compliant, training_cell_is_scored
+
+NOW = datetime(2026, 10, 14, 15, 30, tzinfo=timezone.utc)
+CUTOFFS = [NOW - timedelta(days=7 * week) for week in range(53)]
+STATUSES = [status.value for status in AssetStatus]
+
+
+def _reference_tool_pct(rows: list[tuple[str, Optional[datetime], Optional[datetime]]], cutoff: datetime) -> float:
+    """The pre-timeline dashboard computation, verbatim in substance."""
+    rows_as_of = [
+        AssetHealthRow(asset_type=None, status=status, expiry_date=expiry)
+        for status, expiry, created_at in rows
+        if created_at is None or created_at <= cutoff
+    ]
+    summary = cast(Dict[str, Any], aggregate_asset_health_kpis(rows_as_of, as_of=cutoff))
+    bands = summary["expiry_bands"]
+    in_service = summary["total"] - bands["removed"]
+    if in_service <= 0:
+        return 100.0
+    quarantined = summary["by_status"].get(AssetStatus.QUARANTINED.value, 0)
+    return round(100.0 * (in_service - bands["overdue"] - quarantined) / in_service, 1)
+
+
+def _random_assets(rng: random.Random, count: int) -> list[tuple[str, Optional[datetime], Optional[datetime]]]:
+    rows = []
+    for _ in range(count):
+        created = None if rng.random() < 0.1 else NOW - timedelta(minutes=rng.randint(0, 500 * 24 * 60))
+        expiry = None if rng.random() < 0.15 else NOW + timedelta(minutes=rng.randint(-420 * 24 * 60, 120 * 24 * 60))
+        rows.append((rng.choice(STATUSES), expiry, created))
+    return rows
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_tool_timeline_matches_aggregate_at_every_cutoff(seed):
+    rows = _random_assets(random.Random(seed), 600)
+    timeline = ToolComplianceTimeline(rows)
+
+    for cutoff in CUTOFFS:
+        assert timeline.compliance_pct_at(cutoff) == _reference_tool_pct(rows, cutoff), cutoff
+
+
+def test_tool_overdue_flips_at_midnight_after_expiry_day():
+    expiry_day = date(2026, 10, 1)
+    rows: list[tuple[str, Optional[datetime], Optional[datetime]]] = [
+        ("active", datetime.combine(expiry_day, time(23, 59), tzinfo=timezone.utc), None),
+    ]
+    timeline = ToolComplianceTimeline(rows)
+    last_valid = datetime.combine(expiry_day, time(23, 59, 59), tzinfo=timezone.utc)
+    first_overdue = datetime.combine(expiry_day + timedelta(days=1), time.min, tzinfo=timezone.utc)
+
+    assert timeline.overdue_at(last_valid) == 0
+    assert timeline.overdue_at(first_overdue) == 1
+    for cutoff in (last_valid, first_overdue):
+        assert timeline.compliance_pct_at(cutoff) == _reference_tool_pct(rows, cutoff)
+
+
+def test_tool_asset_created_after_expiry_is_overdue_from_creation():
+    created = NOW - timedelta(days=3)
+    rows: list[tuple[str, Optional[datetime], Optional[datetime]]] = [
+        ("active", NOW - timedelta(days=30), created),
+    ]
+    timeline = ToolComplianceTimeline(rows)
+
+    assert timeline.in_service_at(created - timedelta(seconds=1)) == 0
+    assert timeline.overdue_at(created - timedelta(seconds=1)) == 0
+    assert timeline.overdue_at(created) == 1
+    assert timeline.compliance_pct_at(created) == 0.0
+
+
+def test_tool_removed_assets_and_empty_population():
+    rows: list[tuple[str, Optional[datetime], Optional[datetime]]] = [
+        ("decommissioned", NOW - timedelta(days=400), None),
+    ]
+    timeline = ToolComplianceTimeline(rows)
+
+    assert timeline.in_service_at(NOW) == 0
+    assert timeline.compliance_pct_at(NOW) == 100.0
+
+
+def test_tool_naive_created_at_is_read_as_utc():
+    created = datetime(2026, 9, 1, 12, 0)
+    timeline = ToolComplianceTimeline([("active", None, created)])
+
+    assert timeline.in_service_at(created.replace(tzinfo=timezone.utc)) == 1
+    assert timeline.in_service_at(created.replace(tzinfo=timezone.utc) - timedelta(microseconds=1)) == 0
+
+
+def _random_cells(rng: random.Random, count: int) -> list[tuple[Optional[date], Optional[date]]]:
+    today = NOW.date()
+    cells = []
+    for _ in range(count):
+        passed = None if rng.random() < 0.3 else today - timedelta(days=rng.randint(0, 900))
+        expires = None if rng.random() < 0.25 else today + timedelta(days=rng.randint(-400, 400))
+        cells.append((passed, expires))
+    return cells
+
+
+@pytest.mark.parametrize("seed", [4, 5])
+def test_training_timeline_matches_cell_definitions(seed):
+    cells = [cell for cell in _random_cells(random.Random(seed), 2000) if training_cell_is_scored(*cell)]
+    timeline = TrainingComplianceTimeline(cells)
+
+    assert timeline.measured == len(cells)
+    for cutoff in CUTOFFS:
+        as_of = cutoff.date()
+        horizon = as_of + timedelta(days=30)
+        assert timeline.compliant_at(as_of) == sum(1 for p, e in cells if training_cell_is_compliant(p, e, as_of))
+        assert timeline.overdue_at(as_of) == sum(1 for _p, e in cells if e is not None and e < as_of)
+        assert timeline.expiring_between(as_of, horizon) == sum(
+            1 for _p, e in cells if e is not None and as_of <= e < horizon
+        )
+
+
+def test_training_certificate_is_valid_on_its_expiry_day():
+    expiry = date(2026, 10, 14)
+    timeline = TrainingComplianceTimeline([(date(2025, 10, 14), expiry)])
+
+    assert timeline.compliant_at(expiry) == 1
+    assert timeline.overdue_at(expiry) == 0
+    assert timeline.compliant_at(expiry + timedelta(days=1)) == 0
+    assert timeline.overdue_at(expiry + timedelta(days=1)) == 1
+
+
+def test_training_empty_timeline_measures_nothing():
+    timeline = TrainingComplianceTimeline(())
+
+    assert timeline.measured == 0
+    assert timeline.compliant_at(NOW.date()) == 0
+    assert timeline.expiring_between(NOW.date(), NOW.date() + timedelta(days=30)) == 0
@@ -0,0 +1,138 @@
+"""SQL work is charged to the HTTP request that issued it.
+
+Engine and pool hooks count statements, SQL time and pool wait into the stats
+``RequestLoggerMiddleware`` binds per request; those surface in the log line,
+``Server-Timing`` and histograms, and sampled requests flag statements repeated
+past the N+1 threshold with the route template.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.config import settings
+from src.infrastructure.middleware.request_logger import RequestLoggerMiddleware
+from src.infrastructure.monitoring import db_instrumentation
+from src.infrastructure.monitoring.db_instrumentation import (
+    TimedAsyncAdaptedQueuePool,
+    begin_request_db_stats,
+    end_request_db_stats,
+    get_request_db_stats,
+    instrument_engine,
+    normalize_statement,
+)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/db.sqlite", poolclass=TimedAsyncAdaptedQueuePool)
+    instrument_engine(engine.sync_engine)
+    instrument_engine(engine.sync_engine)  # idempotent
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE item (id INTEGER PRIMARY KEY, owner_id INTEGER)"))
+        await conn.execute(text("INSERT INTO item (id, owner_id) VALUES (1, 1), (2, 1), (3, 2)"))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def sample_all(monkeypatch):
+    monkeypatch.setattr(settings, "db_statement_sample_rate", 1.0)
+    monkeypatch.setattr(settings, "db_n_plus_one_threshold", 10)
+
+
+def test_normalize_statement_collapses_placeholders_and_in_lists():
+    sql = "SELECT item.id\n  FROM item WHERE item.id IN ($1, $2,  $3) AND owner_id = $4 AND name::text = :name"
+    assert normalize_statement(sql) == (
+        "SELECT item.id FROM item WHERE item.id IN (?) AND owner_id = ? AND name::text = ?"
+    )
+    assert normalize_statement("SELECT 1 WHERE a = %(a)s AND b IN (?, ?)") == "SELECT 1 WHERE a = ? AND b IN (?)"
+
+
+@pytest.mark.asyncio
+async def test_statements_count_only_inside_a_bound_request(engine, sample_all):
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    stats, token = begin_request_db_stats()
+    try:
+        async with engine.connect() as conn:
+            for item_id in range(12):
+                await conn.execute(text("SELECT owner_id FROM item WHERE id = :id"), {"id": item_id})
+            await conn.execute(text("SELECT count(*) FROM item"))
+    finally:
+        end_request_db_stats(token)
+
+    assert get_request_db_stats() is None
+    assert stats.statements == 13
+    assert stats.db_time_ms > 0 and stats.pool_wait_ms > 0
+    assert stats.suspected_n_plus_one(10) == [("SELECT owner_id FROM item WHERE id = ?", 12)]
+    assert stats.suspected_n_plus_one(12) == []
+
+
+@pytest.mark.asyncio
+async def test_unsampled_requests_skip_fingerprinting(engine, monkeypatch):
+    monkeypatch.setattr(settings, "db_statement_sample_rate", 0.0)
+    stats, token = begin_request_db_stats()
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    finally:
+        end_request_db_stats(token)
+    assert stats.statements == 1 and stats.fingerprints is None
+
+
+@pytest.mark.asyncio
+async def test_request_logger_reports_db_work_and_flags_n_plus_one(engine, sample_all, monkeypatch, caplog):
+    recorded: list[tuple] = []
+    monkeypatch.setattr(db_instrumentation, "track_request_db_stats", lambda *args: recorded.append(args))
+
+    app = FastAPI()
+
+    @app.get("/api/v1/owners/{owner_id}/items")
+    async def items(owner_id: int):
+        async with engine.connect() as conn:
+            ids = (await conn.execute(text("SELECT id FROM item WHERE owner_id = :o"), {"o": owner_id})).scalars()
+            # One lookup per row: the pattern the detector exists for.
+            for item_id in list(ids) * 6:
+                await conn.execute(text("SELECT owner_id FROM item WHERE id = :id"), {"id": item_id})
+        return {"ok": True}
+
+    app.add_middleware(RequestLoggerMiddleware)
+
+    with caplog.at_level(logging.WARNING, logger=db_instrumentation.__name__):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/api/v1/owners/1/items")
+
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert 'desc="13 queries"' in response.headers["server-timing"]
+    assert "db-pool;dur=" in response.headers["server-timing"]
+    assert [(route, statements) for route, statements, _, _ in recorded] == [("/api/v1/owners/{owner_id}/items", 13)]
+    [warning] = caplog.records
+    assert warning.route == "/api/v1/owners/{owner_id}/items" and warning.executions == 12
+    assert get_request_db_stats() is None
+
+
+@pytest.mark.asyncio
+async def test_instrumentation_can_be_switched_off(engine, monkeypatch):
+    monkeypatch.setattr(settings, "db_request_instrumentation_enabled", False)
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return {}
+
+    app.add_middleware(RequestLoggerMiddleware)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/ping")
+    assert "server-timing" not in response.headers
+    assert "x-response-time" in response.headers
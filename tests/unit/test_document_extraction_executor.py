@@ -0,0 +1,162 @@
+"""Unit coverage for the off-loop document extraction executor."""
+
+from __future__ import annotations
+
+import io
+import time
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+import pytest
+
+from src.domain.models.document import FileType
+from src.domain.services import document_extraction_executor as executor_module
+from src.domain.services.document_extraction_executor import DocumentExtractionExecutor
+from src.domain.services.document_extraction_service import ExtractedDocumentContent, extract_document_content
+from src.infrastructure.cache.redis_cache import InMemoryCache
+
+
+def _pdf_bytes(pages: int) -> bytes:
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=11)
+    for page in range(1, pages + 1):
+        pdf.add_page()
+        pdf.multi_cell(0, 6, f"Page {page} fire risk assessment control review evidence retained.")
+    return bytes(pdf.output())
+
+
+@pytest.mark.asyncio
+async def test_thread_mode_matches_synchronous_extraction() -> None:
+    content = b"Policy statement\nControls are reviewed annually."
+    executor = DocumentExtractionExecutor(workers=0, cache=InMemoryCache())
+
+    result = await executor.extract(FileType.TXT, "policy.txt", content)
+
+    assert result == extract_document_content(FileType.TXT, "policy.txt", content)
+
+
+@pytest.mark.asyncio
+async def test_repeat_extraction_of_same_bytes_is_served_from_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def _counting_extract(file_type, file_name, content):
+        calls.append(file_name)
+        return ExtractedDocumentContent(text="cached corpus", page_texts=["cached corpus"])
+
+    monkeypatch.setattr(executor_module, "extract_document_content", _counting_extract)
+    executor = DocumentExtractionExecutor(workers=0, cache=InMemoryCache())
+
+    first = await executor.extract(FileType.PDF, "upload.pdf", b"%PDF-same-bytes")
+    second = await executor.extract(FileType.PDF, "re-upload.pdf", b"%PDF-same-bytes")
+
+    assert calls == ["upload.pdf"]
+    assert second == first
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_empty_results_are_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def _empty_extract(file_type, file_name, content):
+        calls.append(file_name)
+        return ExtractedDocumentContent(text="", note="unreadable")
+
+    monkeypatch.setattr(executor_module, "extract_document_content", _empty_extract)
+    executor = DocumentExtractionExecutor(workers=0, cache=InMemoryCache())
+
+    await executor.extract(FileType.PDF, "scan.pdf", b"%PDF-scan")
+    await executor.extract(FileType.PDF, "scan.pdf", b"%PDF-scan")
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_timeout_returns_an_empty_extraction_with_a_note(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _slow_extract(file_type, file_name, content):
+        time.sleep(0.5)
+        return ExtractedDocumentContent(text="too late")
+
+    monkeypatch.setattr(executor_module, "extract_document_content", _slow_extract)
+    executor = DocumentExtractionExecutor(workers=0, timeout_seconds=0.05, cache=InMemoryCache())
+
+    result = await executor.extract(FileType.PDF, "huge.pdf", b"%PDF-huge")
+
+    assert result.text == ""
+    assert result.note == "Stored successfully but extraction timed out for huge.pdf."
+
+
+class _FakePool:
+    _processes: dict = {}
+
+    def __init__(self, breaks: bool) -> None:
+        self.breaks = breaks
+        self.shut_down = False
+
+    def shutdown(self, wait: bool, cancel_futures: bool = False) -> None:
+        self.shut_down = True
+
+
+def _executor_over(monkeypatch: pytest.MonkeyPatch, pools: list[_FakePool]) -> DocumentExtractionExecutor:
+    executor = DocumentExtractionExecutor(workers=0, timeout_seconds=5, cache=InMemoryCache())
+
+    def _next_pool() -> Any:
+        if executor._pool is None:
+            executor._pool = pools.pop(0)  # type: ignore[assignment]
+        return executor._pool
+
+    async def _run(pool: Any, fn: Any, *args: Any) -> ExtractedDocumentContent:
+        if pool.breaks:
+            raise BrokenProcessPool("a worker terminated abruptly")
+        return ExtractedDocumentContent(text="clause 8.1 evidence")
+
+    monkeypatch.setattr(executor, "_executor", _next_pool)
+    monkeypatch.setattr(executor, "_run", _run)
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_a_pool_broken_under_a_job_is_retried_once_on_a_fresh_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    broken, fresh = _FakePool(breaks=True), _FakePool(breaks=False)
+    executor = _executor_over(monkeypatch, [broken, fresh])
+
+    result = await executor.extract(FileType.PDF, "policy.pdf", b"%PDF-collateral")
+
+    assert result.text == "clause 8.1 evidence"
+    assert broken.shut_down and not fresh.shut_down
+    # A late handler for the broken pool must not kill its replacement.
+    executor._recycle(broken)  # type: ignore[arg-type]
+    assert executor._pool is fresh and not fresh.shut_down
+
+
+@pytest.mark.asyncio
+async def test_a_pool_that_breaks_twice_is_reported_as_a_memory_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    executor = _executor_over(monkeypatch, [_FakePool(breaks=True), _FakePool(breaks=True)])
+
+    result = await executor.extract(FileType.PDF, "bomb.pdf", b"%PDF-bomb")
+
+    assert result.text == ""
+    assert result.note == "Stored successfully but extraction exceeded the memory limit for bomb.pdf."
+
+
+@pytest.mark.asyncio
+async def test_page_ranges_in_worker_processes_match_whole_document_extraction() -> None:
+    content = _pdf_bytes(7)
+    executor = DocumentExtractionExecutor(
+        workers=2,
+        split_pages=3,
+        pages_per_task=3,
+        cache_ttl_seconds=0,
+    )
+    try:
+        split = await executor.extract(FileType.PDF, "report.pdf", content)
+    finally:
+        executor.shutdown()
+
+    whole = extract_document_content(FileType.PDF, "report.pdf", content)
+    assert split.page_count == 7
+    assert split.page_texts == whole.page_texts
+    assert split.text == whole.text
+    assert split.extraction_method == whole.extraction_method == "pdfplumber"
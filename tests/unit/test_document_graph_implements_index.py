@@ -0,0 +1,215 @@
+"""Doc Graph cycle checks and the cascade aggregate read a cached implements index.
+
+These tests pin the indexed paths to the per-call queries they replace on
+random SQLite graphs, then check that the service's own writes patch the index
+in place, that writes from elsewhere force a rebuild, and that the verifier
+reports an index the database has moved away from.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import insert, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.api.schemas.document_graph import CascadeAggregateResponse
+from src.core.config import settings
+from src.domain.models.document import Document
+from src.domain.models.document_graph import DocumentEdge, DocumentEdgeStatus, DocumentEdgeType
+from src.domain.services import document_graph_index, document_graph_service
+from src.domain.services.document_graph_index import (
+    implements_index,
+    invalidate_implements_index,
+    verify_implements_index,
+)
+from src.domain.services.document_graph_service import DocumentGraphService
+
+TENANT_ID = 1
+DOCUMENTS = 30
+STATUSES = [
+    DocumentEdgeStatus.CONFIRMED,
+    DocumentEdgeStatus.CONFIRMED,
+    DocumentEdgeStatus.PROPOSED,
+    DocumentEdgeStatus.NEEDS_REVIEW,
+    DocumentEdgeStatus.REJECTED,
+]
+
+
+def _random_edges(seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    edges: list[dict] = []
+    pairs: set[tuple[int, int]] = set()
+    for edge_id in rng.sample(range(1, 10 * DOCUMENTS), DOCUMENTS + DOCUMENTS // 2):
+        src, dst = rng.sample(range(1, DOCUMENTS + 1), 2)
+        if (src, dst) in pairs:
+            continue
+        pairs.add((src, dst))
+        implements = rng.random() < 0.9
+        edges.append(
+            {
+                "id": edge_id,
+                "tenant_id": TENANT_ID if rng.random() < 0.95 else TENANT_ID + 1,
+                "src_document_id": src,
+                "dst_document_id": dst,
+                "dst_pel_doc_ref": f"PEL-{dst}" if rng.random() < 0.5 else None,
+                "edge_type": DocumentEdgeType.IMPLEMENTS if implements else DocumentEdgeType.REFERENCES,
+                "status": rng.choice(STATUSES),
+                "is_primary_parent": implements and rng.random() < 0.6,
+                "deleted_at": datetime.now(timezone.utc) if rng.random() < 0.05 else None,
+            }
+        )
+    return edges
+
+
+@pytest.fixture
+async def session(monkeypatch):
+    monkeypatch.setattr(settings, "document_graph_implements_index_enabled", True)
+    monkeypatch.setattr(document_graph_service, "record_audit_event", AsyncMock())
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Document.__table__.create)
+        await conn.run_sync(DocumentEdge.__table__.create)
+        # Legacy data can hold duplicate primaries; the cascade must still pick deterministically.
+        await conn.execute(text("DROP INDEX ux_document_edges_one_primary_parent"))
+        await conn.execute(
+            insert(Document),
+            [
+                {
+                    "id": n,
+                    "tenant_id": TENANT_ID,
+                    "title": f"Doc {n}",
+                    "reference_number": f"DOC-{n:05d}",
+                    "file_name": "x.pdf",
+                    "file_type": "pdf",
+                    "file_size": 1,
+                    "file_path": "x",
+                    "cascade_level": n % 6 or None,
+                    "is_active": n % 11 != 0,
+                }
+                for n in range(1, DOCUMENTS + 1)
+            ],
+        )
+    invalidate_implements_index()
+    async with async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)() as db:
+        yield db
+    invalidate_implements_index()
+    await engine.dispose()
+
+
+async def _both_ways(monkeypatch, call):
+    monkeypatch.setattr(settings, "document_graph_implements_index_enabled", False)
+    legacy = await call()
+    monkeypatch.setattr(settings, "document_graph_implements_index_enabled", True)
+    return legacy, await call()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", [1, 2, 3])
+async def test_indexed_cycle_check_and_cascade_match_the_queries(session, monkeypatch, seed):
+    await session.execute(insert(DocumentEdge), _random_edges(seed))
+    service = DocumentGraphService(session)
+
+    async def every_pair():
+        return [
+            await service.would_create_implements_cycle(tenant_id=TENANT_ID, src_document_id=src, dst_document_id=dst)
+            for src in range(1, DOCUMENTS + 1)
+            for dst in range(1, DOCUMENTS + 1)
+        ]
+
+    legacy, indexed = await _both_ways(monkeypatch, every_pair)
+    assert legacy == indexed and any(indexed)
+
+    async def cascade():
+        payload = await service.get_cascade_aggregate(tenant_id=TENANT_ID, viewer=None)
+        return CascadeAggregateResponse.model_validate(payload).model_dump()
+
+    legacy_cascade, indexed_cascade = await _both_ways(monkeypatch, cascade)
+    assert legacy_cascade == indexed_cascade
+    assert indexed_cascade["returned_edges"] > 0
+
+
+@pytest.mark.asyncio
+async def test_service_writes_patch_the_index_in_place(session, monkeypatch):
+    results: list[str] = []
+    monkeypatch.setattr(document_graph_index, "track_metric", lambda name, value, tags: results.append(tags["result"]))
+    service = DocumentGraphService(session)
+
+    async def cycles(src: int, dst: int) -> bool:
+        return await service.would_create_implements_cycle(
+            tenant_id=TENANT_ID, src_document_id=src, dst_document_id=dst
+        )
+
+    chain = [
+        await service.create_edge(
+            tenant_id=TENANT_ID,
+            src_document_id=child,
+            dst_document_id=child + 1,
+            edge_type=DocumentEdgeType.IMPLEMENTS,
+            is_primary_parent=True,
+            status=DocumentEdgeStatus.CONFIRMED,
+        )
+        for child in (1, 2, 3)
+    ]
+    index = await implements_index(session, TENANT_ID)
+    assert await cycles(4, 1) and await cycles(3, 1)
+    assert results[:6] == ["miss", "applied", "hit", "applied", "hit", "applied"]
+
+    await service.reject(tenant_id=TENANT_ID, edge_id=chain[1].id)
+    assert not await cycles(4, 1) and await cycles(2, 1)
+    pending = await service.create_edge(
+        tenant_id=TENANT_ID,
+        src_document_id=2,
+        dst_document_id=4,
+        edge_type=DocumentEdgeType.IMPLEMENTS,
+        commit=False,
+    )
+    assert await cycles(4, 1) and not await cycles(3, 1)
+    await service.confirm(tenant_id=TENANT_ID, edge_id=pending.id, actor_id=1)
+    assert await cycles(4, 1)
+    await service.soft_delete(tenant_id=TENANT_ID, edge_id=pending.id)
+    assert not await cycles(4, 1) and await cycles(2, 1)
+
+    assert await implements_index(session, TENANT_ID) is index
+    assert "rebuild" not in results
+    assert (await verify_implements_index(session, TENANT_ID))["status"] == "verified"
+
+
+@pytest.mark.asyncio
+async def test_writes_from_elsewhere_rebuild_and_the_verifier_reports_drift(session):
+    await session.execute(insert(DocumentEdge), _random_edges(7))
+    first = await implements_index(session, TENANT_ID)
+    assert await implements_index(session, TENANT_ID) is first
+
+    # Another tenant's edges are not this index's input.
+    await session.execute(
+        insert(DocumentEdge).values(
+            tenant_id=TENANT_ID + 1, src_document_id=1, dst_document_id=2, edge_type=DocumentEdgeType.IMPLEMENTS
+        )
+    )
+    assert await implements_index(session, TENANT_ID) is first
+
+    await session.execute(
+        insert(DocumentEdge).values(
+            tenant_id=TENANT_ID, src_document_id=1, dst_document_id=2, edge_type=DocumentEdgeType.IMPLEMENTS
+        )
+    )
+    second = await implements_index(session, TENANT_ID)
+    assert second is not first
+    assert (await verify_implements_index(session, TENANT_ID))["status"] == "verified"
+
+    # A bulk update that pins updated_at slips past the fingerprint; the verifier catches it.
+    live = next(iter(second.edges.values()))
+    await session.execute(
+        update(DocumentEdge)
+        .where(DocumentEdge.id == live.id)
+        .values(status=DocumentEdgeStatus.REJECTED, updated_at=live.row["updated_at"])
+    )
+    assert await implements_index(session, TENANT_ID) is second
+    report = await verify_implements_index(session, TENANT_ID)
+    assert report["status"] == "drift" and report["unexpected_edge_ids"] == [live.id]
+    assert (await verify_implements_index(session, TENANT_ID))["status"] == "not_cached"
+    assert live.id not in (await implements_index(session, TENANT_ID)).edges
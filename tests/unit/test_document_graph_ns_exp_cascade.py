@@ -23,6 +23,12 @@ from src.domain.services.document_graph_service import DocumentGraphService
 GRAPH_PREFIX = "/api/v1/document-graph"
 
 
+@pytest.fixture(autouse=True)
+def _query_edges_per_call(monkeypatch):
+    """These tests script the per-call edge query; the cached index has its own tests."""
+    monkeypatch.setattr(settings, "document_graph_implements_index_enabled", False)
+
+
 def _doc(
     doc_id: int,
     *,
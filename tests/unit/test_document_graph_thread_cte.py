@@ -0,0 +1,182 @@
+"""Doc Graph thread walks come from one recursive-CTE statement.
+
+The walk used to issue a query per ancestor level and per descendant node.
+These tests run the CTE on SQLite against random graphs (legacy duplicate
+primaries, cycles, pending / rejected / deleted edges, another tenant) and pin
+it to a reference walk with the old semantics, then check the batch mode's
+statement count and what it leaves out.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.domain.models.document import Document
+from src.domain.models.document_graph import DocumentEdge, DocumentEdgeStatus, DocumentEdgeType
+from src.domain.services.document_graph_service import DocumentGraphService, thread_walk_statuses
+
+TENANT_ID = 1
+STATUSES = [
+    DocumentEdgeStatus.CONFIRMED,
+    DocumentEdgeStatus.CONFIRMED,
+    DocumentEdgeStatus.CONFIRMED,
+    DocumentEdgeStatus.PROPOSED,
+    DocumentEdgeStatus.NEEDS_REVIEW,
+    DocumentEdgeStatus.REJECTED,
+]
+
+
+def _random_edges(seed: int, documents: int) -> list[dict]:
+    rng = random.Random(seed)
+    edges: list[dict] = []
+    pairs: set[tuple[int, int]] = set()
+    for edge_id in rng.sample(range(1, 10 * documents), 2 * documents):
+        src, dst = rng.sample(range(1, documents + 1), 2)
+        if (src, dst) in pairs:
+            continue
+        pairs.add((src, dst))
+        edges.append(
+            {
+                "id": edge_id,
+                "tenant_id": TENANT_ID if rng.random() < 0.95 else TENANT_ID + 1,
+                "src_document_id": src,
+                "dst_document_id": dst,
+                "edge_type": DocumentEdgeType.IMPLEMENTS if rng.random() < 0.9 else DocumentEdgeType.REFERENCES,
+                "status": rng.choice(STATUSES),
+                "is_primary_parent": rng.random() < 0.85,
+                "deleted_at": datetime.now(timezone.utc) if rng.random() < 0.05 else None,
+            }
+        )
+    for edge in edges:
+        edge["is_primary_parent"] = edge["is_primary_parent"] and edge["edge_type"] == DocumentEdgeType.IMPLEMENTS
+    return edges
+
+
+def _reference_thread(edges: list[dict], document_id: int, depth_cap: int, include_proposed: bool) -> dict:
+    """The per-query walk get_thread used to do, over an in-memory edge list."""
+    statuses = thread_walk_statuses(include_proposed=include_proposed)
+    walkable = sorted(
+        (
+            e
+            for e in edges
+            if e["tenant_id"] == TENANT_ID
+            and e["edge_type"] == DocumentEdgeType.IMPLEMENTS
+            and e["is_primary_parent"]
+            and e["status"] in statuses
+            and e["deleted_at"] is None
+        ),
+        key=lambda e: e["id"],
+    )
+    ancestors, current, seen = [], document_id, {document_id}
+    for depth in range(1, depth_cap + 1):
+        parent = next((e for e in walkable if e["src_document_id"] == current), None)
+        if parent is None or parent["dst_document_id"] in seen:
+            break
+        seen.add(parent["dst_document_id"])
+        ancestors.append((parent["dst_document_id"], parent["id"], depth))
+        current = parent["dst_document_id"]
+
+    descendants, visited = [], {document_id}
+
+    def walk(parent_id: int, depth: int) -> None:
+        if depth > depth_cap:
+            return
+        for child in (e for e in walkable if e["dst_document_id"] == parent_id):
+            if child["src_document_id"] in visited:
+                continue
+            visited.add(child["src_document_id"])
+            descendants.append((child["src_document_id"], child["id"], depth))
+            walk(child["src_document_id"], depth + 1)
+
+    walk(document_id, 1)
+    return {"ancestors": ancestors, "descendants": descendants}
+
+
+def _hops(payload: dict) -> dict:
+    return {
+        key: [(hop["document_id"], hop["edge_id"], hop["depth"]) for hop in payload[key]]
+        for key in ("ancestors", "descendants")
+    }
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Document.__table__.create)
+        await conn.run_sync(DocumentEdge.__table__.create)
+        # Legacy data can hold duplicate primaries; the walk must still pick deterministically.
+        await conn.execute(text("DROP INDEX ux_document_edges_one_primary_parent"))
+    yield engine
+    await engine.dispose()
+
+
+async def _session(engine, documents: int, edges: list[dict]) -> AsyncSession:
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(Document),
+            [
+                {
+                    "id": n,
+                    "tenant_id": TENANT_ID if n != documents else TENANT_ID + 1,
+                    "title": f"Doc {n}",
+                    "reference_number": f"DOC-{n:05d}",
+                    "file_name": "x.pdf",
+                    "file_type": "pdf",
+                    "file_size": 1,
+                    "file_path": "x",
+                }
+                for n in range(1, documents + 1)
+            ],
+        )
+        await conn.execute(insert(DocumentEdge), edges)
+    return async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", [1, 2, 3])
+async def test_cte_walk_matches_the_per_query_walk(engine, seed):
+    documents = 40
+    edges = _random_edges(seed, documents)
+    async with await _session(engine, documents, edges) as db:
+        service = DocumentGraphService(db)
+        for include_proposed in (False, True):
+            for max_depth in (0, 2, 4):
+                threads = await service.get_threads(
+                    tenant_id=TENANT_ID,
+                    document_ids=list(range(1, documents)),
+                    max_depth=max_depth,
+                    include_proposed=include_proposed,
+                )
+                for document_id in range(1, documents):
+                    expected = _reference_thread(edges, document_id, max_depth, include_proposed)
+                    assert _hops(threads[document_id]) == expected, (document_id, max_depth, include_proposed)
+                    single = await service.get_thread(
+                        tenant_id=TENANT_ID,
+                        document_id=document_id,
+                        max_depth=max_depth,
+                        include_proposed=include_proposed,
+                    )
+                    assert single == threads[document_id]
+
+
+@pytest.mark.asyncio
+async def test_batch_is_two_statements_and_skips_foreign_documents(engine):
+    documents = 40
+    async with await _session(engine, documents, _random_edges(9, documents)) as db:
+        statements: list[str] = []
+        event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        threads = await DocumentGraphService(db).get_threads(
+            tenant_id=TENANT_ID, document_ids=[5, 3, 5, documents, 999, *range(1, documents)]
+        )
+
+        assert len(statements) == 2
+        assert documents not in threads and 999 not in threads
+        assert list(threads)[:2] == [5, 3]
+        assert len(threads) == documents - 1
@@ -163,8 +163,9 @@ async def test_create_edge_rejects_live_duplicate():
 
 
 @pytest.mark.asyncio
-async def test_would_create_implements_cycle_detects_ancestor_path():
+async def test_would_create_implements_cycle_detects_ancestor_path(monkeypatch):
     """A → B already exists; adding B → A must cycle."""
+    monkeypatch.setattr(settings, "document_graph_implements_index_enabled", False)
     db = MagicMock()
     service = DocumentGraphService(db)
 
@@ -8,13 +8,16 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from src.api.routes import document_graph as document_graph_routes
 from src.api.schemas.document_graph import DocumentThreadHop
 from src.core.config import Settings, settings
 from src.domain.exceptions import ConflictError
 from src.domain.features.catalogue import CLIENT_FEATURES_BY_KEY
-from src.domain.models.document_graph import DocumentEdgeStatus, DocumentEdgeType
+from src.domain.models.document import Document
+from src.domain.models.document_graph import DocumentEdge, DocumentEdgeStatus, DocumentEdgeType
 from src.domain.services.document_graph_service import DocumentGraphService, thread_walk_statuses
 
 GRAPH_PREFIX = "/api/v1/document-graph"
@@ -63,6 +66,49 @@ def _doc(doc_id: int, *, title: str, reference: str | None = None, pel: str | No
     )
 
 
+@pytest.fixture
+async def graph_db():
+    """Documents + edges on SQLite; the thread walk is one real recursive-CTE statement."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Document.__table__.create)
+        await conn.run_sync(DocumentEdge.__table__.create)
+        # Legacy rows predate ux_document_edges_one_primary_parent; the walk must cope.
+        await conn.execute(text("DROP INDEX ux_document_edges_one_primary_parent"))
+    async with async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)() as db:
+        yield db
+    await engine.dispose()
+
+
+async def _seed(db: AsyncSession, *, docs=None, pels=None, edges=()) -> None:
+    for doc_id, title in (docs or {}).items():
+        await db.execute(
+            insert(Document).values(
+                id=doc_id,
+                tenant_id=1,
+                title=title,
+                reference_number=f"DOC-2026-{doc_id:04d}",
+                pel_doc_ref=(pels or {}).get(doc_id),
+                file_name="x.pdf",
+                file_type="pdf",
+                file_size=1,
+                file_path="x",
+            )
+        )
+    for edge in edges:
+        await db.execute(
+            insert(DocumentEdge).values(
+                id=edge.id,
+                tenant_id=1,
+                src_document_id=edge.src_document_id,
+                dst_document_id=edge.dst_document_id,
+                edge_type=edge.edge_type,
+                status=edge.status,
+                is_primary_parent=edge.is_primary_parent,
+            )
+        )
+
+
 # ---------------------------------------------------------------------------
 # (a) Confirmed-only vs include_proposed
 # ---------------------------------------------------------------------------
@@ -83,39 +129,16 @@ def test_thread_walk_statuses_include_proposed_adds_pending():
 
 
 @pytest.mark.asyncio
-async def test_get_thread_excludes_proposed_parent_by_default():
+async def test_get_thread_excludes_proposed_parent_by_default(graph_db):
     """Ambient thread must not surface PROPOSED primary parents unless opted in."""
-    db = MagicMock()
-    service = DocumentGraphService(db)
-    service._get_document_or_404 = AsyncMock(return_value=_doc(10, title="Child"))  # type: ignore[method-assign]
-    service._documents_by_ids = AsyncMock(  # type: ignore[method-assign]
-        return_value={20: _doc(20, title="Parent Policy", pel="POL-001")}
-    )
-
-    proposed_parent = _edge(edge_id=1, src=10, dst=20, status=DocumentEdgeStatus.PROPOSED)
-    confirmed_parent = _edge(edge_id=2, src=10, dst=30, status=DocumentEdgeStatus.CONFIRMED)
-
-    # Ancestor query returns empty when statuses are confirmed-only (DB filtered).
-    empty = MagicMock()
-    empty.scalars.return_value.all.return_value = []
-    # Descendant query likewise empty.
-    db.execute = AsyncMock(return_value=empty)
+    await _seed(graph_db, docs={10: "Child", 20: "Parent Policy"}, pels={20: "POL-001"})
+    await _seed(graph_db, edges=[_edge(edge_id=1, src=10, dst=20, status=DocumentEdgeStatus.PROPOSED)])
+    service = DocumentGraphService(graph_db)
 
     payload = await service.get_thread(tenant_id=1, document_id=10, include_proposed=False)
     assert payload["ancestors"] == []
     assert payload["descendants"] == []
 
-    # With include_proposed, proposed parent is returned by the (mocked) query.
-    parent_result = MagicMock()
-    parent_result.scalars.return_value.all.return_value = [proposed_parent]
-    child_empty = MagicMock()
-    child_empty.scalars.return_value.all.return_value = []
-    # After taking proposed parent, next ancestor level empty; then descendants empty.
-    db.execute = AsyncMock(side_effect=[parent_result, empty, child_empty])
-    service._documents_by_ids = AsyncMock(  # type: ignore[method-assign]
-        return_value={20: _doc(20, title="Parent Policy", pel="POL-001")}
-    )
-
     payload = await service.get_thread(tenant_id=1, document_id=10, include_proposed=True)
     assert len(payload["ancestors"]) == 1
     hop = payload["ancestors"][0]
@@ -123,7 +146,6 @@ async def test_get_thread_excludes_proposed_parent_by_default():
     assert hop["status"] == DocumentEdgeStatus.PROPOSED.value
     assert hop["title"] == "Parent Policy"
     assert hop["origin"] == "graph"
-    _ = confirmed_parent  # reserved — documents the alternative status fixture
 
 
 # ---------------------------------------------------------------------------
@@ -175,30 +197,13 @@ async def test_confirm_rejects_second_primary_implements_parent():
 
 
 @pytest.mark.asyncio
-async def test_ancestor_walk_orders_primary_parents_deterministically():
+async def test_ancestor_walk_orders_primary_parents_deterministically(graph_db):
     """If two primary parents exist (legacy), lowest edge id wins — never .first() alone."""
-    db = MagicMock()
-    service = DocumentGraphService(db)
-    service._get_document_or_404 = AsyncMock(return_value=_doc(10, title="Child"))  # type: ignore[method-assign]
-    service._documents_by_ids = AsyncMock(  # type: ignore[method-assign]
-        return_value={
-            20: _doc(20, title="Parent A", pel="POL-A"),
-            30: _doc(30, title="Parent B", pel="POL-B"),
-        }
-    )
+    await _seed(graph_db, docs={10: "Child", 20: "Parent A", 30: "Parent B"}, pels={20: "POL-A", 30: "POL-B"})
+    # Higher id inserted first so storage order cannot pick the winner.
+    await _seed(graph_db, edges=[_edge(edge_id=50, src=10, dst=30), _edge(edge_id=40, src=10, dst=20)])
 
-    # Unordered return; service must order by id asc and take the first.
-    higher = _edge(edge_id=50, src=10, dst=30)
-    lower = _edge(edge_id=40, src=10, dst=20)
-    parent_result = MagicMock()
-    parent_result.scalars.return_value.all.return_value = [higher, lower]
-    next_empty = MagicMock()
-    next_empty.scalars.return_value.all.return_value = []
-    child_empty = MagicMock()
-    child_empty.scalars.return_value.all.return_value = []
-    db.execute = AsyncMock(side_effect=[parent_result, next_empty, child_empty])
-
-    payload = await service.get_thread(tenant_id=1, document_id=10)
+    payload = await DocumentGraphService(graph_db).get_thread(tenant_id=1, document_id=10)
     assert payload["ancestors"][0]["document_id"] == 20
     assert payload["ancestors"][0]["edge_id"] == 40
 
@@ -209,36 +214,15 @@ async def test_ancestor_walk_orders_primary_parents_deterministically():
 
 
 @pytest.mark.asyncio
-async def test_descendant_walk_is_cycle_safe_and_dedupes():
-    db = MagicMock()
-    service = DocumentGraphService(db)
-    service._get_document_or_404 = AsyncMock(return_value=_doc(1, title="Root"))  # type: ignore[method-assign]
-    service._documents_by_ids = AsyncMock(  # type: ignore[method-assign]
-        return_value={
-            2: _doc(2, title="Child"),
-            3: _doc(3, title="Grandchild"),
-        }
-    )
-
-    # Ancestors empty.
-    anc_empty = MagicMock()
-    anc_empty.scalars.return_value.all.return_value = []
-
+async def test_descendant_walk_is_cycle_safe_and_dedupes(graph_db):
+    await _seed(graph_db, docs={1: "Root", 2: "Child", 3: "Grandchild"})
     # From 1: child 2. From 2: child 3. From 3: child 2 again (cycle) — must stop.
-    e12 = _edge(edge_id=1, src=2, dst=1)
-    e23 = _edge(edge_id=2, src=3, dst=2)
-    e32_cycle = _edge(edge_id=3, src=2, dst=3)
-
-    children_of_1 = MagicMock()
-    children_of_1.scalars.return_value.all.return_value = [e12]
-    children_of_2 = MagicMock()
-    children_of_2.scalars.return_value.all.return_value = [e23]
-    children_of_3 = MagicMock()
-    children_of_3.scalars.return_value.all.return_value = [e32_cycle]
-
-    db.execute = AsyncMock(side_effect=[anc_empty, children_of_1, children_of_2, children_of_3])
+    await _seed(
+        graph_db,
+        edges=[_edge(edge_id=1, src=2, dst=1), _edge(edge_id=2, src=3, dst=2), _edge(edge_id=3, src=2, dst=3)],
+    )
 
-    payload = await service.get_thread(tenant_id=1, document_id=1, max_depth=4)
+    payload = await DocumentGraphService(graph_db).get_thread(tenant_id=1, document_id=1, max_depth=4)
     descendant_ids = [h["document_id"] for h in payload["descendants"]]
     assert descendant_ids == [2, 3]
     assert len(descendant_ids) == len(set(descendant_ids))
@@ -269,24 +253,11 @@ def test_document_thread_hop_schema_requires_enrichment_fields():
 
 
 @pytest.mark.asyncio
-async def test_get_thread_hops_carry_title_reference_href_origin_status():
-    db = MagicMock()
-    service = DocumentGraphService(db)
-    service._get_document_or_404 = AsyncMock(return_value=_doc(10, title="SOP"))  # type: ignore[method-assign]
-    service._documents_by_ids = AsyncMock(  # type: ignore[method-assign]
-        return_value={20: _doc(20, title="IM Policy", pel="POL-IM-001", reference="DOC-2026-0020")}
-    )
-
-    parent = _edge(edge_id=5, src=10, dst=20, status=DocumentEdgeStatus.CONFIRMED)
-    parent_result = MagicMock()
-    parent_result.scalars.return_value.all.return_value = [parent]
-    next_empty = MagicMock()
-    next_empty.scalars.return_value.all.return_value = []
-    child_empty = MagicMock()
-    child_empty.scalars.return_value.all.return_value = []
-    db.execute = AsyncMock(side_effect=[parent_result, next_empty, child_empty])
+async def test_get_thread_hops_carry_title_reference_href_origin_status(graph_db):
+    await _seed(graph_db, docs={10: "SOP", 20: "IM Policy"}, pels={20: "POL-IM-001"})
+    await _seed(graph_db, edges=[_edge(edge_id=5, src=10, dst=20, status=DocumentEdgeStatus.CONFIRMED)])
 
-    payload = await service.get_thread(tenant_id=1, document_id=10)
+    payload = await DocumentGraphService(graph_db).get_thread(tenant_id=1, document_id=10)
     hop = payload["ancestors"][0]
     assert hop["title"] == "IM Policy"
     assert hop["reference"] == "POL-IM-001"
@@ -20,15 +20,17 @@ from src.domain.services.external_audit_ocr_service import ExternalAuditExtracti
 async def test_extract_bytes_skips_ocr_when_native_is_rich(monkeypatch: pytest.MonkeyPatch) -> None:
     rich_text = " ".join(f"word{i}" for i in range(LIBRARY_THIN_NATIVE_WORD_THRESHOLD + 5))
     monkeypatch.setattr(
-        "src.domain.services.document_intelligence_service.extract_document_content",
-        lambda *_args, **_kwargs: SimpleNamespace(
-            text=rich_text,
-            page_texts=[rich_text],
-            extraction_method="pdf_text",
-            page_count=1,
-            sheet_count=None,
-            has_tables=False,
-            note=None,
+        "src.domain.services.document_intelligence_service.extract_document_content_async",
+        AsyncMock(
+            return_value=SimpleNamespace(
+                text=rich_text,
+                page_texts=[rich_text],
+                extraction_method="pdf_text",
+                page_count=1,
+                sheet_count=None,
+                has_tables=False,
+                note=None,
+            ),
         ),
     )
     ocr_service = SimpleNamespace(
@@ -58,15 +60,17 @@ async def test_extract_bytes_skips_ocr_when_native_is_rich(monkeypatch: pytest.M
 @pytest.mark.asyncio
 async def test_extract_bytes_uses_mistral_when_native_is_thin(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        "src.domain.services.document_intelligence_service.extract_document_content",
-        lambda *_args, **_kwargs: SimpleNamespace(
-            text="scan artifact",
-            page_texts=["scan artifact"],
-            extraction_method="pdf_text",
-            page_count=1,
-            sheet_count=None,
-            has_tables=False,
-            note=None,
+        "src.domain.services.document_intelligence_service.extract_document_content_async",
+        AsyncMock(
+            return_value=SimpleNamespace(
+                text="scan artifact",
+                page_texts=["scan artifact"],
+                extraction_method="pdf_text",
+                page_count=1,
+                sheet_count=None,
+                has_tables=False,
+                note=None,
+            ),
         ),
     )
     merged = ExternalAuditExtractionResult(
@@ -150,15 +154,17 @@ async def test_extract_bytes_azure_di_failover_when_mistral_missing(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.setattr(
-        "src.domain.services.document_intelligence_service.extract_document_content",
-        lambda *_args, **_kwargs: SimpleNamespace(
-            text="scan",
-            page_texts=["scan"],
-            extraction_method="pdf_text",
-            page_count=1,
-            sheet_count=None,
-            has_tables=False,
-            note=None,
+        "src.domain.services.document_intelligence_service.extract_document_content_async",
+        AsyncMock(
+            return_value=SimpleNamespace(
+                text="scan",
+                page_texts=["scan"],
+                extraction_method="pdf_text",
+                page_count=1,
+                sheet_count=None,
+                has_tables=False,
+                note=None,
+            ),
         ),
     )
     azure_pages = [SimpleNamespace(text="Azure recovered full scanned policy text for indexing.", table_count=0)]
@@ -0,0 +1,173 @@
+"""Weekly trend series come from one grouped statement, not one query per week.
+
+``_week_buckets`` replaced a loop that issued a COUNT (or AVG) per window. These
+tests pin the new path to the old definition: the statement is run for real on
+SQLite against a per-window reference count/average, and a PostgreSQL-dialect
+session is checked for receiving a single GROUP BY statement whose rows map
+back to windows.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, List
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import Column, DateTime, Float, Integer, MetaData, Table, and_, insert
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.domain.services.executive_dashboard import _TREND_WEEK, ExecutiveDashboardService
+
+TENANT_ID = 7
+NOW = datetime(2026, 10, 14, 15, 30, tzinfo=timezone.utc)
+
+_metadata = MetaData()
+_events = Table(
+    "trend_bucket_events",
+    _metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tenant_id", Integer),
+    Column("deleted_at", DateTime(timezone=True)),
+    Column("occurred_at", DateTime(timezone=True)),
+    Column("score", Float),
+)
+# ``_tenant_filter`` reads ``model.tenant_id`` / ``model.deleted_at`` as on a mapped class.
+_EventModel = _events.c
+
+
+def _windows(weeks: int) -> List[tuple[datetime, datetime, str]]:
+    windows = []
+    for i in range(weeks, 0, -1):
+        week_end = NOW - (i - 1) * _TREND_WEEK
+        week_start = week_end - _TREND_WEEK
+        windows.append((week_start, week_end, week_start.strftime("%Y-%m-%d")))
+    return windows
+
+
+def _rows() -> List[dict[str, Any]]:
+    rows: List[dict[str, Any]] = []
+    for index in range(240):
+        rows.append(
+            {
+                "tenant_id": TENANT_ID if index % 5 else TENANT_ID + 1,
+                "deleted_at": NOW if index % 17 == 0 else None,
+                "occurred_at": NOW - timedelta(hours=7 * index + 3),
+                "score": None if index % 11 == 0 else float(40 + index % 57),
+            }
+        )
+    # Exact window boundaries: the start is inclusive and the end exclusive.
+    for window_start, window_end, _label in _windows(6):
+        rows.append({"tenant_id": TENANT_ID, "deleted_at": None, "occurred_at": window_start, "score": 10.0})
+        rows.append({"tenant_id": TENANT_ID, "deleted_at": None, "occurred_at": window_end, "score": 90.0})
+    return rows
+
+
+def _reference(rows: List[dict[str, Any]], windows: List[tuple[datetime, datetime, str]]) -> dict[int, tuple]:
+    """The per-window definition the old query loop used."""
+    expected: dict[int, tuple] = {}
+    for index, (start, end, _label) in enumerate(windows):
+        hits = [
+            row
+            for row in rows
+            if row["tenant_id"] == TENANT_ID and row["deleted_at"] is None and start <= row["occurred_at"] < end
+        ]
+        if hits:
+            scores = [row["score"] for row in hits if row["score"] is not None]
+            expected[index] = (len(hits), sum(scores) / len(scores) if scores else None)
+    return expected
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(_metadata.create_all)
+        await conn.execute(insert(_events), _rows())
+    factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    async with factory() as db:
+        yield db
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("weeks", [1, 4, 6, 12])
+async def test_buckets_match_per_window_reference(session, weeks):
+    service = ExecutiveDashboardService(session, tenant_id=TENANT_ID)
+    windows = _windows(weeks)
+
+    buckets = await service._week_buckets(
+        windows, _events.c.occurred_at, service._tenant_filter(_EventModel), value_col=_events.c.score
+    )
+
+    expected = _reference(_rows(), windows)
+    assert buckets.keys() == expected.keys()
+    for index, (count, average) in expected.items():
+        assert buckets[index][0] == count
+        assert buckets[index][1] == pytest.approx(average)
+
+
+@pytest.mark.asyncio
+async def test_count_series_keeps_shape_and_fills_empty_weeks(session):
+    service = ExecutiveDashboardService(session, tenant_id=TENANT_ID)
+    windows = _windows(60)
+
+    series = await service._trend_count_in_window(windows, _EventModel, _events.c.occurred_at)
+
+    expected = _reference(_rows(), windows)
+    assert [entry["week_start"] for entry in series] == [label for _start, _end, label in windows]
+    assert [entry["count"] for entry in series] == [expected.get(i, (0, None))[0] for i in range(len(windows))]
+    assert series[0]["count"] == 0  # older than any seeded row
+
+
+class _Result:
+    def __init__(self, rows: List[tuple]):
+        self._rows = rows
+
+    def all(self) -> List[tuple]:
+        return self._rows
+
+
+@pytest.mark.asyncio
+async def test_audit_series_is_one_grouped_statement_on_postgres():
+    statements: List[Any] = []
+
+    async def execute(statement):
+        statements.append(statement)
+        return _Result([(0, 3, 71.25), (2, 1, 88.0)])
+
+    db = SimpleNamespace(
+        execute=execute,
+        get_bind=lambda: SimpleNamespace(dialect=SimpleNamespace(name="postgresql")),
+        new=(),
+        dirty=(),
+        deleted=(),
+        begin_nested=MagicMock(),
+    )
+    service = ExecutiveDashboardService(db, tenant_id=TENANT_ID)  # type: ignore[arg-type]
+
+    series = await service._trend_audits_weekly(_windows(4))
+
+    assert len(statements) == 1
+    sql = str(statements[0].compile(dialect=postgresql.dialect()))
+    assert "GROUP BY" in sql and "CASE WHEN" in sql
+    assert series == [
+        {"week_start": _windows(4)[0][2], "count": 71, "value": 71.2},
+        {"week_start": _windows(4)[1][2], "count": 0, "value": None},
+        {"week_start": _windows(4)[2][2], "count": 88, "value": 88.0},
+        {"week_start": _windows(4)[3][2], "count": 0, "value": None},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_count_criteria_are_applied_in_sql(session):
+    service = ExecutiveDashboardService(session, tenant_id=TENANT_ID)
+    windows = _windows(6)
+
+    buckets = await service._week_buckets(
+        windows, _events.c.occurred_at, and_(service._tenant_filter(_EventModel), _events.c.score > 1000)
+    )
+
+    assert buckets == {}
@@ -37,6 +37,9 @@ class _FakeResult:
     def scalars(self):
         return _FakeScalars(self._values)
 
+    def all(self):
+        return list(self._values)
+
 
 @pytest.mark.asyncio
 async def test_catalog_returns_live_counts_and_honest_capabilities():
@@ -46,6 +49,7 @@ async def test_catalog_returns_live_counts_and_honest_capabilities():
     catalog = await service.get_catalog(tenant_id=42)
 
     assert catalog["capabilities"]["sync_csv"] is True
+    assert catalog["capabilities"]["async_jobs"] is True
     assert catalog["capabilities"]["job_history"] is False
     assert catalog["capabilities"]["scheduled_templates"] is False
     assert catalog["capabilities"]["max_sync_rows"] == SYNC_ROW_LIMIT
@@ -53,6 +57,7 @@ async def test_catalog_returns_live_counts_and_honest_capabilities():
     assert catalog["modules"][0]["id"] == "incidents"
     assert catalog["modules"][0]["record_count"] == 0
     assert catalog["modules"][0]["formats"] == ["csv"]
+    assert catalog["modules"][0]["job_formats"] == ["csv", "xlsx"]
     assert catalog["modules"][6]["id"] == "documents"
     assert catalog["modules"][6]["record_count"] == 6
     assert catalog["modules"][6]["formats"] == ["csv", "xlsx", "pdf"]
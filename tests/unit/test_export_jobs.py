@@ -0,0 +1,152 @@
+"""Uncapped Export Center jobs: streamed rows into CSV / XLSX files and storage."""
+
+from __future__ import annotations
+
+import csv
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import sqlalchemy as sa
+from openpyxl import load_workbook
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import src.domain.models  # noqa: F401 - resolve Incident's foreign keys
+from src.api.routes.exports import get_export_job
+from src.domain.exceptions import BadRequestError, NotFoundError
+from src.domain.models.incident import Incident
+from src.domain.services import export_stream
+from src.domain.services.export_center_service import SYNC_ROW_LIMIT, ExportCenterService
+from src.domain.services.export_stream import TabularFileWriter, csv_chunks
+from src.infrastructure.storage import LocalFileStorageService
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Incident.__table__.create(sync_conn))
+        await conn.execute(
+            sa.insert(Incident.__table__),
+            [
+                {
+                    "tenant_id": 1 if n % 100 else 2,
+                    "reference_number": f"INC-{n:05d}",
+                    "title": f"Incident {n}",
+                    "incident_type": "injury",
+                    "severity": "low",
+                    "status": "reported",
+                    "incident_date": datetime(2026, 1, 1),
+                    "reported_date": datetime(2026, 1, 2),
+                    "description": "",
+                }
+                for n in range(1, SYNC_ROW_LIMIT + 201)
+            ],
+        )
+    async with async_sessionmaker(engine)() as db:
+        yield db
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_write_export_streams_every_tenant_row_past_the_sync_cap(session, tmp_path):
+    result = await ExportCenterService(session).write_export(1, "incidents", "csv", tmp_path)
+
+    with open(result.path, newline="", encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+    assert rows[0][:3] == ["id", "reference_number", "title"]
+    expected = [n for n in range(SYNC_ROW_LIMIT + 200, 0, -1) if n % 100]
+    assert [int(row[0]) for row in rows[1:]] == expected
+    assert result.row_count == len(expected) > SYNC_ROW_LIMIT
+    assert rows[1][3:6] == ["injury", "low", "reported"]
+    assert result.media_type.startswith("text/csv")
+
+
+@pytest.mark.asyncio
+async def test_write_export_xlsx_matches_csv(session, tmp_path):
+    service = ExportCenterService(session)
+    xlsx = await service.write_export(2, "incidents", "xlsx", tmp_path)
+    as_csv = await service.write_export(2, "incidents", "csv", tmp_path)
+
+    sheet = load_workbook(xlsx.path, read_only=True).active
+    xlsx_rows = [[cell if cell is not None else "" for cell in row] for row in sheet.iter_rows(values_only=True)]
+    with open(as_csv.path, newline="", encoding="utf-8") as handle:
+        csv_rows = list(csv.reader(handle))
+    assert xlsx.row_count == as_csv.row_count == len(csv_rows) - 1
+    assert [[str(cell) for cell in row] for row in xlsx_rows] == csv_rows
+
+
+@pytest.mark.asyncio
+async def test_job_formats_are_validated_before_queueing():
+    service = ExportCenterService(SimpleNamespace())
+    service.validate_job_request("incidents", "xlsx")
+    with pytest.raises(BadRequestError, match="Supported: csv, xlsx"):
+        service.validate_job_request("incidents", "pdf")
+    with pytest.raises(BadRequestError, match="authenticated user"):
+        service.validate_job_request("documents", "pdf")
+
+
+def test_xlsx_writer_continues_on_a_new_sheet_at_the_row_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_stream, "XLSX_MAX_ROWS", 3)
+    with TabularFileWriter(tmp_path / "out.xlsx", "xlsx", ["n"], sheet_title="Rows") as writer:
+        for n in range(5):
+            writer.writerow([n])
+
+    workbook = load_workbook(tmp_path / "out.xlsx", read_only=True)
+    assert workbook.sheetnames == ["Rows", "Rows (2)", "Rows (3)"]
+    assert [row[0] for row in workbook["Rows (2)"].iter_rows(values_only=True)] == ["n", 2, 3]
+    assert writer.row_count == 5
+
+
+@pytest.mark.asyncio
+async def test_csv_chunks_encode_a_bounded_number_of_rows_each():
+    async def rows():
+        for n in range(7):
+            yield [n, f"row {n}"]
+
+    chunks = [chunk async for chunk in csv_chunks(rows(), rows_per_chunk=3)]
+
+    assert [chunk.count(b"\n") for chunk in chunks] == [3, 3, 1]
+    assert b"".join(chunks).decode().splitlines()[6] == "6,row 6"
+
+
+@pytest.mark.asyncio
+async def test_local_storage_upload_file_copies_from_disk(tmp_path):
+    source = tmp_path / "export.csv"
+    source.write_text("id\n1\n")
+    storage = LocalFileStorageService(base_path=str(tmp_path / "blobs"))
+
+    await storage.upload_file("exports/1/job/export.csv", source, "text/csv", metadata={"tenant_id": "1"})
+
+    assert await storage.download("exports/1/job/export.csv") == b"id\n1\n"
+
+
+@pytest.mark.asyncio
+async def test_job_status_hides_results_from_other_tenants_and_users():
+    finished = SimpleNamespace(
+        state="SUCCESS",
+        result={
+            "tenant_id": 1,
+            "user_id": 7,
+            "module": "incidents",
+            "format": "csv",
+            "filename": "incidents_export.csv",
+            "row_count": 3,
+            "storage_key": "exports/1/job-1/incidents_export.csv",
+        },
+    )
+    with (
+        patch("src.infrastructure.tasks.export_tasks.run_export_job.AsyncResult", return_value=finished),
+        patch("src.infrastructure.tasks.export_tasks.export_download_url", return_value="https://signed"),
+    ):
+        own = await get_export_job("job-1", current_user=SimpleNamespace(tenant_id=1, id=7))
+        with pytest.raises(NotFoundError):
+            await get_export_job("job-1", current_user=SimpleNamespace(tenant_id=2, id=7))
+        # Same tenant, other user: the documents register is filtered by the requester's ACL.
+        with pytest.raises(NotFoundError):
+            await get_export_job("job-1", current_user=SimpleNamespace(tenant_id=1, id=8))
+
+    assert own.status == "completed"
+    assert own.row_count == 3
+    assert own.download_url == "https://signed"
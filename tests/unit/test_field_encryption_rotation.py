@@ -0,0 +1,153 @@
+"""Key rotation for EncryptedString columns, and the per-request decrypt memo.
+
+The models declare no EncryptedString column yet, so the table here is
+test-local: discovery must find it from metadata the same way it would find
+a model's.
+"""
+
+from __future__ import annotations
+
+import pytest
+import sqlalchemy as sa
+from cryptography.fernet import Fernet
+
+from src.core.config import settings
+from src.infrastructure.encryption import encrypted_type
+from src.infrastructure.encryption.encrypted_type import EncryptedString, begin_decrypt_memo, end_decrypt_memo
+from src.infrastructure.encryption.field_encryption import FieldEncryptor
+from src.infrastructure.encryption.key_rotation import (
+    RotationProgress,
+    discover_encrypted_columns,
+    rotate_encrypted_columns,
+)
+from src.infrastructure.middleware.decrypt_memo import DecryptMemoMiddleware
+
+OLD_KEY = Fernet.generate_key().decode()
+NEW_KEY = Fernet.generate_key().decode()
+STRANGER_KEY = Fernet.generate_key().decode()
+
+
+@pytest.fixture
+def metadata():
+    metadata = sa.MetaData()
+    sa.Table(
+        "contacts",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("email", EncryptedString(255)),
+        sa.Column("phone", EncryptedString(64)),
+        sa.Column("label", sa.String(50)),
+    )
+    sa.Table("plain", metadata, sa.Column("id", sa.Integer, primary_key=True), sa.Column("note", sa.String(50)))
+    return metadata
+
+
+@pytest.fixture
+def engine(tmp_path, metadata):
+    engine = sa.create_engine(f"sqlite+pysqlite:///{tmp_path / 'rotation.db'}")
+    metadata.create_all(engine)
+    old, stranger = FieldEncryptor(OLD_KEY), FieldEncryptor(STRANGER_KEY)
+    rows = [
+        {"id": n, "email": old.encrypt(f"user{n}@example.com"), "phone": old.encrypt(f"0700{n:04d}"), "label": "x"}
+        for n in range(1, 11)
+    ]
+    rows[3]["phone"] = "07000000 (legacy plaintext)"
+    rows[5]["email"] = stranger.encrypt("lost@example.com")
+    rows[7]["phone"] = None
+    with engine.begin() as conn:
+        conn.execute(
+            sa.text("INSERT INTO contacts (id, email, phone, label) VALUES (:id, :email, :phone, :label)"), rows
+        )
+    yield engine
+    engine.dispose()
+
+
+def _raw(engine) -> dict[int, tuple]:
+    with engine.connect() as conn:
+        return {row[0]: tuple(row[1:]) for row in conn.execute(sa.text("SELECT id, email, phone FROM contacts"))}
+
+
+def test_discovery_finds_encrypted_columns_from_metadata(metadata):
+    found = discover_encrypted_columns(metadata)
+    assert {table.name: [column.name for column in columns] for table, columns in found.items()} == {
+        "contacts": ["email", "phone"]
+    }
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_rotation_rewrites_old_values_under_the_primary_key(engine, metadata, workers):
+    saved: list[dict] = []
+    progress = rotate_encrypted_columns(
+        engine,
+        metadata,
+        key=f"{NEW_KEY},{OLD_KEY}",
+        batch_size=3,
+        workers=workers,
+        on_batch=lambda state: saved.append(state.to_dict()),
+    )
+
+    state = progress["contacts"]
+    assert state.done and state.rows_scanned == 10
+    assert state.counts == {"rotated": 17, "encrypted": 1, "unreadable": 1, "empty": 1}
+    assert [entry["last_key"] for entry in saved] == [3, 6, 9, 10, 10]
+
+    new_only = FieldEncryptor(NEW_KEY)
+    raw = _raw(engine)
+    assert new_only.decrypt(raw[1][0]) == "user1@example.com"
+    assert new_only.decrypt(raw[4][1]) == "07000000 (legacy plaintext)"
+    assert FieldEncryptor(STRANGER_KEY).decrypt(raw[6][0]) == "lost@example.com"  # left as it was
+    assert raw[8][1] is None
+
+    again = rotate_encrypted_columns(engine, metadata, key=f"{NEW_KEY},{OLD_KEY}", batch_size=4)
+    assert again["contacts"].counts == {"current": 18, "unreadable": 1, "empty": 1}
+    assert _raw(engine) == raw
+
+
+def test_an_interrupted_run_resumes_after_its_last_batch(engine, metadata):
+    key = f"{NEW_KEY},{OLD_KEY}"
+    resumed = {"contacts": RotationProgress("contacts", ["email", "phone"], last_key=6, rows_scanned=6)}
+
+    progress = rotate_encrypted_columns(engine, metadata, key=key, batch_size=3, progress=resumed)
+
+    assert progress["contacts"].rows_scanned == 10
+    raw = _raw(engine)
+    assert FieldEncryptor(NEW_KEY).decrypt(raw[2][0]) == raw[2][0], "rows before the cursor were not revisited"
+    assert FieldEncryptor(NEW_KEY).decrypt(raw[7][0]) == "user7@example.com"
+
+    progress["contacts"].counts.clear()
+    assert rotate_encrypted_columns(engine, metadata, key=key, progress=progress)["contacts"].counts == {}
+
+
+def test_decrypt_memo_runs_fernet_once_per_ciphertext_within_a_request(monkeypatch):
+    column_type = EncryptedString()
+    column_type._encryptor = FieldEncryptor(NEW_KEY)
+    ciphertext = column_type.process_bind_param("secret", None)
+    calls = []
+    real_decrypt = column_type._encryptor.decrypt
+    monkeypatch.setattr(column_type._encryptor, "decrypt", lambda value: calls.append(value) or real_decrypt(value))
+
+    assert column_type.process_result_value(ciphertext, None) == "secret"
+    token = begin_decrypt_memo()
+    try:
+        for _ in range(5):
+            assert column_type.process_result_value(ciphertext, None) == "secret"
+    finally:
+        end_decrypt_memo(token)
+    assert column_type.process_result_value(ciphertext, None) == "secret"
+
+    assert len(calls) == 3
+    assert encrypted_type._decrypt_memo.get() is None
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+async def test_decrypt_memo_middleware_binds_the_memo_for_the_request_only(monkeypatch, enabled):
+    monkeypatch.setattr(settings, "field_decrypt_memo_enabled", enabled)
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(encrypted_type._decrypt_memo.get())
+
+    await DecryptMemoMiddleware(app)({"type": "http"}, None, None)
+
+    assert seen == [{} if enabled else None]
+    assert encrypted_type._decrypt_memo.get() is None
@@ -1,14 +1,15 @@
 """Unit tests for the idempotency middleware.
 
 Tests helper functions, payload hashing, key generation,
-and dispatch logic with mocked Redis/request/response objects.
+and the middleware itself driven as an ASGI app with mocked Redis.
 """
 
 import hashlib
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
+from starlette.responses import Response
 
 from src.api.middleware.idempotency import _IDEMPOTENT_METHODS, IdempotencyMiddleware, _compute_payload_hash, _make_key
 
@@ -74,68 +75,91 @@ class TestIdempotentMethods:
 
 
 # =========================================================================
-# Middleware dispatch
+# Middleware (driven as an ASGI app)
 # =========================================================================
 
 
-def _make_request(method="POST", headers=None, body=b"{}"):
-    req = MagicMock()
-    req.method = method
-    req.headers = headers or {}
-    req.body = AsyncMock(return_value=body)
-    return req
+class _Downstream:
+    """ASGI app standing in for the handler; records calls and the body it read."""
+
+    def __init__(self, status_code=200, body=b'{"ok": true}'):
+        self.status_code = status_code
+        self.body = body
+        self.calls = 0
+        self.received = None
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        self.received = (await receive())["body"]
+        await Response(self.body, status_code=self.status_code, media_type="application/json")(scope, receive, send)
+
+
+async def _call(mw, method="POST", headers=None, body=b"{}"):
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": "/api/v1/incidents/",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "query_string": b"",
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await mw(scope, receive, send)
+    status = sent[0]["status"]
+    return status, b"".join(m.get("body", b"") for m in sent[1:])
 
 
 class TestMiddlewareDispatchNonIdempotent:
     @pytest.mark.asyncio
     async def test_get_passes_through(self):
-        mw = IdempotencyMiddleware(app=MagicMock())
-        call_next = AsyncMock(return_value=MagicMock())
-        request = _make_request(method="GET")
+        downstream = _Downstream()
+        mw = IdempotencyMiddleware(app=downstream)
 
-        result = await mw.dispatch(request, call_next)
-        call_next.assert_awaited_once_with(request)
+        await _call(mw, method="GET")
+        assert downstream.calls == 1
 
     @pytest.mark.asyncio
     async def test_delete_passes_through(self):
-        mw = IdempotencyMiddleware(app=MagicMock())
-        call_next = AsyncMock(return_value=MagicMock())
-        request = _make_request(method="DELETE")
+        downstream = _Downstream()
+        mw = IdempotencyMiddleware(app=downstream)
 
-        result = await mw.dispatch(request, call_next)
-        call_next.assert_awaited_once()
+        await _call(mw, method="DELETE")
+        assert downstream.calls == 1
 
     @pytest.mark.asyncio
     async def test_options_passes_through(self):
-        mw = IdempotencyMiddleware(app=MagicMock())
-        call_next = AsyncMock(return_value=MagicMock())
-        request = _make_request(method="OPTIONS")
+        downstream = _Downstream()
+        mw = IdempotencyMiddleware(app=downstream)
 
-        await mw.dispatch(request, call_next)
-        call_next.assert_awaited_once()
+        await _call(mw, method="OPTIONS")
+        assert downstream.calls == 1
 
 
 class TestMiddlewareNoKey:
     @pytest.mark.asyncio
     async def test_post_without_key_passes_through(self):
-        mw = IdempotencyMiddleware(app=MagicMock())
-        call_next = AsyncMock(return_value=MagicMock())
-        request = _make_request(method="POST", headers={})
+        downstream = _Downstream()
+        mw = IdempotencyMiddleware(app=downstream)
 
-        await mw.dispatch(request, call_next)
-        call_next.assert_awaited_once()
+        await _call(mw, method="POST", headers={})
+        assert downstream.calls == 1
 
 
 class TestMiddlewareRedisUnavailable:
     @pytest.mark.asyncio
     @patch("src.api.middleware.idempotency._get_redis", new_callable=AsyncMock, return_value=None)
     async def test_falls_back_when_redis_unavailable(self, mock_redis):
-        mw = IdempotencyMiddleware(app=MagicMock())
-        call_next = AsyncMock(return_value=MagicMock())
-        request = _make_request(headers={"Idempotency-Key": "test-key"})
+        downstream = _Downstream()
+        mw = IdempotencyMiddleware(app=downstream)
 
-        await mw.dispatch(request, call_next)
-        call_next.assert_awaited_once()
+        await _call(mw, headers={"Idempotency-Key": "test-key"})
+        assert downstream.calls == 1
 
 
 class TestMiddlewareCacheHit:
@@ -157,13 +181,12 @@ class TestMiddlewareCacheHit:
         redis_mock.get.return_value = cached
         mock_get_redis.return_value = redis_mock
 
-        mw = IdempotencyMiddleware(app=MagicMock())
-        call_next = AsyncMock()
-        request = _make_request(headers={"Idempotency-Key": "key-1"}, body=body)
+        downstream = _Downstream()
+        mw = IdempotencyMiddleware(app=downstream)
 
-        response = await mw.dispatch(request, call_next)
-        call_next.assert_not_awaited()
-        assert response.status_code == 200
+        status, _ = await _call(mw, headers={"Idempotency-Key": "key-1"}, body=body)
+        assert downstream.calls == 0
+        assert status == 200
 
     @pytest.mark.asyncio
     @patch("src.api.middleware.idempotency._get_redis")
@@ -181,13 +204,11 @@ class TestMiddlewareCacheHit:
         redis_mock.get.return_value = cached
         mock_get_redis.return_value = redis_mock
 
-        mw = IdempotencyMiddleware(app=MagicMock())
-        call_next = AsyncMock()
-        request = _make_request(headers={"Idempotency-Key": "key-2"}, body=b'{"new": true}')
+        mw = IdempotencyMiddleware(app=_Downstream())
 
-        response = await mw.dispatch(request, call_next)
-        assert response.status_code == 409
-        content = json.loads(response.body)
+        status, body = await _call(mw, headers={"Idempotency-Key": "key-2"}, body=b'{"new": true}')
+        assert status == 409
+        content = json.loads(body)
         assert content["error"]["code"] == "IDEMPOTENCY_CONFLICT"
 
 
@@ -200,25 +221,19 @@ class TestMiddlewareCacheMiss:
         redis_mock.set.return_value = True  # SET NX claim succeeded
         mock_get_redis.return_value = redis_mock
 
-        response_body = b'{"created": true}'
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.headers = MagicMock()
-        mock_response.headers.items.return_value = [("content-type", "application/json")]
+        downstream = _Downstream(status_code=201, body=b'{"created": true}')
+        mw = IdempotencyMiddleware(app=downstream)
 
-        async def body_iter():
-            yield response_body
-
-        mock_response.body_iterator = body_iter()
-
-        mw = IdempotencyMiddleware(app=MagicMock())
-        call_next = AsyncMock(return_value=mock_response)
-        request = _make_request(headers={"Idempotency-Key": "key-3"})
-
-        result = await mw.dispatch(request, call_next)
+        status, body = await _call(mw, headers={"Idempotency-Key": "key-3"}, body=b'{"title": "x"}')
         redis_mock.set.assert_awaited_once()
         redis_mock.setex.assert_awaited_once()
-        assert result.status_code == 201
+        assert status == 201
+        assert body == b'{"created": true}'
+        # The handler still reads the body the middleware hashed
+        assert downstream.received == b'{"title": "x"}'
+        cached = json.loads(redis_mock.setex.await_args.args[2])
+        assert cached["status_code"] == 201 and cached["body"] == '{"created": true}'
+        assert cached["headers"]["content-type"] == "application/json"
 
     @pytest.mark.asyncio
     @patch("src.api.middleware.idempotency._get_redis")
@@ -242,16 +257,15 @@ class TestMiddlewareCacheMiss:
         redis_mock.set.return_value = False
         mock_get_redis.return_value = redis_mock
 
-        mw = IdempotencyMiddleware(app=MagicMock())
-        call_next = AsyncMock()
-        request = _make_request(headers={"Idempotency-Key": "race-key"}, body=payload)
+        downstream = _Downstream()
+        mw = IdempotencyMiddleware(app=downstream)
 
         with patch("src.api.middleware.idempotency._IN_FLIGHT_POLL_INTERVAL_S", 0):
-            response = await mw.dispatch(request, call_next)
+            status, body = await _call(mw, headers={"Idempotency-Key": "race-key"}, body=payload)
 
-        call_next.assert_not_awaited()
-        assert response.status_code == 201
-        assert b'"id": 7' in response.body or b'"id":7' in response.body.replace(b" ", b"")
+        assert downstream.calls == 0
+        assert status == 201
+        assert b'"id": 7' in body or b'"id":7' in body.replace(b" ", b"")
 
 
 class TestMiddlewareRedisError:
@@ -262,20 +276,9 @@ class TestMiddlewareRedisError:
         redis_mock.get.side_effect = Exception("Connection lost")
         mock_get_redis.return_value = redis_mock
 
-        response_body = b'{"ok": true}'
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = MagicMock()
-        mock_response.headers.items.return_value = []
-
-        async def body_iter():
-            yield response_body
-
-        mock_response.body_iterator = body_iter()
-
-        mw = IdempotencyMiddleware(app=MagicMock())
-        call_next = AsyncMock(return_value=mock_response)
-        request = _make_request(headers={"Idempotency-Key": "key-err"})
+        downstream = _Downstream()
+        mw = IdempotencyMiddleware(app=downstream)
 
-        result = await mw.dispatch(request, call_next)
-        call_next.assert_awaited_once()
+        status, body = await _call(mw, headers={"Idempotency-Key": "key-err"})
+        assert downstream.calls == 1
+        assert status == 200 and body == b'{"ok": true}'
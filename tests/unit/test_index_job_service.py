@@ -132,6 +132,215 @@ def test_vector_index_configured_true_when_keys_present(monkeypatch: pytest.Monk
     assert warning is None
 
 
+@pytest.mark.asyncio
+async def test_resolve_resume_document_ids_prefers_pipeline_checkpoint() -> None:
+    job = SimpleNamespace(
+        id=9,
+        document_ids=[1, 2, 3, 4, 5],
+        documents_processed=3,
+        processed_document_ids=[1, 3, 4],
+        error_log=[{"message": "Document 3: upstream timeout"}],
+    )
+    service = IndexJobService(AsyncMock())
+    service.get_job = AsyncMock(return_value=job)
+
+    resume_ids = await service.resolve_resume_document_ids(9, tenant_id=1)
+
+    # Out-of-order completion: 2 and 5 were never reached, 3 failed.
+    assert resume_ids == [2, 3, 5]
+
+
+def _document(document_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=document_id,
+        tenant_id=1,
+        file_name=f"policy-{document_id}.pdf",
+        file_path=f"documents/policy-{document_id}.pdf",
+        file_type=SimpleNamespace(value="pdf"),
+        mime_type="application/pdf",
+        document_type=SimpleNamespace(value="policy"),
+        status=DocumentStatus.APPROVED,
+        has_tables=False,
+        indexing_error=None,
+    )
+
+
+def _job(document_ids: list[int]) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=5,
+        document_ids=document_ids,
+        tenant_id=1,
+        status=IndexJobStatus.PENDING,
+        started_at=None,
+        completed_at=None,
+        error_log=None,
+        previous_vector_ids=None,
+        documents_processed=0,
+        documents_succeeded=0,
+        documents_failed=0,
+        chunks_processed=0,
+        chunks_succeeded=0,
+        chunks_failed=0,
+        chunk_count=0,
+    )
+
+
+def _pipeline_db(documents: dict[int, SimpleNamespace]) -> AsyncMock:
+    db = AsyncMock()
+    db.get = AsyncMock(side_effect=lambda _model, document_id: documents.get(document_id))
+    db.flush = AsyncMock()
+    db.begin_nested = MagicMock()
+    previous_chunks_result = MagicMock()
+    previous_chunks_result.all.return_value = []
+    db.execute = AsyncMock(return_value=previous_chunks_result)
+    return db
+
+
+def _patch_ai_stack(monkeypatch: pytest.MonkeyPatch, analyze: AsyncMock | None = None) -> None:
+    chunk = SimpleNamespace(content="chunk", index=0, token_count=1, heading=None, char_start=0, char_end=5)
+    monkeypatch.setattr(
+        "src.domain.services.index_job_service.storage_service",
+        lambda: SimpleNamespace(download=AsyncMock(return_value=b"pdf-bytes")),
+    )
+    monkeypatch.setattr(
+        "src.domain.services.index_job_service.DocumentAIService",
+        lambda: SimpleNamespace(
+            analyze_document=analyze
+            or AsyncMock(
+                return_value=SimpleNamespace(
+                    summary="s",
+                    tags=[],
+                    keywords=[],
+                    topics=[],
+                    entities={},
+                    confidence=0.9,
+                    has_tables=False,
+                    has_images=False,
+                )
+            ),
+            generate_chunks=AsyncMock(return_value=[chunk]),
+        ),
+    )
+    monkeypatch.setattr(
+        "src.domain.services.index_job_service.EmbeddingService",
+        lambda: SimpleNamespace(generate_embeddings=AsyncMock(return_value=[[0.1, 0.2]])),
+    )
+    monkeypatch.setattr(
+        "src.domain.services.index_job_service.VectorSearchService",
+        lambda: SimpleNamespace(upsert_chunks=AsyncMock(return_value=True)),
+    )
+
+
+def _extraction(text: str = "Sample policy text for indexing.") -> SimpleNamespace:
+    return SimpleNamespace(
+        text=text,
+        hard_ocr_failure=False,
+        note=None,
+        page_count=1,
+        sheet_count=None,
+        has_tables=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_job_isolates_a_failing_document_and_checkpoints(monkeypatch: pytest.MonkeyPatch) -> None:
+    documents = {document_id: _document(document_id) for document_id in (1, 2, 3)}
+    job = _job([1, 2, 3])
+    service = IndexJobService(_pipeline_db(documents))
+    service.get_job = AsyncMock(return_value=job)
+
+    async def _extract(**kwargs):
+        if kwargs["filename"] == "policy-2.pdf":
+            raise RuntimeError("OCR provider timed out")
+        return _extraction()
+
+    service.intelligence_service.extract_bytes = AsyncMock(side_effect=_extract)
+    _patch_ai_stack(monkeypatch)
+    monkeypatch.setattr(
+        "src.domain.services.index_job_service.settings",
+        SimpleNamespace(index_job_pipeline_concurrency=2, index_job_checkpoint_every=1),
+    )
+    checkpoint = AsyncMock()
+
+    result = await service.process_job(5, tenant_id=1, checkpoint=checkpoint)
+
+    assert result.status == IndexJobStatus.COMPLETED
+    assert result.documents_processed == 3
+    assert result.documents_succeeded == 2
+    assert result.documents_failed == 1
+    assert sorted(result.processed_document_ids) == [1, 2, 3]
+    assert checkpoint.await_count == 3
+    assert documents[2].status == DocumentStatus.FAILED
+    assert documents[1].status == DocumentStatus.INDEXED
+    assert any(entry["message"].startswith("Document 2:") for entry in result.error_log)
+    assert result.metrics["concurrency"] == 2
+    assert result.metrics["stages"]["extract"]["count"] == 3
+    assert result.metrics["stages"]["upsert"]["count"] == 2
+    assert "documents_per_minute" in result.metrics
+
+
+@pytest.mark.asyncio
+async def test_process_job_reloads_rows_expired_by_a_failed_persist(monkeypatch: pytest.MonkeyPatch) -> None:
+    documents = {1: _document(1)}
+    job = _job([1])
+    db = _pipeline_db(documents)
+    service = IndexJobService(db)
+    service.get_job = AsyncMock(return_value=job)
+    service.intelligence_service.extract_bytes = AsyncMock(return_value=_extraction())
+    service._persist_document = AsyncMock(side_effect=RuntimeError("chunk insert failed"))  # type: ignore[method-assign]
+    _patch_ai_stack(monkeypatch)
+    monkeypatch.setattr(
+        "src.domain.services.index_job_service.settings",
+        SimpleNamespace(index_job_pipeline_concurrency=1, index_job_checkpoint_every=1),
+    )
+
+    result = await service.process_job(5, tenant_id=1)
+
+    # The savepoint rollback expires the document and job; both are reloaded before use.
+    refreshed = [call.args[0] for call in db.refresh.await_args_list]
+    assert documents[1] in refreshed and job in refreshed
+    assert documents[1].status == DocumentStatus.FAILED
+    assert result.documents_failed == 1
+    assert any(entry["message"] == "Document 1: chunk insert failed" for entry in result.error_log)
+
+
+@pytest.mark.asyncio
+async def test_process_job_overlaps_io_stages_across_documents(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    documents = {document_id: _document(document_id) for document_id in (1, 2, 3, 4)}
+    service = IndexJobService(_pipeline_db(documents))
+    service.get_job = AsyncMock(return_value=_job([1, 2, 3, 4]))
+    service.intelligence_service.extract_bytes = AsyncMock(return_value=_extraction())
+
+    in_flight = 0
+    peak = 0
+
+    async def _analyze(*_args):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return SimpleNamespace(
+            summary="s",
+            tags=[],
+            keywords=[],
+            topics=[],
+            entities={},
+            confidence=0.9,
+            has_tables=False,
+            has_images=False,
+        )
+
+    _patch_ai_stack(monkeypatch, analyze=AsyncMock(side_effect=_analyze))
+
+    result = await service.process_job(5, tenant_id=1, concurrency=2)
+
+    assert result.documents_succeeded == 4
+    assert peak == 2
+
+
 @pytest.mark.asyncio
 async def test_process_job_updates_document_progress_counters(monkeypatch: pytest.MonkeyPatch) -> None:
     document = SimpleNamespace(
@@ -139,6 +348,8 @@ async def test_process_job_updates_document_progress_counters(monkeypatch: pytes
         tenant_id=1,
         file_name="policy.pdf",
         file_path="documents/policy.pdf",
+        file_type=SimpleNamespace(value="pdf"),
+        mime_type="application/pdf",
         document_type=SimpleNamespace(value="policy"),
         status=DocumentStatus.APPROVED,
         has_tables=False,
@@ -164,6 +375,7 @@ async def test_process_job_updates_document_progress_counters(monkeypatch: pytes
     db = AsyncMock()
     db.get = AsyncMock(return_value=document)
     db.flush = AsyncMock()
+    db.begin_nested = MagicMock()
     previous_chunks_result = MagicMock()
     previous_chunks_result.all.return_value = []
     db.execute = AsyncMock(return_value=previous_chunks_result)
@@ -171,9 +383,7 @@ async def test_process_job_updates_document_progress_counters(monkeypatch: pytes
     service = IndexJobService(db)
     service.get_job = AsyncMock(return_value=job)
     service._append_error = AsyncMock()
-    service.intelligence_service.process = AsyncMock(
-        return_value=SimpleNamespace(text="Sample policy text for indexing.", hard_ocr_failure=False, note=None)
-    )
+    service.intelligence_service.extract_bytes = AsyncMock(return_value=_extraction())
     monkeypatch.setattr(
         "src.domain.services.index_job_service.storage_service",
         lambda: SimpleNamespace(download=AsyncMock(return_value=b"pdf-bytes")),
@@ -142,8 +142,8 @@ def test_the_w4_revision_is_the_only_revision_on_the_w3_head(tmp_path):
     assert mapping["on_top_of_w3"] == ["20261022_job_cell_req_ev"]
     # Tip head advances with later migrations; W4 remains the only successor of W3.
     assert mapping["heads"] == [
-        "20261113_standards_w6_edges"
-    ], f"expected the Int-W6 alignment-edges revision as the single head, found {mapping['heads']}"
+        "20261122_retention_cursors"
+    ], f"expected the retention sweep cursor revision as the single head, found {mapping['heads']}"
     assert mapping["on_top_of_w4"] == ["20261023_job_type_baselines"]
 
 
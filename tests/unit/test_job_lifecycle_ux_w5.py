@@ -118,8 +118,8 @@ def test_migration_chains_serially_from_the_w4_head():
 def test_the_w5_revision_is_the_only_head(tmp_path):
     heads = _alembic_revision_map(tmp_path)["heads"]
     assert heads == [
-        "20261113_standards_w6_edges"
-    ], f"expected the Int-W6 alignment-edges revision as the single head, found {heads}"
+        "20261122_retention_cursors"
+    ], f"expected the retention sweep cursor revision as the single head, found {heads}"
 
 
 def test_only_the_w5_revision_sits_on_the_w4_head(tmp_path):
@@ -0,0 +1,230 @@
+"""KRI runs share source metrics: one aggregate per source table, one commit.
+
+``KRIService.calculate_all_kris`` used to call ``calculate_kri`` per KRI, which
+re-read the KRI and recomputed every source count on its own. These tests run
+the planned path against SQLite and pin both halves of the contract: the values
+are what the per-source definitions give, and the statement count no longer
+grows with the number of KRIs.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.domain.models.incident import Incident, IncidentSeverity, IncidentStatus
+from src.domain.models.kri import (
+    KeyRiskIndicator,
+    KRIAlert,
+    KRICategory,
+    KRIMeasurement,
+    KRITrendDirection,
+    ThresholdStatus,
+)
+from src.domain.models.near_miss import NearMiss
+from src.domain.models.tenant import Tenant
+from src.domain.services.kri_metric_plan import KRIMetricPlan, evaluate_data_source
+from src.services.risk_scoring import KRIService
+
+NOW = datetime.now(timezone.utc)
+
+
+def _incident(n: int, *, days_ago: int, severity=IncidentSeverity.LOW, status=IncidentStatus.REPORTED) -> Incident:
+    when = NOW - timedelta(days=days_ago, hours=1)
+    return Incident(
+        tenant_id=1,
+        reference_number=f"INC-{n:05d}",
+        title=f"Incident {n}",
+        description="d",
+        incident_date=when,
+        reported_date=when,
+        created_at=when,
+        severity=severity,
+        status=status,
+    )
+
+
+def _near_miss(n: int, *, days_ago: int) -> NearMiss:
+    when = NOW - timedelta(days=days_ago, hours=1)
+    return NearMiss(
+        tenant_id=1,
+        reference_number=f"NM-{n:05d}",
+        reporter_name="r",
+        contract="c",
+        location="l",
+        event_date=when,
+        description="d",
+        created_at=when,
+    )
+
+
+def _kri(code: str, data_source: str, *, lower_is_better: bool = True) -> KeyRiskIndicator:
+    return KeyRiskIndicator(
+        code=code,
+        name=code,
+        category=KRICategory.SAFETY,
+        unit="count",
+        data_source=data_source,
+        lower_is_better=lower_is_better,
+        green_threshold=2,
+        amber_threshold=5,
+        red_threshold=10,
+        is_active=True,
+        auto_calculate=True,
+    )
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for table in (
+            Tenant.__table__,
+            Incident.__table__,
+            NearMiss.__table__,
+            KeyRiskIndicator.__table__,
+            KRIMeasurement.__table__,
+            KRIAlert.__table__,
+        ):
+            await conn.run_sync(table.create)
+    factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    async with factory() as session:
+        session.add_all(
+            [
+                _incident(1, days_ago=2, severity=IncidentSeverity.CRITICAL),
+                _incident(2, days_ago=10),
+                _incident(3, days_ago=20, status=IncidentStatus.CLOSED),
+                _incident(4, days_ago=45, status=IncidentStatus.CLOSED),
+                _incident(5, days_ago=80, status=IncidentStatus.UNDER_INVESTIGATION),
+                _incident(6, days_ago=200),
+                _near_miss(1, days_ago=5),
+                _near_miss(2, days_ago=40),
+                _near_miss(3, days_ago=60),
+                _near_miss(4, days_ago=85),
+            ]
+        )
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(engine):
+    factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    async with factory() as db:
+        yield db
+
+
+def _count_statements(engine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_plan_computes_each_metric_once_per_table(session, engine):
+    plan = KRIMetricPlan(
+        [
+            "incident_count",
+            "critical_incident_count",
+            "open_incident_count",
+            "incident_closure_rate",
+            "near_miss_reporting_ratio",
+        ]
+    )
+    statements = _count_statements(engine)
+
+    metrics = await plan.compute(session, NOW)
+
+    assert metrics == {
+        "incidents_30d": 3.0,
+        "critical_incidents_30d": 1.0,
+        "open_incidents": 4.0,
+        "incidents_created_90d": 5.0,
+        "incidents_closed_created_90d": 2.0,
+        "incidents_90d": 5.0,
+        "near_misses_90d": 4.0,
+    }
+    # One statement for all incident metrics, one for near misses.
+    selects = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 2
+
+
+def test_evaluate_data_source_formulas():
+    metrics = {
+        "incidents_30d": 3.0,
+        "workforce_size": 150.0,
+        "incidents_created_90d": 5.0,
+        "incidents_closed_created_90d": 2.0,
+        "near_misses_90d": 4.0,
+        "incidents_90d": 0.0,
+    }
+
+    assert evaluate_data_source("incident_count", metrics) == 3.0
+    assert evaluate_data_source("incident_rate_per_1000", metrics) == pytest.approx(20.0)
+    assert evaluate_data_source("incident_closure_rate", metrics) == pytest.approx(40.0)
+    assert evaluate_data_source("near_miss_reporting_ratio", metrics) == 40.0
+    assert evaluate_data_source("incident_closure_rate", {**metrics, "incidents_created_90d": 0.0}) == 100.0
+    assert evaluate_data_source("unknown_source", metrics) is None
+
+
+@pytest.mark.asyncio
+async def test_calculate_all_kris_shares_queries_and_commits_once(session, engine):
+    codes = [f"K{i:03d}" for i in range(30)]
+    sources = ["incident_count", "incident_rate_per_1000", "near_miss_count", "open_incident_count", "bogus"]
+    session.add_all([_kri(code, sources[i % len(sources)]) for i, code in enumerate(codes)])
+    await session.commit()
+    statements = _count_statements(engine)
+
+    results = await KRIService(session).calculate_all_kris()
+
+    by_source = {
+        source: {round(r["value"], 6) for r in results if r["kri_code"] in codes[i :: len(sources)]}
+        for i, source in enumerate(sources)
+    }
+    assert by_source == {
+        "incident_count": {3.0},
+        "incident_rate_per_1000": {12.0},
+        "near_miss_count": {1.0},
+        "open_incident_count": {4.0},
+        "bogus": set(),
+    }
+    assert len(results) == 24
+    selects = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    # KRIs, incident aggregate, near-miss aggregate, tenant headcount, history.
+    assert len(selects) == 5
+    assert sum(1 for sql in statements if sql.lstrip().upper().startswith("INSERT INTO KRI_MEASUREMENTS")) == 1
+    measured = (await session.execute(select(KRIMeasurement.kri_id))).scalars().all()
+    assert len(measured) == 24
+
+
+@pytest.mark.asyncio
+async def test_batched_history_drives_trend_and_status(session):
+    kri = _kri("TREND", "incident_count")
+    session.add(kri)
+    await session.flush()
+    for days_ago, value in ((3, 9.0), (2, 8.0), (1, 10.0), (20, 0.0)):
+        session.add(
+            KRIMeasurement(
+                kri_id=kri.id,
+                measurement_date=NOW - timedelta(days=days_ago),
+                value=value,
+                status=ThresholdStatus.RED,
+            )
+        )
+    await session.commit()
+
+    result = await KRIService(session).calculate_kri(kri.id)
+
+    # Mean of the three most recent (9, 8, 10) is 9; 3 is well below it.
+    assert result is not None
+    assert result["value"] == 3.0
+    assert result["status"] == ThresholdStatus.AMBER.value
+    assert result["trend"] == KRITrendDirection.IMPROVING.value
@@ -12,7 +12,8 @@ import pytest
 
 from src.api.routes import documents
 from src.domain.exceptions import NotFoundError
-from src.domain.models.document import DocumentStatus, IndexJobStatus
+from src.domain.models.document import DocumentStatus, FileType, IndexJobStatus
+from src.domain.services.document_intelligence_service import DocumentIntelligenceResult
 from src.domain.services.index_job_service import IndexJobService
 
 
@@ -294,6 +295,8 @@ def _make_process_job_fixture(monkeypatch: pytest.MonkeyPatch, *, upsert_result:
         tenant_id=1,
         file_name="policy.pdf",
         file_path="documents/policy.pdf",
+        file_type=FileType.PDF,
+        mime_type="application/pdf",
         document_type=SimpleNamespace(value="policy"),
         status=DocumentStatus.APPROVED,
         has_tables=False,
@@ -320,6 +323,7 @@ def _make_process_job_fixture(monkeypatch: pytest.MonkeyPatch, *, upsert_result:
     db = AsyncMock()
     db.get = AsyncMock(return_value=document)
     db.flush = AsyncMock()
+    db.begin_nested = MagicMock()
     previous_chunks_result = MagicMock()
     previous_chunks_result.all.return_value = []
     db.execute = AsyncMock(return_value=previous_chunks_result)
@@ -327,8 +331,14 @@ def _make_process_job_fixture(monkeypatch: pytest.MonkeyPatch, *, upsert_result:
     service = IndexJobService(db)
     service.get_job = AsyncMock(return_value=job)
     service._append_error = AsyncMock()
-    service.intelligence_service.process = AsyncMock(
-        return_value=SimpleNamespace(text="Sample policy text for indexing.", hard_ocr_failure=False, note=None)
+    service.intelligence_service.extract_bytes = AsyncMock(
+        return_value=DocumentIntelligenceResult(
+            text="Sample policy text for indexing.",
+            page_texts=[],
+            extraction_method="native",
+            hard_ocr_failure=False,
+            note=None,
+        )
     )
     monkeypatch.setattr(
         "src.domain.services.index_job_service.storage_service",
@@ -1,8 +1,13 @@
 """Unit tests for Safety lookup similarity / duplicate guards."""
 
+import random
+
 from src.domain.services.lookup_similarity import (
     SIMILAR_THRESHOLD,
+    LookupMatchIndex,
+    SimilarMatch,
     classify_lookup_name,
+    classify_many,
     find_exact_match,
     find_similar_matches,
     normalise_lookup_key,
@@ -48,3 +53,46 @@ def test_classify_reuse_similar_new():
 
 def test_unrelated_names_score_low():
     assert similarity_score("Axle Stand", "Microwave") < SIMILAR_THRESHOLD
+
+
+def _brute_force_similar(name, candidates, threshold):
+    key = normalise_lookup_key(name)
+    scored = [
+        SimilarMatch(id=candidate_id, name=candidate_name, score=round(similarity_score(name, candidate_name), 4))
+        for candidate_id, candidate_name in candidates
+        if similarity_score(name, candidate_name) >= threshold and normalise_lookup_key(candidate_name) != key
+    ]
+    scored.sort(key=lambda item: (-item.score, item.name.lower(), item.id))
+    return scored
+
+
+def test_index_matches_brute_force_scoring_across_thresholds():
+    rng = random.Random(29)
+    words = ["d shackle", "torque wrench", "gas detector", "rcd tester", "axle stand", "depot north", "van"]
+
+    def typo(word: str) -> str:
+        chars = list(word)
+        for _ in range(rng.randint(0, 3)):
+            position = rng.randrange(len(chars))
+            chars[position] = rng.choice("abcdefghij -")
+        return "".join(chars)
+
+    candidates = [(index, typo(rng.choice(words))) for index in range(400)] + [(900, ""), (901, "ab")]
+    index = LookupMatchIndex(candidates)
+    for threshold in (SIMILAR_THRESHOLD, 0.6, 0.3):
+        for _ in range(40):
+            name = typo(rng.choice(words))
+            assert index.similar(name, threshold=threshold, limit=1000) == _brute_force_similar(
+                name, candidates, threshold
+            )
+
+
+def test_classify_many_matches_single_classification_in_order():
+    candidates = [(1, "D Shackle"), (2, "Torque Wrench"), (3, "d-shackle")]
+    names = ["Gas Detector", "D Shackel", "d  shackle", "D Shackel"]
+
+    results = classify_many(names, candidates)
+
+    assert results == [classify_lookup_name(name, candidates) for name in names]
+    assert [intent for intent, _exact, _similar in results] == ["new", "similar", "reuse", "similar"]
+    assert results[2][1] == (1, "D Shackle")
@@ -0,0 +1,122 @@
+"""Metric registry: one instrument per name, of its declared kind, fed in batches.
+
+Reads back through an in-memory OpenTelemetry reader, so the assertions cover
+what an exporter would receive.
+"""
+
+from __future__ import annotations
+
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from src.infrastructure.monitoring import azure_monitor
+from src.infrastructure.monitoring.metric_registry import MetricKind, MetricRegistry, MetricSpec
+
+
+class _CountingMeter:
+    """Delegates to a real meter and counts instrument creation."""
+
+    def __init__(self, meter):
+        self._meter = meter
+        self.created: list[str] = []
+
+    def __getattr__(self, attr):
+        create = getattr(self._meter, attr)
+
+        def counted(name, *args, **kwargs):
+            self.created.append(name)
+            return create(name, *args, **kwargs)
+
+        return counted
+
+
+def _collect(reader: InMemoryMetricReader) -> dict[str, dict]:
+    """name -> {frozenset(attributes): value} (histograms give (count, sum))."""
+    out: dict[str, dict] = {}
+    for resource_metrics in reader.get_metrics_data().resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                points = out.setdefault(metric.name, {})
+                for point in metric.data.data_points:
+                    value = (point.count, point.sum) if hasattr(point, "bucket_counts") else point.value
+                    points[frozenset(point.attributes.items())] = value
+    return out
+
+
+@pytest.fixture
+def reader():
+    return InMemoryMetricReader()
+
+
+@pytest.fixture
+def meter(reader):
+    return _CountingMeter(MeterProvider(metric_readers=[reader]).get_meter("test"))
+
+
+def test_each_name_gets_one_instrument_of_its_declared_kind(reader, meter):
+    registry = MetricRegistry(
+        {
+            "search.module_latency_ms": MetricSpec(MetricKind.HISTOGRAM, "latency", "ms"),
+            "queue.depth": MetricSpec(MetricKind.UP_DOWN_COUNTER),
+        }
+    )
+    registry.bind_meter(meter)
+
+    for n in range(1000):
+        registry.add("search.query", 1, {"module": "audits" if n % 2 else "incidents"})
+        registry.add("search.module_latency_ms", n, {"module": "audits"})
+    registry.add("queue.depth", 5)
+    registry.add("queue.depth", -2)
+    registry.add("search.query", -4, {"module": "audits"})  # counters only go up
+
+    assert sorted(meter.created) == ["queue.depth", "search.module_latency_ms", "search.query"]
+    metrics = _collect(reader)
+    assert metrics["search.query"] == {
+        frozenset({("module", "audits")}): 500,
+        frozenset({("module", "incidents")}): 500,
+    }
+    assert metrics["search.module_latency_ms"] == {frozenset({("module", "audits")}): (1000, sum(range(1000)))}
+    assert metrics["queue.depth"] == {frozenset(): 3}
+
+
+def test_bound_metrics_share_the_series_of_equal_attributes(reader, meter):
+    registry = MetricRegistry()
+    bound = registry.bind("documents.uploaded", source="portal", kind="pdf")
+    bound.add()  # no meter yet: dropped, as before telemetry is set up
+    registry.bind_meter(meter)
+
+    for _ in range(3):
+        bound.add()
+    registry.add("documents.uploaded", 2, {"kind": "pdf", "source": "portal"})
+
+    assert _collect(reader)["documents.uploaded"] == {frozenset({("source", "portal"), ("kind", "pdf")}): 5}
+    assert meter.created == ["documents.uploaded"]
+
+
+def test_unbound_registry_is_a_no_op():
+    registry = MetricRegistry()
+    registry.add("anything", 1, {"a": "b"})
+    registry.bind("other").add()
+    registry.bind_meter(None)
+    registry.add("anything", 1)
+
+
+def test_track_metric_and_record_helpers_report_through_the_registry(reader, meter):
+    azure_monitor.metric_registry.bind_meter(meter)
+    try:
+        azure_monitor.track_metric("search.query", 1, {"module": "all"})
+        azure_monitor.track_metric("search.query", 1, {"module": "all"})
+        azure_monitor.track_metric("search.module_latency_ms", 12.5, {"module": "audits", "outcome": "ok"})
+        azure_monitor.record_incident_created()
+        azure_monitor.track_cache_operation(hit=False)
+        azure_monitor.track_request_db_stats("/api/v1/items", 3, 4.5, 0.2)
+        metrics = _collect(reader)
+    finally:
+        azure_monitor.metric_registry.bind_meter(None)
+
+    assert metrics["search.query"] == {frozenset({("module", "all")}): 2}
+    assert metrics["search.module_latency_ms"] == {frozenset({("module", "audits"), ("outcome", "ok")}): (1, 12.5)}
+    assert metrics["incidents.created"] == {frozenset(): 1}
+    assert metrics["cache.operations"] == {frozenset({("result", "miss")}): -1}
+    assert metrics["db.request.statements"] == {frozenset({("route", "/api/v1/items")}): (1, 3)}
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import random
 from pathlib import Path
 
 import pytest
@@ -12,6 +13,8 @@ from src.domain.services.ocr_consensus import (
     build_page_consensus,
     character_error_rate,
     hash_ocr_text,
+    levenshtein_distance,
+    score_provider_pairs,
 )
 from src.infrastructure.external.azure_document_intelligence import AzureDocumentIntelligenceClient
 
@@ -36,6 +39,80 @@ def test_character_error_rate_tracks_character_substitutions() -> None:
     assert character_error_rate("", "audit") is None
 
 
+def _reference_levenshtein(first: str, second: str) -> int:
+    previous = list(range(len(second) + 1))
+    for first_index, first_character in enumerate(first, start=1):
+        current = [first_index]
+        for second_index, second_character in enumerate(second, start=1):
+            current.append(
+                min(
+                    current[-1] + 1,
+                    previous[second_index] + 1,
+                    previous[second_index - 1] + int(first_character != second_character),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def test_levenshtein_distance_matches_full_matrix_on_random_pairs() -> None:
+    rng = random.Random(2026)
+    for _ in range(500):
+        first = "".join(rng.choice("aeb c") for _ in range(rng.randint(0, 90)))
+        second = "".join(rng.choice("aeb c") for _ in range(rng.randint(0, 90)))
+        expected = _reference_levenshtein(first, second)
+        bound = rng.randint(0, 40)
+
+        assert levenshtein_distance(first, second) == expected
+        assert levenshtein_distance(first, second, max_distance=bound) == (expected if expected <= bound else None)
+
+
+def test_character_error_rate_threshold_returns_none_above_bound() -> None:
+    reference = "x" * 100
+    observed = "x" * 71 + "y" * 29
+
+    assert character_error_rate(reference, observed) == 0.29
+    assert character_error_rate(reference, observed, max_rate=0.29) == 0.29
+    assert character_error_rate(reference, observed, max_rate=0.28) is None
+
+
+def test_score_provider_pairs_scores_every_pair_per_page() -> None:
+    candidates = [
+        OCRPageCandidate(provider="native_pdf", page_number=2, text="Fire door checked"),
+        OCRPageCandidate(provider="azure", page_number=1, text="Audit  evidence"),
+        OCRPageCandidate(provider="native_pdf", page_number=1, text="audit evidence"),
+        OCRPageCandidate(provider="mistral", page_number=1, text="audit evidense"),
+        OCRPageCandidate(provider="azure", page_number=2, text="Unrelated scan noise"),
+    ]
+
+    scores = score_provider_pairs(candidates, max_character_error_rate=0.5)
+
+    assert [(s.page_number, s.reference_provider, s.observed_provider) for s in scores] == [
+        (1, "azure", "native_pdf"),
+        (1, "azure", "mistral"),
+        (1, "native_pdf", "mistral"),
+        (2, "native_pdf", "azure"),
+    ]
+    assert scores[0].distance == 0
+    assert scores[1].character_error_rate == character_error_rate("Audit  evidence", "audit evidense")
+    assert scores[3].distance is None
+    assert scores[3].character_error_rate is None
+
+
+def test_page_consensus_prefers_most_frequent_text_then_first_candidate() -> None:
+    candidates = [
+        OCRPageCandidate(provider="first", page_number=3, text="alpha"),
+        OCRPageCandidate(provider="second", page_number=3, text="beta"),
+        OCRPageCandidate(provider="third", page_number=3, text="BETA"),
+        OCRPageCandidate(provider="fourth", page_number=3, text="alpha"),
+    ]
+
+    result = build_page_consensus(candidates)
+
+    assert result.selected_provider == "first"
+    assert result.agreement == 0.5
+
+
 def test_page_consensus_requires_candidates_from_one_page() -> None:
     candidates = [
         OCRPageCandidate(provider="first", page_number=1, text="one"),
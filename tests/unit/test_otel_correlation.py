@@ -102,32 +102,31 @@ class TestCorrelationIdPropagation:
 class TestRequestStateCorrelationId:
     """The middleware must store request_id on request.state."""
 
-    @pytest.mark.asyncio
-    async def test_request_state_has_request_id(self) -> None:
-        """request.state.request_id is set by the middleware on every request."""
-        from starlette.datastructures import Headers
-        from starlette.types import Receive, Scope, Send
+    @staticmethod
+    async def _run(headers: list) -> dict:
+        """Drive the middleware around an app that captures request.state."""
+        from starlette.requests import Request
 
         captured_state: dict = {}
 
-        async def call_next(request: MagicMock) -> Response:
-            captured_state["request_id"] = getattr(request.state, "request_id", None)
-            return Response("ok", status_code=200)
-
-        middleware = RequestStateMiddleware(app=AsyncMock())
+        async def app(scope, receive, send) -> None:
+            captured_state["request_id"] = getattr(Request(scope).state, "request_id", None)
+            await Response("ok", status_code=200)(scope, receive, send)
 
         scope: dict = {
             "type": "http",
             "method": "GET",
             "path": "/probe",
-            "headers": [],
+            "headers": headers,
             "query_string": b"",
         }
-        from starlette.requests import Request
+        await RequestStateMiddleware(app)(scope, AsyncMock(), AsyncMock())
+        return captured_state
 
-        request = Request(scope)
-
-        response = await middleware.dispatch(request, call_next)
+    @pytest.mark.asyncio
+    async def test_request_state_has_request_id(self) -> None:
+        """request.state.request_id is set by the middleware on every request."""
+        captured_state = await self._run([])
 
         assert captured_state.get("request_id"), "request_id must be set in state"
         assert len(captured_state["request_id"]) == 32
@@ -135,26 +134,8 @@ class TestRequestStateCorrelationId:
     @pytest.mark.asyncio
     async def test_client_supplied_id_stored_on_state(self) -> None:
         """A client-supplied X-Request-ID is stored on request.state unchanged."""
-        from starlette.requests import Request
-
         custom_id = "trace-from-client-abc"
-        captured_state: dict = {}
-
-        async def call_next(request: MagicMock) -> Response:
-            captured_state["request_id"] = getattr(request.state, "request_id", None)
-            return Response("ok", status_code=200)
-
-        middleware = RequestStateMiddleware(app=AsyncMock())
-
-        scope: dict = {
-            "type": "http",
-            "method": "GET",
-            "path": "/probe",
-            "headers": [(b"x-request-id", custom_id.encode())],
-            "query_string": b"",
-        }
-        request = Request(scope)
-        await middleware.dispatch(request, call_next)
+        captured_state = await self._run([(b"x-request-id", custom_id.encode())])
 
         assert captured_state.get("request_id") == custom_id
 
@@ -0,0 +1,150 @@
+"""Set-based defect detection during PAMS checklist sync."""
+
+from __future__ import annotations
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+import src.domain.models  # noqa: F401 - resolve foreign keys
+from src.domain.models.capa import CAPAAction
+from src.domain.models.vehicle_defect import VehicleDefect
+from src.domain.services.vehicle_capa_pipeline import create_capas_from_defects_sync
+from src.infrastructure.tasks.pams_sync_tasks import _auto_detect_defects, _FailScanner
+
+
+@pytest.fixture
+def engine():
+    engine = sa.create_engine("sqlite+pysqlite:///:memory:")
+    VehicleDefect.__table__.create(engine)
+    CAPAAction.__table__.create(engine)
+    yield engine
+    engine.dispose()
+
+
+def _statements(engine) -> list[str]:
+    seen: list[str] = []
+    sa.event.listen(engine, "before_cursor_execute", lambda *args: seen.append(args[2].split()[0].upper()))
+    return seen
+
+
+def _defects(db: Session) -> set[tuple[int, str, str]]:
+    return {
+        (row.pams_record_id, row.check_field, row.check_value)
+        for row in db.execute(
+            sa.select(VehicleDefect.pams_record_id, VehicleDefect.check_field, VehicleDefect.check_value)
+        )
+    }
+
+
+def test_scanner_matches_fail_values_and_ignores_skip_keys():
+    scanner = _FailScanner()
+    row = {
+        "id": 0,
+        "vanReg": "no",
+        "tyres": " FAIL ",
+        "lights": "Pass",
+        "horn": 0,
+        "wipers": False,
+        "mirrors": 0.0,
+        "brakes": None,
+        "oil": "n",
+    }
+
+    assert scanner.failures(row) == [("tyres", " FAIL "), ("horn", 0), ("wipers", False), ("oil", "n")]
+    assert scanner.failures(dict(row, tyres="pass")) == [("horn", 0), ("wipers", False), ("oil", "n")]
+
+
+def test_detection_skips_open_defects_and_inserts_the_rest_in_bulk(engine):
+    with Session(engine) as db:
+        db.add_all(
+            [
+                VehicleDefect(
+                    pams_table="daily",
+                    pams_record_id=1,
+                    check_field="tyres",
+                    check_value="fail",
+                    priority="P3",
+                    status="acknowledged",
+                ),
+                VehicleDefect(
+                    pams_table="daily",
+                    pams_record_id=2,
+                    check_field="tyres",
+                    check_value="fail",
+                    priority="P3",
+                    status="resolved",
+                ),
+            ]
+        )
+        db.commit()
+        rows = [(n, {"id": n, "vanID": f"VAN{n}", "tyres": "fail", "lights": "pass", "oil": "no"}) for n in (1, 2, 3)]
+        statements = _statements(engine)
+
+        detected = _auto_detect_defects(rows, "vanchecklist", VehicleDefect, db)
+        db.commit()
+
+        assert detected == 5
+        assert statements.count("SELECT") == 1
+        assert _defects(db) - {(1, "tyres", "fail"), (2, "tyres", "fail")} == {
+            (1, "oil", "no"),
+            (2, "oil", "no"),
+            (3, "oil", "no"),
+            (3, "tyres", "fail"),
+        }
+        assert db.scalar(sa.select(sa.func.count()).select_from(VehicleDefect)) == 7
+        assert (
+            db.scalar(sa.select(VehicleDefect.vehicle_reg).where(VehicleDefect.pams_record_id == 3).limit(1)) == "VAN3"
+        )
+
+        # A rerun finds every failure already open.
+        assert _auto_detect_defects(rows, "vanchecklist", VehicleDefect, db) == 0
+
+
+def test_open_defect_lookup_is_scoped_to_the_batch_in_chunks(engine, monkeypatch):
+    monkeypatch.setattr("src.infrastructure.tasks.pams_sync_tasks.DEFECT_INSERT_BATCH", 2)
+    with Session(engine) as db:
+        # Open defects on records outside the batch are not read at all.
+        db.add_all(
+            VehicleDefect(
+                pams_table="daily",
+                pams_record_id=record_id,
+                check_field="tyres",
+                check_value="fail",
+                priority="P3",
+                status="open",
+            )
+            for record_id in (3, 100, 101)
+        )
+        db.commit()
+        rows = [(n, {"id": n, "tyres": "fail"}) for n in (1, 2, 3, 4, 5)]
+        parameters: list[tuple] = []
+        sa.event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, params, *rest: statement.startswith("SELECT") and parameters.append(params),
+        )
+
+        assert _auto_detect_defects(rows, "vanchecklist", VehicleDefect, db) == 4
+
+        record_ids = [[value for value in params if isinstance(value, int)] for params in parameters]
+        assert record_ids == [[1, 2], [3, 4], [5]]
+
+
+def test_capas_are_created_once_per_defect_with_sequential_references(engine):
+    defect = {"priority": "P1", "vehicle_reg": "VAN1", "check_field": "brakes", "check_value": "fail", "tenant_id": 1}
+    with Session(engine) as db:
+        first = create_capas_from_defects_sync([dict(defect, id=10), dict(defect, id=11, priority="P2")], db)
+        again = create_capas_from_defects_sync([dict(defect, id=11), dict(defect, id=12)], db)
+        db.commit()
+
+        actions = db.execute(
+            sa.select(CAPAAction.source_id, CAPAAction.reference_number, CAPAAction.priority).order_by(
+                CAPAAction.source_id
+            )
+        ).all()
+
+    assert len(first) == 2 and len(again) == 1
+    assert [action.source_id for action in actions] == [10, 11, 12]
+    assert [action.reference_number[-4:] for action in actions] == ["0001", "0002", "0003"]
+    assert [action.priority for action in actions] == ["critical", "high", "critical"]
@@ -12,9 +12,10 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.domain.models.document import DocumentChunk, DocumentStatus, IndexJobStatus
+from src.domain.models.document import DocumentChunk, DocumentStatus, FileType, IndexJobStatus
 from src.domain.services import document_library_disposal_service as disposal_service
 from src.domain.services.document_ai_service import document_chunk_vector_id
+from src.domain.services.document_intelligence_service import DocumentIntelligenceResult
 from src.domain.services.governed_knowledge_service import GovernedKnowledgeService
 from src.domain.services.index_job_service import IndexJobService
 
@@ -43,6 +44,8 @@ def _make_index_job_fixture(
         tenant_id=1,
         file_name="policy.pdf",
         file_path="documents/policy.pdf",
+        file_type=FileType.PDF,
+        mime_type="application/pdf",
         document_type=SimpleNamespace(value="policy"),
         status=DocumentStatus.APPROVED,
         has_tables=False,
@@ -69,6 +72,7 @@ def _make_index_job_fixture(
     db = AsyncMock()
     db.get = AsyncMock(return_value=document)
     db.flush = AsyncMock()
+    db.begin_nested = MagicMock()
     chunk_rows_result = MagicMock()
     chunk_rows_result.all.return_value = previous_chunk_rows or []
     db.execute = AsyncMock(return_value=chunk_rows_result)
@@ -81,8 +85,14 @@ def _make_index_job_fixture(
 
     service = IndexJobService(db)
     service.get_job = AsyncMock(return_value=job)
-    service.intelligence_service.process = AsyncMock(
-        return_value=SimpleNamespace(text="Sample policy text for indexing.", hard_ocr_failure=False, note=None)
+    service.intelligence_service.extract_bytes = AsyncMock(
+        return_value=DocumentIntelligenceResult(
+            text="Sample policy text for indexing.",
+            page_texts=[],
+            extraction_method="native",
+            hard_ocr_failure=False,
+            note=None,
+        )
     )
     monkeypatch.setattr(
         "src.domain.services.index_job_service.storage_service",
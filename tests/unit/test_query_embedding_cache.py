@@ -0,0 +1,48 @@
+"""Query embeddings are cached so repeated and paginated searches embed once."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.services import document_ai_service
+from src.domain.services.document_ai_service import EmbeddingService
+from src.infrastructure.cache.redis_cache import InMemoryCache
+
+
+@pytest.fixture
+def embedding_service(monkeypatch: pytest.MonkeyPatch) -> EmbeddingService:
+    cache = InMemoryCache()
+    monkeypatch.setattr(document_ai_service, "get_cache", lambda: cache)
+    service = EmbeddingService()
+    service.voyage_api_key = "test-key"
+    service._request_query_embedding = AsyncMock(return_value=[0.1, 0.2, 0.3])  # type: ignore[method-assign]
+    return service
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_is_embedded_once(embedding_service: EmbeddingService) -> None:
+    first = await embedding_service.generate_query_embedding("fire door  inspection")
+    second = await embedding_service.generate_query_embedding(" fire door inspection ")
+
+    assert first == second == [0.1, 0.2, 0.3]
+    embedding_service._request_query_embedding.assert_awaited_once_with("fire door inspection")
+
+
+@pytest.mark.asyncio
+async def test_failed_embedding_is_not_cached(embedding_service: EmbeddingService) -> None:
+    embedding_service._request_query_embedding = AsyncMock(side_effect=[None, [0.5]])  # type: ignore[method-assign]
+
+    assert await embedding_service.generate_query_embedding("permit to work") is None
+    assert await embedding_service.generate_query_embedding("permit to work") == [0.5]
+
+
+@pytest.mark.asyncio
+async def test_cache_disabled_by_zero_ttl(embedding_service: EmbeddingService, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(document_ai_service.settings, "query_embedding_cache_ttl_seconds", 0)
+
+    await embedding_service.generate_query_embedding("ladder inspection")
+    await embedding_service.generate_query_embedding("ladder inspection")
+
+    assert embedding_service._request_query_embedding.await_count == 2
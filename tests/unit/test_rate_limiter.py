@@ -1,5 +1,6 @@
 """Unit tests for rate limiting middleware."""
 
+import math
 import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
@@ -7,11 +8,13 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from starlette.responses import Response
 
+from src.infrastructure.middleware import rate_limiter
 from src.infrastructure.middleware.rate_limiter import (
     ENDPOINT_LIMITS,
     LOADTEST_RATE_LIMIT,
     InMemoryRateLimiter,
     RateLimitConfig,
+    RedisRateLimiter,
     get_limit_config,
     is_loadtest_rate_limit_profile,
     rate_limit_middleware,
@@ -216,6 +219,124 @@ class TestInMemoryRateLimiter:
         assert "cleanup-test" in limiter._requests
 
 
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch):
+    """Freeze the limiter's clock; tests advance ``clock[0]`` by hand."""
+    now = [1_760_000_000.0]
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+class TestGcraInMemory:
+    """The in-memory limiter keeps one theoretical arrival time per key."""
+
+    @pytest.mark.asyncio
+    async def test_quota_refills_one_interval_at_a_time(self, clock):
+        limiter = InMemoryRateLimiter()
+        for _ in range(6):
+            assert (await limiter.is_allowed("k", 6, 60))[0] is True
+        assert await limiter.is_allowed("k", 6, 60) == (False, 0, int(clock[0]) + 10)
+        assert isinstance(limiter._requests["k"], float)
+
+        # Denied requests cost nothing: one interval later exactly one more fits.
+        clock[0] += 10
+        assert (await limiter.is_allowed("k", 6, 60))[:2] == (True, 0)
+        assert (await limiter.is_allowed("k", 6, 60))[0] is False
+
+        clock[0] += 60
+        assert await limiter.is_allowed("k", 6, 60) == (True, 5, int(clock[0]) + 10)
+
+    @pytest.mark.asyncio
+    async def test_expired_keys_are_swept(self, clock, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(rate_limiter, "_SWEEP_MIN_KEYS", 4)
+        limiter = InMemoryRateLimiter()
+        for n in range(3):
+            await limiter.is_allowed(f"old-{n}", 60, 60)
+        clock[0] += 2
+        await limiter.is_allowed("new", 60, 60)
+        assert list(limiter._requests) == ["new"]
+
+
+class _ScriptStore:
+    """Stands in for the GCRA script: same arithmetic over a dict of TATs."""
+
+    def __init__(self):
+        self.tats: dict[str, int] = {}
+        self.calls = 0
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        now, interval, window, cost, refund = args
+        stored = self.tats.get(keys[0])
+        tat = now if stored is None else max(stored - refund * interval, now)
+        if cost > 1 and tat + (2 * cost - 1) * interval - now > window:
+            cost = 1
+        new_tat = tat + cost * interval
+        if new_tat - now > window:
+            if stored is not None:
+                self.tats[keys[0]] = tat
+            return [0, 0, 0, math.ceil((new_tat - window) / 1e6)]
+        self.tats[keys[0]] = new_tat
+        return [1, cost, (window - (new_tat - now)) // interval, math.ceil(new_tat / 1e6)]
+
+
+def _redis_limiter(store: _ScriptStore, local_lease: int) -> RedisRateLimiter:
+    limiter = RedisRateLimiter("redis://unused", local_lease=local_lease)
+    limiter._redis = object()
+    limiter._script = store
+    return limiter
+
+
+class TestRedisGcraLeases:
+    """Local pre-admission spends leased units without a Redis round trip."""
+
+    @pytest.mark.asyncio
+    async def test_one_call_per_request_without_leases(self, clock):
+        store = _ScriptStore()
+        limiter = _redis_limiter(store, local_lease=0)
+        results = [await limiter.is_allowed("k", 60, 60) for _ in range(61)]
+        assert store.calls == 61
+        assert [r[1] for r in results[:3]] == [59, 58, 57]
+        assert results[-1][0] is False
+
+    @pytest.mark.asyncio
+    async def test_leases_cut_round_trips_and_keep_remaining_exact(self, clock):
+        store = _ScriptStore()
+        limiter = _redis_limiter(store, local_lease=5)
+        results = [await limiter.is_allowed("k", 60, 60) for _ in range(10)]
+        assert store.calls == 2
+        assert [r[1] for r in results] == list(range(59, 49, -1))
+
+    @pytest.mark.asyncio
+    async def test_workers_sharing_redis_never_exceed_the_limit(self, clock):
+        store = _ScriptStore()
+        workers = [_redis_limiter(store, local_lease=5) for _ in range(3)]
+        admitted = 0
+        for n in range(200):
+            allowed, _, _ = await workers[n % 3].is_allowed("k", 60, 60)
+            admitted += allowed
+        # Leases stop once fewer than two leases' worth remain, so the tail is exact.
+        assert admitted <= 60
+        assert admitted >= 60 - 3 * 4
+
+    @pytest.mark.asyncio
+    async def test_unused_lease_units_are_refunded(self, clock):
+        store = _ScriptStore()
+        limiter = _redis_limiter(store, local_lease=5)
+        # Hourly window: one unit refills per minute, so two seconds refill nothing.
+        assert (await limiter.is_allowed("k", 60, 3600))[1] == 59
+        clock[0] += 2  # lease expired with four units unused
+        assert (await limiter.is_allowed("k", 60, 3600))[1] == 58
+
+    @pytest.mark.asyncio
+    async def test_small_limits_are_never_leased(self, clock):
+        store = _ScriptStore()
+        limiter = _redis_limiter(store, local_lease=5)
+        results = [await limiter.is_allowed("login", 10, 60) for _ in range(11)]
+        assert store.calls == 11 and not limiter._leases
+        assert [r[0] for r in results].count(True) == 10
+
+
 class TestSecurityEndpointLimits:
     """Test that security-sensitive endpoints have appropriate limits."""
 
@@ -0,0 +1,133 @@
+"""The application's middleware runs as one composed pure-ASGI pipeline.
+
+Checks the stage order ``create_application`` registers, that no stage is a
+``BaseHTTPMiddleware`` (each of which costs a task and a stream per request),
+and that the composed stages stream a response chunk by chunk and still hand
+the handler a request body they have already read.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from src.api.middleware.audit_middleware import AuditLoggingMiddleware
+from src.api.middleware.idempotency import IdempotencyMiddleware
+from src.core.middleware import RequestPipeline, RequestStateMiddleware
+from src.core.uat_safety import UATSafetyMiddleware
+from src.infrastructure.middleware.decrypt_memo import DecryptMemoMiddleware
+from src.infrastructure.middleware.request_logger import RequestLoggerMiddleware
+from src.infrastructure.middleware.tenant_context import TenantContextMiddleware
+from src.main import RateLimitMiddleware, SecurityHeadersMiddleware, create_application
+
+
+@pytest.fixture(scope="module")
+def stages():
+    app = create_application()
+    assert [m.cls for m in app.user_middleware] == [CORSMiddleware, RequestPipeline]
+    return app.user_middleware[1].kwargs["stages"]
+
+
+def test_stages_keep_the_stack_order(stages):
+    assert [stage.cls for stage in stages] == [
+        AuditLoggingMiddleware,
+        IdempotencyMiddleware,
+        RateLimitMiddleware,
+        RequestLoggerMiddleware,
+        SecurityHeadersMiddleware,
+        TenantContextMiddleware,
+        UATSafetyMiddleware,
+        RequestStateMiddleware,
+        DecryptMemoMiddleware,
+        GZipMiddleware,
+    ]
+    assert not any(issubclass(stage.cls, BaseHTTPMiddleware) for stage in stages)
+
+
+async def _request(app, method: str, path: str, *, headers=(), body: bytes = b"", on_chunk=None):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver"), *headers],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    sent: list[dict] = []
+    delivered = False
+
+    async def receive():
+        nonlocal delivered
+        if delivered:
+            await asyncio.Event().wait()
+        delivered = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+        if on_chunk is not None and message["type"] == "http.response.body" and message.get("body"):
+            on_chunk(message["body"])
+
+    await asyncio.wait_for(app(scope, receive, send), timeout=5)
+    headers = {k.decode().lower(): v.decode() for k, v in sent[0]["headers"]}
+    return sent[0]["status"], headers, [m.get("body", b"") for m in sent[1:]]
+
+
+@pytest.mark.asyncio
+async def test_responses_stream_through_every_stage(stages):
+    released = asyncio.Event()
+
+    async def export(request):
+        async def rows():
+            yield b"first,"
+            # Only reachable if the first chunk already left the pipeline.
+            await released.wait()
+            yield b"second"
+
+        return StreamingResponse(rows(), media_type="text/csv")
+
+    app = RequestPipeline(Starlette(routes=[Route("/api/v1/export", export)]), stages)
+    status, headers, chunks = await _request(app, "GET", "/api/v1/export", on_chunk=lambda _: released.set())
+
+    assert status == 200
+    assert [c for c in chunks if c] == [b"first,", b"second"]
+    assert headers["x-content-type-options"] == "nosniff"
+    assert headers["cache-control"].startswith("no-store")
+    assert "x-request-id" in headers and "x-response-time" in headers
+
+
+@pytest.mark.asyncio
+async def test_handlers_read_bodies_the_stages_already_read(stages, monkeypatch):
+    monkeypatch.setattr("src.api.middleware.idempotency._get_redis", lambda: asyncio.sleep(0))
+
+    async def echo(request: Request):
+        return JSONResponse({"echo": await request.json(), "request_id": request.state.request_id})
+
+    app = RequestPipeline(Starlette(routes=[Route("/api/v1/items", echo, methods=["POST"])]), stages)
+    payload = {"title": "x" * 2000}
+    status, headers, chunks = await _request(
+        app,
+        "POST",
+        "/api/v1/items",
+        headers=[(b"content-type", b"application/json"), (b"idempotency-key", b"k-1"), (b"x-request-id", b"r-1")],
+        body=json.dumps(payload).encode(),
+    )
+
+    assert status == 200
+    assert json.loads(b"".join(chunks)) == {"echo": payload, "request_id": "r-1"}
+    assert headers["x-request-id"] == "r-1"
@@ -0,0 +1,104 @@
+"""``absent_tables`` answers from a cached catalogue without ever caching an absence.
+
+The catalogue is per engine and keyed by the ``alembic_version`` revision. These
+tests pin the three properties that make caching it safe: a present table costs
+no catalogue query after the first call, a table that appears is reported
+present on the very next call, and a revision change drops the snapshot.
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.config import settings
+from src.domain.services import schema_presence
+from src.domain.services.schema_presence import absent_tables
+
+
+@pytest.fixture
+def refreshes(monkeypatch) -> list[str]:
+    reasons: list[str] = []
+    monkeypatch.setattr(
+        schema_presence, "track_metric", lambda name, value=1.0, tags=None: reasons.append((tags or {})["reason"])
+    )
+    return reasons
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE present_one (id INTEGER PRIMARY KEY)"))
+        await conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        await conn.execute(text("INSERT INTO alembic_version VALUES ('rev_a')"))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(engine):
+    async with async_sessionmaker(engine, class_=AsyncSession)() as db:
+        yield db
+
+
+def _statements(engine) -> list[str]:
+    seen: list[str] = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: seen.append(args[2]))
+    return seen
+
+
+@pytest.mark.asyncio
+async def test_present_tables_are_answered_from_the_catalogue(session, engine, refreshes):
+    assert await absent_tables(session, ["present_one"]) == ()
+    statements = _statements(engine)
+
+    for _ in range(5):
+        assert await absent_tables(session, ["present_one", "alembic_version"]) == ()
+
+    assert statements == []
+    assert refreshes == ["cold"]
+
+
+@pytest.mark.asyncio
+async def test_an_absence_is_rechecked_so_a_new_table_is_seen_at_once(session, engine, refreshes):
+    assert await absent_tables(session, ["late_table", "present_one"]) == ("late_table",)
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE late_table (id INTEGER PRIMARY KEY)"))
+
+    assert await absent_tables(session, ["late_table", "present_one"]) == ()
+    assert refreshes == ["cold", "stale_absent"]
+
+
+@pytest.mark.asyncio
+async def test_a_revision_change_reloads_the_catalogue_after_the_ttl(session, engine, refreshes, monkeypatch):
+    assert await absent_tables(session, ["present_one"]) == ()
+    monkeypatch.setattr(settings, "schema_catalogue_ttl_seconds", 0.0)
+
+    # Same revision: the snapshot is renewed, not reloaded.
+    assert await absent_tables(session, ["present_one"]) == ()
+    assert refreshes == ["cold"]
+
+    await session.commit()
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE present_one"))
+        await conn.execute(text("UPDATE alembic_version SET version_num = 'rev_b'"))
+
+    assert await absent_tables(session, ["present_one"]) == ("present_one",)
+    assert refreshes == ["cold", "revision"]
+
+
+@pytest.mark.asyncio
+async def test_without_alembic_version_the_ttl_alone_reloads(refreshes, monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE present_one (id INTEGER PRIMARY KEY)"))
+    async with async_sessionmaker(engine, class_=AsyncSession)() as db:
+        assert await absent_tables(db, ["present_one"]) == ()
+        monkeypatch.setattr(settings, "schema_catalogue_ttl_seconds", 0.0)
+        assert await absent_tables(db, ["present_one"]) == ()
+    await engine.dispose()
+
+    assert refreshes == ["cold", "ttl"]
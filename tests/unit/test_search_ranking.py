@@ -0,0 +1,85 @@
+"""Unit tests for the global search ranking stage (normalisation, RRF, top-k)."""
+
+from src.domain.services.search_ranking import (
+    LEXICAL_RANKING,
+    SEMANTIC_RANKING,
+    fuse,
+    lexical_order,
+    normalized_relevance,
+    top_k,
+)
+from src.domain.services.search_service import SearchResultItem
+
+
+def _item(item_id: str, relevance: float, *, module: str = "Incidents", entity_id: int | None = None, type_="t"):
+    return SearchResultItem(
+        id=item_id,
+        type=type_,
+        title=item_id,
+        description="",
+        module=module,
+        status="Open",
+        date="",
+        relevance=relevance,
+        entity_id=entity_id,
+    )
+
+
+def test_normalized_relevance_clamps_to_unit_interval():
+    assert normalized_relevance(None) == 0.0
+    assert normalized_relevance(55) == 0.55
+    assert normalized_relevance(140) == 1.0
+    assert normalized_relevance(-3) == 0.0
+
+
+def test_lexical_order_matches_a_stable_global_sort():
+    incidents = [_item("i-low", 61), _item("i-high", 90), _item("i-tie", 75)]
+    audits = [_item("a-tie", 75, module="Audits"), _item("a-top", 95, module="Audits")]
+
+    merged = [item.id for item in lexical_order([incidents, [], audits])]
+
+    expected = sorted(incidents + audits, key=lambda item: item.relevance, reverse=True)
+    assert merged == [item.id for item in expected]
+
+
+def test_lexical_only_fusion_preserves_lexical_order():
+    items = [_item(str(index), 100 - index) for index in range(6)]
+
+    fused = fuse({LEXICAL_RANKING: items})
+
+    assert [candidate.item.id for candidate in top_k(fused, 6)] == [str(index) for index in range(6)]
+
+
+def test_fusion_promotes_hits_both_retrievers_agree_on():
+    lexical = [
+        _item("strong-lexical", 95, type_="document_content", entity_id=1),
+        _item("agreed", 80, type_="document_content", entity_id=2),
+    ]
+    semantic = [
+        _item("agreed-semantic", 70, type_="document_content", entity_id=2),
+        _item("semantic-only", 65, type_="document_content", entity_id=3),
+    ]
+
+    ranked = top_k(fuse({LEXICAL_RANKING: lexical, SEMANTIC_RANKING: semantic}), 10)
+
+    assert [candidate.item.id for candidate in ranked] == ["agreed", "strong-lexical", "semantic-only"]
+    assert ranked[0].ranks == {LEXICAL_RANKING: 2, SEMANTIC_RANKING: 1}
+
+
+def test_further_chunks_of_one_document_keep_their_own_rank():
+    lexical = [
+        _item("chunk-a", 90, type_="document_content", entity_id=7),
+        _item("chunk-b", 85, type_="document_content", entity_id=7),
+    ]
+    semantic = [_item("semantic", 70, type_="document_content", entity_id=7)]
+
+    fused = fuse({LEXICAL_RANKING: lexical, SEMANTIC_RANKING: semantic})
+
+    assert [candidate.item.id for candidate in top_k(fused, 10)] == ["chunk-a", "chunk-b"]
+
+
+def test_top_k_returns_requested_window_only():
+    fused = fuse({LEXICAL_RANKING: [_item(str(index), 90 - index) for index in range(50)]})
+
+    assert [candidate.item.id for candidate in top_k(fused, 3)] == ["0", "1", "2"]
+    assert top_k(fused, 0) == []
@@ -184,11 +184,14 @@ class TestSearchServiceSearch:
             "_search_document_content",
         ):
             setattr(service, method, AsyncMock(return_value=[]))
-        service._search_incidents = AsyncMock(return_value=items)
+        service._search_incidents = AsyncMock(return_value=items[:1])
+        service._search_risks = AsyncMock(return_value=items[1:])
 
         result = await service.search(query="test", tenant_id=1, module="Risks")
         assert result["total"] == 1
         assert result["results"][0]["module"] == "Risks"
+        # The other modules are not queried at all.
+        service._search_incidents.assert_not_awaited()
 
     @pytest.mark.asyncio
     @patch("src.domain.services.search_service.track_metric")
@@ -379,3 +382,71 @@ class TestSearchServiceSearch:
 
         await service.search(query="test", tenant_id=1)
         assert mock_metric.call_count >= 2
+
+
+class TestSearchServiceHybridRanking:
+    @pytest.mark.asyncio
+    @patch("src.domain.services.search_service.track_metric")
+    async def test_semantic_hits_are_fused_with_lexical_results(self, mock_metric):
+        service = SearchService(AsyncMock())
+        for method in (
+            "_search_incidents",
+            "_search_near_misses",
+            "_search_rtas",
+            "_search_complaints",
+            "_search_risks",
+            "_search_audits",
+            "_search_actions",
+            "_search_documents",
+            "_search_compliance_requirements",
+        ):
+            setattr(service, method, AsyncMock(return_value=[]))
+
+        def content(item_id, entity_id, relevance):
+            return SearchResultItem(
+                id=item_id,
+                type="document_content",
+                title=item_id,
+                description="",
+                module="Document Content",
+                status="Available",
+                date="",
+                relevance=relevance,
+                entity_id=entity_id,
+            )
+
+        service._search_document_content = AsyncMock(
+            return_value=[content("DOC-1", 1, 92.0), content("DOC-2", 2, 81.0)]
+        )
+        service._search_semantic_documents = AsyncMock(
+            return_value=[content("DOC-2", 2, 90.0), content("DOC-3", 3, 88.0)]
+        )
+
+        result = await service.search(query="fire door inspection", tenant_id=1, user=MagicMock())
+
+        assert [r["id"] for r in result["results"]] == ["DOC-2", "DOC-1", "DOC-3"]
+        assert result["total"] == 3
+        assert result["facets"]["modules"] == {"Document Content": 3}
+
+    @pytest.mark.asyncio
+    @patch("src.domain.services.search_service.track_metric")
+    async def test_semantic_stage_skipped_when_module_facet_excludes_it(self, mock_metric):
+        service = SearchService(AsyncMock())
+        for method in (
+            "_search_incidents",
+            "_search_near_misses",
+            "_search_rtas",
+            "_search_complaints",
+            "_search_risks",
+            "_search_audits",
+            "_search_actions",
+            "_search_documents",
+            "_search_document_content",
+            "_search_compliance_requirements",
+        ):
+            setattr(service, method, AsyncMock(return_value=[]))
+        service._search_semantic_documents = AsyncMock(return_value=[])
+
+        await service.search(query="fire", tenant_id=1, module="Incidents")
+
+        service._search_semantic_documents.assert_not_called()
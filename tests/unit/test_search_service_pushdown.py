@@ -0,0 +1,201 @@
+"""Global search pushes status / date filters into SQL and counts facets with COUNT.
+
+Module queries used to fetch ten rows each and filter afterwards, so a filtered
+search could come back empty with matches in the table, and totals were capped
+by the page. Runs against SQLite with audit findings (an ``ILIKE`` module, so no
+PostgreSQL full-text is needed), then checks the concurrent path on pooled
+sessions and its per-module timeout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.config import settings
+from src.domain.models.audit import AuditFinding, FindingStatus, audit_finding_risks
+from src.domain.models.risk_register import EnterpriseRisk
+from src.domain.services import search_service
+from src.domain.services.search_service import AUDITS_MODULE, INCIDENTS_MODULE, MODULE_RESULT_LIMIT_MAX, SearchService
+
+TENANT_ID = 1
+T0 = datetime(2026, 3, 1, 9, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/search.db")
+    async with engine.begin() as conn:
+        # Findings select-in load their linked risks.
+        for table in (AuditFinding.__table__, EnterpriseRisk.__table__, audit_finding_risks):
+            await conn.run_sync(table.create)
+        await conn.execute(
+            insert(AuditFinding),
+            [
+                {
+                    "tenant_id": TENANT_ID if n < 40 else TENANT_ID + 1,
+                    "run_id": 1,
+                    "reference_number": f"AF-{n:03d}",
+                    "title": f"Valve leak {n}",
+                    "description": "Leak found at the pump house",
+                    # Every third finding is closed; a handful carry legacy upper-case status.
+                    "status": FindingStatus.CLOSED if n % 3 == 0 else ("OPEN" if n % 7 == 0 else FindingStatus.OPEN),
+                    "created_at": T0 + timedelta(days=n),
+                }
+                for n in range(45)
+            ],
+        )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    recorded: list[tuple[str, dict]] = []
+    monkeypatch.setattr(search_service, "track_metric", lambda name, value=1, tags=None: recorded.append((name, tags)))
+    return recorded
+
+
+async def _search(engine, **kwargs):
+    async with async_sessionmaker(engine, class_=AsyncSession)() as db:
+        return await SearchService(db).search(query="leak", tenant_id=TENANT_ID, module=AUDITS_MODULE, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_status_and_date_filters_are_applied_before_the_page_cap(engine, metrics):
+    closed = await _search(engine, status_filter="closed", page_size=5)
+    assert closed["total"] == closed["facets"]["modules"][AUDITS_MODULE] == 14  # 0, 3, ..., 39
+    assert {r["status"] for r in closed["results"]} == {"closed"}
+    assert len(closed["results"]) == 5
+
+    # Legacy upper-case values match too, and the total counts past the page.
+    opened = await _search(engine, status_filter="Open", page=3, page_size=10)
+    assert opened["total"] == 40 - 14
+    assert len(opened["results"]) == 6
+
+    march = await _search(engine, date_from="2026-03-10", date_to="2026-03-19")
+    assert march["total"] == 10
+    assert sorted(r["id"] for r in march["results"]) == [f"AF-{n:03d}" for n in range(9, 19)]
+
+    unfiltered = await _search(engine)
+    assert unfiltered["total"] == 40 and len(unfiltered["results"]) == 20
+
+
+@pytest.mark.asyncio
+async def test_modules_run_on_their_own_sessions_under_a_timeout(engine, metrics, monkeypatch):
+    factory = async_sessionmaker(engine, class_=AsyncSession)
+    opened: list[AsyncSession] = []
+
+    @asynccontextmanager
+    async def pooled():
+        async with factory() as session:
+            opened.append(session)
+            yield session
+
+    async def stalled(self, *args, **kwargs):
+        await asyncio.sleep(5)
+        return []
+
+    monkeypatch.setattr(SearchService, "_search_incidents", stalled)
+    monkeypatch.setattr(settings, "search_module_timeout_seconds", 0.2)
+    allowed = frozenset({AUDITS_MODULE, INCIDENTS_MODULE})
+
+    async with factory() as db:
+        sequential = await SearchService(db).search(
+            query="leak", tenant_id=TENANT_ID, status_filter="closed", allowed_modules=frozenset({AUDITS_MODULE})
+        )
+        concurrent = await SearchService(db).search(
+            query="leak",
+            tenant_id=TENANT_ID,
+            status_filter="closed",
+            allowed_modules=allowed,
+            session_factory=pooled,
+        )
+
+    assert concurrent == sequential
+    assert len(opened) == 2 and db not in opened
+    latency = {tags["module"]: tags["outcome"] for name, tags in metrics if name == "search.module_latency_ms"}
+    assert latency[INCIDENTS_MODULE] == "timeout"
+    assert latency[AUDITS_MODULE] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_fanout_sessions_share_one_cap_across_searches(engine, monkeypatch):
+    from src.infrastructure import database
+
+    monkeypatch.setattr(database, "_READ_FANOUT_LIMIT", 2)
+    monkeypatch.setattr(database, "async_session_maker", async_sessionmaker(engine, class_=AsyncSession))
+    open_now = peak = 0
+
+    async def hold() -> None:
+        nonlocal open_now, peak
+        async with database.tenant_read_session():
+            open_now += 1
+            peak = max(peak, open_now)
+            await asyncio.sleep(0.02)
+            open_now -= 1
+
+    await asyncio.gather(*(hold() for _ in range(6)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_a_module_waiting_for_a_session_times_out_instead_of_stalling(engine, metrics, monkeypatch):
+    factory = async_sessionmaker(engine, class_=AsyncSession)
+
+    @asynccontextmanager
+    async def exhausted():
+        await asyncio.sleep(5)  # every fan-out connection is taken
+        yield None
+
+    monkeypatch.setattr(settings, "search_module_timeout_seconds", 0.2)
+    async with factory() as db:
+        result = await SearchService(db).search(
+            query="leak",
+            tenant_id=TENANT_ID,
+            allowed_modules=frozenset({AUDITS_MODULE, INCIDENTS_MODULE}),
+            session_factory=exhausted,
+        )
+
+    assert result["total"] == 0
+    outcomes = {tags["outcome"] for name, tags in metrics if name == "search.module_latency_ms"}
+    assert outcomes == {"timeout"}
+
+
+@pytest.mark.asyncio
+async def test_total_only_advertises_pages_the_module_cap_can_serve(engine, metrics):
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(AuditFinding),
+            [
+                {
+                    "tenant_id": TENANT_ID,
+                    "run_id": 1,
+                    "reference_number": f"GW-{n:03d}",
+                    "title": f"Gasket wear {n}",
+                    "description": "Gasket worn at the compressor",
+                    "status": FindingStatus.OPEN,
+                    "created_at": T0 + timedelta(hours=n),
+                }
+                for n in range(MODULE_RESULT_LIMIT_MAX * 3)
+            ],
+        )
+
+    async def page(number: int) -> dict:
+        async with async_sessionmaker(engine, class_=AsyncSession)() as db:
+            return await SearchService(db).search(
+                query="gasket", tenant_id=TENANT_ID, module=AUDITS_MODULE, page=number, page_size=20
+            )
+
+    first = await page(1)
+    assert first["facets"]["modules"][AUDITS_MODULE] == MODULE_RESULT_LIMIT_MAX * 3  # the true COUNT
+    assert first["total"] == MODULE_RESULT_LIMIT_MAX
+    last = first["total"] // 20
+    assert len((await page(last))["results"]) == 20
+    assert (await page(last + 1))["results"] == []
@@ -22,10 +22,12 @@ from src.infrastructure.middleware.tenant_context import (
 
 
 def test_tenant_context_middleware_is_registered_on_app():
+    from src.core.middleware import RequestPipeline
     from src.main import create_application
 
     app = create_application()
-    classes = [m.cls for m in app.user_middleware]
+    (pipeline,) = [m for m in app.user_middleware if m.cls is RequestPipeline]
+    classes = [stage.cls for stage in pipeline.kwargs["stages"]]
     assert TenantContextMiddleware in classes
 
 
@@ -82,41 +84,39 @@ def test_broken_throwaway_session_pattern_removed():
     assert "await session.commit()" not in source
 
 
+def _scope(path: str, state: dict) -> dict:
+    return {"type": "http", "method": "GET", "path": path, "headers": [], "query_string": b"", "state": state}
+
+
 @pytest.mark.asyncio
 async def test_middleware_skips_health_paths():
     assert "/healthz" in SKIP_PATHS
 
-    mw = TenantContextMiddleware(app=MagicMock())
-    request = MagicMock()
-    request.url.path = "/healthz"
-    request.state = SimpleNamespace()
-    call_next = AsyncMock(return_value=JSONResponse({"ok": True}))
+    app = AsyncMock()
+    mw = TenantContextMiddleware(app=app)
+    scope = _scope("/healthz", {})
 
-    await mw.dispatch(request, call_next)
+    await mw(scope, AsyncMock(), AsyncMock())
 
-    call_next.assert_awaited_once_with(request)
+    app.assert_awaited_once()
     assert get_request_tenant_id() is None
-    assert not hasattr(request.state, "tenant_id") or getattr(request.state, "tenant_id", None) is None
+    assert scope["state"].get("tenant_id") is None
 
 
 @pytest.mark.asyncio
 async def test_middleware_sets_request_state_tenant_id():
-    mw = TenantContextMiddleware(app=MagicMock())
-    request = MagicMock()
-    request.url.path = "/api/v1/ping"
-    request.state = SimpleNamespace(
-        user=SimpleNamespace(tenant_id=42, is_superuser=False),
-    )
-
     captured: dict = {}
 
-    async def call_next(req):
-        captured["tenant_id"] = getattr(req.state, "tenant_id", None)
+    async def app(scope, receive, send):
+        captured["tenant_id"] = scope["state"].get("tenant_id")
         captured["ctx"] = get_request_tenant_id()
-        captured["rls_intent"] = getattr(req.state, "rls_intent", None)
-        return JSONResponse({"ok": True})
+        captured["rls_intent"] = scope["state"].get("rls_intent")
+        await JSONResponse({"ok": True})(scope, receive, send)
 
-    await mw.dispatch(request, call_next)
+    mw = TenantContextMiddleware(app=app)
+    scope = _scope("/api/v1/ping", {"user": SimpleNamespace(tenant_id=42, is_superuser=False)})
+
+    await mw(scope, AsyncMock(), AsyncMock())
 
     assert captured["tenant_id"] == 42
     assert captured["ctx"] == 42
@@ -125,6 +125,19 @@ async def test_middleware_sets_request_state_tenant_id():
     assert get_request_tenant_id() is None
 
 
+@pytest.mark.asyncio
+async def test_middleware_restores_a_tenant_bound_downstream():
+    """Auth binds the tenant in the handler's task; the middleware must not let it outlive the request."""
+
+    async def app(scope, receive, send):
+        set_request_tenant_id(7)
+        await JSONResponse({"ok": True})(scope, receive, send)
+
+    await TenantContextMiddleware(app=app)(_scope("/api/v1/ping", {}), AsyncMock(), AsyncMock())
+
+    assert get_request_tenant_id() is None
+
+
 @pytest.mark.asyncio
 async def test_apply_tenant_guc_issues_set_config():
     session = AsyncMock()
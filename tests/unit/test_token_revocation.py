@@ -0,0 +1,249 @@
+"""Redis token revocation store behind a pub/sub-maintained Bloom filter."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.domain.models.token_blacklist import TokenBlacklist
+from src.domain.services import token_service
+from src.domain.services.token_service import TokenService
+from src.infrastructure.security.token_revocation import (
+    BloomFilter,
+    RedisTokenRevocationStore,
+    get_token_revocation_store,
+    reset_token_revocation_store_for_tests,
+)
+
+
+class _FakePubSub:
+    def __init__(self, hub: "_FakeRedis") -> None:
+        self._hub = hub
+        self._queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, channel: str) -> None:
+        self._hub.subscribers.setdefault(channel, []).append(self._queue)
+
+    async def get_message(self, ignore_subscribe_messages: bool, timeout: float) -> Optional[dict]:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        return None
+
+
+class _FakePipeline:
+    def __init__(self, hub: "_FakeRedis") -> None:
+        self._hub = hub
+        self._ops: list[tuple[str, tuple]] = []
+
+    def set(self, key: str, value: bytes, ex: int) -> None:
+        self._ops.append(("set", (key, ex)))
+
+    def publish(self, channel: str, message: str) -> None:
+        self._ops.append(("publish", (channel, message)))
+
+    async def execute(self) -> list[Any]:
+        if self._hub.failing_publishes:
+            self._hub.failing_publishes -= 1
+            raise ConnectionError("connection reset")
+        for op, args in self._ops:
+            if op == "set":
+                self._hub.ttls[args[0]] = args[1]
+            else:
+                for queue in self._hub.subscribers.get(args[0], []):
+                    queue.put_nowait({"type": "message", "data": args[1].encode()})
+        return [True] * len(self._ops)
+
+
+class _FakeRedis:
+    """One Redis shared by several stores, standing in for several processes."""
+
+    def __init__(self) -> None:
+        self.ttls: dict[str, int] = {}
+        self.subscribers: dict[str, list[asyncio.Queue]] = {}
+        self.lookups = 0
+        self.failing_publishes = 0
+
+    async def exists(self, key: str) -> int:
+        self.lookups += 1
+        return int(key in self.ttls)
+
+    def pipeline(self) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    def pubsub(self) -> _FakePubSub:
+        return _FakePubSub(self)
+
+
+def _store(redis: _FakeRedis, revoked: list[str]) -> RedisTokenRevocationStore:
+    async def loader() -> list[str]:
+        return list(revoked)
+
+    store = RedisTokenRevocationStore("redis://fake", loader, capacity=1000)
+
+    async def get_redis() -> _FakeRedis:
+        return redis
+
+    store._get_redis = get_redis  # type: ignore[method-assign]
+    return store
+
+
+async def _until(predicate, seconds: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + seconds
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+@pytest.fixture(autouse=True)
+def _reset_store_singleton():
+    reset_token_revocation_store_for_tests()
+    yield
+    reset_token_revocation_store_for_tests()
+
+
+def test_bloom_filter_has_no_false_negatives_and_few_false_positives() -> None:
+    bloom = BloomFilter(capacity=5000, error_rate=0.01)
+    members = [f"jti-{n}" for n in range(5000)]
+    for jti in members:
+        bloom.add(jti)
+
+    assert all(jti in bloom for jti in members)
+    false_positives = sum(f"other-{n}" in bloom for n in range(20_000))
+    assert false_positives < 20_000 * 0.02
+
+
+@pytest.mark.asyncio
+async def test_filter_miss_answers_without_redis_and_hits_are_confirmed() -> None:
+    redis = _FakeRedis()
+    store = _store(redis, revoked=["only-in-table"])
+    try:
+        assert await store.check("anything") is None  # not ready yet: Redis, then the table
+        await _until(lambda: store.ready)
+        redis.lookups = 0
+
+        assert await store.check("fresh") is False
+        assert redis.lookups == 0
+        # In the filter but not in Redis (e.g. evicted): the table decides.
+        assert await store.check("only-in-table") is None
+        assert redis.lookups == 1
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_revocation_reaches_other_processes_over_pubsub() -> None:
+    redis = _FakeRedis()
+    revoking, other = _store(redis, revoked=[]), _store(redis, revoked=[])
+    try:
+        await revoking.check("warm-up")
+        await other.check("warm-up")
+        await _until(lambda: revoking.ready and other.ready)
+
+        await revoking.revoke("jti-1", datetime.now(timezone.utc) + timedelta(minutes=30))
+        await _until(lambda: "jti-1" in (other._filter or ()))
+
+        assert await other.check("jti-1") is True
+        assert 1790 <= redis.ttls["qgp:revoked_jti:jti-1"] <= 1800
+        # Already-expired tokens are not written to Redis.
+        await revoking.revoke("jti-2", datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=1))
+        assert "qgp:revoked_jti:jti-2" not in redis.ttls
+    finally:
+        await revoking.close()
+        await other.close()
+
+
+@pytest.mark.asyncio
+async def test_token_service_uses_the_store_and_falls_back_to_the_table(monkeypatch) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(TokenBlacklist.__table__.create)
+
+    class _Store:
+        def __init__(self) -> None:
+            self.answer: Optional[bool] = None
+            self.revoked: list[str] = []
+
+        async def check(self, jti: str) -> Optional[bool]:
+            return self.answer
+
+        async def revoke(self, jti: str, expires_at: datetime) -> None:
+            self.revoked.append(jti)
+
+    store = _Store()
+    monkeypatch.setattr(token_service, "get_token_revocation_store", lambda: store)
+    try:
+        async with async_sessionmaker(engine)() as db:
+            await TokenService.revoke_token(db, "jti-1", 7, datetime.now(timezone.utc) + timedelta(minutes=30))
+            assert store.revoked == ["jti-1"]
+
+            assert await TokenService.is_revoked(db, "jti-1", prefilter=True) is True  # store cannot answer: table
+            assert await TokenService.is_revoked(db, "jti-2", prefilter=True) is False
+            store.answer = False
+            assert await TokenService.is_revoked(db, "jti-1", prefilter=True) is False  # store answers: table not read
+            # Refresh / logout / password-reset checks never take the store's word for it.
+            assert await TokenService.is_revoked(db, "jti-1") is True
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_unpublished_revocation_bypasses_the_filter_until_republished() -> None:
+    redis = _FakeRedis()
+    revoking, other = _store(redis, revoked=[]), _store(redis, revoked=[])
+    try:
+        await revoking.check("warm-up")
+        await other.check("warm-up")
+        await _until(lambda: revoking.ready and other.ready)
+
+        redis.failing_publishes = 1
+        await revoking.revoke("jti-1", datetime.now(timezone.utc) + timedelta(minutes=30))
+        assert not revoking.ready
+
+        await _until(lambda: "jti-1" in (other._filter or ()), seconds=5.0)
+        await _until(lambda: revoking.ready, seconds=5.0)
+        assert "qgp:revoked_jti:jti-1" in redis.ttls
+        assert await other.check("jti-1") is True
+    finally:
+        await revoking.close()
+        await other.close()
+
+
+def test_store_is_disabled_without_redis(monkeypatch) -> None:
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    assert get_token_revocation_store() is None
+
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+    assert isinstance(get_token_revocation_store(), RedisTokenRevocationStore)
+
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_is_not_retried_on_every_request(monkeypatch) -> None:
+    import redis.asyncio as redis_asyncio
+
+    attempts = []
+
+    class _Down:
+        async def ping(self) -> None:
+            raise ConnectionError("refused")
+
+    monkeypatch.setattr(redis_asyncio, "from_url", lambda url: attempts.append(url) or _Down())
+
+    async def loader() -> list[str]:
+        return []
+
+    store = RedisTokenRevocationStore("redis://down", loader)
+    try:
+        assert await store.check("a") is None
+        assert await store.check("b") is None
+        await asyncio.sleep(0)  # let the listener take its turn
+        assert len(attempts) == 1
+    finally:
+        await store.close()
@@ -220,3 +220,73 @@ def test_build_status_briefings_empty_rows_no_role_stats():
     briefings = build_status_briefings([], {}, today=TODAY)
     assert len(briefings) == 1
     assert briefings[0]["title"] == "Due in 30 days"
+
+
+def _random_rows(seed: int, people: int = 60, courses: int = 12) -> list[dict]:
+    import random
+
+    rng = random.Random(seed)
+    departments = ["Mobile Engineers", "Workshop", "Head Office", "Senior Management", "Sales", None]
+    rows = []
+    for p in range(people):
+        department = rng.choice(departments)
+        override = rng.choice([None, None, None, "Office", "bogus"])
+        for c in rng.sample(range(courses), rng.randint(1, courses)):
+            status = rng.choice(["compliant", "due_soon", "overdue", "missing", "pending", "failed", None])
+            due = TODAY + timedelta(days=rng.randint(-400, 400)) if rng.random() < 0.7 else None
+            rows.append(
+                {
+                    "atlas_name": f"Person {p}" if p % 17 else "",
+                    "department": department,
+                    "board_role_override": override,
+                    "status": status,
+                    "qgp_due_on": due,
+                    "course_display_name": f"Course {c}" if c % 5 else None,
+                    "course_key": f"c{c}",
+                }
+            )
+    return rows
+
+
+def test_single_pass_summary_matches_the_per_metric_functions():
+    from src.domain.services.training_matrix_board import (
+        build_board_summary,
+        compute_horizon_counts,
+        compute_module_role_stats,
+        compute_people_fully_ok_stats,
+        top_overdue_courses,
+    )
+
+    for seed in range(5):
+        rows = _random_rows(seed)
+        people = {str(r["atlas_name"]) for r in rows if r["atlas_name"]}
+        assert build_board_summary(rows, today=TODAY) == {
+            "module_ok": compute_module_role_stats(rows),
+            "people_fully_ok": compute_people_fully_ok_stats(rows),
+            "horizons": compute_horizon_counts(rows, today=TODAY),
+            "top_overdue_courses": top_overdue_courses(rows, today=TODAY),
+            "required_row_count": len(rows),
+            "person_count": len(people),
+        }
+
+
+def test_redated_snapshot_answers_for_later_days_like_a_rebuild():
+    """A snapshot built from today's rows equals re-evaluating the rows on a later day."""
+    from src.domain.services.training_matrix_board import BoardSnapshot, build_board_summary
+
+    def evaluated(rows: list[dict], day: date) -> list[dict]:
+        # The date-dependent part of evaluate_compliance.
+        out = []
+        for row in rows:
+            due = row["qgp_due_on"]
+            if due is not None and row["status"] in ("compliant", "due_soon", "overdue"):
+                status = "overdue" if due < day else "due_soon" if due <= day + timedelta(days=30) else "compliant"
+                row = {**row, "status": status}
+            out.append(row)
+        return out
+
+    base = [r for r in _random_rows(7) if r["qgp_due_on"] is not None or r["status"] not in ("compliant", "due_soon")]
+    snapshot = BoardSnapshot.from_rows(evaluated(base, TODAY), redate=True)
+    for later in (0, 1, 29, 45, 200):
+        day = TODAY + timedelta(days=later)
+        assert snapshot.summary(day) == build_board_summary(evaluated(base, day), today=day)
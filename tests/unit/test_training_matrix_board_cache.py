@@ -0,0 +1,108 @@
+"""The board snapshot is rebuilt when its inputs change, and only then."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.domain.models.engineer import Engineer
+from src.domain.models.training_matrix import (
+    TrainingMatrixCell,
+    TrainingMatrixCourse,
+    TrainingMatrixPerson,
+    TrainingMatrixRequirement,
+)
+from src.domain.services import training_matrix_board_cache
+from src.domain.services.training_matrix_board_cache import board_snapshot, invalidate_board_snapshots
+
+TENANT_ID = 5
+T0 = datetime(2026, 10, 1, tzinfo=timezone.utc)
+TODAY = date(2026, 10, 14)
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for model in (
+            Engineer,
+            TrainingMatrixPerson,
+            TrainingMatrixCourse,
+            TrainingMatrixCell,
+            TrainingMatrixRequirement,
+        ):
+            await conn.run_sync(model.__table__.create)
+        await conn.execute(
+            insert(TrainingMatrixPerson),
+            [{"tenant_id": tid, "atlas_name": f"P{tid}", "updated_at": T0} for tid in (TENANT_ID, TENANT_ID + 1)],
+        )
+        await conn.execute(
+            insert(TrainingMatrixCourse), [{"tenant_id": TENANT_ID, "course_key": "gdpr", "display_name": "GDPR"}]
+        )
+        await conn.execute(
+            insert(TrainingMatrixCell),
+            [{"tenant_id": TENANT_ID, "import_id": 1, "person_id": 1, "course_id": 1, "updated_at": T0}],
+        )
+    invalidate_board_snapshots()
+    async with async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)() as db:
+        yield db
+    invalidate_board_snapshots()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_reused_until_an_input_changes(session, monkeypatch):
+    metrics: list[str] = []
+    monkeypatch.setattr(
+        training_matrix_board_cache, "track_metric", lambda name, value, tags: metrics.append(tags["result"])
+    )
+    loads: list[int] = []
+
+    async def load_rows():
+        loads.append(1)
+        return [
+            {"atlas_name": "P5", "department": "Workshop", "status": "compliant", "qgp_due_on": TODAY},
+            {"atlas_name": "P5", "department": "Workshop", "status": "compliant", "qgp_due_on": TODAY.replace(day=20)},
+        ]
+
+    async def snapshot(import_id: int = 1):
+        return await board_snapshot(session, tenant_id=TENANT_ID, import_id=import_id, load_rows=load_rows)
+
+    first = await snapshot()
+    assert await snapshot() is first
+    assert len(loads) == 1
+
+    # Re-dated on read: a day later the row due today is overdue, without a rebuild.
+    tomorrow = first.summary(TODAY + timedelta(days=1))
+    assert tomorrow["module_ok"][0] == {"role": "Overall", "ok": 1, "total": 2, "pct": 50, "metric": "module_ok"}
+    assert tomorrow["horizons"]["overdue"] == 1
+
+    # Another tenant's write is not this board's input.
+    await session.execute(
+        update(TrainingMatrixPerson)
+        .where(TrainingMatrixPerson.tenant_id == TENANT_ID + 1)
+        .values(updated_at=T0 + timedelta(hours=1))
+    )
+    assert await snapshot() is first
+
+    await session.execute(update(TrainingMatrixCell).values(atlas_status="Passed", updated_at=T0 + timedelta(hours=2)))
+    second = await snapshot()
+    assert second is not first and len(loads) == 2
+
+    await session.execute(
+        insert(TrainingMatrixRequirement).values(
+            tenant_id=TENANT_ID, course_key="gdpr", course_display_name="GDPR", frequency_years=1, updated_at=T0
+        )
+    )
+    third = await snapshot()
+    assert third is not second and len(loads) == 3
+
+    # A new import, or an explicit invalidation, rebuilds.
+    assert await snapshot(import_id=2) is not third
+    invalidate_board_snapshots(TENANT_ID)
+    await snapshot(import_id=2)
+    assert len(loads) == 5
+    assert metrics == ["miss", "hit", "hit", "rebuild", "rebuild", "rebuild", "miss"]
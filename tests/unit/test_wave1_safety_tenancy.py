@@ -46,18 +46,22 @@ class _FakeExecuteResult:
 
 @pytest.mark.asyncio
 async def test_request_state_middleware_sets_user_id_from_bearer_token():
-    middleware = RequestStateMiddleware(app=lambda scope, receive, send: None)
-    request = MagicMock()
-    request.headers = {"Authorization": f"Bearer {create_access_token(subject='42')}"}
-    request.state = types.SimpleNamespace()
-
-    async def call_next(_request):
-        return Response("ok")
-
-    await middleware.dispatch(request, call_next)
-
-    assert request.state.user_id == "42"
-    assert request.state.request_id is not None
+    async def app(scope, receive, send):
+        await Response("ok")(scope, receive, send)
+
+    token = create_access_token(subject="42")
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "query_string": b"",
+    }
+
+    await RequestStateMiddleware(app)(scope, AsyncMock(), AsyncMock())
+
+    assert scope["state"]["user_id"] == "42"
+    assert scope["state"]["request_id"] is not None
 
 
 def test_uat_safety_ignores_spoofed_x_user_id_header():
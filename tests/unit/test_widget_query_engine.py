@@ -0,0 +1,240 @@
+"""Dashboard widgets compile to tenant-scoped aggregates, batched and cached.
+
+The engine replaced a hard-coded zero payload. These tests run the compiled
+statements for real on SQLite and pin what a dashboard relies on: the numbers
+match a hand count over the same rows, a whole dashboard costs one statement,
+a repeat costs none, a write to a source invalidates only its widgets, and a
+widget that cannot be answered says so instead of reporting zero.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.domain.exceptions import ValidationError
+from src.domain.models.audit import AuditRun
+from src.domain.models.incident import Incident
+from src.domain.models.risk_register import EnterpriseRisk
+from src.domain.services import widget_query_engine
+from src.domain.services.widget_query_engine import BucketGrid, WidgetQueryEngine
+from src.infrastructure.cache.redis_cache import InMemoryCache
+
+TENANT_ID = 3
+NOW = datetime(2026, 10, 14, 15, 30, tzinfo=timezone.utc)
+MIDNIGHT = datetime(2026, 10, 15, tzinfo=timezone.utc)
+
+
+def _widget(data_source: str, aggregation: str = "count", metric: str = "count", **extra: Any) -> SimpleNamespace:
+    return SimpleNamespace(
+        data_source=data_source,
+        aggregation=aggregation,
+        metric=metric,
+        group_by=extra.get("group_by"),
+        filters=extra.get("filters"),
+    )
+
+
+def _incident(n: int, days_ago: float, **values: Any) -> dict[str, Any]:
+    occurred = NOW - timedelta(days=days_ago)
+    row = {
+        "tenant_id": TENANT_ID,
+        "reference_number": f"INC-{n:05d}",
+        "title": f"Incident {n}",
+        "description": "-",
+        "incident_type": "other",
+        "severity": "medium",
+        "status": "reported",
+        "incident_date": occurred,
+        "reported_date": occurred,
+        "created_at": occurred,
+        "updated_at": occurred,
+        "deleted_at": None,
+    }
+    row.update(values)
+    return row
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for model in (Incident, AuditRun, EnterpriseRisk):
+            await conn.run_sync(model.__table__.create)
+        rows = [_incident(n, n * 0.75, severity="high" if n % 3 == 0 else "medium") for n in range(1, 80)]
+        rows.append(_incident(900, 1, tenant_id=TENANT_ID + 1))
+        rows.append(_incident(901, 1, deleted_at=NOW))
+        # Legacy upper-case label: still grouped and filtered as "high".
+        rows.append(_incident(902, 2, severity="HIGH"))
+        await conn.execute(insert(Incident), rows)
+        await conn.execute(
+            insert(AuditRun),
+            [
+                {
+                    "tenant_id": TENANT_ID,
+                    "template_id": 1,
+                    "reference_number": f"AUD-{n:05d}",
+                    "status": "completed",
+                    "completed_at": NOW - timedelta(days=n),
+                    "score_percentage": None if n == 5 else float(50 + n),
+                    "created_at": NOW,
+                    "updated_at": NOW,
+                }
+                for n in range(1, 40)
+            ],
+        )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session(engine):
+    async with async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)() as db:
+        yield db
+
+
+@pytest.fixture
+def statements(engine) -> list[str]:
+    seen: list[str] = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: seen.append(args[2]))
+    return seen
+
+
+def _selects(statements: list[str]) -> list[str]:
+    # The batch runs inside a SAVEPOINT; only the SELECTs are round trips for data.
+    return [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+
+
+def _engine(session, cache=None, now=NOW) -> WidgetQueryEngine:
+    return WidgetQueryEngine(session, TENANT_ID, cache=cache or InMemoryCache(), now=now)
+
+
+async def _invalidate(cache: InMemoryCache, namespace: str) -> None:
+    # What invalidate_tenant_cache does on a write, against this test's cache.
+    await cache.delete_pattern(f"tenant:{TENANT_ID}:{namespace}:*")
+
+
+@pytest.mark.asyncio
+async def test_counts_match_a_hand_count_over_the_same_grid(session):
+    data = await _engine(session).evaluate(_widget("incidents"), 30)
+
+    grid = BucketGrid.for_period(30, NOW)
+    assert grid.end == MIDNIGHT and grid.start == MIDNIGHT - timedelta(days=30)
+    occurred = [NOW - timedelta(days=n * 0.75) for n in range(1, 80)] + [NOW - timedelta(days=2)]
+    current = [when for when in occurred if grid.start <= when < grid.end]
+    previous = [when for when in occurred if grid.edges[0] <= when < grid.start]
+
+    assert data["status"] == "measured"
+    assert data["value"] == len(current)
+    assert data["previous_value"] == len(previous)
+    assert data["granularity"] == "daily"
+    assert len(data["chart_data"]["labels"]) == 30
+    assert data["chart_data"]["labels"][-1] == "2026-10-14"
+    assert sum(data["chart_data"]["values"]) == len(current)
+    assert data["change"] == (round((len(current) - len(previous)) / len(previous) * 100, 1) if previous else None)
+
+
+@pytest.mark.asyncio
+async def test_aggregations_group_by_and_percentage(session):
+    engine = _engine(session)
+    grouped, share, average, lowest = await engine.evaluate_many(
+        [
+            _widget("incidents", group_by="severity"),
+            _widget("incidents", "percentage", filters={"severity": "High"}),
+            _widget("audits", "average", "score_percentage"),
+            _widget("audits", "min", "score_percentage"),
+        ],
+        30,
+    )
+
+    by_severity = dict(zip(grouped["chart_data"]["labels"], grouped["chart_data"]["values"]))
+    assert set(by_severity) == {"high", "medium"}
+    assert sum(by_severity.values()) == grouped["value"]
+    assert share["value"] == round(100 * by_severity["high"] / grouped["value"], 2)
+
+    scores = [50.0 + n for n in range(1, 30) if n != 5]
+    assert average["value"] == round(sum(scores) / len(scores), 2)
+    assert lowest["value"] == 51.0
+
+
+@pytest.mark.asyncio
+async def test_a_dashboard_is_one_statement_and_a_repeat_is_none(session, statements):
+    cache = InMemoryCache()
+    dashboard = [
+        _widget("incidents"),
+        _widget("incidents", group_by="severity"),
+        _widget("incidents", "rate"),
+        _widget("audits", "average", "score_percentage"),
+        _widget("audits", group_by="status"),
+        _widget("incidents"),  # a duplicate tile is computed once
+    ]
+
+    first = await _engine(session, cache).evaluate_many(dashboard, 90)
+    assert len(_selects(statements)) == 1
+    assert first[0] == first[5]
+
+    statements.clear()
+    assert await _engine(session, cache).evaluate_many(dashboard, 90) == first
+    assert statements == []
+
+    # A write to incidents clears only the incident widgets.
+    await _invalidate(cache, "incidents")
+    statements.clear()
+    await _engine(session, cache).evaluate_many(dashboard, 90)
+    (recomputed,) = _selects(statements)
+    assert "incidents" in recomputed and "audit_runs" not in recomputed
+
+
+@pytest.mark.asyncio
+async def test_cache_entries_never_outlive_the_open_bucket(session, monkeypatch):
+    cache = InMemoryCache()
+    written: list[tuple[str, int]] = []
+    original = cache.set_many
+
+    async def _record(items):
+        written.extend((key, ttl) for key, (_value, ttl) in items.items())
+        return await original(items)
+
+    monkeypatch.setattr(cache, "set_many", _record)
+    just_before = MIDNIGHT - timedelta(seconds=40)
+    await _engine(session, cache, now=just_before).evaluate(_widget("incidents"), 7)
+    await _engine(session, cache, now=MIDNIGHT + timedelta(seconds=5)).evaluate(_widget("incidents"), 7)
+
+    (before_key, before_ttl), (after_key, after_ttl) = written
+    assert before_ttl == 40
+    assert after_ttl == widget_query_engine.settings.analytics_widget_cache_ttl_seconds
+    assert before_key != after_key
+
+
+@pytest.mark.asyncio
+async def test_unanswerable_widgets_say_so_instead_of_reporting_zero(session):
+    engine = _engine(session)
+    bad_metric, unsupported, fine = await engine.evaluate_many(
+        [_widget("audits", "sum", "nonexistent"), _widget("training"), _widget("incidents")], 30
+    )
+
+    assert bad_metric["status"] == "unavailable" and bad_metric["reason"] == "invalid_widget_config"
+    assert unsupported == {**unsupported, "status": "unavailable", "reason": "unsupported_data_source"}
+    assert "value" not in bad_metric and "value" not in unsupported
+    assert fine["status"] == "measured"
+
+    with pytest.raises(ValidationError):
+        await engine.evaluate(_widget("incidents", group_by="reporter_email"), 30, strict=True)
+
+
+def test_grids_align_to_calendar_buckets():
+    weekly = BucketGrid.for_period(90, NOW)
+    assert weekly.granularity == "weekly" and weekly.buckets == 13
+    assert all(edge.weekday() == 0 and edge.hour == 0 for edge in weekly.edges)
+    assert weekly.end == datetime(2026, 10, 19, tzinfo=timezone.utc)
+
+    monthly = BucketGrid.for_period(365, NOW)
+    assert monthly.granularity == "monthly" and monthly.buckets == 12
+    assert monthly.end == datetime(2026, 11, 1, tzinfo=timezone.utc)
+    assert monthly.start == datetime(2025, 11, 1, tzinfo=timezone.utc)
+    assert monthly.edges[0] == datetime(2024, 11, 1, tzinfo=timezone.utc)